@@ -0,0 +1,123 @@
+"""
+Full machine fault check: BackendCavity.run_through_faults against FaultPredicates.
+
+Builds a BackendMachine (without connecting to any PVs), gives a fraction of
+the fault PVs a random sample and the rest an OK one, and times finding each
+cavity's fault both ways after checking they agree.
+
+    python benchmarks/bench_fault_predicates.py [--repeat N] [--faulted F]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from random import Random
+
+from sc_linac_physics.displays.cavity_display.backend.backend_machine import (
+    BackendMachine,
+)
+from sc_linac_physics.displays.cavity_display.backend.fault_predicates import (
+    FaultPredicates,
+)
+from sc_linac_physics.utils.epics import PVSnapshot
+
+
+class SampledPV:
+    """Serves one sample, like a monitored PV between updates"""
+
+    def __init__(self, sample: PVSnapshot):
+        self.sample = sample
+
+    def snapshot(self) -> PVSnapshot:
+        return self.sample
+
+
+def build(seed: int, faulted: float):
+    """
+    @param faulted: fraction of PVs given a random sample, the rest are OK
+    """
+    cavities = list(BackendMachine(lazy_fault_pvs=True).all_iterator)
+    random = Random(seed)
+    pv_objs = {}
+    for cavity in cavities:
+        for fault in cavity.faults.values():
+            if fault.pv in pv_objs:
+                fault._pv_obj = pv_objs[fault.pv]
+                continue
+            if random.random() < faulted:
+                value = random.choice([0, 1, 2, 3, 4, 5, 8])
+                severity = random.choice([0, 1, 2, 3])
+            else:
+                # No fault in the spreadsheet is faulted at -1
+                value = -1 if fault.ok_value is None else fault.ok_value
+                severity = 0
+            fault._pv_obj = pv_objs[fault.pv] = SampledPV(
+                PVSnapshot(fault.pv, value, severity, 0, None)
+            )
+    return cavities
+
+
+def serial(cavities) -> list:
+    results = []
+    for cavity in cavities:
+        published = []
+        cavity.publish_fault = lambda fault, invalid=False: published.append(
+            (fault, invalid)
+        )
+        cavity.run_through_faults()
+        results.append(published[0])
+    return results
+
+
+def vectorized(predicates: FaultPredicates) -> list:
+    states = predicates.check()
+    return [
+        (predicates.faults[row] if row >= 0 else None, bool(invalid))
+        for row, invalid in zip(states.rows.tolist(), states.invalid.tolist())
+    ]
+
+
+def best_of(repeat: int, func, *args) -> float:
+    times = []
+    # run_through_faults reports every invalid PV it stops at
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(*args)
+            times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--faulted", type=float, default=0.01)
+    args = parser.parse_args()
+
+    cavities = build(args.seed, args.faulted)
+    start = time.perf_counter()
+    predicates = FaultPredicates(cavities)
+    compile_time = time.perf_counter() - start
+    records, _ = predicates.snapshot()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        matches = serial(cavities) == vectorized(predicates)
+    serial_time = best_of(args.repeat, serial, cavities)
+    check_time = best_of(args.repeat, predicates.check)
+    evaluate_time = best_of(args.repeat, predicates.evaluate, records)
+
+    print(f"cavities:          {len(cavities)}")
+    print(f"faults:            {len(predicates)}")
+    print(f"fault PVs:         {len(predicates.pvs)}")
+    print(f"results match:     {matches}")
+    print(f"compile:           {compile_time * 1e3:.1f} ms")
+    print(f"run_through_faults {serial_time * 1e3:.1f} ms")
+    print(f"snapshot+evaluate: {check_time * 1e3:.1f} ms")
+    print(f"evaluate only:     {evaluate_time * 1e3:.1f} ms")
+    print(f"(best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Memory and construction time of the linac object model.
+
+Builds a full Machine (every cryomodule, rack, cavity, SSA, tuner and piezo,
+without connecting to any PVs) and reports traced bytes per cavity.
+
+    python benchmarks/bench_object_model.py [--repeat N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from sc_linac_physics.utils.sc_linac.linac import Machine
+
+
+def measure() -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    machine = Machine()
+    cavities = sum(1 for _ in machine.all_iterator)
+    elapsed = time.perf_counter() - start
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cavities, traced, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.repeat)]
+    cavities, traced, _ = runs[-1]
+    best = min(elapsed for _, _, elapsed in runs)
+    print(f"cavities:          {cavities}")
+    print(f"traced bytes:      {traced:,}")
+    print(f"bytes per cavity:  {traced // cavities:,}")
+    print(f"construction time: {best * 1e3:.1f} ms (best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
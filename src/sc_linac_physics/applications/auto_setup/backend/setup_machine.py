@@ -18,12 +18,13 @@ class SetupMachine(Machine, SetupLinacObject):
     def pv_prefix(self):
         return "ACCL:SYS0:SC:"
 
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
         Machine.__init__(
             self,
             cavity_class=SetupCavity,
             cryomodule_class=SetupCryomodule,
             linac_class=SetupLinac,
+            lazy=lazy,
         )
         SetupLinacObject.__init__(self)
 
@@ -32,4 +33,4 @@ class SetupMachine(Machine, SetupLinacObject):
             cm.clear_abort()
 
 
-SETUP_MACHINE = SetupMachine()
+SETUP_MACHINE = SetupMachine(lazy=True)
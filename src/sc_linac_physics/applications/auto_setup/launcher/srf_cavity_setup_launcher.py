@@ -13,6 +13,7 @@ from sc_linac_physics.applications.auto_setup.backend.setup_utils import (
 )
 from sc_linac_physics.utils.logger import custom_logger
 from sc_linac_physics.utils.sc_linac.linac_utils import ALL_CRYOMODULES
+from sc_linac_physics.utils.sc_linac.status_publisher import StatusPublisher
 
 
 def setup_cavity(
@@ -86,6 +87,9 @@ def main():
         cavity: SetupCavity = SETUP_MACHINE.cryomodules[cm_name].cavities[
             cav_num
         ]
+        # Progress and status messages are only for display, so the setup
+        # doesn't wait on their puts
+        cavity.status_publisher = StatusPublisher()
 
         logger.info(
             "Setup request flags",
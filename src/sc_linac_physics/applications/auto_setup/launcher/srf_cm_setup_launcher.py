@@ -1,7 +1,9 @@
 import argparse
 import logging
 import sys
+from collections import Counter
 from time import sleep
+from typing import List
 
 from sc_linac_physics.applications.auto_setup.backend.setup_cavity import (
     SetupCavity,
@@ -17,6 +19,12 @@ from sc_linac_physics.applications.auto_setup.backend.setup_utils import (
 )
 from sc_linac_physics.utils.logger import custom_logger
 from sc_linac_physics.utils.sc_linac.linac_utils import ALL_CRYOMODULES
+from sc_linac_physics.utils.sc_linac.procedure_executor import (
+    ExecutorProgress,
+    ProcedureExecutor,
+    ProcedureResult,
+)
+from sc_linac_physics.utils.sc_linac.status_publisher import StatusPublisher
 
 
 def setup_cavity(
@@ -41,29 +49,86 @@ def setup_cavity(
         logger.info("Triggering shutdown for %s", cavity_object)
         cavity_object.trigger_shutdown()
     else:
-        cm: SetupCryomodule = cavity_object.cryomodule
+        copy_cm_requests(cavity_object, logger)
+        logger.info("Triggering setup for %s", cavity_object)
+        cavity_object.trigger_start()
+
+
+def copy_cm_requests(cavity_object: SetupCavity, logger: logging.Logger):
+    """
+    Copy the cryomodule's setup request flags to one of its cavities.
+
+    Args:
+        cavity_object: SetupCavity object to set the flags on
+        logger: Logger instance
+    """
+    cm: SetupCryomodule = cavity_object.cryomodule
+
+    logger.debug(
+        "Setting request flags for %s from cryomodule",
+        cavity_object,
+        extra={
+            "extra_data": {
+                "ssa_cal_requested": cm.ssa_cal_requested,
+                "auto_tune_requested": cm.auto_tune_requested,
+                "cav_char_requested": cm.cav_char_requested,
+                "rf_ramp_requested": cm.rf_ramp_requested,
+                "cavity": str(cavity_object),
+            }
+        },
+    )
+
+    cavity_object.ssa_cal_requested = cm.ssa_cal_requested
+    cavity_object.auto_tune_requested = cm.auto_tune_requested
+    cavity_object.cav_char_requested = cm.cav_char_requested
+    cavity_object.rf_ramp_requested = cm.rf_ramp_requested
+
+
+def run_in_process(
+    cm: SetupCryomodule, args: argparse.Namespace, logger: logging.Logger
+) -> List[ProcedureResult]:
+    """
+    Setup or shutdown every cavity in a cryomodule from this process, all at
+    once, instead of triggering each cavity's own setup script in turn.
+    Cavities sharing an SSA still go one at a time.
+
+    Args:
+        cm: SetupCryomodule whose cavities to operate on
+        args: Parsed command-line arguments
+        logger: Logger instance
 
+    Returns:
+        One ProcedureResult per cavity
+    """
+    cavities: List[SetupCavity] = list(cm.cavities.values())
+    # Progress and status messages are only for display, so the setup
+    # doesn't wait on their puts
+    publisher = StatusPublisher()
+    for cavity in cavities:
+        cavity.status_publisher = publisher
+        if not args.shutdown:
+            copy_cm_requests(cavity, logger)
+
+    def log_progress(progress: ExecutorProgress):
         logger.debug(
-            "Setting request flags for %s from cryomodule",
-            cavity_object,
-            extra={
-                "extra_data": {
-                    "ssa_cal_requested": cm.ssa_cal_requested,
-                    "auto_tune_requested": cm.auto_tune_requested,
-                    "cav_char_requested": cm.cav_char_requested,
-                    "rf_ramp_requested": cm.rf_ramp_requested,
-                    "cavity": str(cavity_object),
-                }
-            },
+            "%d/%d cavities finished, running: %s",
+            progress.finished,
+            progress.total,
+            ", ".join(progress.running),
         )
 
-        cavity_object.ssa_cal_requested = cm.ssa_cal_requested
-        cavity_object.auto_tune_requested = cm.auto_tune_requested
-        cavity_object.cav_char_requested = cm.cav_char_requested
-        cavity_object.rf_ramp_requested = cm.rf_ramp_requested
-
-        logger.info("Triggering setup for %s", cavity_object)
-        cavity_object.trigger_start()
+    executor = ProcedureExecutor(
+        max_workers=len(cavities),
+        on_progress=log_progress,
+        abort_cavity=SetupCavity.trigger_abort,
+    )
+    procedure = SetupCavity.shut_down if args.shutdown else SetupCavity.setup
+    logger.info(
+        "%s %d cavities in process",
+        "Shutting down" if args.shutdown else "Setting up",
+        len(cavities),
+    )
+    return executor.run(cavities, procedure)
 
 
 def main():
@@ -87,6 +152,13 @@ def main():
         help="Turn off all cavities and SSAs in the cryomodule",
     )
 
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run every cavity's setup from this process, concurrently,"
+        " instead of triggering each cavity's setup script in turn",
+    )
+
     parsed_args = parser.parse_args()
     cm_name = parsed_args.cryomodule
 
@@ -123,12 +195,19 @@ def main():
         cavity_count = len(cm.cavities)
         logger.info("Processing %d cavities in %s", cavity_count, cm_name)
 
-        for idx, cavity in enumerate(cm.cavities.values(), 1):
+        if parsed_args.in_process:
+            results = run_in_process(cm, parsed_args, logger)
             logger.info(
-                "Processing cavity %d/%d: %s", idx, cavity_count, cavity
+                "Cavity procedure states: %s",
+                dict(Counter(result.state for result in results)),
             )
-            setup_cavity(cavity, parsed_args, logger)
-            sleep(0.1)
+        else:
+            for idx, cavity in enumerate(cm.cavities.values(), 1):
+                logger.info(
+                    "Processing cavity %d/%d: %s", idx, cavity_count, cavity
+                )
+                setup_cavity(cavity, parsed_args, logger)
+                sleep(0.1)
 
         logger.info(
             "Cryomodule setup script completed successfully",
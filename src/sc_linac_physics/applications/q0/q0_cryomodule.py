@@ -13,6 +13,7 @@ from sc_linac_physics.applications.q0.calibration import Calibration
 from sc_linac_physics.applications.q0.q0_utils import round_for_printing
 from sc_linac_physics.applications.q0.rf_measurement import Q0Measurement
 from sc_linac_physics.applications.q0.rf_run import RFRun
+from sc_linac_physics.utils.epics import PV, wait_until
 from sc_linac_physics.utils.sc_linac.cryomodule import Cryomodule
 
 
@@ -492,9 +493,11 @@ class Q0Cryomodule(Cryomodule):
 
         # One way for the JT valve to be locked in the correct position is for
         # it to be in manual mode and at the desired value
-        while caget(self.jt_mode_pv) != q0_utils.JT_MANUAL_MODE_VALUE:
-            self.check_abort()
-            sleep(1)
+        wait_until(
+            PV(self.jt_mode_pv),
+            lambda mode: mode == q0_utils.JT_MANUAL_MODE_VALUE,
+            abort_check=self.check_abort,
+        )
 
         print(f"Walking {self} JT to {value}%")
         for _ in range(int(floor(abs(delta)))):
@@ -507,9 +510,11 @@ class Q0Cryomodule(Cryomodule):
 
         print(f"Waiting for {self} JT Valve position to be in tolerance")
         # Wait for the valve position to be within tolerance before continuing
-        while abs(self.jt_position - value) > q0_utils.VALVE_POS_TOL:
-            self.check_abort()
-            sleep(1)
+        wait_until(
+            PV(self.jt_valve_readback_pv),
+            lambda position: abs(position - value) <= q0_utils.VALVE_POS_TOL,
+            abort_check=self.check_abort,
+        )
 
         print(f"{self} JT Valve at {value}")
 
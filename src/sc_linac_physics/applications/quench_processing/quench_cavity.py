@@ -18,6 +18,7 @@ from sc_linac_physics.utils.epics import PV, EPICS_INVALID_VAL
 from sc_linac_physics.utils.logger import custom_logger
 from sc_linac_physics.utils.sc_linac.cavity import Cavity
 from sc_linac_physics.utils.sc_linac.decarad import Decarad
+from sc_linac_physics.utils.sc_linac.pv_descriptors import pv_name, pv_property
 from sc_linac_physics.utils.sc_linac.linac_utils import (
     QuenchError,
     RF_MODE_SELA,
@@ -25,28 +26,30 @@ from sc_linac_physics.utils.sc_linac.linac_utils import (
 
 
 class QuenchCavity(Cavity):
+    cav_power_pv = pv_name("CAV:PWRMEAN")
+    forward_power_pv = pv_name("FWD:PWRMEAN")
+    reverse_power_pv = pv_name("REV:PWRMEAN")
+    fault_waveform_pv_obj = pv_property("CAV:FLTAWF")
+    decay_ref_pv = pv_name("DECAYREFWF")
+    fault_time_waveform_pv_obj = pv_property("CAV:FLTTWF")
+    srf_max_pv = pv_name("ADES_MAX_SRF")
+    quench_bypass_rbck_pv_obj = pv_property(
+        "QUENCH_BYP_RBV", slot="_quench_bypass_rbck_pv"
+    )
+
+    # Redeclared so that these are created with this module's PV
+    current_q_loaded_pv_obj: PV = pv_property()
+    quench_latch_pv_obj: PV = pv_property()
+    interlock_reset_pv_obj: PV = pv_property()
+
     def __init__(
         self,
         cavity_num,
         rack_object,
     ):
         super().__init__(cavity_num=cavity_num, rack_object=rack_object)
-        self.cav_power_pv = self.pv_addr("CAV:PWRMEAN")
-        self.forward_power_pv = self.pv_addr("FWD:PWRMEAN")
-        self.reverse_power_pv = self.pv_addr("REV:PWRMEAN")
-
-        self.fault_waveform_pv = self.pv_addr("CAV:FLTAWF")
-        self._fault_waveform_pv_obj: Optional[PV] = None
-
-        self.decay_ref_pv = self.pv_addr("DECAYREFWF")
-
-        self.fault_time_waveform_pv = self.pv_addr("CAV:FLTTWF")
-        self._fault_time_waveform_pv_obj: Optional[PV] = None
 
-        self.srf_max_pv = self.pv_addr("ADES_MAX_SRF")
         self.pre_quench_amp = None
-        self._quench_bypass_rbck_pv: Optional[PV] = None
-        self._current_q_loaded_pv_obj: Optional[PV] = None
 
         self.decarad: Optional[Decarad] = None
 
@@ -59,39 +62,13 @@ class QuenchCavity(Cavity):
             log_filename=f"setup_cavity_{self.number}",
         )
 
-    @property
-    def current_q_loaded_pv_obj(self):
-        if not self._current_q_loaded_pv_obj:
-            self._current_q_loaded_pv_obj = PV(self.current_q_loaded_pv)
-        return self._current_q_loaded_pv_obj
-
-    @property
-    def quench_latch_pv_obj(self) -> PV:
-        if not self._quench_latch_pv_obj:
-            self._quench_latch_pv_obj = PV(self.quench_latch_pv)
-        return self._quench_latch_pv_obj
-
     @property
     def quench_latch_invalid(self):
         return self.quench_latch_pv_obj.severity == EPICS_INVALID_VAL
 
     @property
     def quench_intlk_bypassed(self) -> bool:
-        if not self._quench_bypass_rbck_pv:
-            self._quench_bypass_rbck_pv = PV(self.pv_addr("QUENCH_BYP_RBV"))
-        return self._quench_bypass_rbck_pv.get() == 1
-
-    @property
-    def fault_waveform_pv_obj(self) -> PV:
-        if not self._fault_waveform_pv_obj:
-            self._fault_waveform_pv_obj = PV(self.fault_waveform_pv)
-        return self._fault_waveform_pv_obj
-
-    @property
-    def fault_time_waveform_pv_obj(self) -> PV:
-        if not self._fault_time_waveform_pv_obj:
-            self._fault_time_waveform_pv_obj = PV(self.fault_time_waveform_pv)
-        return self._fault_time_waveform_pv_obj
+        return self.quench_bypass_rbck_pv_obj.get() == 1
 
     def reset_interlocks(
         self, wait: int = 0, attempt: int = 0, time_after_reset=1
@@ -99,10 +76,7 @@ class QuenchCavity(Cavity):
         """Overwriting base function to skip wait/reset cycle."""
         self.logger.info(f"Resetting interlocks for cavity {self.number}")
 
-        if not self._interlock_reset_pv_obj:
-            self._interlock_reset_pv_obj = PV(self.interlock_reset_pv)
-
-        self._interlock_reset_pv_obj.put(1)
+        self.interlock_reset_pv_obj.put(1)
         self.wait_for_decarads()
 
     def walk_to_quench(
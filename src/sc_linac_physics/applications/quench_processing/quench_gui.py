@@ -34,7 +34,7 @@ from sc_linac_physics.utils.sc_linac.decarad import Decarad
 from sc_linac_physics.utils.sc_linac.linac import Machine
 from sc_linac_physics.utils.sc_linac.linac_utils import ALL_CRYOMODULES
 
-QUENCH_MACHINE = Machine(cavity_class=QuenchCavity)
+QUENCH_MACHINE = Machine(cavity_class=QuenchCavity, lazy=True)
 
 
 class QuenchGUI(Display):
@@ -18,7 +18,7 @@ from sc_linac_physics.utils.sc_linac.linac_utils import (
     CavityFaultError,
 )
 
-QUENCH_MACHINE = Machine(cavity_class=QuenchCavity)
+QUENCH_MACHINE = Machine(cavity_class=QuenchCavity, lazy=True)
 
 # Module-level logger with explicit descriptive name
 logger = custom_logger(
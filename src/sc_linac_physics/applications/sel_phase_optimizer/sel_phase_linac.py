@@ -197,4 +197,4 @@ class SELCavity(Cavity):
             return 0
 
 
-SEL_MACHINE: Machine = Machine(cavity_class=SELCavity)
+SEL_MACHINE: Machine = Machine(cavity_class=SELCavity, lazy=True)
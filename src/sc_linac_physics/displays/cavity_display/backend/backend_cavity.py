@@ -17,8 +17,6 @@ from sc_linac_physics.displays.cavity_display.utils.utils import (
     STATUS_SUFFIX,
     DESCRIPTION_SUFFIX,
     SEVERITY_SUFFIX,
-    SpreadsheetError,
-    display_hash,
     severity_of_fault,
 )
 from sc_linac_physics.utils.epics import PV
@@ -59,107 +57,42 @@ class BackendCavity(Cavity):
         return self._description_pv_obj
 
     def create_faults(self):
-        for csv_fault_dict in utils.parse_csv():
-            level: str = csv_fault_dict["Level"]
-            suffix: str = csv_fault_dict["PV Suffix"]
-            rack: str = csv_fault_dict["Rack"]
-
-            button_command = csv_fault_dict["Button Path"]
+        machine = self.rack.cryomodule.linac.machine
+        for template, key, pv in utils.fault_table().for_cavity(self):
+            button_command = template.button_path
             macros = self.edm_macro_string
 
-            if level == "RACK":
-                # Rack A cavities don't care about faults for Rack B and vice versa
-                if rack != self.rack.rack_name:
-                    # Takes us to the next iteration of the for loop
-                    continue
-
-                # tested in the python console that strings without one of these
-                # formatting keys just ignores them and moves on
-                prefix = csv_fault_dict["PV Prefix"].format(
-                    LINAC=self.linac.name,
-                    CRYOMODULE=self.cryomodule.name,
-                    RACK=self.rack.rack_name,
-                    CAVITY=self.number,
-                )
-                pv: str = prefix + suffix
-
-            elif level == "CRYO":
-                prefix = csv_fault_dict["PV Prefix"].format(
-                    CRYOMODULE=self.cryomodule.name, CAVITY=self.number
-                )
-                pv: str = prefix + suffix
+            if template.level == "CRYO":
                 macros = self.cryo_edm_macro_string
 
-            elif level == "SSA":
-                pv: str = self.ssa.pv_addr(suffix)
+            elif template.level == "SSA":
                 button_command = button_command.format(
                     cm_OR_hl=(
                         "hl" if self.cryomodule.is_harmonic_linearizer else "cm"
                     )
                 )
 
-            elif level == "CAV":
-                pv: str = self.pv_addr(suffix)
-
-            elif level == "CM":
-                cm_type = csv_fault_dict["CM Type"]
-                prefix = csv_fault_dict["PV Prefix"].format(
-                    LINAC=self.linac.name,
-                    CRYOMODULE=self.cryomodule.name,
-                    CAVITY=self.number,
-                )
-
-                if (
-                    cm_type == "1.3" and self.cryomodule.is_harmonic_linearizer
-                ) or (
-                    cm_type == "3.9"
-                    and not self.cryomodule.is_harmonic_linearizer
-                ):
-                    continue
-                pv: str = prefix + suffix
-
-            elif level == "ALL":
-                prefix = csv_fault_dict["PV Prefix"]
-                pv: str = prefix + suffix
-
-            else:
-                raise (
-                    SpreadsheetError(
-                        "Unexpected fault level in fault spreadsheet"
-                    )
-                )
-
-            tlc: str = csv_fault_dict["Three Letter Code"]
-            ok_condition: str = csv_fault_dict["OK If Equal To"]
-            fault_condition: str = csv_fault_dict["Faulted If Equal To"]
-            csv_prefix: str = csv_fault_dict["PV Prefix"]
-
-            key: int = display_hash(
-                rack=rack,
-                fault_condition=fault_condition,
-                ok_condition=ok_condition,
-                tlc=tlc,
-                suffix=suffix,
-                prefix=csv_prefix,
-            )
-
             # setting key of faults dictionary to be row number b/c it's unique (i.e. not repeated)
             self.faults[key]: OrderedDict[int, Fault] = Fault(
-                tlc=tlc,
-                severity=csv_fault_dict["Severity"],
+                tlc=template.tlc,
+                severity=template.severity,
                 pv=pv,
-                ok_value=ok_condition,
-                fault_value=fault_condition,
-                long_description=csv_fault_dict["Long Description"],
-                short_description=csv_fault_dict["Short Description"],
-                button_level=csv_fault_dict["Button Type"],
+                ok_value=template.ok_value,
+                fault_value=template.fault_value,
+                long_description=template.long_description,
+                short_description=template.short_description,
+                button_level=template.button_type,
                 button_command=button_command,
                 macros=macros,
-                button_text=csv_fault_dict["Three Letter Code"],
-                button_macro=csv_fault_dict["Button Macros"],
-                action=csv_fault_dict["Recommended Corrective Actions"],
-                lazy_pv=self.rack.cryomodule.linac.machine.lazy_fault_pvs,
+                button_text=template.tlc,
+                button_macro=template.button_macros,
+                action=template.action,
+                lazy_pv=machine.lazy_fault_pvs,
+                pv_obj=machine.fault_index.pv_obj(
+                    pv, lazy=machine.lazy_fault_pvs
+                ),
             )
+            machine.fault_index.add(self, self.faults[key])
 
     def get_fault_counts(
         self, start_time: datetime, end_time: datetime
@@ -227,7 +160,14 @@ class BackendCavity(Cavity):
                 invalid = True
                 break
 
-        if is_okay:
+        self.publish_fault(None if is_okay else fault, invalid)
+
+    def publish_fault(self, fault: Optional[Fault], invalid: bool = False):
+        """
+        Publish the fault the cavity stopped at, None if it has none
+        @param invalid: fault's PV is invalid rather than faulted
+        """
+        if fault is None:
             self.severity_pv_obj.put(0)
             self.status_pv_obj.put(str(self.number))
             self.description_pv_obj.put(" ")
@@ -1,6 +1,6 @@
 import dataclasses
 from datetime import datetime
-from typing import Union, Optional, Dict
+from typing import Union, Optional, Dict, Tuple
 
 from lcls_tools.common.data.archiver import (
     ArchiveDataHandler,
@@ -13,6 +13,7 @@ from sc_linac_physics.utils.epics import (
     PV,
     EPICS_INVALID_VAL,
     PVInvalidError,
+    PVSnapshot,
 )
 
 
@@ -41,6 +42,35 @@ class FaultCounter:
         return self.sum_fault_count == other.sum_fault_count
 
 
+class FaultCondition:
+    """
+    The result of checking one PV against one OK or faulted value, shared by
+    every Fault making the same check (see FaultIndex) so the check runs once
+    per PV update rather than once per cavity displaying it
+    """
+
+    def __init__(self):
+        # The snapshot last checked and its result (None if invalid)
+        self._checked: Tuple[Optional[PVSnapshot], Optional[bool]] = (
+            None,
+            None,
+        )
+
+    def is_faulted(self, fault: "Fault") -> bool:
+        snapshot = fault.pv_obj.snapshot()
+        checked, result = self._checked
+        # Monitored PVs serve the same snapshot until the next update
+        if snapshot is not checked:
+            try:
+                result = fault.is_faulted(snapshot)
+            except PVInvalidError:
+                result = None
+            self._checked = (snapshot, result)
+        if result is None:
+            raise PVInvalidError(fault.pv)
+        return result
+
+
 class Fault:
     def __init__(
         self,
@@ -58,6 +88,7 @@ class Fault:
         button_macro=None,
         action=None,
         lazy_pv=True,
+        pv_obj: Optional[PV] = None,
     ):
         self.tlc = tlc
         self.severity = int(severity)
@@ -75,7 +106,12 @@ class Fault:
         # Storing PV name as a string instead of making a PV obj
         self.pv: str = pv
         # TODO figure out why lazy generation breaks the backend runner
-        self._pv_obj: Optional[PV] = PV(self.pv) if not lazy_pv else None
+        if pv_obj is None and not lazy_pv:
+            pv_obj = PV(self.pv)
+        self._pv_obj: Optional[PV] = pv_obj
+
+        # Set when a FaultIndex shares this fault's check with other cavities
+        self.condition: Optional[FaultCondition] = None
 
     @property
     def pv_obj(self) -> PV:
@@ -86,9 +122,11 @@ class Fault:
     def is_currently_faulted(self) -> bool:
         # returns "TRUE" if faulted
         # returns "FALSE" if not faulted
-        return self.is_faulted(self.pv_obj)
+        if self.condition:
+            return self.condition.is_faulted(self)
+        return self.is_faulted(self.pv_obj.snapshot())
 
-    def is_faulted(self, obj: Union[PV, ArchiverValue]) -> bool:
+    def is_faulted(self, obj: Union[PVSnapshot, ArchiverValue]) -> bool:
         """
         Dug through the pyepics source code to find the severity values:
         class AlarmSeverity(DefaultIntEnum):
@@ -0,0 +1,73 @@
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from sc_linac_physics.displays.cavity_display.backend.fault import (
+    Fault,
+    FaultCondition,
+)
+from sc_linac_physics.utils.epics import PV
+
+if TYPE_CHECKING:
+    from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
+        BackendCavity,
+    )
+
+
+class FaultIndex:
+    """
+    Machine wide index of the faults every BackendCavity checks, by PV name.
+
+    ALL, CM and RACK level faults name the same PV for up to every cavity in
+    the machine. The index gives those faults one PV object, one shared
+    FaultCondition per distinct check of that PV, and one monitor callback
+    fanned out to every cavity that uses it.
+    """
+
+    def __init__(self):
+        self._pv_objs: Dict[str, PV] = {}
+        self._conditions: Dict[
+            Tuple[str, Optional[float], Optional[float]], FaultCondition
+        ] = {}
+        # The cavities using each PV (in insertion order) and their first
+        # fault on it
+        self._users: Dict[str, Dict["BackendCavity", Fault]] = {}
+        self.num_faults = 0
+
+    @property
+    def num_pvs(self) -> int:
+        return len(self._users)
+
+    @property
+    def num_conditions(self) -> int:
+        return len(self._conditions)
+
+    def pv_obj(self, pv: str, lazy: bool = True) -> Optional[PV]:
+        """The PV object faults on pv share, created now unless lazy"""
+        if pv not in self._pv_objs and not lazy:
+            self._pv_objs[pv] = PV(pv)
+        return self._pv_objs.get(pv)
+
+    def add(self, cavity: "BackendCavity", fault: Fault):
+        key = (fault.pv, fault.ok_value, fault.fault_value)
+        fault.condition = self._conditions.setdefault(key, FaultCondition())
+        self._users.setdefault(fault.pv, {}).setdefault(cavity, fault)
+        self.num_faults += 1
+
+    def cavities(self, pv: str) -> List["BackendCavity"]:
+        return list(self._users.get(pv, ()))
+
+    def watch(self, on_change: Callable[["BackendCavity"], None]):
+        """
+        Call on_change for every cavity using a fault PV whenever it updates
+        or its connection changes (from the channel access thread, so
+        on_change should only note the cavity)
+        """
+        for users in self._users.values():
+            cavities = list(users)
+
+            def fan_out(cavities=cavities, **kwargs):
+                for cavity in cavities:
+                    on_change(cavity)
+
+            pv_obj = next(iter(users.values())).pv_obj
+            pv_obj.add_callback(fan_out)
+            pv_obj.connection_callbacks.append(fan_out)
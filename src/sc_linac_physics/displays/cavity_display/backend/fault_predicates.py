@@ -0,0 +1,280 @@
+from numbers import Real
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+from sc_linac_physics.displays.cavity_display.backend.fault import Fault
+from sc_linac_physics.utils.epics import (
+    EPICS_INVALID_VAL,
+    PVSnapshot,
+    SNAPSHOT_DTYPE,
+)
+from sc_linac_physics.utils.epics.snapshot import empty_snapshot_records
+
+if TYPE_CHECKING:
+    from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
+        BackendCavity,
+    )
+
+# Fault modes, from which of the spreadsheet's conditions a fault has
+OK_IF_EQUAL = 0
+FAULTED_IF_EQUAL = 1
+NO_CONDITION = 2
+
+# Record severity and status for a sample without one. Fault.is_faulted
+# only counts a missing status as invalid, so unlike PV.snapshot_many a
+# missing severity is kept apart from INVALID.
+NO_SEVERITY = -1
+NO_STATUS = -1
+
+# The record of a PV that could not be read
+INVALID_RECORD = tuple(empty_snapshot_records(1)[0].tolist())
+
+
+class FaultStates(NamedTuple):
+    """
+    The fault each evaluated cavity stops at, one entry per cavity: its row
+    in FaultPredicates.faults (-1 if none), the severity to publish (0 if
+    none, INVALID if the fault's PV is) and whether its PV is invalid.
+
+    errors maps the position of each cavity run_through_faults would raise
+    for to the error: reading its stopping fault's PV failed, or that fault
+    has no condition.
+    """
+
+    rows: np.ndarray
+    severity: np.ndarray
+    invalid: np.ndarray
+    errors: Dict[int, Exception]
+
+
+def snapshot_value(value: Any) -> float:
+    """
+    value as it compares to a fault's float OK or faulted value: numbers as
+    floats and anything else (strings, None, waveforms) as NaN, which like
+    them is unequal to every float
+    """
+    if type(value) in (int, float):
+        return float(value)
+    if isinstance(value, np.ndarray) and value.size == 1:
+        value = value.item()
+    if isinstance(value, (Real, np.number)):
+        return float(value)
+    return np.nan
+
+
+def snapshot_record(snapshot: PVSnapshot) -> tuple:
+    """snapshot as a SNAPSHOT_DTYPE record, its value as snapshot_value"""
+    return (
+        snapshot_value(snapshot.value),
+        NO_SEVERITY if snapshot.severity is None else snapshot.severity,
+        NO_STATUS if snapshot.status is None else snapshot.status,
+        np.nan if snapshot.timestamp is None else snapshot.timestamp,
+        True,
+    )
+
+
+class FaultPredicates:
+    """
+    The faults of a group of cavities (a shard or the whole machine)
+    compiled into arrays: for every fault in cavity and priority order, the
+    index of its PV, its mode, the value it compares against and its
+    severity.
+
+    evaluate then finds every cavity's highest priority fault from one
+    record per PV in a single numpy pass. It gives the same fault, severity
+    and invalid flag as BackendCavity.run_through_faults does for the same
+    samples, and reports the errors it would raise.
+
+        states = predicates.check()
+    """
+
+    def __init__(self, cavities: Sequence["BackendCavity"]):
+        self.cavities: List["BackendCavity"] = list(cavities)
+        self.faults: List[Fault] = []
+        self.pvs: List[str] = []
+        # First fault on each PV, whose (possibly shared) PV object it reads
+        self._pv_faults: List[Fault] = []
+
+        pv_indices: Dict[str, int] = {}
+        pv_index, mode, reference, severity = [], [], [], []
+        starts = [0]
+        for cavity in self.cavities:
+            for fault in cavity.faults.values():
+                if fault.pv not in pv_indices:
+                    pv_indices[fault.pv] = len(self.pvs)
+                    self.pvs.append(fault.pv)
+                    self._pv_faults.append(fault)
+                pv_index.append(pv_indices[fault.pv])
+                if fault.ok_value is not None:
+                    mode.append(OK_IF_EQUAL)
+                    reference.append(fault.ok_value)
+                elif fault.fault_value is not None:
+                    mode.append(FAULTED_IF_EQUAL)
+                    reference.append(fault.fault_value)
+                else:
+                    mode.append(NO_CONDITION)
+                    reference.append(np.nan)
+                severity.append(fault.severity)
+                self.faults.append(fault)
+            starts.append(len(self.faults))
+
+        self.pv_index = np.asarray(pv_index, dtype=np.intp)
+        self.mode = np.asarray(mode, dtype=np.int8)
+        self.reference = np.asarray(reference, dtype=np.float64)
+        self.severity = np.asarray(severity, dtype=np.int16)
+        # Each cavity's faults are rows starts[i] to starts[i + 1]
+        self.starts = np.asarray(starts, dtype=np.intp)
+        self._cavity_index: Dict["BackendCavity", int] = {
+            cavity: index for index, cavity in enumerate(self.cavities)
+        }
+
+        # The last snapshot of each PV and its record. Monitored PVs serve
+        # the same snapshot until the next update, so only new ones are
+        # converted.
+        self._sampled: List[Optional[PVSnapshot]] = [None] * len(self.pvs)
+        self._records = empty_snapshot_records(len(self.pvs))
+
+    def __len__(self):
+        return len(self.faults)
+
+    def snapshot(
+        self, cavities: Optional[Sequence["BackendCavity"]] = None
+    ) -> Tuple[np.ndarray, Dict[int, Exception]]:
+        """
+        One record per PV (in pvs order) from each PV's snapshot, the
+        monitored sample when there is one. Only the PVs cavities use are
+        read; the rest keep their last record (invalid until first read).
+        @return: the records and the error reading each unread PV by index
+        """
+        if cavities is None:
+            indices = range(len(self.pvs))
+        else:
+            indices = np.unique(self.pv_index[self._rows(cavities)[2]]).tolist()
+        pv_faults = self._pv_faults
+        sampled = self._sampled
+        errors: Dict[int, Exception] = {}
+        changed, samples = [], []
+        for index in indices:
+            try:
+                snapshot = pv_faults[index].pv_obj.snapshot()
+            except Exception as e:
+                errors[index] = e
+                snapshot = None
+            if snapshot is sampled[index]:
+                continue
+            sampled[index] = snapshot
+            changed.append(index)
+            samples.append(
+                INVALID_RECORD
+                if snapshot is None
+                else snapshot_record(snapshot)
+            )
+        if changed:
+            self._records[changed] = np.array(samples, dtype=SNAPSHOT_DTYPE)
+        return self._records.copy(), errors
+
+    def check(
+        self, cavities: Optional[Sequence["BackendCavity"]] = None
+    ) -> FaultStates:
+        """Snapshot and evaluate cavities (all by default)"""
+        records, errors = self.snapshot(cavities)
+        return self.evaluate(records, cavities, errors)
+
+    def _rows(
+        self, cavities: Optional[Sequence["BackendCavity"]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The number of faults each of cavities has, where each cavity's
+        faults start among the selected rows and the selected rows
+        """
+        if cavities is None:
+            selected = np.arange(len(self.cavities))
+        else:
+            selected = np.asarray(
+                [self._cavity_index[cavity] for cavity in cavities],
+                dtype=np.intp,
+            )
+        counts = self.starts[selected + 1] - self.starts[selected]
+        offsets = np.zeros(len(selected), dtype=np.intp)
+        np.cumsum(counts[:-1], out=offsets[1:])
+        rows = np.repeat(self.starts[selected] - offsets, counts) + np.arange(
+            counts.sum(), dtype=np.intp
+        )
+        return counts, offsets, rows
+
+    def evaluate(
+        self,
+        records: np.ndarray,
+        cavities: Optional[Sequence["BackendCavity"]] = None,
+        errors: Optional[Dict[int, Exception]] = None,
+    ) -> FaultStates:
+        """
+        @param records: SNAPSHOT_DTYPE records in pvs order
+        @param cavities: the cavities to evaluate, all by default
+        @param errors: errors reading PVs by index, as from snapshot
+        """
+        if records.dtype != SNAPSHOT_DTYPE or len(records) != len(self.pvs):
+            raise ValueError(f"Expected {len(self.pvs)} snapshot records")
+        counts, offsets, rows = self._rows(cavities)
+
+        samples = records[self.pv_index[rows]]
+        mode = self.mode[rows]
+        reference = self.reference[rows]
+        invalid = (samples["severity"] == EPICS_INVALID_VAL) | (
+            samples["status"] == NO_STATUS
+        )
+        faulted = np.where(
+            mode == OK_IF_EQUAL,
+            samples["value"] != reference,
+            samples["value"] == reference,
+        )
+        stops = invalid | faulted | (mode == NO_CONDITION)
+
+        # Position of each cavity's first stop, or len(rows) for none
+        positions = np.where(stops, np.arange(len(rows)), len(rows))
+        first = np.full(len(counts), len(rows), dtype=np.intp)
+        has_faults = counts > 0
+        if has_faults.any():
+            first[has_faults] = np.minimum.reduceat(
+                positions, offsets[has_faults]
+            )
+
+        stopped = first < len(rows)
+        stop_rows = rows[first[stopped]]
+        stop_invalid = invalid[first[stopped]]
+        # Where run_through_faults would raise instead: on reading a PV that
+        # failed, or on a valid PV's fault without a condition
+        errors = errors or {}
+        unread = np.isin(self.pv_index[stop_rows], list(errors))
+        unconditioned = (self.mode[stop_rows] == NO_CONDITION) & ~stop_invalid
+        stop_positions = np.flatnonzero(stopped)
+        stop_errors: Dict[int, Exception] = {}
+        for i in np.flatnonzero(unread | unconditioned).tolist():
+            row = int(stop_rows[i])
+            stop_errors[int(stop_positions[i])] = errors.get(
+                int(self.pv_index[row]),
+                Exception(
+                    f"Fault for {self.faults[row].pv} has neither 'Fault if"
+                    " equal to' nor 'OK if equal to' parameter"
+                ),
+            )
+
+        fault_rows = np.full(len(counts), -1, dtype=np.intp)
+        fault_rows[stopped] = stop_rows
+        severity = np.zeros(len(counts), dtype=np.int16)
+        severity[stopped] = np.where(
+            stop_invalid, EPICS_INVALID_VAL, self.severity[stop_rows]
+        )
+        invalid_states = np.zeros(len(counts), dtype=bool)
+        invalid_states[stopped] = stop_invalid
+        return FaultStates(fault_rows, severity, invalid_states, stop_errors)
@@ -1,6 +1,9 @@
-from datetime import datetime
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
     BackendCavity,
@@ -8,50 +11,298 @@ from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
 from sc_linac_physics.displays.cavity_display.backend.backend_machine import (
     BackendMachine,
 )
+from sc_linac_physics.displays.cavity_display.backend.fault_predicates import (
+    FaultPredicates,
+)
 from sc_linac_physics.displays.cavity_display.utils.utils import (
     DEBUG,
     BACKEND_SLEEP_TIME,
 )
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import (
+    PV,
+    PVConnectionError,
+    PVGetError,
+    PVInvalidError,
+    PVPutError,
+)
+
+HEARTBEAT_PV = "PHYS:SYS0:1:SC_CAV_FAULT_HEARTBEAT"
+
+# Seconds an idle shard waits for fault PV changes before beating anyway
+SHARD_IDLE_TIMEOUT = 1
+
+# Seconds between full checks of a shard, in case a change was missed
+FULL_CHECK_INTERVAL = 60
+
+# How cavities can be split between shards, each checked by its own thread
+SHARD_KEYS: Dict[str, Callable[[BackendCavity], str]] = {
+    "linac": lambda cavity: cavity.linac.name,
+    "cryomodule": lambda cavity: cavity.cryomodule.name,
+}
+
+
+class FaultShard:
+    """
+    A group of cavities checked and published together, with its own
+    heartbeat so a slow or stuck IOC only stalls the shard it belongs to.
+
+    Cavities are marked dirty when one of their fault PVs changes (see
+    Runner.watch), so only those need checking again.
+
+    A vectorized shard compiles its cavities' faults into FaultPredicates
+    and finds every cavity's fault in one numpy pass before publishing,
+    with the same results as checking them one by one.
+    """
+
+    def __init__(
+        self, name: str, cavities: List[BackendCavity], vectorized=False
+    ):
+        self.name = name
+        self.cavities = cavities
+        self.predicates: Optional[FaultPredicates] = (
+            FaultPredicates(cavities) if vectorized else None
+        )
+        self.heartbeat_pv = f"{HEARTBEAT_PV}_{name}"
+        self._heartbeat_pv_obj: Optional[PV] = None
+        self.cycles = 0
+        self.cycle_time: Optional[float] = None
+
+        # Insertion ordered, so cavities are checked in shard order
+        self._dirty: Dict[BackendCavity, None] = {}
+        self._dirty_changed = threading.Condition()
+
+    def __str__(self):
+        return f"Fault shard {self.name}"
+
+    @property
+    def heartbeat_pv_obj(self) -> PV:
+        # Created once even if nothing serves it yet: channel access keeps
+        # searching for it in the background
+        if not self._heartbeat_pv_obj:
+            self._heartbeat_pv_obj = PV(
+                self.heartbeat_pv, require_connection=False
+            )
+        return self._heartbeat_pv_obj
+
+    def beat(self):
+        """
+        Write the cycle count to the heartbeat PV, once it is connected. A
+        put to an unserved PV would wait out its connection timeout and
+        count against the PHYS:SYS0:1 circuit breaker, which the aggregate
+        heartbeat shares.
+        """
+        pv_obj = self.heartbeat_pv_obj
+        if not pv_obj.connected:
+            return
+        try:
+            pv_obj.put(self.cycles)
+        except (PVConnectionError, PVPutError) as e:
+            print(f"Write to {self} heartbeat PV failed with error: {e}")
+
+    def mark_dirty(self, cavity: BackendCavity):
+        with self._dirty_changed:
+            self._dirty[cavity] = None
+            self._dirty_changed.notify_all()
+
+    def take_dirty(
+        self, timeout: Optional[float] = None
+    ) -> List[BackendCavity]:
+        """Wait up to timeout seconds for dirty cavities and clear them"""
+        with self._dirty_changed:
+            self._dirty_changed.wait_for(lambda: self._dirty, timeout)
+            dirty = list(self._dirty)
+            self._dirty.clear()
+        return dirty
+
+    def check_faults(self, cavities: Optional[List[BackendCavity]] = None):
+        """
+        Check and publish cavities (all of the shard's by default), each
+        stopping at its highest priority fault
+        """
+        start = time.monotonic()
+        if self.predicates:
+            self._publish_checked(cavities)
+        else:
+            for cavity in self.cavities if cavities is None else cavities:
+                cavity.run_through_faults()
+        self.cycle_time = time.monotonic() - start
+        self.cycles += 1
+        if DEBUG:
+            print(f"{self} cycle took {self.cycle_time:.3f} s")
+            sleep(max(BACKEND_SLEEP_TIME - self.cycle_time, 0))
+        self.beat()
+
+    def _publish_checked(self, cavities: Optional[List[BackendCavity]]):
+        predicates = self.predicates
+        states = predicates.check(cavities)
+        for position, cavity in enumerate(
+            predicates.cavities if cavities is None else cavities
+        ):
+            if position in states.errors:
+                raise states.errors[position]
+            row = int(states.rows[position])
+            fault = predicates.faults[row] if row >= 0 else None
+            invalid = bool(states.invalid[position])
+            if invalid:
+                print(PVInvalidError(fault.pv), " is disconnected")
+            cavity.publish_fault(fault, invalid)
 
 
 class Runner:
-    def __init__(self, lazy_fault_pvs=False):
-        self.watcher_pv = "PHYS:SYS0:1:SC_CAV_FAULT_HEARTBEAT"
+    """
+    Checks every backend cavity's faults, split into shards (one per linac by
+    default) that are checked concurrently and publish independently. Each
+    shard has its own heartbeat; the original heartbeat PV is the aggregate
+    and advances once every shard has completed another cycle.
+
+    While running, a shard only rechecks the cavities whose fault PVs have
+    changed, as soon as they change, plus a full check every
+    FULL_CHECK_INTERVAL. An idle shard still cycles (and beats) every
+    SHARD_IDLE_TIMEOUT.
+    """
+
+    def __init__(
+        self, lazy_fault_pvs=False, shard_by: str = "linac", vectorized=False
+    ):
+        """
+        @param shard_by: a SHARD_KEYS key, "linac" or "cryomodule"
+        @param vectorized: check each shard with compiled FaultPredicates
+        """
+        self.watcher_pv = HEARTBEAT_PV
         self._watcher_pv_obj: Optional[PV] = None
+        self.machine = BackendMachine(lazy_fault_pvs=lazy_fault_pvs)
         self.backend_cavities: List[BackendCavity] = list(
-            BackendMachine(lazy_fault_pvs=lazy_fault_pvs).all_iterator
+            self.machine.all_iterator
         )
 
+        shard_key = SHARD_KEYS[shard_by]
+        shard_cavities: Dict[str, List[BackendCavity]] = {}
+        for cavity in self.backend_cavities:
+            shard_cavities.setdefault(shard_key(cavity), []).append(cavity)
+        self.shards: List[FaultShard] = [
+            FaultShard(name, cavities, vectorized=vectorized)
+            for name, cavities in shard_cavities.items()
+        ]
+        self._shard_of: Dict[BackendCavity, FaultShard] = {
+            cavity: shard for shard in self.shards for cavity in shard.cavities
+        }
+
+        self._cycle_done = threading.Condition()
+        self._shard_error: Optional[BaseException] = None
+        self._stop = threading.Event()
+
     @property
     def watcher_pv_obj(self):
         if not self._watcher_pv_obj:
             self._watcher_pv_obj = PV(self.watcher_pv)
         return self._watcher_pv_obj
 
-    def check_faults(self):
-        start = datetime.now()
-        for cavity in self.backend_cavities:
-            cavity.run_through_faults()
-        if DEBUG:
-            delta = (datetime.now() - start).total_seconds()
-            sleep(
-                BACKEND_SLEEP_TIME - delta if delta < BACKEND_SLEEP_TIME else 0
-            )
+    @property
+    def cycle_times(self) -> Dict[str, Optional[float]]:
+        """Seconds each shard's last cycle took"""
+        return {shard.name: shard.cycle_time for shard in self.shards}
+
+    def beat(self):
         try:
             self.watcher_pv_obj.put(self.watcher_pv_obj.get() + 1)
-        except TypeError as e:
+        except (TypeError, PVConnectionError, PVGetError, PVPutError) as e:
             print(f"Write to watcher PV failed with error: {e}")
 
+    def check_faults(self):
+        """Check every shard once, concurrently"""
+        with ThreadPoolExecutor(max_workers=len(self.shards)) as executor:
+            futures = [
+                executor.submit(shard.check_faults) for shard in self.shards
+            ]
+            for future in futures:
+                future.result()
+        self.beat()
+
+    def watch(self):
+        """Mark cavities dirty in their shards when their fault PVs change"""
+        self.machine.fault_index.watch(
+            lambda cavity: self._shard_of[cavity].mark_dirty(cavity)
+        )
+
+    def _run_shard(self, shard: FaultShard):
+        try:
+            last_full_check = None
+            while not self._stop.is_set():
+                if (
+                    last_full_check is None
+                    or time.monotonic() - last_full_check >= FULL_CHECK_INTERVAL
+                ):
+                    last_full_check = time.monotonic()
+                    shard.take_dirty(timeout=0)
+                    shard.check_faults()
+                else:
+                    shard.check_faults(shard.take_dirty(SHARD_IDLE_TIMEOUT))
+                with self._cycle_done:
+                    self._cycle_done.notify_all()
+        except Exception as e:
+            with self._cycle_done:
+                self._shard_error = e
+                self._cycle_done.notify_all()
+
     def run(self):
-        """Run the fault checker continuously."""
+        """
+        Run the fault checker continuously, each shard at its own pace
+        @raises: the first error a shard stopped on, like the serial checker
+        """
         self.watcher_pv_obj.put(0)
-        while True:
-            self.check_faults()
+        # Before the first full checks, so no change is missed
+        self.watch()
+        for shard in self.shards:
+            threading.Thread(
+                target=self._run_shard,
+                args=(shard,),
+                name=str(shard),
+                daemon=True,
+            ).start()
+
+        counted = {shard.name: shard.cycles for shard in self.shards}
+        while not self._stop.is_set():
+            with self._cycle_done:
+                self._cycle_done.wait_for(
+                    lambda: self._shard_error
+                    or self._stop.is_set()
+                    or all(
+                        shard.cycles > counted[shard.name]
+                        for shard in self.shards
+                    )
+                )
+                if self._shard_error:
+                    self._stop.set()
+                    raise self._shard_error
+            if self._stop.is_set():
+                break
+            counted = {shard.name: shard.cycles for shard in self.shards}
+            self.beat()
+
+    def stop(self):
+        """Stop run (and its shards) after their current cycles"""
+        with self._cycle_done:
+            self._stop.set()
+            self._cycle_done.notify_all()
+
 
+def main(argv: Optional[List[str]] = None):
+    """
+    Run the fault checker. Faults are found with compiled FaultPredicates,
+    which give the same results as checking each cavity in turn; --serial
+    goes back to run_through_faults.
+    """
+    parser = argparse.ArgumentParser(
+        description="Check and publish every cavity's faults"
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Check each cavity's faults one by one instead of vectorized",
+    )
+    args = parser.parse_args(argv)
 
-def main():
-    runner = Runner(lazy_fault_pvs=False)
+    runner = Runner(lazy_fault_pvs=False, vectorized=not args.serial)
     runner.run()
 
 
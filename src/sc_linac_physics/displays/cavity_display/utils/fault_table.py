@@ -0,0 +1,319 @@
+import hashlib
+import os
+import tempfile
+from csv import DictReader
+from pathlib import Path
+from string import Formatter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from sc_linac_physics.displays.cavity_display.utils.utils import (
+    SpreadsheetError,
+    display_hash,
+)
+from sc_linac_physics.utils.sc_linac.linac_utils import cache_dir
+
+# Bump when the columns or their validation change, so stale cache files are
+# rebuilt instead of loaded
+TABLE_VERSION = 1
+
+FAULTS_CSV = Path(__file__).parent / "faults.csv"
+
+
+class FaultTemplate(NamedTuple):
+    tlc: str
+    short_description: str
+    long_description: str
+    action: str
+    level: str
+    cm_type: str
+    button_type: str
+    button_path: str
+    button_macros: str
+    rack: str
+    prefix: str
+    suffix: str
+    ok_value: str
+    fault_value: str
+    severity: str
+    generic_description: str
+
+
+# Spreadsheet header of each FaultTemplate field
+CSV_COLUMNS: Dict[str, str] = dict(
+    zip(
+        FaultTemplate._fields,
+        (
+            "Three Letter Code",
+            "Short Description",
+            "Long Description",
+            "Recommended Corrective Actions",
+            "Level",
+            "CM Type",
+            "Button Type",
+            "Button Path",
+            "Button Macros",
+            "Rack",
+            "PV Prefix",
+            "PV Suffix",
+            "OK If Equal To",
+            "Faulted If Equal To",
+            "Severity",
+            "Generic Short Description for Decoder",
+        ),
+    )
+)
+
+# The fields each level may use in its PV prefix. CAV and SSA faults are
+# addressed from the cavity and SSA prefixes, so their prefixes are unused.
+PREFIX_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "RACK": ("LINAC", "CRYOMODULE", "RACK", "CAVITY"),
+    "CRYO": ("CRYOMODULE", "CAVITY"),
+    "CM": ("LINAC", "CRYOMODULE", "CAVITY"),
+    "ALL": (),
+    "CAV": None,
+    "SSA": None,
+}
+LEVELS = tuple(PREFIX_FIELDS)
+
+
+class FaultTable:
+    """
+    The fault spreadsheet compiled once into immutable columns: one numpy
+    string array per FaultTemplate field, plus the level of each row as an
+    index into LEVELS and the key every cavity files that fault under.
+
+    for_cavity selects a cavity's rows with array comparisons and fills in
+    the PV prefix templates for all of them at once. for_csv keeps the
+    compiled table on disk keyed by a hash of the spreadsheet, so cold
+    starts skip parsing and validation.
+
+        for template, key, pv in table.for_cavity(cavity):
+            ...
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns: Dict[str, np.ndarray] = {}
+        for field in FaultTemplate._fields:
+            column = np.asarray(columns[field], dtype=str)
+            column.flags.writeable = False
+            self.columns[field] = column
+
+        self.levels = np.asarray(
+            [LEVELS.index(level) for level in self.columns["level"].tolist()],
+            dtype=np.int8,
+        )
+        self.levels.flags.writeable = False
+        self.templates: Tuple[FaultTemplate, ...] = tuple(
+            FaultTemplate(*row)
+            for row in zip(
+                *(self.columns[f].tolist() for f in FaultTemplate._fields)
+            )
+        )
+        # display_hash uses the process's string hashes, so it is never
+        # stored with the table
+        self.keys: Tuple[int, ...] = tuple(
+            display_hash(
+                rack=template.rack,
+                fault_condition=template.fault_value,
+                ok_condition=template.ok_value,
+                tlc=template.tlc,
+                suffix=template.suffix,
+                prefix=template.prefix,
+            )
+            for template in self.templates
+        )
+
+    def __len__(self):
+        return len(self.templates)
+
+    def __iter__(self) -> Iterator[FaultTemplate]:
+        return iter(self.templates)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, str]]) -> "FaultTable":
+        """
+        Compile spreadsheet rows keyed by header, skipping rows without a PV
+        suffix
+        @raises SpreadsheetError: if a column is missing, a level is unknown
+                                  or a PV prefix uses fields its level lacks
+        """
+        rows: List[FaultTemplate] = []
+        for number, record in enumerate(records, start=1):
+            missing = [
+                column
+                for column in CSV_COLUMNS.values()
+                if column not in record
+            ]
+            if missing:
+                raise SpreadsheetError(
+                    f"Fault spreadsheet is missing columns {missing}"
+                )
+            if not record["PV Suffix"]:
+                continue
+            template = FaultTemplate(
+                *(record[column] or "" for column in CSV_COLUMNS.values())
+            )
+            _validate(template, number)
+            rows.append(template)
+
+        return cls(
+            {
+                field: [getattr(row, field) for row in rows]
+                for field in FaultTemplate._fields
+            }
+        )
+
+    @classmethod
+    def from_csv(cls, path: Union[str, Path] = FAULTS_CSV) -> "FaultTable":
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            return cls.from_records(DictReader(f))
+
+    @classmethod
+    def for_csv(cls, path: Union[str, Path] = FAULTS_CSV) -> "FaultTable":
+        """
+        Load the compiled table for the spreadsheet at path from the disk
+        cache, compiling and caching it on a miss
+        """
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(str(TABLE_VERSION).encode() + f.read())
+        cache_path = cache_dir() / f"fault_table_{digest.hexdigest()}.npy"
+
+        try:
+            return cls.load(cache_path)
+        except (OSError, ValueError):
+            pass
+
+        table = cls.from_csv(path)
+        try:
+            table.save(cache_path)
+        except OSError:
+            # A read-only home only costs the compile next time
+            pass
+        return table
+
+    def save(self, path: Union[str, Path]):
+        """
+        Write atomically to path as one npy string matrix (no pickled
+        objects), a row per FaultTemplate field
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        matrix = np.stack(
+            [self.columns[field] for field in FaultTemplate._fields]
+        )
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, matrix, allow_pickle=False)
+            # mkstemp creates the file private to the user
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "FaultTable":
+        """
+        @raises OSError: if path cannot be read
+        @raises ValueError: if path is not a saved table
+        """
+        matrix = np.load(path, allow_pickle=False)
+        if matrix.ndim != 2 or len(matrix) != len(FaultTemplate._fields):
+            raise ValueError(f"{path} is not a fault table")
+        return cls(dict(zip(FaultTemplate._fields, matrix)))
+
+    def records(self) -> List[Dict[str, str]]:
+        """The rows as the spreadsheet has them, keyed by header"""
+        return [
+            {
+                CSV_COLUMNS[field]: value
+                for field, value in row._asdict().items()
+            }
+            for row in self.templates
+        ]
+
+    def mask(self, rack: str, harmonic_linearizer: bool) -> np.ndarray:
+        """
+        Rows that apply to a cavity in rack: a rack's faults only apply to
+        its own cavities, and CM faults only to their type of cryomodule
+        """
+        levels = self.levels
+        cm_type = self.columns["cm_type"]
+        skipped_type = "1.3" if harmonic_linearizer else "3.9"
+        return ~(
+            ((levels == LEVELS.index("RACK")) & (self.columns["rack"] != rack))
+            | ((levels == LEVELS.index("CM")) & (cm_type == skipped_type))
+        )
+
+    def pvs(self, cavity, mask: np.ndarray) -> List[str]:
+        """PV names of the masked rows' faults for cavity"""
+        levels = self.levels[mask]
+        suffixes = self.columns["suffix"][mask]
+
+        # Fields missing from a level's prefix were rejected at compile time,
+        # so filling every field in every row matches formatting each prefix
+        prefixes = self.columns["prefix"][mask]
+        for field, value in (
+            ("LINAC", cavity.linac.name),
+            ("CRYOMODULE", cavity.cryomodule.name),
+            ("RACK", cavity.rack.rack_name),
+            ("CAVITY", cavity.number),
+        ):
+            prefixes = np.char.replace(prefixes, f"{{{field}}}", str(value))
+        pvs = np.char.add(prefixes, suffixes).tolist()
+
+        cav_rows = np.flatnonzero(levels == LEVELS.index("CAV")).tolist()
+        cav_pvs = np.char.add(cavity.pv_prefix, suffixes[cav_rows]).tolist()
+        for i, pv in zip(cav_rows, cav_pvs):
+            pvs[i] = pv
+        # HL SSAs share some signals, so each SSA suffix needs the SSA to
+        # address it
+        for i in np.flatnonzero(levels == LEVELS.index("SSA")).tolist():
+            pvs[i] = cavity.ssa.pv_addr(str(suffixes[i]))
+        return pvs
+
+    def for_cavity(self, cavity) -> Iterator[Tuple[FaultTemplate, int, str]]:
+        """
+        The template, key and PV name of every fault that applies to cavity,
+        in spreadsheet order
+        """
+        mask = self.mask(
+            cavity.rack.rack_name, cavity.cryomodule.is_harmonic_linearizer
+        )
+        rows = np.flatnonzero(mask).tolist()
+        return zip(
+            (self.templates[i] for i in rows),
+            (self.keys[i] for i in rows),
+            self.pvs(cavity, mask),
+        )
+
+
+def _validate(template: FaultTemplate, number: int):
+    if template.level not in PREFIX_FIELDS:
+        raise SpreadsheetError(
+            f"Unexpected fault level {template.level!r} in row {number} of the"
+            f" fault spreadsheet"
+        )
+    allowed = PREFIX_FIELDS[template.level]
+    if allowed is None:
+        return
+    try:
+        parsed = list(Formatter().parse(template.prefix))
+    except ValueError as e:
+        raise SpreadsheetError(
+            f"Bad PV prefix {template.prefix!r} in row {number} of the fault"
+            f" spreadsheet: {e}"
+        )
+    # Only plain {FIELD}s, which for_cavity fills by replacement
+    for literal, field, spec, conversion in parsed:
+        escaped = "{" in literal or "}" in literal
+        if escaped or spec or conversion or field not in (None, *allowed):
+            raise SpreadsheetError(
+                f"PV prefix {template.prefix!r} in row {number} of the fault"
+                f" spreadsheet can only use {allowed} for {template.level}"
+                f" faults"
+            )
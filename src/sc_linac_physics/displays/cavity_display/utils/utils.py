@@ -1,5 +1,3 @@
-import os
-from csv import DictReader
 from datetime import datetime, timedelta
 from typing import Dict, List
 
@@ -13,15 +11,25 @@ SEVERITY_SUFFIX = "CUDSEVR"
 DESCRIPTION_SUFFIX = "CUDDESC"
 RF_STATUS_SUFFIX = "RFSTATE"
 
+_fault_table = None
+
+
+def fault_table():
+    """The compiled fault spreadsheet, loaded once per process"""
+    global _fault_table
+    if _fault_table is None:
+        # fault_table builds on this module's helpers
+        from sc_linac_physics.displays.cavity_display.utils.fault_table import (
+            FaultTable,
+        )
+
+        _fault_table = FaultTable.for_csv()
+    return _fault_table
+
 
 def parse_csv() -> List[Dict]:
-    this_dir = os.path.dirname(__file__)
-    path = os.path.join(this_dir, "faults.csv")
-    faults: List[Dict] = []
-    for row in DictReader(open(path, encoding="utf-8-sig")):
-        if row["PV Suffix"]:
-            faults.append(row)
-    return faults
+    """The fault spreadsheet's rows with a PV suffix, keyed by header"""
+    return fault_table().records()
 
 
 def display_hash(
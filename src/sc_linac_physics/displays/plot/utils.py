@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple, Union
 
@@ -14,6 +15,12 @@ from PyQt5.QtWidgets import (
 )
 from qtpy.QtWidgets import QDialog, QScrollArea, QGridLayout
 
+from sc_linac_physics.utils.sc_linac.pv_descriptors import instance_attributes
+from sc_linac_physics.utils.sc_linac.pv_table import (
+    PVNameTable,
+    is_pv_attribute as _is_pv_attribute,
+)
+
 
 class AxisRangeDialog(QDialog):
     """Dialog for controlling Y-axis ranges."""
@@ -255,13 +262,6 @@ class HierarchicalPVs:
         return self.cavities.get((cm_name, cav_num))
 
 
-def _is_pv_attribute(attr_name: str) -> bool:
-    """Check if attribute name indicates it's a PV."""
-    return (
-        attr_name.endswith("_pv") or attr_name.endswith("_pvs")
-    ) and not attr_name.endswith("_pv_obj")
-
-
 class PVExtractor:
     """Helper class to extract PVs from hierarchy and organize them."""
 
@@ -388,8 +388,9 @@ class PVExtractor:
         self.add_to_cavity_group(pv_key, pv_list)
 
     def process_child_container(self, child_container: Any):
-        """Process a child container (dict, list, or single object)."""
-        if isinstance(child_container, dict):
+        """Process a child container (mapping, list, or single object)."""
+        # Lazy machines hold their children in a LazyDict, not a dict
+        if isinstance(child_container, Mapping):
             for child_obj in child_container.values():
                 self.extract_pvs(child_obj)
         elif isinstance(child_container, (list, tuple)):
@@ -409,7 +410,7 @@ class PVExtractor:
         self.update_context(obj_type, current_obj)
 
         # Extract PVs
-        for attr, value in vars(current_obj).items():
+        for attr, value in instance_attributes(current_obj).items():
             if _is_pv_attribute(attr):
                 pv_list = value if isinstance(value, list) else [value]
                 pv_key = (obj_type, attr)
@@ -422,13 +423,26 @@ class PVExtractor:
             if child_container is not None:
                 self.process_child_container(child_container)
 
+    def extract_table(self, table: PVNameTable):
+        """Fill the groupings from a PV name table instead of by reflection."""
+        for row in table.rows():
+            self.context = {
+                "machine": table,
+                "linac_name": row.linac or None,
+                "cryomodule_name": row.cryomodule or None,
+                "rack_name": row.rack or None,
+                "cavity_number": row.cavity or None,
+            }
+            self.add_to_all_groups((row.source, row.attr), [row.pvname])
+
 
 def get_pvs_all_groupings(obj: Any) -> HierarchicalPVs:
     """
     Extract PVs grouped by ALL hierarchy levels in a single traversal.
 
     Args:
-        obj: Root object (typically Machine or Linac)
+        obj: Root object (typically Machine or Linac). Objects with a
+             pv_table (Machine) are read from the table instead of walked.
 
     Returns:
         HierarchicalPVs object with PVs organized by machine, linac, cryomodule, rack, and cavity.
@@ -444,5 +458,9 @@ def get_pvs_all_groupings(obj: Any) -> HierarchicalPVs:
         l0b_pvs = all_pvs.get_linac('L0B')
     """
     extractor = PVExtractor()
-    extractor.extract_pvs(obj)
+    table = getattr(obj, "pv_table", None)
+    if isinstance(table, PVNameTable):
+        extractor.extract_table(table)
+    else:
+        extractor.extract_pvs(obj)
     return extractor.result
@@ -22,6 +22,45 @@ Batch Operations:
     >>>
     >>> # Low-level batch read (fastest for one-time operations)
     >>> values = PVBatch.get_values(["PV:1", "PV:2", "PV:3"])
+    >>>
+    >>> # Persistent channel set for repeated snapshots
+    >>> batch = PVBatch(["PV:1", "PV:2", "PV:3"])
+    >>> values, invalid = batch.get()  # NumPy array + disconnected mask
+
+Shared Instances:
+    >>> # Plain PV(name) calls share one reference-counted instance
+    >>> a = PV("SOME:PV:NAME")
+    >>> b = PV("SOME:PV:NAME")
+    >>> assert a is b
+    >>> a.release()  # channel stays open until b is released too
+    >>> lease = PV.lease("SOME:PV:NAME")  # a reference released only once
+    >>> lease.release(); lease.release()  # second call does nothing
+
+Asyncio:
+    >>> from sc_linac_physics.utils.epics import AsyncPV
+    >>> apv = AsyncPV("SOME:PV:NAME")
+    >>> await apv.put(1)
+    >>> await apv.wait_for(lambda value: value == 1, timeout=10)
+
+Waiting on State Changes:
+    >>> from sc_linac_physics.utils.epics import PV, wait_until
+    >>> wait_until(PV("SOME:STATUS"), lambda status: status == 1, timeout=30)
+
+Alarm Snapshots:
+    >>> snap = PV("SOME:PV:NAME").snapshot()  # value + alarm, one sample
+    >>> snap.value, snap.severity, snap.status, snap.timestamp
+    >>> records = PV.snapshot_many(pvs)  # structured array (SNAPSHOT_DTYPE)
+    >>> faulted = records["valid"] & (records["value"] != 0)
+
+Metrics:
+    >>> from sc_linac_physics.utils.epics import PV_METRICS
+    >>> PV_METRICS.prefix_stats("ACCL:L0B:0110")["timeouts"]
+    >>> print(PV_METRICS.to_prometheus())
+
+Circuit Breakers:
+    >>> from sc_linac_physics.utils.epics import PV_BREAKERS
+    >>> PV_BREAKERS.state("ACCL:L0B:0110")  # 'closed', 'open' or 'half_open'
+    >>> PV_BREAKERS.reset()  # close every breaker, e.g. after an IOC reboot
 
 Custom Configuration:
     >>> from sc_linac_physics.utils.epics import PV, PVConfig
@@ -51,9 +90,15 @@ from .config import (
     EPICS_MAJOR_VAL,
     EPICS_INVALID_VAL,
 )
+from .connection import ConnectionReport, ConnectionWaiter
 
 # Core functionality
 from .core import PV
+from .async_pv import AsyncPV
+from .breaker import CircuitBreaker, PVCircuitBreakers, PV_BREAKERS
+from .metrics import PVMetrics, PV_METRICS
+from .registry import PVLease, PVRegistry, PV_REGISTRY
+from .snapshot import PVSnapshot, SNAPSHOT_DTYPE
 from .exceptions import (
     PVConnectionError,
     PVGetError,
@@ -66,11 +111,23 @@ from .testing import make_mock_pv
 
 # Utilities
 from .utils import create_pv_safe, diagnose_pv_connection
+from .wait import wait_until
 
 __all__ = [
     # Core
     "PV",
+    "AsyncPV",
     "PVConfig",
+    "PVRegistry",
+    "PV_REGISTRY",
+    "PVLease",
+    "PVSnapshot",
+    "SNAPSHOT_DTYPE",
+    "PVMetrics",
+    "PV_METRICS",
+    "CircuitBreaker",
+    "PVCircuitBreakers",
+    "PV_BREAKERS",
     # Constants
     "EPICS_NO_ALARM_VAL",
     "EPICS_MINOR_VAL",
@@ -83,9 +140,12 @@ __all__ = [
     "PVInvalidError",
     # Batch operations
     "PVBatch",
+    "ConnectionReport",
+    "ConnectionWaiter",
     # Utilities
     "create_pv_safe",
     "diagnose_pv_connection",
+    "wait_until",
     # Testing
     "make_mock_pv",
 ]
@@ -0,0 +1,340 @@
+import asyncio
+from functools import partial
+from time import monotonic
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from sc_linac_physics.utils.epics.config import PVConfig
+from sc_linac_physics.utils.epics.core import PV
+from sc_linac_physics.utils.epics.exceptions import PVConnectionError
+from sc_linac_physics.utils.epics.logger import get_logger
+from sc_linac_physics.utils.epics.registry import PVLease
+
+
+class AsyncPV:
+    """
+    asyncio facade over the PV wrapper.
+
+    Reads of monitored channels are answered from the monitor cache, puts
+    complete through CA put callbacks and ``wait_for`` is woken by monitor
+    events, so a single event loop can drive many concurrent procedures
+    without an OS thread per cavity. Network gets that cannot be served from
+    the monitor run on the loop's default executor.
+
+    Retries follow the wrapped PV's PVConfig (max_retries, retry_delay with
+    linear backoff) and exhausted retries raise the same PVGetError /
+    PVPutError / PVConnectionError as the synchronous PV.
+    """
+
+    def __init__(self, pv: Union[str, PV], **pv_kwargs):
+        """
+        Args:
+            pv: Existing PV instance or a PV name to open
+            **pv_kwargs: Passed to PV(...) when a name is given
+        """
+        # This facade's own reference when it opened the PV
+        self._lease: Optional[PVLease] = None
+        if isinstance(pv, PV):
+            self.pv: PV = pv
+        else:
+            self._lease = PV.lease(pv, **pv_kwargs)
+            self.pv = self._lease.pv
+
+    @property
+    def pvname(self) -> str:
+        return self.pv.pvname
+
+    @property
+    def config(self) -> PVConfig:
+        return self.pv.config
+
+    @property
+    def connected(self) -> bool:
+        return self.pv.connected
+
+    def __str__(self) -> str:
+        return self.pv.pvname
+
+    def __repr__(self) -> str:
+        return f"AsyncPV({self.pv!r})"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def close(self):
+        """Release the underlying PV if this facade opened it (once)"""
+        if self._lease is not None:
+            self._lease.release()
+
+    async def ensure_connected(self, timeout: Optional[float] = None):
+        """
+        Wait for the channel to (re)connect without blocking the loop.
+
+        Raises:
+            PVConnectionError: If the channel does not connect in time
+        """
+        if self.pv.connected:
+            return
+        await self._run_blocking(self.pv._ensure_connected, timeout=timeout)
+
+    async def get(
+        self,
+        timeout: Optional[float] = None,
+        use_monitor: Optional[bool] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Get the PV value.
+
+        Args:
+            timeout: Timeout per attempt (defaults to config.get_timeout)
+            use_monitor: Serve the monitored value when available
+                         (defaults to the PV's auto_monitor setting)
+            **kwargs: Passed to epics.PV.get (count, as_string, as_numpy...)
+
+        Returns:
+            PV value (never None)
+
+        Raises:
+            PVConnectionError: If PV is not connected or its IOC's circuit
+                               breaker is open
+            PVGetError: If get operation fails after retries
+        """
+        timeout = timeout or self.config.get_timeout
+
+        if use_monitor is None:
+            use_monitor = self.pv.auto_monitor
+        if use_monitor and not kwargs:
+            value = self.pv._monitor_value
+            if value is not None and self.pv.connected:
+                return value
+
+        async def attempt():
+            return await self._run_blocking(
+                super(PV, self.pv).get,
+                timeout=timeout,
+                use_monitor=use_monitor,
+                **kwargs,
+            )
+
+        async def operation():
+            await self.ensure_connected(timeout=timeout)
+            return await self._execute_with_retry("get", attempt, timeout)
+
+        return await self._circuit(operation)
+
+    async def put(
+        self,
+        value: Any,
+        wait: bool = True,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Put a value, awaiting the CA completion callback when wait is True.
+
+        Args:
+            value: Value to write
+            wait: Await put completion
+            timeout: Completion timeout per attempt
+                     (defaults to config.put_timeout)
+
+        Raises:
+            PVConnectionError: If PV is not connected or its IOC's circuit
+                               breaker is open
+            PVPutError: If put operation fails after retries
+        """
+        timeout = timeout or self.config.put_timeout
+        loop = asyncio.get_running_loop()
+
+        async def attempt():
+            done = loop.create_future()
+
+            def on_complete(**kwargs):
+                loop.call_soon_threadsafe(_resolve, done, True)
+
+            status = super(PV, self.pv).put(
+                value,
+                wait=False,
+                use_complete=wait,
+                callback=on_complete if wait else None,
+            )
+            if status != 1 or not wait:
+                return status
+            try:
+                await asyncio.wait_for(done, timeout)
+            except asyncio.TimeoutError:
+                get_logger().debug(
+                    f"PV {self.pvname} put not confirmed within {timeout}s"
+                )
+                return None
+            return 1
+
+        async def operation():
+            await self.ensure_connected(timeout=timeout)
+            await self._execute_with_retry(
+                "put", attempt, timeout, context={"value": value}
+            )
+
+        await self._circuit(operation)
+
+    async def wait_for(
+        self,
+        predicate: Callable[[Any], bool],
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0,
+    ) -> Any:
+        """
+        Wait until predicate(value) is true.
+
+        Monitored PVs are re-checked on every monitor event; unmonitored PVs
+        fall back to polling every poll_interval seconds.
+
+        Args:
+            predicate: Called with each new value
+            timeout: Give up after this many seconds (None waits forever)
+            poll_interval: Poll period for PVs without a monitor
+
+        Returns:
+            The first value satisfying predicate
+
+        Raises:
+            TimeoutError: If the predicate is not met within timeout
+            PVConnectionError, PVGetError: If the PV cannot be read
+        """
+        try:
+            return await asyncio.wait_for(
+                self._wait_for(predicate, poll_interval), timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"PV {self.pvname} did not reach the requested state "
+                f"within {timeout}s"
+            ) from None
+
+    async def _wait_for(
+        self, predicate: Callable[[Any], bool], poll_interval: float
+    ) -> Any:
+        value = await self.get()
+        if predicate(value):
+            return value
+        if self.pv.auto_monitor:
+            return await self._wait_for_monitor(predicate)
+        return await self._wait_for_poll(predicate, poll_interval)
+
+    async def _wait_for_poll(
+        self, predicate: Callable[[Any], bool], poll_interval: float
+    ) -> Any:
+        while True:
+            await asyncio.sleep(poll_interval)
+            value = await self.get()
+            if predicate(value):
+                return value
+
+    async def _wait_for_monitor(self, predicate: Callable[[Any], bool]) -> Any:
+        loop = asyncio.get_running_loop()
+        matched = loop.create_future()
+
+        def check(new_value):
+            if matched.done():
+                return
+            try:
+                if predicate(new_value):
+                    matched.set_result(new_value)
+            except Exception as e:
+                matched.set_exception(e)
+
+        def on_update(value=None, **kwargs):
+            loop.call_soon_threadsafe(check, value)
+
+        index = self.pv.add_callback(on_update)
+        try:
+            # Catch a change that landed between the read and the subscribe
+            if self.pv._monitor_value is not None:
+                check(self.pv._monitor_value)
+            return await matched
+        finally:
+            self.pv.remove_callback(index)
+
+    async def _circuit(self, operation: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of PV._circuit"""
+        breakers = self.pv.breakers
+        if breakers is None:
+            return await operation()
+
+        breakers.check(self.pvname)
+        try:
+            result = await operation()
+        except Exception:
+            breakers.record_failure(self.pvname)
+            raise
+        breakers.record_success(self.pvname)
+        return result
+
+    async def _execute_with_retry(
+        self,
+        operation: str,
+        attempt: Callable[[], Awaitable[Any]],
+        timeout: float,
+        context: Optional[dict] = None,
+    ) -> Any:
+        """Async counterpart of PV._execute_with_retry"""
+        context = context or {}
+        last_exception = None
+        max_retries = self.config.max_retries
+        start = monotonic()
+        timeouts = 0
+
+        for attempt_number in range(1, max_retries + 1):
+            try:
+                result = await attempt()
+                if PV._operation_succeeded(operation, result):
+                    if attempt_number > 1:
+                        get_logger().info(
+                            f"PV {self.pvname} {operation} succeeded on "
+                            f"attempt {attempt_number}"
+                        )
+                    self.pv._record_operation(
+                        operation, start, attempt_number, timeouts
+                    )
+                    return result if operation == "get" else None
+                if result is None or result == -1:
+                    timeouts += 1
+                failure = "failed"
+            except Exception as e:
+                last_exception = e
+                failure = f"raised exception: {e}"
+
+            if attempt_number < max_retries:
+                get_logger().warning(
+                    f"PV {self.pvname} {operation} {failure} "
+                    f"(attempt {attempt_number}/{max_retries})"
+                )
+                await self._retry_backoff(attempt_number, timeout)
+
+        self.pv._record_operation(
+            operation, start, max_retries, timeouts, failed=True
+        )
+        self.pv._raise_operation_error(operation, last_exception, context)
+
+    async def _retry_backoff(self, attempt: int, timeout: float):
+        """Async counterpart of PV._retry_backoff"""
+        await asyncio.sleep(self.config.retry_delay * attempt)
+
+        if not self.pv.connected:
+            try:
+                await self.ensure_connected(timeout=timeout)
+            except PVConnectionError as e:
+                get_logger().debug(f"Reconnection attempt failed: {e}")
+
+    @staticmethod
+    async def _run_blocking(func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+def _resolve(future: asyncio.Future, result: Any):
+    if not future.done():
+        future.set_result(result)
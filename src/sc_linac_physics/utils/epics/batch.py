@@ -1,12 +1,253 @@
-from typing import List, Any
+import threading
+from numbers import Number
+from time import monotonic
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import epics
+import numpy as np
 
+from sc_linac_physics.utils.epics.connection import (
+    ConnectionReport,
+    ConnectionWaiter,
+)
 from sc_linac_physics.utils.epics.logger import get_logger
 
 
 class PVBatch:
-    """Utilities for batch PV operations using raw EPICS calls"""
+    """
+    Batch PV operations using raw EPICS calls.
+
+    The static ``get_values``/``put_values`` helpers are for one-off access.
+    For repeated reads or writes of the same PV list, create an instance: it
+    connects every channel once and keeps them open, so each ``get`` is a
+    single pipelined CA round trip with no channel churn.
+
+    Example:
+        >>> batch = PVBatch(["PV:1", "PV:2", "PV:3"])
+        >>> values, invalid = batch.get()  # float array + mask
+        >>> ok = batch.put([1.0, 2.0, 3.0])
+        >>> batch.close()
+    """
+
+    def __init__(
+        self,
+        pv_names: Sequence[str],
+        connection_timeout: float = 1.0,
+        timeout: float = 0.5,
+    ):
+        """
+        Create and connect a persistent channel for every PV.
+
+        Args:
+            pv_names: PV names; results keep this order (duplicates share
+                      one channel)
+            connection_timeout: Shared deadline for connecting all channels
+            timeout: Default shared deadline for get and put
+        """
+        self.pv_names: List[str] = list(pv_names)
+        self.timeout = timeout
+
+        unique_names = list(dict.fromkeys(self.pv_names))
+        waiter = ConnectionWaiter(len(unique_names))
+        channels: Dict[str, Optional[epics.PV]] = {}
+        for pv_name in unique_names:
+            channels[pv_name] = self._create_channel(
+                pv_name, connection_timeout, waiter
+            )
+        waiter.expect(sum(ch is not None for ch in channels.values()))
+
+        self._unique: List[Tuple[str, Optional[epics.PV]]] = list(
+            channels.items()
+        )
+        # Position of each requested name in the unique channel list
+        position = {name: i for i, name in enumerate(channels)}
+        self._index = np.fromiter(
+            (position[name] for name in self.pv_names),
+            dtype=np.intp,
+            count=len(self.pv_names),
+        )
+        self.connection_report: ConnectionReport = waiter.wait(
+            self._unique, connection_timeout
+        )
+        if self.connection_report.failed:
+            get_logger().warning(
+                f"PVBatch: {len(self.connection_report.failed)} of "
+                f"{len(unique_names)} PVs not connected: "
+                f"{self.connection_report.failed[:10]}"
+            )
+
+    @staticmethod
+    def _create_channel(
+        pv_name: str, connection_timeout: float, waiter: ConnectionWaiter
+    ) -> Optional[epics.PV]:
+        try:
+            channel = epics.PV(
+                pv_name,
+                auto_monitor=False,
+                connection_timeout=connection_timeout,
+                connection_callback=waiter.callback,
+            )
+        except Exception as e:
+            get_logger().warning(f"Failed to create channel {pv_name}: {e}")
+            return None
+        if channel.connected:
+            waiter.mark_connected(pv_name)
+        return channel
+
+    def __len__(self) -> int:
+        return len(self.pv_names)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    @property
+    def connected(self) -> np.ndarray:
+        """Boolean array, True where the PV's channel is connected"""
+        unique = np.fromiter(
+            (ch is not None and ch.connected for _, ch in self._unique),
+            dtype=bool,
+            count=len(self._unique),
+        )
+        return unique[self._index]
+
+    def get(
+        self, timeout: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read every PV in one pipelined round trip.
+
+        All gets are issued and flushed before any reply is awaited, and the
+        replies share one deadline.
+
+        Args:
+            timeout: Shared deadline for all replies (defaults to self.timeout)
+
+        Returns:
+            (values, invalid): values is a float64 array when every value
+            read is a numeric scalar (NaN where invalid), otherwise an object
+            array (None where invalid). invalid is a boolean array marking
+            disconnected PVs and PVs that did not answer in time.
+        """
+        unique_values = self._read(timeout or self.timeout)
+        values = [unique_values[i] for i in self._index]
+        invalid = np.fromiter(
+            (value is None for value in values), dtype=bool, count=len(values)
+        )
+
+        if all(_is_scalar(v) for v in values if v is not None):
+            return (
+                np.array(
+                    [np.nan if v is None else v for v in values], dtype=float
+                ),
+                invalid,
+            )
+
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array, invalid
+
+    def _read(self, timeout: float) -> List[Any]:
+        issued = []
+        for position, (pv_name, channel) in enumerate(self._unique):
+            if channel is None or not channel.connected:
+                continue
+            try:
+                epics.ca.get(channel.chid, ftype=channel.ftype, wait=False)
+                issued.append(position)
+            except Exception as e:
+                get_logger().debug(f"Batch get not issued for {pv_name}: {e}")
+        epics.ca.flush_io()
+
+        values: List[Any] = [None] * len(self._unique)
+        deadline = monotonic() + timeout
+        for position in issued:
+            pv_name, channel = self._unique[position]
+            try:
+                values[position] = epics.ca.get_complete(
+                    channel.chid,
+                    ftype=channel.ftype,
+                    timeout=max(deadline - monotonic(), 0.001),
+                    as_numpy=True,
+                )
+            except Exception as e:
+                get_logger().debug(f"Batch get failed for {pv_name}: {e}")
+        return values
+
+    def put(
+        self,
+        values: Sequence[Any],
+        wait: bool = True,
+        timeout: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Write one value per PV, issuing every put before waiting on any.
+
+        Args:
+            values: Values in the same order as pv_names
+            wait: Wait for put completion callbacks (shared deadline)
+            timeout: Completion deadline (defaults to self.timeout)
+
+        Returns:
+            Boolean array, True where the put was issued (and confirmed
+            when wait is True)
+
+        Raises:
+            ValueError: If values and pv_names lengths don't match
+        """
+        if len(values) != len(self.pv_names):
+            raise ValueError(
+                f"Length mismatch: {len(self.pv_names)} PVs "
+                f"but {len(values)} values"
+            )
+
+        timeout = timeout or self.timeout
+        ok = np.zeros(len(self.pv_names), dtype=bool)
+        completions = {}
+        for position, value in enumerate(values):
+            pv_name, channel = self._unique[self._index[position]]
+            if channel is None or not channel.connected:
+                continue
+            done = threading.Event()
+            try:
+                status = channel.put(
+                    value,
+                    wait=False,
+                    use_complete=wait,
+                    callback=(
+                        (lambda done=done, **kwargs: done.set())
+                        if wait
+                        else None
+                    ),
+                )
+            except Exception as e:
+                get_logger().warning(f"Failed to put {pv_name}={value}: {e}")
+                continue
+            if status != 1:
+                continue
+            if wait:
+                completions[position] = done
+            else:
+                ok[position] = True
+
+        deadline = monotonic() + timeout
+        for position, done in completions.items():
+            ok[position] = done.wait(max(deadline - monotonic(), 0))
+        return ok
+
+    def close(self):
+        """Disconnect every channel held by this batch"""
+        for pv_name, channel in self._unique:
+            if channel is None:
+                continue
+            try:
+                channel.disconnect()
+            except Exception as e:
+                get_logger().debug(f"Error disconnecting {pv_name}: {e}")
+        self._unique = [(name, None) for name, _ in self._unique]
 
     @staticmethod
     def get_values(
@@ -17,7 +258,9 @@ class PVBatch:
         Batch read multiple PV values efficiently using epics.caget_many().
 
         This is faster than creating PV objects when you only need to read
-        values once and don't need the full PV interface.
+        values once and don't need the full PV interface. Channels are
+        created and torn down on every call; use a PVBatch instance to read
+        the same PVs repeatedly.
 
         Args:
             pv_names: List of PV names to read
@@ -88,3 +331,9 @@ class PVBatch:
                 results.append(False)
 
         return results
+
+
+def _is_scalar(value: Any) -> bool:
+    return isinstance(value, Number) or (
+        isinstance(value, np.ndarray) and value.ndim == 0
+    )
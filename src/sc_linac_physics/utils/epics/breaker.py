@@ -0,0 +1,214 @@
+import threading
+from time import monotonic
+from typing import Dict, Optional
+
+from sc_linac_physics.utils.epics.exceptions import PVConnectionError
+from sc_linac_physics.utils.epics.logger import get_logger
+from sc_linac_physics.utils.epics.metrics import (
+    PVMetrics,
+    PV_METRICS,
+    ioc_prefix,
+)
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker for one IOC.
+
+    closed: calls go through. After ``failure_threshold`` consecutive
+    failures the breaker opens and calls fail fast. Once ``cooldown`` seconds
+    have passed a single probe call is let through (half open); its success
+    closes the breaker, its failure re-opens it for another cool-down. A
+    probe that never reports back is replaced after another ``cooldown``.
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = BREAKER_CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._probed_at = 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may proceed (claims the probe when half open)"""
+        if self.state == BREAKER_CLOSED:
+            return True
+        if self.state == BREAKER_OPEN:
+            if monotonic() - self._opened_at >= self.cooldown:
+                self.state = BREAKER_HALF_OPEN
+                self._probed_at = monotonic()
+                return True
+            return False
+        # Half open: the single probe is already in flight, unless it was
+        # lost without recording a result
+        if monotonic() - self._probed_at >= self.cooldown:
+            self._probed_at = monotonic()
+            return True
+        return False
+
+    def record_success(self):
+        self.state = BREAKER_CLOSED
+        self.consecutive_failures = 0
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if (
+            self.state == BREAKER_HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state != BREAKER_OPEN:
+                self.trips += 1
+            self.state = BREAKER_OPEN
+            self._opened_at = monotonic()
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 unless open)"""
+        if self.state != BREAKER_OPEN:
+            return 0.0
+        return max(self.cooldown - (monotonic() - self._opened_at), 0.0)
+
+
+class PVCircuitBreakers:
+    """
+    Per-IOC circuit breakers for the PV layer.
+
+    PVs are grouped by the IOC serving them so that once an IOC has failed
+    ``failure_threshold`` operations in a row, every channel it serves fails
+    fast with PVConnectionError instead of running the full retry and
+    reconnect cycle. Breaker states are published to ``metrics``.
+
+    A PV's IOC is the CA server host it connected to (reported by PV through
+    ``set_host``). Before a PV has connected it is the IOC ``ioc_map`` gives
+    for the longest PV name prefix it lists, else the name prefix from
+    metrics.ioc_prefix at ``prefix_depth``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        prefix_depth: int = 3,
+        metrics: Optional[PVMetrics] = None,
+        ioc_map: Optional[Dict[str, str]] = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.prefix_depth = prefix_depth
+        self.metrics = metrics
+        # Longest prefix first, so the most specific entry wins
+        self.ioc_map = dict(
+            sorted((ioc_map or {}).items(), key=lambda item: -len(item[0]))
+        )
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._hosts: Dict[str, str] = {}
+
+    def set_host(self, pvname: str, host: Optional[str]):
+        """Key pvname's breaker by the CA server host it connected to"""
+        if host:
+            self._hosts[pvname] = host
+
+    def ioc(self, pvname: str) -> str:
+        """Key of the breaker guarding pvname"""
+        host = self._hosts.get(pvname)
+        if host:
+            return host
+        for prefix, ioc in self.ioc_map.items():
+            if pvname.startswith(prefix):
+                return ioc
+        return ioc_prefix(pvname, self.prefix_depth)
+
+    def _breaker_for(self, prefix: str) -> CircuitBreaker:
+        breaker = self._breakers.get(prefix)
+        if breaker is None:
+            breaker = self._breakers[prefix] = CircuitBreaker(
+                self.failure_threshold, self.cooldown
+            )
+        return breaker
+
+    def check(self, pvname: str) -> bool:
+        """
+        Raise if calls to this PV's IOC are currently short-circuited.
+
+        Returns:
+            Whether this call is the IOC's half-open probe, whose result
+            must be recorded for the breaker to close or re-open
+
+        Raises:
+            PVConnectionError: If the IOC's breaker is open
+        """
+        prefix = self.ioc(pvname)
+        with self._lock:
+            breaker = self._breakers.get(prefix)
+            if breaker is None:
+                return False
+            previous = breaker.state
+            allowed = breaker.allow()
+            state, retry_in = breaker.state, breaker.retry_in
+            self._publish(prefix, breaker, previous)
+
+        if not allowed:
+            raise PVConnectionError(
+                f"PV {pvname} not attempted: IOC {prefix} circuit is {state} "
+                f"(next probe in {retry_in:.1f}s)"
+            )
+        return state == BREAKER_HALF_OPEN
+
+    def record_success(self, pvname: str):
+        prefix = self.ioc(pvname)
+        with self._lock:
+            breaker = self._breakers.get(prefix)
+            if breaker is None:
+                return
+            previous = breaker.state
+            breaker.record_success()
+            self._publish(prefix, breaker, previous)
+
+    def record_failure(self, pvname: str):
+        prefix = self.ioc(pvname)
+        with self._lock:
+            breaker = self._breaker_for(prefix)
+            previous = breaker.state
+            breaker.record_failure()
+            self._publish(prefix, breaker, previous)
+
+    def _publish(self, prefix: str, breaker: CircuitBreaker, previous: str):
+        if breaker.state == previous:
+            return
+        log = (
+            get_logger().warning
+            if breaker.state == BREAKER_OPEN
+            else get_logger().info
+        )
+        log(f"IOC {prefix} circuit breaker {previous} -> {breaker.state}")
+        if self.metrics is not None:
+            self.metrics.record_breaker(prefix, breaker.state, breaker.trips)
+
+    def state(self, prefix: str) -> str:
+        with self._lock:
+            breaker = self._breakers.get(prefix)
+            return breaker.state if breaker else BREAKER_CLOSED
+
+    def states(self) -> Dict[str, str]:
+        with self._lock:
+            return {k: b.state for k, b in self._breakers.items()}
+
+    def reset(self):
+        """Close and forget every breaker"""
+        with self._lock:
+            prefixes = list(self._breakers)
+            self._breakers.clear()
+        if self.metrics is not None:
+            for prefix in prefixes:
+                self.metrics.record_breaker(prefix, BREAKER_CLOSED, 0)
+
+
+# Default breakers used by PV
+PV_BREAKERS = PVCircuitBreakers(metrics=PV_METRICS)
@@ -0,0 +1,134 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import epics
+import numpy as np
+
+# Default latency bucket edges (seconds) for connection histograms
+DEFAULT_LATENCY_BINS = (0.0, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+@dataclass
+class ConnectionReport:
+    """Outcome of a batch connection phase"""
+
+    latencies: Dict[str, float] = field(default_factory=dict)
+    failed: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def connected_count(self) -> int:
+        return len(self.latencies)
+
+    def histogram(
+        self, bins: Tuple[float, ...] = DEFAULT_LATENCY_BINS
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Histogram of per-PV connect latencies.
+
+        Latencies beyond the last edge are counted in the last bucket.
+
+        Returns:
+            (counts, edges) as returned by numpy.histogram
+        """
+        edges = np.asarray(bins, dtype=float)
+        values = np.fromiter(self.latencies.values(), dtype=float)
+        values = np.minimum(values, edges[-1])
+        return np.histogram(values, bins=edges)
+
+    def summary(self) -> str:
+        """One-line histogram summary suitable for logging"""
+        counts, edges = self.histogram()
+        buckets = ", ".join(
+            f"<{edges[i + 1] * 1000:g}ms: {count}"
+            for i, count in enumerate(counts)
+            if count
+        )
+        return (
+            f"{self.connected_count} connected, {len(self.failed)} failed "
+            f"in {self.elapsed:.3f}s [{buckets}]"
+        )
+
+
+class ConnectionWaiter:
+    """
+    Waits for a group of channels to connect under one shared deadline.
+
+    Pass ``waiter.callback`` as the ``connection_callback`` of every raw PV
+    before calling ``wait``. Channel Access connection events record each PV's
+    latency and wake the waiter once every expected channel is up, so dead
+    channels cost one timeout in total rather than one timeout each.
+    """
+
+    def __init__(self, expected: int):
+        self._lock = threading.Lock()
+        self._all_connected = threading.Event()
+        self._start = time.monotonic()
+        self._latencies: Dict[str, float] = {}
+        self.expect(expected)
+
+    def expect(self, expected: int):
+        """Update how many distinct channels must connect"""
+        with self._lock:
+            self._expected = expected
+            if len(self._latencies) >= expected:
+                self._all_connected.set()
+
+    def callback(self, pvname: str = None, conn: bool = True, **kwargs):
+        """Connection callback for raw EPICS PVs"""
+        if not conn:
+            return
+        with self._lock:
+            if pvname in self._latencies:
+                return
+            self._latencies[pvname] = time.monotonic() - self._start
+            if len(self._latencies) >= self._expected:
+                self._all_connected.set()
+
+    def mark_connected(self, pvname: str):
+        """Record a PV that was already connected when it was created"""
+        self.callback(pvname=pvname, conn=True)
+
+    def wait(
+        self,
+        pvs: List[Tuple[str, Optional[epics.PV]]],
+        timeout: float,
+        poll_interval: float = 0.05,
+    ) -> ConnectionReport:
+        """
+        Block until every PV connects or the shared deadline passes.
+
+        Args:
+            pvs: (name, raw PV) pairs; a None PV counts as failed
+            timeout: Shared deadline for the whole group (seconds)
+            poll_interval: How often to let CA process pending events
+
+        Returns:
+            ConnectionReport with per-PV latencies and failed names
+        """
+        deadline = time.monotonic() + timeout
+        while not self._all_connected.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            epics.ca.poll()
+            self._all_connected.wait(min(poll_interval, remaining))
+
+        report = ConnectionReport(elapsed=time.monotonic() - self._start)
+        with self._lock:
+            latencies = dict(self._latencies)
+
+        for pv_name, raw_pv in pvs:
+            if raw_pv is None:
+                report.failed.append(pv_name)
+            elif pv_name in latencies:
+                report.latencies[pv_name] = latencies[pv_name]
+            elif raw_pv.connected:
+                # Connected between the last event and the deadline check
+                report.latencies[pv_name] = report.elapsed
+            else:
+                report.failed.append(pv_name)
+
+        return report
@@ -1,17 +1,26 @@
 import threading
-from time import sleep
+from contextlib import contextmanager
+from time import sleep, monotonic
 from typing import List, Any, Optional, Callable, Union
 
 import epics
 import numpy as np
 from epics import PV as EPICS_PV
 
+from sc_linac_physics.utils.epics.breaker import (
+    PVCircuitBreakers,
+    PV_BREAKERS,
+)
 from sc_linac_physics.utils.epics.config import (
     PVConfig,
     EPICS_INVALID_VAL,
     EPICS_MINOR_VAL,
     EPICS_MAJOR_VAL,
 )
+from sc_linac_physics.utils.epics.connection import (
+    ConnectionReport,
+    ConnectionWaiter,
+)
 from sc_linac_physics.utils.epics.exceptions import (
     PVConnectionError,
     PVGetError,
@@ -19,17 +28,124 @@ from sc_linac_physics.utils.epics.exceptions import (
     PVInvalidError,
 )
 from sc_linac_physics.utils.epics.logger import get_logger
+from sc_linac_physics.utils.epics.metrics import PVMetrics, PV_METRICS
+from sc_linac_physics.utils.epics.registry import (
+    PVLease,
+    PVRegistry,
+    PV_REGISTRY,
+)
+from sc_linac_physics.utils.epics.snapshot import (
+    PVSnapshot,
+    empty_snapshot_records,
+    fill_snapshot_record,
+)
+
+# Constructor arguments that make a PV private to its creator
+_UNSHAREABLE_DEFAULTS = {
+    "callback": None,
+    "verbose": False,
+    "count": None,
+    "connection_callback": None,
+    "access_callback": None,
+    "require_connection": True,
+    "config": None,
+    "_skip_connection_wait": False,
+}
+
+
+class _SharedPVMeta(type):
+    """
+    Routes plain ``PV(name)`` constructions through the class registry so
+    that every holder of the same channel gets the same instance.
+    """
+
+    def __call__(cls, pvname: str, *args, **kwargs):
+        return cls._construct(pvname, args, kwargs, leased=False)
+
+    def lease(cls, pvname: str, *args, **kwargs) -> PVLease:
+        """
+        Construct like PV(...), but return this holder's PVLease on the
+        instance. Releasing the lease drops this holder's reference once,
+        however many times it is called.
+        """
+        return cls._construct(pvname, args, kwargs, leased=True)
+
+    def _construct(cls, pvname: str, args: tuple, kwargs: dict, leased: bool):
+        registry = cls.registry
+        shareable = not args and all(
+            kwargs.get(name, default) == default
+            for name, default in _UNSHAREABLE_DEFAULTS.items()
+        )
+        if registry is None or not shareable:
+            pv = super().__call__(pvname, *args, **kwargs)
+            return PVLease(pv) if leased else pv
+
+        key = PVRegistry.make_key(
+            cls,
+            pvname,
+            kwargs.get("form", "time"),
+            kwargs.get("auto_monitor", True),
+        )
+
+        def factory():
+            return type.__call__(cls, pvname, **kwargs)
+
+        if leased:
+            reference = registry.lease(key, factory)
+            pv = reference.pv
+        else:
+            pv = reference = registry.acquire(key, factory)
+
+        if not pv.connected:
+            # Keep constructor semantics for holders joining a dead channel
+            try:
+                pv._wait_for_connection_with_retry(
+                    kwargs.get("connection_timeout")
+                    or pv.config.connection_timeout
+                )
+            except PVConnectionError:
+                if leased:
+                    reference.release()
+                else:
+                    registry.release(pv)
+                raise
+        return reference
 
 
-class PV(EPICS_PV):
+class PV(EPICS_PV, metaclass=_SharedPVMeta):
     """
     Enhanced EPICS PV that always raises exceptions on failure.
     Never returns None - either returns a value or raises an exception.
+
+    Plain constructions (no callbacks, custom config, or element count) are
+    shared through ``PV.registry``: ``PV(name)`` returns the same
+    reference-counted instance for every caller asking for the same name,
+    form and auto_monitor setting. Call ``release()`` (or use the PV as a
+    context manager) when done; the channel is disconnected once the last
+    holder releases it. Holders that may release more than once take
+    ``PV.lease(name)`` instead, whose release only ever drops their own
+    reference. Set ``PV.registry = None`` to disable sharing.
+
+    Operations are guarded by per-IOC circuit breakers (``PV.breakers``):
+    after repeated failures against one IOC, its PVs raise PVConnectionError
+    immediately until a probe after the cool-down succeeds.
     """
 
+    # Registry of shared instances (None disables sharing)
+    registry: Optional[PVRegistry] = PV_REGISTRY
+
+    # Operation counters and latency histograms (None disables recording)
+    metrics: Optional[PVMetrics] = PV_METRICS
+
+    # Per-IOC fail-fast breakers (None disables them)
+    breakers: Optional[PVCircuitBreakers] = PV_BREAKERS
+
     # Default configuration (can be overridden per instance)
     default_config = PVConfig()
 
+    # Latency report from the most recent batch_create connection phase
+    last_connection_report: Optional[ConnectionReport] = None
+
     def __init__(
         self,
         pvname: str,
@@ -63,6 +179,7 @@ class PV(EPICS_PV):
             _skip_connection_wait: Internal flag for batch creation
         """
         # Initialize configuration and guards
+        self._registry_key = None
         self.config = config or self.default_config
         self._connection_lock = threading.RLock()
         self._user_callback = callback
@@ -84,6 +201,18 @@ class PV(EPICS_PV):
             access_callback=access_callback,
         )
 
+        # Key this PV's breaker by the IOC host it (re)connects to
+        self.connection_callbacks.append(self._on_connection_change)
+
+        # Monitor cache for max_age reads
+        self._monitor_value = None
+        self._monitor_stamp: Optional[float] = None
+        self._monitor_snapshot: Optional[PVSnapshot] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        if auto_monitor:
+            self.add_callback(self._on_monitor_update)
+
         # Skip connection wait for batch operations
         if _skip_connection_wait:
             self._add_user_callback_if_connected()
@@ -92,6 +221,45 @@ class PV(EPICS_PV):
         # Wait for initial connection
         self._wait_for_connection_with_retry(connection_timeout)
         self._add_user_callback_if_connected()
+        if self.connected:
+            self._note_host()
+
+    def _on_connection_change(self, conn: bool = False, **kwargs):
+        # pyepics runs connection callbacks before it sets self.connected,
+        # so only conn says whether the channel is up
+        if conn:
+            self._note_host()
+
+    def _note_host(self):
+        """Report the CA server host this PV connected to to its breakers"""
+        if self.breakers is None:
+            return
+        # Read the cached host directly: the host property can issue a get
+        args = getattr(self, "_args", None) or {}
+        self.breakers.set_host(self.pvname, args.get("host"))
+
+    def _on_monitor_update(self, value=None, **kwargs):
+        """Record the latest monitored value and when it arrived"""
+        self._monitor_value = value
+        self._monitor_stamp = monotonic()
+        # Only DBR_TIME monitors carry the alarm state with the value
+        if kwargs.get("severity") is None:
+            self._monitor_snapshot = None
+        else:
+            self._monitor_snapshot = PVSnapshot.from_metadata(
+                self.pvname, dict(kwargs, value=value)
+            )
+
+    @property
+    def monitor_age(self) -> Optional[float]:
+        """Seconds since the last monitor update (None if none received)"""
+        stamp = self._monitor_stamp
+        return None if stamp is None else monotonic() - stamp
+
+    @property
+    def cache_stats(self) -> dict:
+        """Hit/miss counters for max_age reads"""
+        return {"hits": self.cache_hits, "misses": self.cache_misses}
 
     def _add_user_callback_if_connected(self):
         """Add user callback if PV is connected"""
@@ -104,11 +272,21 @@ class PV(EPICS_PV):
         if self.connected:
             return
 
+        if self.breakers is not None:
+            try:
+                self.breakers.check(self.pvname)
+            except PVConnectionError as e:
+                if self._require_connection:
+                    raise
+                get_logger().warning(f"{e} (connection not required)")
+                return
+
         # Give pyepics a moment to process
         sleep(0.01)
 
         # First connection attempt
         if self.wait_for_connection(timeout=timeout):
+            self._record_connection(True)
             return
 
         # Retry logic
@@ -125,9 +303,11 @@ class PV(EPICS_PV):
                 get_logger().info(
                     f"PV {self.pvname} connected on retry attempt {attempt + 1}"
                 )
+                self._record_connection(True)
                 return
 
         # Connection failed
+        self._record_connection(False)
         error_msg = f"PV {self.pvname} failed to connect within {timeout}s"
         if self._require_connection:
             get_logger().error(error_msg)
@@ -135,6 +315,15 @@ class PV(EPICS_PV):
         else:
             get_logger().warning(error_msg + " (connection not required)")
 
+    def _record_connection(self, connected: bool):
+        """Report a connection wait outcome to the IOC's circuit breaker"""
+        if self.breakers is None:
+            return
+        if connected:
+            self.breakers.record_success(self.pvname)
+        else:
+            self.breakers.record_failure(self.pvname)
+
     def __str__(self) -> str:
         return self.pvname
 
@@ -154,9 +343,26 @@ class PV(EPICS_PV):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.disconnect()
+        self.release()
         return False
 
+    @property
+    def is_shared(self) -> bool:
+        """Whether this instance is handed out by the PV registry"""
+        return self._registry_key is not None
+
+    def release(self):
+        """
+        Drop one holder's reference. Shared PVs are disconnected when the
+        last holder releases them; private PVs are disconnected immediately.
+        Holders share the instance, so releasing twice drops two references;
+        use PV.lease for a reference that is released once.
+        """
+        if self.is_shared and self.registry is not None:
+            self.registry.release(self)
+        else:
+            self._close()
+
     def _ensure_connected(self, timeout: Optional[float] = None):
         """
         Ensure PV is connected, raise exception if not.
@@ -192,9 +398,21 @@ class PV(EPICS_PV):
                 raise PVConnectionError(error_msg)
 
             get_logger().info(f"PV {self.pvname} reconnected successfully")
+            if self.metrics is not None:
+                self.metrics.record_reconnect(self.pvname)
 
     def disconnect(self, deepclean: bool = True):
-        """Clean disconnect"""
+        """
+        Clean disconnect. For a shared PV this only releases the caller's
+        reference so other holders keep a live channel.
+        """
+        if self.is_shared and self.registry is not None:
+            self.registry.release(self)
+            return
+        self._close(deepclean=deepclean)
+
+    def _close(self, deepclean: bool = True):
+        """Disconnect the underlying channel unconditionally"""
         try:
             super().disconnect(deepclean=deepclean)
         except Exception as e:
@@ -221,6 +439,7 @@ class PV(EPICS_PV):
         timeout: Optional[float] = None,
         with_ctrlvars: bool = False,
         use_monitor: Optional[bool] = None,
+        max_age: Optional[float] = None,
     ) -> Union[int, float, str, np.ndarray, List]:
         """
         Get PV value with automatic retry logic.
@@ -232,33 +451,54 @@ class PV(EPICS_PV):
             timeout: Timeout for get operation
             with_ctrlvars: Include control variables
             use_monitor: Use cached monitored value
+            max_age: If set, return the last monitored value when it arrived
+                     less than max_age seconds ago, without touching the
+                     network. Older (or missing) values force a fresh CA get.
 
         Returns:
             PV value (never None)
 
         Raises:
-            PVConnectionError: If PV is not connected
+            PVConnectionError: If PV is not connected or its IOC's circuit
+                               breaker is open
             PVGetError: If get operation fails after retries
         """
+        if max_age is not None:
+            stamp = self._monitor_stamp
+            if (
+                stamp is not None
+                and monotonic() - stamp <= max_age
+                and self.connected
+                and self._monitor_value is not None
+                and count is None
+                and not as_string
+                and not with_ctrlvars
+            ):
+                self.cache_hits += 1
+                return self._monitor_value
+            self.cache_misses += 1
+            use_monitor = False
+
         timeout = timeout or self.config.get_timeout
         use_monitor = (
             use_monitor if use_monitor is not None else self.auto_monitor
         )
 
-        self._ensure_connected(timeout=timeout)
-
-        return self._execute_with_retry(
-            operation="get",
-            operation_func=lambda: super(PV, self).get(
-                count=count,
-                as_string=as_string,
-                as_numpy=as_numpy,
+        with self._circuit():
+            self._ensure_connected(timeout=timeout)
+
+            return self._execute_with_retry(
+                operation="get",
+                operation_func=lambda: super(PV, self).get(
+                    count=count,
+                    as_string=as_string,
+                    as_numpy=as_numpy,
+                    timeout=timeout,
+                    with_ctrlvars=with_ctrlvars,
+                    use_monitor=use_monitor,
+                ),
                 timeout=timeout,
-                with_ctrlvars=with_ctrlvars,
-                use_monitor=use_monitor,
-            ),
-            timeout=timeout,
-        )
+            )
 
     def put(
         self,
@@ -281,26 +521,93 @@ class PV(EPICS_PV):
             callback_data: Data to pass to callback
 
         Raises:
-            PVConnectionError: If PV is not connected
+            PVConnectionError: If PV is not connected or its IOC's circuit
+                               breaker is open
             PVPutError: If put operation fails after retries
         """
         timeout = timeout or self.config.put_timeout
 
-        self._ensure_connected(timeout=timeout)
+        with self._circuit():
+            self._ensure_connected(timeout=timeout)
+
+            self._execute_with_retry(
+                operation="put",
+                operation_func=lambda: super(PV, self).put(
+                    value,
+                    wait=wait,
+                    timeout=timeout,
+                    use_complete=use_complete,
+                    callback=callback,
+                    callback_data=callback_data,
+                ),
+                timeout=timeout,
+                context={"value": value},
+            )
+
+    def snapshot(
+        self,
+        timeout: Optional[float] = None,
+        use_monitor: Optional[bool] = None,
+    ) -> PVSnapshot:
+        """
+        Value, severity, status and timestamp from one consistent sample.
+
+        Served from the last DBR_TIME monitor event when the PV is monitored
+        and connected, otherwise read with a single DBR_TIME get (with the
+        usual retries).
+
+        Args:
+            timeout: Timeout per attempt (defaults to config.get_timeout)
+            use_monitor: Serve the monitored sample when available
+                         (defaults to the PV's auto_monitor setting)
 
-        self._execute_with_retry(
-            operation="put",
-            operation_func=lambda: super(PV, self).put(
-                value,
-                wait=wait,
+        Returns:
+            Immutable PVSnapshot
+
+        Raises:
+            PVConnectionError: If PV is not connected or its IOC's circuit
+                               breaker is open
+            PVGetError: If the read fails after retries
+        """
+        if use_monitor is None:
+            use_monitor = self.auto_monitor
+        cached = self._monitor_snapshot
+        if use_monitor and cached is not None and self.connected:
+            return cached
+
+        timeout = timeout or self.config.get_timeout
+        with self._circuit():
+            self._ensure_connected(timeout=timeout)
+
+            data = self._execute_with_retry(
+                operation="get",
+                operation_func=lambda: super(PV, self).get_with_metadata(
+                    form="time", use_monitor=False, timeout=timeout
+                ),
                 timeout=timeout,
-                use_complete=use_complete,
-                callback=callback,
-                callback_data=callback_data,
-            ),
-            timeout=timeout,
-            context={"value": value},
-        )
+            )
+        return PVSnapshot.from_metadata(self.pvname, data)
+
+    @contextmanager
+    def _circuit(self):
+        """
+        Run an operation under this PV's IOC circuit breaker.
+
+        Raises:
+            PVConnectionError: Immediately, if the IOC's breaker is open
+        """
+        breakers = self.breakers
+        if breakers is None:
+            yield
+            return
+
+        breakers.check(self.pvname)
+        try:
+            yield
+        except Exception:
+            breakers.record_failure(self.pvname)
+            raise
+        breakers.record_success(self.pvname)
 
     def _execute_with_retry(
         self,
@@ -326,24 +633,25 @@ class PV(EPICS_PV):
         """
         context = context or {}
         last_exception = None
+        start = monotonic()
+        timeouts = 0
 
         for attempt in range(1, self.config.max_retries + 1):
             try:
                 result = operation_func()
 
-                # Check success based on operation type
-                if operation == "get":
-                    success = result is not None
-                else:  # put
-                    success = result == 1
-
-                if success:
+                if self._operation_succeeded(operation, result):
                     if attempt > 1:
                         get_logger().info(
                             f"PV {self.pvname} {operation} succeeded on attempt {attempt}"
                         )
+                    self._record_operation(operation, start, attempt, timeouts)
                     return result if operation == "get" else None
 
+                # pyepics signals a timeout with None (get) or -1 (put)
+                if result is None or result == -1:
+                    timeouts += 1
+
                 # Operation returned failure status
                 if attempt < self.config.max_retries:
                     get_logger().warning(
@@ -364,8 +672,37 @@ class PV(EPICS_PV):
                 self._retry_backoff(attempt, timeout)
 
         # All retries exhausted - raise appropriate error
+        self._record_operation(
+            operation, start, self.config.max_retries, timeouts, failed=True
+        )
         self._raise_operation_error(operation, last_exception, context)
 
+    @staticmethod
+    def _operation_succeeded(operation: str, result: Any) -> bool:
+        """Check success based on operation type"""
+        if operation == "get":
+            return result is not None
+        return result == 1  # put
+
+    def _record_operation(
+        self,
+        operation: str,
+        start: float,
+        attempts: int,
+        timeouts: int,
+        failed: bool = False,
+    ):
+        """Report a finished get/put to the metrics sink"""
+        if self.metrics is not None:
+            self.metrics.record_operation(
+                self.pvname,
+                operation,
+                monotonic() - start,
+                attempts=attempts,
+                timeouts=timeouts,
+                failed=failed,
+            )
+
     def _retry_backoff(self, attempt: int, timeout: float):
         """Handle retry delay and reconnection attempt"""
         # Exponential backoff
@@ -457,9 +794,7 @@ class PV(EPICS_PV):
         Raises:
             PVInvalidError: If raise_on_alarm=True and PV is alarming
         """
-        self._ensure_connected()
-
-        severity = self.severity
+        severity = self.snapshot().severity
 
         if severity is None:
             get_logger().warning(f"PV {self.pvname} severity is None")
@@ -497,11 +832,13 @@ class PV(EPICS_PV):
 
         This method is significantly faster than creating PVs one at a time
         because it allows EPICS Channel Access to connect to multiple PVs
-        simultaneously in the background.
+        simultaneously in the background. Connection events are collected
+        through CA callbacks and all PVs share one deadline; per-PV connect
+        latencies are kept in ``PV.last_connection_report``.
 
         Args:
             pv_names: List of PV names to create
-            connection_timeout: Timeout for each PV connection (seconds)
+            connection_timeout: Shared timeout for the whole batch (seconds)
             auto_monitor: Whether to enable automatic monitoring
             require_connection: If True, raise error if any PV fails to connect
             config: Custom PVConfig to use for all PVs
@@ -522,13 +859,14 @@ class PV(EPICS_PV):
             return []
 
         # Phase 1: Create raw EPICS PVs (non-blocking, fast)
+        waiter = ConnectionWaiter(len(set(pv_names)))
         raw_pvs = cls._create_raw_pvs(
-            pv_names, auto_monitor, connection_timeout
+            pv_names, auto_monitor, connection_timeout, waiter
         )
 
-        # Phase 2: Wait for all connections in batch
+        # Phase 2: Wait for all connections under one shared deadline
         failed_pvs = cls._wait_for_connections(
-            pv_names, raw_pvs, connection_timeout
+            pv_names, raw_pvs, connection_timeout, waiter
         )
 
         # Phase 3: Wrap in our PV class
@@ -545,8 +883,10 @@ class PV(EPICS_PV):
         pv_names: List[str],
         auto_monitor: bool,
         connection_timeout: float,
+        waiter: Optional[ConnectionWaiter] = None,
     ) -> List[Optional[epics.PV]]:
         """Create raw EPICS PV objects without waiting for connection."""
+        connection_callback = waiter.callback if waiter else None
         raw_pvs = []
         for pv_name in pv_names:
             try:
@@ -554,30 +894,47 @@ class PV(EPICS_PV):
                     pv_name,
                     auto_monitor=auto_monitor,
                     connection_timeout=connection_timeout,
+                    connection_callback=connection_callback,
                 )
+                if waiter and raw_pv.connected:
+                    waiter.mark_connected(pv_name)
                 raw_pvs.append(raw_pv)
             except Exception as e:
                 get_logger().warning(f"Failed to create raw PV {pv_name}: {e}")
                 raw_pvs.append(None)
+
+        if waiter:
+            created = {n for n, pv in zip(pv_names, raw_pvs) if pv is not None}
+            waiter.expect(len(created))
         return raw_pvs
 
-    @staticmethod
+    @classmethod
     def _wait_for_connections(
+        cls,
         pv_names: List[str],
         raw_pvs: List[Optional[epics.PV]],
         connection_timeout: float,
+        waiter: Optional[ConnectionWaiter] = None,
     ) -> List[str]:
-        """Wait for raw PVs to connect and return list of failed PV names."""
-        failed_pvs = []
-
-        for pv_name, raw_pv in zip(pv_names, raw_pvs):
-            if raw_pv is None:
-                failed_pvs.append(pv_name)
-                continue
+        """
+        Wait for raw PVs to connect and return list of failed PV names.
 
-            if not raw_pv.wait_for_connection(timeout=connection_timeout):
-                failed_pvs.append(pv_name)
+        All channels share a single deadline of ``connection_timeout``
+        seconds, so N dead channels cost one timeout rather than N.
+        """
+        if waiter is None:
+            waiter = ConnectionWaiter(len(set(pv_names)))
+            for pv_name, raw_pv in zip(pv_names, raw_pvs):
+                if raw_pv is not None and raw_pv.connected:
+                    waiter.mark_connected(pv_name)
+
+        report = waiter.wait(
+            list(zip(pv_names, raw_pvs)), timeout=connection_timeout
+        )
+        cls.last_connection_report = report
+        get_logger().debug(f"Batch connection: {report.summary()}")
 
+        failed_pvs = report.failed
         if failed_pvs:
             get_logger().warning(
                 f"Failed to connect to {len(failed_pvs)} PVs: "
@@ -612,6 +969,8 @@ class PV(EPICS_PV):
                     config=config,
                     _skip_connection_wait=True,  # Skip wait, already connected
                 )
+                if pv.connected:
+                    pv._note_host()
                 wrapped_pvs.append(pv)
             except Exception as e:
                 if require_connection:
@@ -629,15 +988,21 @@ class PV(EPICS_PV):
         pvs: List["PV"],
         timeout: Optional[float] = None,
         raise_on_error: bool = True,
+        parallel: bool = False,
     ) -> List[Any]:
         """
         Get multiple PV values efficiently.
 
         Args:
             pvs: List of PV objects
-            timeout: Timeout for each get
+            timeout: Timeout for each get (shared deadline when parallel)
             raise_on_error: If True, raise exception on any failure.
                            If False, failed PVs will have None in results.
+            parallel: If True, issue every CA get before waiting on any of
+                      them so the batch costs one round trip. PVs that do
+                      not answer in time fall back to a normal get with
+                      retries; disconnected PVs and failed breaker probes
+                      fail at once.
 
         Returns:
             List of values in same order as input PVs
@@ -645,10 +1010,22 @@ class PV(EPICS_PV):
         Raises:
             PVGetError: If any PV fails to get and raise_on_error=True
         """
+        if parallel:
+            values = PV._get_many_pipelined(pvs, timeout)
+        else:
+            values = [None] * len(pvs)
+
         results = []
         errors = []
 
-        for pv in pvs:
+        for pv, value in zip(pvs, values):
+            if isinstance(value, PVConnectionError):
+                errors.append((pv.pvname, str(value)))
+                results.append(None)
+                continue
+            if value is not None:
+                results.append(value)
+                continue
             try:
                 results.append(pv.get(timeout=timeout))
             except (PVConnectionError, PVGetError) as e:
@@ -662,6 +1039,190 @@ class PV(EPICS_PV):
 
         return results
 
+    @staticmethod
+    def _get_many_pipelined(
+        pvs: List["PV"], timeout: Optional[float]
+    ) -> List[Union[Any, Exception, None]]:
+        """
+        Issue CA gets for every connected PV, flush them out together, then
+        collect the replies under one deadline. Each PV's result counts
+        towards its IOC's circuit breaker and the metrics like a normal get.
+
+        Returns, per PV: its value, a PVConnectionError if it was
+        disconnected, its IOC's breaker is open or its get was the breaker's
+        probe and failed (not worth retrying within the deadline), or None
+        if it was not issued or did not answer in time (the caller retries
+        those with a normal get).
+        """
+        timeout = timeout or PV.default_config.get_timeout
+        outcomes: List[Union[Any, Exception, None]] = [None] * len(pvs)
+        # (index, whether it is its IOC's breaker probe) of queued gets
+        issued = []
+        start = monotonic()
+        for index, pv in enumerate(pvs):
+            try:
+                probe = pv._issue_pipelined_get(start)
+            except PVConnectionError as e:
+                outcomes[index] = e
+                continue
+            if probe is not None:
+                issued.append((index, probe))
+        epics.ca.flush_io()
+
+        deadline = start + timeout
+        for index, probe in issued:
+            outcomes[index] = pvs[index]._collect_pipelined_get(
+                start, deadline, probe
+            )
+        return outcomes
+
+    def _collect_pipelined_get(
+        self, start: float, deadline: float, probe: bool
+    ) -> Union[Any, Exception, None]:
+        """
+        Wait until deadline for the reply to this PV's queued get.
+
+        Returns:
+            The value; else a PVConnectionError if the get was the IOC's
+            breaker probe (its failure has re-opened the breaker), or None
+            to leave the PV to a normal get
+        """
+        try:
+            value = epics.ca.get_complete(
+                self.chid,
+                ftype=self.ftype,
+                timeout=max(deadline - monotonic(), 0.001),
+                as_numpy=True,
+            )
+        except Exception as e:
+            get_logger().debug(f"Pipelined get failed for {self}: {e}")
+            value = None
+        if value is not None:
+            self._record_pipelined(start)
+            return value
+        error = PVConnectionError(f"{self.pvname} pipelined get got no reply")
+        self._record_pipelined(start, error)
+        return error if probe else None
+
+    def _record_pipelined(
+        self, start: float, error: Optional[Exception] = None
+    ):
+        """
+        Count a pipelined get issued at start (and failed with error, if
+        given) like _circuit and _execute_with_retry count a normal one
+        """
+        if self.breakers is not None:
+            if error is None:
+                self.breakers.record_success(self.pvname)
+            else:
+                self.breakers.record_failure(self.pvname)
+        self._record_operation("get", start, 1, 0, failed=error is not None)
+
+    def _issue_pipelined_get(self, start: float) -> Optional[bool]:
+        """
+        Queue a CA get for this PV without flushing or waiting on it.
+
+        Returns:
+            None if the get could not be queued, else whether it is the
+            IOC's half-open breaker probe
+
+        Raises:
+            PVConnectionError: If the IOC's breaker is open, this PV is
+                               disconnected, or the get was the breaker's
+                               probe and could not be queued
+        """
+        probe = self.breakers is not None and self.breakers.check(self.pvname)
+        if not self.connected:
+            error = PVConnectionError(f"{self.pvname} is not connected")
+            self._record_pipelined(start, error)
+            raise error
+        try:
+            epics.ca.get(self.chid, ftype=self.ftype, wait=False)
+        except Exception as e:
+            get_logger().debug(f"Pipelined get not issued for {self}: {e}")
+            error = PVConnectionError(
+                f"Pipelined get not issued for {self.pvname}: {e}"
+            )
+            self._record_pipelined(start, error)
+            if probe:
+                raise error
+            return None
+        return probe
+
+    @staticmethod
+    def snapshot_many(
+        pvs: List["PV"], timeout: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Snapshot many PVs into one structured array (see SNAPSHOT_DTYPE).
+
+        Monitored PVs are served from their last DBR_TIME event; DBR_TIME
+        gets for the rest are all issued before any reply is awaited and
+        share one deadline. Entries that could not be sampled have
+        valid=False, value NaN and INVALID severity.
+
+        Args:
+            pvs: List of PV objects
+            timeout: Shared deadline for the network reads
+
+        Returns:
+            Structured array with fields value, severity, status, timestamp
+            and valid, in the same order as pvs
+        """
+        records = empty_snapshot_records(len(pvs))
+        issued = []
+        for index, pv in enumerate(pvs):
+            cached = pv._monitor_snapshot
+            if pv.auto_monitor and cached is not None and pv.connected:
+                fill_snapshot_record(
+                    records,
+                    index,
+                    cached.value,
+                    cached.severity,
+                    cached.status,
+                    cached.timestamp,
+                )
+            elif pv.connected and PV._issue_time_get(pv):
+                issued.append(index)
+        epics.ca.flush_io()
+
+        timeout = timeout or PV.default_config.get_timeout
+        deadline = monotonic() + timeout
+        for index in issued:
+            pv = pvs[index]
+            try:
+                data = epics.ca.get_complete_with_metadata(
+                    pv.chid,
+                    ftype=epics.ca.promote_type(pv.chid, use_time=True),
+                    timeout=max(deadline - monotonic(), 0.001),
+                )
+            except Exception as e:
+                get_logger().debug(f"Snapshot read failed for {pv}: {e}")
+                continue
+            if data is not None and data.get("value") is not None:
+                fill_snapshot_record(
+                    records,
+                    index,
+                    data["value"],
+                    data.get("severity"),
+                    data.get("status"),
+                    data.get("timestamp"),
+                )
+        return records
+
+    @staticmethod
+    def _issue_time_get(pv: "PV") -> bool:
+        try:
+            epics.ca.get(
+                pv.chid,
+                ftype=epics.ca.promote_type(pv.chid, use_time=True),
+                wait=False,
+            )
+        except Exception as e:
+            get_logger().debug(f"Snapshot read not issued for {pv}: {e}")
+            return False
+        return True
+
     @staticmethod
     def put_many(
         pvs: List["PV"],
@@ -669,6 +1230,7 @@ class PV(EPICS_PV):
         timeout: Optional[float] = None,
         wait: bool = True,
         raise_on_error: bool = True,
+        parallel: bool = False,
     ) -> List[bool]:
         """
         Put values to multiple PVs.
@@ -676,9 +1238,13 @@ class PV(EPICS_PV):
         Args:
             pvs: List of PV objects
             values: List of values to write (must match length of pvs)
-            timeout: Timeout for each put
+            timeout: Timeout for each put (shared deadline when parallel)
             wait: Wait for completion
             raise_on_error: If True, raise exception on any failure
+            parallel: If True, issue every CA put up front and wait on the
+                      completion callbacks together, so N puts cost one
+                      round trip instead of N. Puts that cannot be issued
+                      fall back to a normal put with retries.
 
         Returns:
             List of success status (True/False) for each PV
@@ -692,10 +1258,22 @@ class PV(EPICS_PV):
                 f"Length mismatch: {len(pvs)} PVs but {len(values)} values"
             )
 
+        if parallel:
+            outcomes = PV._put_many_pipelined(pvs, values, timeout, wait)
+        else:
+            outcomes = [None] * len(pvs)
+
         results = []
         errors = []
 
-        for pv, value in zip(pvs, values):
+        for pv, value, outcome in zip(pvs, values, outcomes):
+            if outcome is True:
+                results.append(True)
+                continue
+            if isinstance(outcome, Exception):
+                errors.append((pv.pvname, value, str(outcome)))
+                results.append(False)
+                continue
             try:
                 pv.put(value, timeout=timeout, wait=wait)
                 results.append(True)
@@ -709,3 +1287,59 @@ class PV(EPICS_PV):
             raise PVPutError(error_msg)
 
         return results
+
+    @staticmethod
+    def _put_many_pipelined(
+        pvs: List["PV"],
+        values: List[Any],
+        timeout: Optional[float],
+        wait: bool,
+    ) -> List[Union[bool, Exception, None]]:
+        """
+        Issue CA puts for every connected PV and wait for their completion
+        callbacks under one deadline.
+
+        Returns, per PV: True on confirmed success, a PVPutError if the put
+        was issued but not confirmed in time, or None if it was never issued
+        (the caller retries those serially).
+        """
+        timeout = timeout or PV.default_config.put_timeout
+        outcomes: List[Union[bool, Exception, None]] = [None] * len(pvs)
+        completions = {}
+
+        for index, (pv, value) in enumerate(zip(pvs, values)):
+            if not pv.connected:
+                continue
+            done = threading.Event()
+            try:
+                status = super(PV, pv).put(
+                    value,
+                    wait=False,
+                    use_complete=wait,
+                    callback=(
+                        (lambda done=done, **kwargs: done.set())
+                        if wait
+                        else None
+                    ),
+                )
+            except Exception as e:
+                get_logger().debug(f"Pipelined put not issued for {pv}: {e}")
+                continue
+            if status != 1:
+                continue
+            if wait:
+                completions[index] = done
+            else:
+                outcomes[index] = True
+
+        deadline = monotonic() + timeout
+        for index, done in completions.items():
+            if done.wait(max(deadline - monotonic(), 0)):
+                outcomes[index] = True
+            else:
+                outcomes[index] = PVPutError(
+                    f"PV {pvs[index].pvname} put with "
+                    f"{{'value': {values[index]!r}}} did not complete "
+                    f"within {timeout}s"
+                )
+        return outcomes
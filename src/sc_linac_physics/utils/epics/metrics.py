@@ -0,0 +1,294 @@
+import json
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# Default latency bucket upper bounds (seconds) for get/put histograms
+DEFAULT_OPERATION_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    10.0,
+    30.0,
+)
+
+OPERATIONS = ("get", "put")
+
+_COUNTER_HELP = (
+    ("gets", "PV get operations"),
+    ("puts", "PV put operations"),
+    ("retries", "PV operation retry attempts"),
+    ("timeouts", "PV operation attempts that timed out"),
+    ("reconnects", "PV reconnections"),
+    ("errors", "PV operations failed after all retries"),
+)
+
+
+_BREAKER_GAUGE = {"closed": 0, "open": 1, "half_open": 0.5}
+
+
+def ioc_prefix(pvname: str, depth: int = 3) -> str:
+    """
+    Group key for a PV name: its first ``depth`` colon-separated segments,
+    e.g. ``ACCL:L0B:0110:AACTMEAN`` -> ``ACCL:L0B:0110``.
+
+    This groups by name, not by IOC: at the default depth that key is one
+    cavity (CM01 cavity 1), while one IOC serves several cavities.
+    PVCircuitBreakers therefore keys by the channel's IOC host once it has
+    connected and only falls back to this before then.
+    """
+    return ":".join(pvname.strip().split(":")[:depth])
+
+
+class LatencyHistogram:
+    """Cumulative-style latency histogram with fixed bucket bounds"""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_OPERATION_BUCKETS):
+        self.bounds = bounds
+        # One slot per bound plus an overflow (+Inf) slot
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(upper bound label, cumulative count) pairs ending with +Inf"""
+        running = 0
+        buckets = []
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            buckets.append((f"{bound:g}", running))
+        buckets.append(("+Inf", running + self.counts[-1]))
+        return buckets
+
+    def to_dict(self) -> dict:
+        return {
+            "buckets": dict(self.cumulative()),
+            "sum": self.total,
+            "count": self.count,
+        }
+
+
+@dataclass
+class OperationStats:
+    """Counters and latency histograms for one PV or one IOC prefix"""
+
+    gets: int = 0
+    puts: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    reconnects: int = 0
+    errors: int = 0
+    latency: Dict[str, LatencyHistogram] = field(
+        default_factory=lambda: {op: LatencyHistogram() for op in OPERATIONS}
+    )
+
+    def record(
+        self,
+        operation: str,
+        seconds: float,
+        attempts: int,
+        timeouts: int,
+        failed: bool,
+    ):
+        if operation == "get":
+            self.gets += 1
+        else:
+            self.puts += 1
+        self.retries += attempts - 1
+        self.timeouts += timeouts
+        if failed:
+            self.errors += 1
+        self.latency[operation].observe(seconds)
+
+    def to_dict(self) -> dict:
+        return {
+            "gets": self.gets,
+            "puts": self.puts,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "reconnects": self.reconnects,
+            "errors": self.errors,
+            "latency": {op: h.to_dict() for op, h in self.latency.items()},
+        }
+
+
+class PVMetrics:
+    """
+    Process-wide counters for PV traffic, keyed by PV name and IOC prefix.
+
+    Recording is a lock, two dict lookups and a bisect, so it is cheap enough
+    to leave on. Set ``enabled = False`` (or ``PV.metrics = None``) to turn
+    recording off entirely.
+    """
+
+    def __init__(self, prefix_depth: int = 3):
+        self.prefix_depth = prefix_depth
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._per_pv: Dict[str, OperationStats] = {}
+        self._per_prefix: Dict[str, OperationStats] = {}
+        self._breakers: Dict[str, dict] = {}
+
+    def _stats_for(self, pvname: str) -> Tuple[OperationStats, OperationStats]:
+        pv_stats = self._per_pv.get(pvname)
+        if pv_stats is None:
+            pv_stats = self._per_pv[pvname] = OperationStats()
+        prefix = ioc_prefix(pvname, self.prefix_depth)
+        prefix_stats = self._per_prefix.get(prefix)
+        if prefix_stats is None:
+            prefix_stats = self._per_prefix[prefix] = OperationStats()
+        return pv_stats, prefix_stats
+
+    def record_operation(
+        self,
+        pvname: str,
+        operation: str,
+        seconds: float,
+        attempts: int = 1,
+        timeouts: int = 0,
+        failed: bool = False,
+    ):
+        """
+        Record one get or put, including all of its retry attempts.
+
+        Args:
+            pvname: PV name
+            operation: 'get' or 'put'
+            seconds: Wall time for the whole operation
+            attempts: Number of attempts made (1 means no retries)
+            timeouts: Attempts that timed out
+            failed: Whether the operation ultimately failed
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            for stats in self._stats_for(pvname):
+                stats.record(operation, seconds, attempts, timeouts, failed)
+
+    def record_reconnect(self, pvname: str):
+        """Record a successful reconnection after a disconnect"""
+        if not self.enabled:
+            return
+        with self._lock:
+            for stats in self._stats_for(pvname):
+                stats.reconnects += 1
+
+    def record_breaker(self, prefix: str, state: str, trips: int):
+        """Record the current circuit breaker state of an IOC prefix"""
+        with self._lock:
+            self._breakers[prefix] = {"state": state, "trips": trips}
+
+    def breaker_state(self, prefix: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._breakers.get(prefix)
+            return dict(entry) if entry else None
+
+    def pv_stats(self, pvname: str) -> Optional[dict]:
+        with self._lock:
+            stats = self._per_pv.get(pvname)
+            return stats.to_dict() if stats else None
+
+    def prefix_stats(self, prefix: str) -> Optional[dict]:
+        with self._lock:
+            stats = self._per_prefix.get(prefix)
+            return stats.to_dict() if stats else None
+
+    def reset(self):
+        with self._lock:
+            self._per_pv.clear()
+            self._per_prefix.clear()
+            self._breakers.clear()
+
+    def snapshot(self) -> dict:
+        """All counters as plain dicts, keyed by IOC prefix and PV name"""
+        with self._lock:
+            return {
+                "iocs": {k: v.to_dict() for k, v in self._per_prefix.items()},
+                "pvs": {k: v.to_dict() for k, v in self._per_pv.items()},
+                "breakers": {k: dict(v) for k, v in self._breakers.items()},
+            }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self, per_pv: bool = False) -> str:
+        """
+        Render counters in the Prometheus text exposition format.
+
+        Args:
+            per_pv: Also emit one series per PV (high cardinality); by default
+                    only per-IOC-prefix series are emitted
+
+        Returns:
+            Exposition text
+        """
+        snapshot = self.snapshot()
+        groups = [("ioc", snapshot["iocs"])]
+        if per_pv:
+            groups.append(("pv", snapshot["pvs"]))
+
+        lines = []
+        for name, help_text in _COUNTER_HELP:
+            metric = f"sc_linac_pv_{name}_total"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for label, entries in groups:
+                for group, stats in entries.items():
+                    lines.append(f'{metric}{{{label}="{group}"}} {stats[name]}')
+
+        metric = "sc_linac_pv_latency_seconds"
+        lines.append(f"# HELP {metric} PV operation latency")
+        lines.append(f"# TYPE {metric} histogram")
+        for label, entries in groups:
+            for group, stats in entries.items():
+                for operation, hist in stats["latency"].items():
+                    labels = f'{label}="{group}",operation="{operation}"'
+                    for bound, count in hist["buckets"].items():
+                        lines.append(
+                            f'{metric}_bucket{{{labels},le="{bound}"}} {count}'
+                        )
+                    lines.append(f"{metric}_sum{{{labels}}} {hist['sum']}")
+                    lines.append(f"{metric}_count{{{labels}}} {hist['count']}")
+
+        lines.extend(_breaker_lines(snapshot["breakers"]))
+        return "\n".join(lines) + "\n"
+
+
+def _breaker_lines(breakers: Dict[str, dict]) -> List[str]:
+    if not breakers:
+        return []
+    lines = [
+        "# HELP sc_linac_pv_breaker_open IOC circuit breaker state "
+        "(0 closed, 1 open, 0.5 half open)",
+        "# TYPE sc_linac_pv_breaker_open gauge",
+    ]
+    for prefix, entry in breakers.items():
+        value = _BREAKER_GAUGE.get(entry["state"], 0)
+        lines.append(f'sc_linac_pv_breaker_open{{ioc="{prefix}"}} {value}')
+    lines.append(
+        "# HELP sc_linac_pv_breaker_trips_total IOC circuit breaker trips"
+    )
+    lines.append("# TYPE sc_linac_pv_breaker_trips_total counter")
+    for prefix, entry in breakers.items():
+        lines.append(
+            f'sc_linac_pv_breaker_trips_total{{ioc="{prefix}"}} {entry["trips"]}'
+        )
+    return lines
+
+
+# Default metrics sink used by PV
+PV_METRICS = PVMetrics()
@@ -0,0 +1,249 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from sc_linac_physics.utils.epics.logger import get_logger
+
+
+@dataclass
+class _RegistryEntry:
+    pv: Any
+    # References taken by acquire, which holders give back through release
+    anonymous: int = 0
+    leases: Set["PVLease"] = field(default_factory=set)
+
+    @property
+    def refcount(self) -> int:
+        return self.anonymous + len(self.leases)
+
+
+class PVLease:
+    """
+    One holder's reference to a shared PV.
+
+    Releasing a lease drops exactly that holder's reference: releasing it
+    again (say from both close() and a context manager exit) does nothing,
+    so it can never take the channel away from the other holders.
+
+        with PV.lease("SOME:PV:NAME") as lease:
+            lease.pv.get()
+    """
+
+    def __init__(self, pv: Any, registry: Optional["PVRegistry"] = None):
+        """
+        @param registry: the registry sharing pv, None for a private PV
+                         that the lease closes on release
+        """
+        self.pv = pv
+        self._registry = registry
+        self._released = False
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    def release(self) -> bool:
+        """
+        Drop this holder's reference, once
+        @return: True if this closed the channel
+        """
+        if self._registry is not None:
+            return self._registry._release_lease(self)
+        if self._released:
+            return False
+        self._released = True
+        self.pv._close()
+        return True
+
+    def __enter__(self) -> "PVLease":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+        return False
+
+    def __repr__(self) -> str:
+        state = "released" if self._released else "held"
+        return f"PVLease({self.pv.pvname!r}, {state})"
+
+
+class PVRegistry:
+    """
+    Process-wide cache of shared, reference-counted PV instances.
+
+    Every application that builds a Machine creates wrappers for the same
+    channels (heartbeats, shared HL SSA PVs, rack-level fault PVs). The
+    registry hands out one instance per (class, name, form, auto_monitor) key
+    so each channel has a single wrapper and a single monitor subscription.
+    Holders call ``release`` when they are done; the channel is disconnected
+    once the last holder lets go.
+
+    References from ``acquire`` are anonymous: every holder gets the same
+    instance, so ``release(pv)`` cannot tell them apart. Holders that must
+    not over-release take a ``lease`` instead, which is released at most
+    once. An anonymous release never drops a lease's reference.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries: Dict[Hashable, _RegistryEntry] = {}
+
+    @staticmethod
+    def make_key(
+        pv_class: type, pvname: str, form: str, auto_monitor: Any
+    ) -> Tuple:
+        return pv_class, pvname.strip(), form.lower(), auto_monitor
+
+    def acquire(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the shared instance for key, creating it with factory if needed.
+
+        The factory runs outside the registry lock so that a slow connection
+        does not block other channels. If two threads race to create the same
+        key, the loser's instance is discarded in favour of the winner's.
+
+        Args:
+            key: Registry key (see make_key)
+            factory: Zero-argument callable that builds a new PV
+
+        Returns:
+            Shared PV instance with its reference count incremented
+        """
+        return self._acquire(key, factory, leased=False)
+
+    def lease(self, key: Hashable, factory: Callable[[], Any]) -> PVLease:
+        """
+        Like acquire, but the reference is a lease the holder releases once
+
+        Returns:
+            A PVLease on the shared PV instance
+        """
+        return self._acquire(key, factory, leased=True)
+
+    def _acquire(
+        self, key: Hashable, factory: Callable[[], Any], leased: bool
+    ) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return self._reference(entry, leased)
+
+        pv = factory()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                pv._registry_key = key
+                entry = self._entries[key] = _RegistryEntry(pv=pv)
+                return self._reference(entry, leased)
+            reference = self._reference(entry, leased)
+
+        # Lost a creation race, keep the instance that was registered first
+        pv._close()
+        return reference
+
+    def _reference(self, entry: _RegistryEntry, leased: bool) -> Any:
+        """Take a reference to entry (holding the lock): a lease, else the PV"""
+        if not leased:
+            entry.anonymous += 1
+            return entry.pv
+        lease = PVLease(entry.pv, self)
+        entry.leases.add(lease)
+        return lease
+
+    def release(self, pv: Any) -> bool:
+        """
+        Drop one anonymous reference to a shared PV. Leased references are
+        only dropped through their lease, so this does nothing once only
+        leases hold pv.
+
+        Args:
+            pv: Instance previously returned by acquire
+
+        Returns:
+            True if this was the last reference and the PV was evicted
+        """
+        key = getattr(pv, "_registry_key", None)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.pv is not pv or not entry.anonymous:
+                return False
+            entry.anonymous -= 1
+            if not self._evict(key, entry):
+                return False
+
+        pv._close()
+        return True
+
+    def _release_lease(self, lease: PVLease) -> bool:
+        pv = lease.pv
+        with self._lock:
+            if lease._released:
+                return False
+            lease._released = True
+            key = getattr(pv, "_registry_key", None)
+            entry = self._entries.get(key)
+            if entry is None or lease not in entry.leases:
+                return False
+            entry.leases.discard(lease)
+            if not self._evict(key, entry):
+                return False
+
+        pv._close()
+        return True
+
+    def _evict(self, key: Hashable, entry: _RegistryEntry) -> bool:
+        """Forget entry (holding the lock) if nothing holds it any more"""
+        if entry.refcount > 0:
+            return False
+        del self._entries[key]
+        entry.pv._registry_key = None
+        return True
+
+    def refcount(self, key: Hashable) -> int:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.refcount if entry else 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.pv if entry else None
+
+    def clear(self):
+        """Disconnect and forget every shared PV regardless of holders"""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            for entry in entries:
+                for lease in entry.leases:
+                    lease._released = True
+
+        for entry in entries:
+            entry.pv._registry_key = None
+            try:
+                entry.pv._close()
+            except Exception as e:
+                get_logger().warning(
+                    f"Error closing shared PV {entry.pv.pvname}: {e}"
+                )
+
+    def stats(self) -> Dict[str, int]:
+        """Number of shared channels and outstanding references"""
+        with self._lock:
+            return {
+                "channels": len(self._entries),
+                "references": sum(e.refcount for e in self._entries.values()),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+
+# Default registry used by PV(...) for shareable constructions
+PV_REGISTRY = PVRegistry()
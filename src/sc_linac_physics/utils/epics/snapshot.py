@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+from sc_linac_physics.utils.epics.config import EPICS_INVALID_VAL
+
+# Record layout used by PV.snapshot_many
+SNAPSHOT_DTYPE = np.dtype(
+    [
+        ("value", "f8"),
+        ("severity", "i2"),
+        ("status", "i2"),
+        ("timestamp", "f8"),
+        ("valid", "?"),
+    ]
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PVSnapshot:
+    """
+    One consistent sample of a PV: value and alarm state from the same
+    DBR_TIME read or monitor event.
+
+    ``val`` mirrors lcls_tools' ArchiverValue so fault logic can take either.
+    """
+
+    pvname: str
+    value: Any
+    severity: Optional[int]
+    status: Optional[int]
+    timestamp: Optional[float]
+
+    @classmethod
+    def from_metadata(cls, pvname: str, data: dict) -> "PVSnapshot":
+        """Build from a pyepics metadata dict or monitor callback kwargs"""
+        return cls(
+            pvname,
+            data.get("value"),
+            data.get("severity"),
+            data.get("status"),
+            data.get("timestamp"),
+        )
+
+    @property
+    def val(self) -> Any:
+        return self.value
+
+    @property
+    def is_invalid(self) -> bool:
+        """INVALID severity, or no severity at all"""
+        return self.severity is None or self.severity == EPICS_INVALID_VAL
+
+
+def fill_snapshot_record(
+    records: np.ndarray,
+    index: int,
+    value: Any,
+    severity: Optional[int],
+    status: Optional[int],
+    timestamp: Optional[float],
+):
+    """Write one sample into a SNAPSHOT_DTYPE array"""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        # Strings and waveforms do not fit the scalar value column
+        value = np.nan
+    records[index] = (
+        value,
+        EPICS_INVALID_VAL if severity is None else severity,
+        -1 if status is None else status,
+        np.nan if timestamp is None else timestamp,
+        True,
+    )
+
+
+def empty_snapshot_records(count: int) -> np.ndarray:
+    """SNAPSHOT_DTYPE array with every entry marked invalid"""
+    records = np.zeros(count, dtype=SNAPSHOT_DTYPE)
+    records["value"] = np.nan
+    records["severity"] = EPICS_INVALID_VAL
+    records["status"] = -1
+    records["timestamp"] = np.nan
+    return records
@@ -2,6 +2,7 @@ from typing import Any
 from unittest.mock import MagicMock
 
 from sc_linac_physics.utils.epics.config import EPICS_NO_ALARM_VAL
+from sc_linac_physics.utils.epics.snapshot import PVSnapshot
 
 
 def make_mock_pv(
@@ -66,6 +67,10 @@ def make_mock_pv(
     mock_pv.wait_for_connection.return_value = connected
     mock_pv.validate_value.return_value = True
     mock_pv.check_alarm.return_value = severity
+    # Snapshots follow the mock's current get() result and severity
+    mock_pv.snapshot.side_effect = lambda *args, **kwargs: PVSnapshot(
+        pv_name, mock_pv.get(), mock_pv.severity, EPICS_NO_ALARM_VAL, None
+    )
     mock_pv.disconnect.return_value = None
 
     # Context manager support
@@ -0,0 +1,90 @@
+import threading
+from time import monotonic
+from typing import Any, Callable, Optional
+
+from sc_linac_physics.utils.epics.core import PV
+
+
+class _ChangeSignal:
+    """Condition variable that counts monitor events"""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._events = 0
+
+    def notify(self, **kwargs):
+        with self._condition:
+            self._events += 1
+            self._condition.notify_all()
+
+    @property
+    def events(self) -> int:
+        with self._condition:
+            return self._events
+
+    def wait(self, seen: int, timeout: float):
+        """Block until an event newer than seen arrives or timeout passes"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._events != seen, timeout)
+
+
+def wait_until(
+    pv: PV,
+    predicate: Callable[[Any], bool],
+    timeout: Optional[float] = None,
+    abort_check: Optional[Callable[[], None]] = None,
+    poll_interval: float = 1.0,
+    on_wait: Optional[Callable[[Any], None]] = None,
+) -> Any:
+    """
+    Block until predicate(pv.get()) is true.
+
+    The PV's monitor callbacks wake the waiter as soon as the value changes,
+    so there is no polling latency once the condition is met. Without a
+    monitor event the value is re-read every poll_interval seconds, which
+    also bounds how often abort_check runs.
+
+    Args:
+        pv: PV to watch
+        predicate: Called with each value read from the PV
+        timeout: Give up after this many seconds (None waits forever)
+        abort_check: Called before every wait; raise from it to abort
+        poll_interval: Maximum time between checks (seconds)
+        on_wait: Called with the current value before every wait
+                 (e.g. to report progress)
+
+    Returns:
+        The first value satisfying predicate
+
+    Raises:
+        TimeoutError: If the predicate is not met within timeout
+        PVConnectionError, PVGetError: If the PV cannot be read
+    """
+    deadline = None if timeout is None else monotonic() + timeout
+    signal = _ChangeSignal()
+    index = pv.add_callback(signal.notify)
+    try:
+        while True:
+            seen = signal.events
+            value = pv.get()
+            if predicate(value):
+                return value
+
+            if abort_check:
+                abort_check()
+            if on_wait:
+                on_wait(value)
+
+            wait_time = poll_interval
+            if deadline is not None:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"PV {pv.pvname} did not reach the requested state "
+                        f"within {timeout}s"
+                    )
+                wait_time = min(wait_time, remaining)
+
+            signal.wait(seen, wait_time)
+    finally:
+        pv.remove_callback(index)
@@ -0,0 +1,140 @@
+import logging
+import math
+import threading
+from typing import TYPE_CHECKING, List, Optional
+
+from sc_linac_physics.utils.epics import PVSnapshot
+from sc_linac_physics.utils.sc_linac import linac_utils
+
+if TYPE_CHECKING:
+    from sc_linac_physics.utils.sc_linac.cavity import Cavity
+
+# Seconds between setpoints. Ramps run at the historical fixed rate, which is
+# also the floor: they only slow down while AACT lags and recover back to it
+RAMP_STEP_INTERVAL = 0.1
+RAMP_MIN_STEP_INTERVAL = 0.1
+RAMP_MAX_STEP_INTERVAL = 0.5
+
+# AACT lagging the last setpoint by more than this many steps slows the ramp
+RAMP_TRACKING_STEPS = 2
+
+
+def ramp_setpoints(
+    start: float, des_amp: float, step_size: float
+) -> List[float]:
+    """
+    Setpoints walking up from start to des_amp in step_size steps, ending
+    exactly on des_amp. Starting above des_amp goes straight to des_amp.
+    """
+    steps = max(0, math.floor((des_amp - start) / step_size + 1e-9))
+    setpoints = [start + step * step_size for step in range(1, steps + 1)]
+    if not setpoints or setpoints[-1] != des_amp:
+        setpoints.append(des_amp)
+    return setpoints
+
+
+class AmplitudeRamp:
+    """
+    Walks a cavity's ADES to a target without a blocking round trip per step.
+
+    The setpoint trajectory is computed once from the starting ADES and each
+    intermediate setpoint is written without waiting for completion. The
+    quench latch is watched through its monitor, so a quench interrupts the
+    wait between steps instead of being found by the next poll. After each
+    step the monitored AACT sample is compared with the previous setpoint:
+    while it lags beyond tolerance the step interval grows towards
+    max_interval, and once it tracks again the interval shrinks back towards
+    min_interval, never below RAMP_MIN_STEP_INTERVAL. A sample that has not
+    updated since the last step leaves the interval alone. The final
+    setpoint is a normal (completed) put.
+    """
+
+    def __init__(
+        self,
+        cavity: "Cavity",
+        step_size: float,
+        step_interval: float = RAMP_STEP_INTERVAL,
+        min_interval: float = RAMP_MIN_STEP_INTERVAL,
+        max_interval: float = RAMP_MAX_STEP_INTERVAL,
+        tracking_tolerance: Optional[float] = None,
+    ):
+        """
+        @param tracking_tolerance: largest acceptable |setpoint - AACT| in MV,
+                                   RAMP_TRACKING_STEPS steps by default
+        """
+        self.cavity = cavity
+        self.step_size = step_size
+        self.min_interval = max(min_interval, RAMP_MIN_STEP_INTERVAL)
+        self.max_interval = max(max_interval, self.min_interval)
+        self.interval = min(
+            self.max_interval, max(step_interval, self.min_interval)
+        )
+        if tracking_tolerance is None:
+            tracking_tolerance = RAMP_TRACKING_STEPS * step_size
+        self.tracking_tolerance = tracking_tolerance
+        self._quenched = threading.Event()
+        self._last_aact: Optional[PVSnapshot] = None
+
+    def _on_quench_latch(self, value=None, **kwargs):
+        if value == 1:
+            self._quenched.set()
+
+    def run(self, des_amp: float, start: Optional[float] = None):
+        """
+        @param start: current ADES, read from the cavity if not given
+        @raises QuenchError: if the quench latch sets during the ramp
+        @raises CavityAbortError: from the cavity's check_abort
+        """
+        cavity = self.cavity
+        if start is None:
+            start = cavity.ades
+        *steps, final = ramp_setpoints(start, des_amp, self.step_size)
+
+        latch_pv = cavity.quench_latch_pv_obj
+        callback_index = latch_pv.add_callback(self._on_quench_latch)
+        try:
+            current = start
+            for setpoint in steps:
+                cavity.check_abort()
+                self._check_quench(current, des_amp)
+                cavity.ades_pv_obj.put(setpoint, wait=False)
+                self._quenched.wait(self.interval)
+                self._adapt(setpoint)
+                current = setpoint
+            if steps:
+                cavity.check_abort()
+                self._check_quench(current, des_amp)
+        finally:
+            latch_pv.remove_callback(callback_index)
+
+        if final != start or steps:
+            cavity.ades = final
+
+    def _check_quench(self, current: float, des_amp: float):
+        if self._quenched.is_set() or self.cavity.is_quenched:
+            self.cavity.set_status_message(
+                "Quench detected during RF ramp",
+                logging.ERROR,
+                extra_data={
+                    "current_amplitude": current,
+                    "target_amplitude": des_amp,
+                    "cavity": str(self.cavity),
+                },
+            )
+            raise linac_utils.QuenchError(
+                f"{self.cavity} quench detected, aborting RF ramp"
+            )
+
+    def _adapt(self, setpoint: float):
+        # The monitored sample, so ramping never waits on a network read
+        aact = self.cavity.aact_pv_obj.snapshot()
+        last, self._last_aact = self._last_aact, aact
+        if last is not None and (
+            aact is last
+            or (aact.timestamp is not None and aact.timestamp == last.timestamp)
+        ):
+            return
+        if abs(setpoint - aact.value) <= self.tracking_tolerance:
+            self.interval = max(self.min_interval, self.interval * 0.8)
+        else:
+            self.interval = min(self.max_interval, self.interval * 2)
@@ -0,0 +1,144 @@
+import math
+import sqlite3
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from sc_linac_physics.utils.sc_linac import linac_utils
+from sc_linac_physics.utils.sc_linac.cavity_cache import (
+    CavityCache,
+    CharacterizationRecord,
+    SSACalibrationRecord,
+)
+
+if TYPE_CHECKING:
+    from sc_linac_physics.utils.sc_linac.cavity import Cavity
+    from sc_linac_physics.utils.sc_linac.ssa import SSA
+
+# Seconds a successful result may be reused by setup instead of measured again
+CHARACTERIZATION_REUSE_AGE = 8 * 3600
+SSA_CALIBRATION_REUSE_AGE = 8 * 3600
+
+
+class CalibrationPolicy:
+    """
+    Decides which setup measurements can be skipped because a recent
+    successful result, recorded in the CavityCache, is still in place.
+
+    A characterization is reused only while the IOC still reports the same
+    characterization (so nobody has run another since), and an SSA
+    calibration only while the SSA still holds the recorded slope.
+
+    Opt-in: only Cavity.setup_rf given a policy consults one. SetupCavity
+    and the setup launchers always measure.
+    """
+
+    def __init__(
+        self,
+        characterization_max_age: float = CHARACTERIZATION_REUSE_AGE,
+        ssa_calibration_max_age: float = SSA_CALIBRATION_REUSE_AGE,
+        cache: Optional[CavityCache] = None,
+    ):
+        """
+        @param characterization_max_age: seconds, 0 to always characterize
+        @param ssa_calibration_max_age: seconds, 0 to always calibrate
+        @param cache: defaults to the host's CavityCache
+        """
+        self.characterization_max_age = characterization_max_age
+        self.ssa_calibration_max_age = ssa_calibration_max_age
+        self.cache = cache or CavityCache()
+
+    def reusable_characterization(
+        self, cavity: "Cavity"
+    ) -> Optional[CharacterizationRecord]:
+        record = self.cache.characterization(
+            cavity.cryomodule.name, cavity.number
+        )
+        if record is None:
+            return None
+
+        ioc_timestamp = cavity.characterization_timestamp
+        age = (datetime.now() - ioc_timestamp).total_seconds()
+        if (
+            record.ioc_timestamp != ioc_timestamp
+            or age >= self.characterization_max_age
+            or cavity.characterization_status
+            != linac_utils.CALIBRATION_COMPLETE_VALUE
+        ):
+            return None
+        return record
+
+    def reusable_ssa_calibration(
+        self, cavity: "Cavity"
+    ) -> Optional[SSACalibrationRecord]:
+        record = self.cache.ssa_calibration(
+            cavity.cryomodule.name, cavity.number
+        )
+        if (
+            record is None
+            or time.time() - record.timestamp >= self.ssa_calibration_max_age
+        ):
+            return None
+
+        current_slope = cavity.ssa.current_slope_pv_obj.get()
+        if current_slope is None or not math.isclose(
+            current_slope, record.slope, rel_tol=1e-6
+        ):
+            return None
+        return record
+
+    def ssa_drive_max(self, cavity: "Cavity") -> float:
+        """
+        Drive max to start SSA calibration from: the last one that calibrated
+        successfully, if that was within the reuse age
+        """
+        record = self.cache.ssa_calibration(
+            cavity.cryomodule.name, cavity.number
+        )
+        if (
+            record is None
+            or time.time() - record.timestamp >= self.ssa_calibration_max_age
+        ):
+            return cavity.ssa.drive_max
+        return record.drive_max
+
+
+def record_characterization(
+    cavity: "Cavity",
+    ioc_timestamp: datetime,
+    cache: Optional[CavityCache] = None,
+):
+    """Record the cavity's pushed characterization results for later reuse"""
+    cache = cache or CavityCache()
+    try:
+        cache.save_characterization(
+            cavity.cryomodule.name,
+            cavity.number,
+            cavity.measured_loaded_q,
+            cavity.measured_scale_factor,
+            ioc_timestamp,
+        )
+    except (OSError, sqlite3.Error) as e:
+        cavity.logger.warning(f"Could not cache {cavity} characterization: {e}")
+
+
+def record_ssa_calibration(
+    ssa: "SSA", drive_max: float, cache: Optional[CavityCache] = None
+):
+    """
+    Record the SSA's pushed calibration results for later reuse
+    @param drive_max: the drive max (DRV_MAX_REQ) the calibration succeeded
+                      with, which the saved drive max need not match
+    """
+    cache = cache or CavityCache()
+    cavity = ssa.cavity
+    try:
+        cache.save_ssa_calibration(
+            cavity.cryomodule.name,
+            cavity.number,
+            ssa.measured_slope,
+            drive_max,
+            ssa.max_fwd_pwr,
+        )
+    except (OSError, sqlite3.Error) as e:
+        cavity.logger.warning(f"Could not cache {ssa} calibration: {e}")
@@ -1,15 +1,32 @@
 import logging
 import time
 from datetime import datetime
-from typing import Optional, Callable, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV, EPICS_INVALID_VAL, PVInvalidError
+from sc_linac_physics.utils.epics import (
+    EPICS_INVALID_VAL,
+    PV,
+    PVInvalidError,
+    wait_until,
+)
 from sc_linac_physics.utils.logger import BASE_LOG_DIR, custom_logger
 from sc_linac_physics.utils.sc_linac import linac_utils
+from sc_linac_physics.utils.sc_linac.amplitude_ramp import AmplitudeRamp
+from sc_linac_physics.utils.sc_linac.calibration_policy import (
+    CalibrationPolicy,
+    record_characterization,
+)
 from sc_linac_physics.utils.sc_linac.linac_utils import (
     STATUS_RUNNING_VALUE,
     STATUS_ERROR_VALUE,
 )
+from sc_linac_physics.utils.sc_linac.pv_descriptors import (
+    pv_name,
+    pv_property,
+    pv_value,
+)
+from sc_linac_physics.utils.sc_linac.status_publisher import StatusPublisher
+from sc_linac_physics.utils.sc_linac.tuner_model import StepResponseModel
 
 if TYPE_CHECKING:
     from linac import Linac
@@ -29,6 +46,100 @@ class Cavity(linac_utils.SCLinacObject):
 
     """
 
+    __slots__ = (
+        "number",
+        "rack",
+        "cryomodule",
+        "linac",
+        "_logger",
+        "_pv_prefix",
+        "ctePrefix",
+        "chirp_prefix",
+        "abort_flag",
+        "ssa",
+        "stepper_tuner",
+        "piezo",
+        "length",
+        "frequency",
+        "loaded_q_lower_limit",
+        "loaded_q_upper_limit",
+        "scale_factor_lower_limit",
+        "scale_factor_upper_limit",
+        "__dict__",
+        "__weakref__",
+    )
+
+    # When set (e.g. by a launcher script), status, progress and status
+    # message puts go through it instead of blocking the procedure
+    status_publisher: Optional[StatusPublisher] = None
+
+    # PV names are derived from the prefix on access and PV objects are only
+    # created (and stored on the instance) the first time they are used
+    calc_probe_q_pv_obj = pv_property("QPROBE_CALC1.PROC")
+    push_ssa_slope_pv_obj = pv_property("PUSH_SSA_SLOPE.PROC")
+    save_ssa_slope_pv_obj = pv_property("SAVE_SSA_SLOPE.PROC")
+    interlock_reset_pv_obj = pv_property("INTLK_RESET_ALL")
+    drive_level_pv_obj = pv_property("SEL_ASET")
+    characterization_start_pv_obj = pv_property("PROBECALSTRT")
+    characterization_status_pv_obj = pv_property("PROBECALSTS")
+    current_q_loaded_pv = pv_name("QLOADED")
+    measured_loaded_q_pv_obj = pv_property("QLOADED_NEW")
+    push_loaded_q_pv_obj = pv_property("PUSH_QLOADED.PROC")
+    save_q_loaded_pv = pv_name("SAVE_QLOADED.PROC")
+    current_cavity_scale_pv = pv_name("CAV:SCALER_SEL.B")
+    measured_scale_factor_pv_obj = pv_property("CAV:CAL_SCALEB_NEW")
+    push_scale_factor_pv_obj = pv_property("PUSH_CAV_SCALE.PROC")
+    save_cavity_scale_pv = pv_name("SAVE_CAV_SCALE.PROC")
+    ades_pv_obj = pv_property("ADES")
+    acon_pv_obj = pv_property("ACON")
+    aact_pv_obj = pv_property("AACTMEAN")
+    ades_max_pv_obj = pv_property("ADES_MAX")
+    rf_mode_ctrl_pv_obj = pv_property("RFMODECTRL")
+    rf_mode_pv_obj = pv_property("RFMODE")
+    rf_state_pv_obj = pv_property("RFSTATE")
+    rf_control_pv_obj = pv_property("RFCTRL")
+    pulse_go_pv_obj = pv_property("PULSE_DIFF_SUM")
+    pulse_status_pv_obj = pv_property("PULSE_STATUS")
+    pulse_on_time_pv_obj = pv_property("PULSE_ONTIME")
+    rev_waveform_pv = pv_name("REV:AWF")
+    fwd_waveform_pv = pv_name("FWD:AWF")
+    cav_waveform_pv = pv_name("CAV:AWF")
+    stepper_temp_pv = pv_name("STEPTEMP")
+    detune_best_pv_obj = pv_property("DFBEST")
+    detune_chirp_pv_obj = pv_property("CHIRP:DF")
+    rf_permit_pv_obj = pv_property("RFPERMIT")
+    quench_latch_pv_obj = pv_property("QUENCH_LTCH")
+    quench_bypass_pv = pv_name("QUENCH_BYP")
+    cw_data_decimation_pv_obj = pv_property(
+        "ACQ_DECIM_SEL.A", slot="_cw_data_decim_pv_obj"
+    )
+    pulsed_data_decimation_pv_obj = pv_property(
+        "ACQ_DECIM_SEL.C", slot="_pulsed_data_decim_pv_obj"
+    )
+    tune_config_pv_obj = pv_property("TUNE_CONFIG")
+    hw_mode_pv_obj = pv_property("HWMODE")
+    char_timestamp_pv_obj = pv_property("PROBECALTS")
+    progress_pv_obj = pv_property("PROG", addr="auto_pv_addr")
+    status_pv_obj = pv_property("STATUS", addr="auto_pv_addr")
+    status_msg_pv_obj = pv_property("MSG", addr="auto_pv_addr")
+    note_pv_obj = pv_property("NOTE", addr="auto_pv_addr")
+    chirp_freq_start_pv_obj = pv_property("CHIRP:FREQ_START")
+    freq_stop_pv_obj = pv_property(
+        "CHIRP:FREQ_STOP",
+        name="chirp_freq_stop_pv",
+        slot="_chirp_freq_stop_pv_obj",
+    )
+
+    cw_data_decimation = pv_value("cw_data_decimation_pv_obj")
+    pulsed_data_decimation = pv_value("pulsed_data_decimation_pv_obj")
+    rf_control = pv_value("rf_control_pv_obj")
+    drive_level = pv_value("drive_level_pv_obj")
+    pulse_on_time = pv_value("pulse_on_time_pv_obj")
+    ades = pv_value("ades_pv_obj")
+    acon = pv_value("acon_pv_obj")
+    chirp_freq_start = pv_value("chirp_freq_start_pv_obj")
+    chirp_freq_stop = pv_value("freq_stop_pv_obj")
+
     def __init__(self, cavity_num: int, rack_object: "Rack"):
         """
         @param cavity_num: int cavity number i.e. 1 - 8
@@ -79,133 +190,6 @@ class Cavity(linac_utils.SCLinacObject):
         )
         self.piezo: "Piezo" = self.rack.piezo_class(cavity=self)
 
-        self._calc_probe_q_pv_obj: Optional[PV] = None
-        self.calc_probe_q_pv: str = self.pv_addr("QPROBE_CALC1.PROC")
-
-        self._push_ssa_slope_pv_obj: Optional[PV] = None
-        self.push_ssa_slope_pv: str = self.pv_addr("PUSH_SSA_SLOPE.PROC")
-
-        self.save_ssa_slope_pv: str = self.pv_addr("SAVE_SSA_SLOPE.PROC")
-        self._save_ssa_slope_pv_obj: Optional[PV] = None
-
-        self.interlock_reset_pv: str = self.pv_addr("INTLK_RESET_ALL")
-        self._interlock_reset_pv_obj: Optional[PV] = None
-
-        self.drive_level_pv: str = self.pv_addr("SEL_ASET")
-        self._drive_level_pv_obj: Optional[PV] = None
-
-        self.characterization_start_pv: str = self.pv_addr("PROBECALSTRT")
-        self._characterization_start_pv_obj: Optional[PV] = None
-
-        self.characterization_status_pv: str = self.pv_addr("PROBECALSTS")
-        self._characterization_status_pv_obj: Optional[PV] = None
-
-        self.current_q_loaded_pv: str = self.pv_addr("QLOADED")
-
-        self.measured_loaded_q_pv: str = self.pv_addr("QLOADED_NEW")
-        self._measured_loaded_q_pv_obj: Optional[PV] = None
-
-        self.push_loaded_q_pv: str = self.pv_addr("PUSH_QLOADED.PROC")
-        self._push_loaded_q_pv_obj: Optional[PV] = None
-
-        self.save_q_loaded_pv: str = self.pv_addr("SAVE_QLOADED.PROC")
-
-        self.current_cavity_scale_pv: str = self.pv_addr("CAV:SCALER_SEL.B")
-
-        self.measured_scale_factor_pv: str = self.pv_addr("CAV:CAL_SCALEB_NEW")
-        self._measured_scale_factor_pv_obj: Optional[PV] = None
-
-        self.push_scale_factor_pv: str = self.pv_addr("PUSH_CAV_SCALE.PROC")
-        self._push_scale_factor_pv_obj: Optional[PV] = None
-
-        self.save_cavity_scale_pv: str = self.pv_addr("SAVE_CAV_SCALE.PROC")
-
-        self.ades_pv: str = self.pv_addr("ADES")
-        self._ades_pv_obj: Optional[PV] = None
-
-        self.acon_pv: str = self.pv_addr("ACON")
-        self._acon_pv_obj: Optional[PV] = None
-
-        self.aact_pv: str = self.pv_addr("AACTMEAN")
-        self._aact_pv_obj: Optional[PV] = None
-
-        self.ades_max_pv: str = self.pv_addr("ADES_MAX")
-        self._ades_max_pv_obj: Optional[PV] = None
-
-        self.rf_mode_ctrl_pv: str = self.pv_addr("RFMODECTRL")
-        self._rf_mode_ctrl_pv_obj: Optional[PV] = None
-
-        self.rf_mode_pv: str = self.pv_addr("RFMODE")
-        self._rf_mode_pv_obj: Optional[PV] = None
-
-        self.rf_state_pv: str = self.pv_addr("RFSTATE")
-        self._rf_state_pv_obj: Optional[PV] = None
-
-        self.rf_control_pv: str = self.pv_addr("RFCTRL")
-        self._rf_control_pv_obj: Optional[PV] = None
-
-        self.pulse_go_pv: str = self.pv_addr("PULSE_DIFF_SUM")
-        self._pulse_go_pv_obj: Optional[PV] = None
-
-        self.pulse_status_pv: str = self.pv_addr("PULSE_STATUS")
-        self._pulse_status_pv_obj: Optional[PV] = None
-
-        self.pulse_on_time_pv: str = self.pv_addr("PULSE_ONTIME")
-        self._pulse_on_time_pv_obj: Optional[PV] = None
-
-        self.rev_waveform_pv: str = self.pv_addr("REV:AWF")
-        self.fwd_waveform_pv: str = self.pv_addr("FWD:AWF")
-        self.cav_waveform_pv: str = self.pv_addr("CAV:AWF")
-
-        self.stepper_temp_pv: str = self.pv_addr("STEPTEMP")
-
-        self.detune_best_pv: str = self.pv_addr("DFBEST")
-        self._detune_best_pv_obj: Optional[PV] = None
-
-        self.detune_chirp_pv: str = self.pv_addr("CHIRP:DF")
-        self._detune_chirp_pv_obj: Optional[PV] = None
-
-        self.rf_permit_pv: str = self.pv_addr("RFPERMIT")
-        self._rf_permit_pv_obj: Optional[PV] = None
-
-        self.quench_latch_pv: str = self.pv_addr("QUENCH_LTCH")
-        self._quench_latch_pv_obj: Optional[PV] = None
-
-        self.quench_bypass_pv: str = self.pv_addr("QUENCH_BYP")
-
-        self.cw_data_decimation_pv: str = self.pv_addr("ACQ_DECIM_SEL.A")
-        self._cw_data_decim_pv_obj: Optional[PV] = None
-
-        self.pulsed_data_decimation_pv: str = self.pv_addr("ACQ_DECIM_SEL.C")
-        self._pulsed_data_decim_pv_obj: Optional[PV] = None
-
-        self.tune_config_pv: str = self.pv_addr("TUNE_CONFIG")
-        self._tune_config_pv_obj: Optional[PV] = None
-
-        self.chirp_freq_start_pv: str = self.chirp_prefix + "FREQ_START"
-        self._chirp_freq_start_pv_obj: Optional[PV] = None
-
-        self.chirp_freq_stop_pv: str = self.chirp_prefix + "FREQ_STOP"
-        self._chirp_freq_stop_pv_obj: Optional[PV] = None
-
-        self.hw_mode_pv: str = self.pv_addr("HWMODE")
-        self._hw_mode_pv_obj: Optional[PV] = None
-
-        self.char_timestamp_pv: str = self.pv_addr("PROBECALTS")
-        self._char_timestamp_pv_obj: Optional[PV] = None
-
-        self.progress_pv: str = self.auto_pv_addr("PROG")
-        self._progress_pv_obj: Optional[PV] = None
-
-        self.status_pv: str = self.auto_pv_addr("STATUS")
-        self._status_pv_obj: Optional[PV] = None
-
-        self.status_msg_pv: str = self.auto_pv_addr("MSG")
-        self._status_msg_pv_obj: Optional[PV] = None
-
-        self.note_pv: str = self.auto_pv_addr("NOTE")
-        self._note_pv_obj: Optional[PV] = None
-
     def __str__(self):
         return (
             f"{self.linac.name} CM{self.cryomodule.name} Cavity {self.number}"
@@ -240,52 +224,39 @@ class Cavity(linac_utils.SCLinacObject):
         return self._pv_prefix
 
     @property
-    def note_pv_obj(self) -> PV:
-        if not self._note_pv_obj:
-            self._note_pv_obj = PV(self.note_pv)
-        return self._note_pv_obj
+    def script_is_running(self) -> bool:
+        return self.status == STATUS_RUNNING_VALUE
 
-    @property
-    def status_pv_obj(self):
-        if not self._status_pv_obj:
-            self._status_pv_obj = PV(self.status_pv)
-        return self._status_pv_obj
+    def _publish(self, pv: PV, value):
+        if self.status_publisher:
+            self.status_publisher.publish(pv, value, self.logger)
+        else:
+            pv.put(value)
+
+    def _published_value(self, pv: PV):
+        if self.status_publisher:
+            return self.status_publisher.get(pv)
+        return pv.get()
 
     @property
     def status(self):
-        return self.status_pv_obj.get()
+        return self._published_value(self.status_pv_obj)
 
     @status.setter
-    def status(self, value: int):
-        self.status_pv_obj.put(value)
+    def status(self, value):
+        self._publish(self.status_pv_obj, value)
 
     @property
-    def script_is_running(self) -> bool:
-        return self.status == STATUS_RUNNING_VALUE
-
-    @property
-    def progress_pv_obj(self):
-        if not self._progress_pv_obj:
-            self._progress_pv_obj = PV(self.progress_pv)
-        return self._progress_pv_obj
-
-    @property
-    def progress(self) -> float:
-        return self.progress_pv_obj.get()
+    def progress(self):
+        return self._published_value(self.progress_pv_obj)
 
     @progress.setter
-    def progress(self, value: float):
-        self.progress_pv_obj.put(value)
-
-    @property
-    def status_msg_pv_obj(self) -> PV:
-        if not self._status_msg_pv_obj:
-            self._status_msg_pv_obj = PV(self.status_msg_pv)
-        return self._status_msg_pv_obj
+    def progress(self, value):
+        self._publish(self.progress_pv_obj, value)
 
     @property
     def status_message(self):
-        return self.status_msg_pv_obj.get()
+        return self._published_value(self.status_msg_pv_obj)
 
     @status_message.setter
     def status_message(self, message: str):
@@ -316,72 +287,18 @@ class Cavity(linac_utils.SCLinacObject):
         else:
             self.logger.debug(message, extra=extra)
 
-        self.status_msg_pv_obj.put(message)
+        self._publish(self.status_msg_pv_obj, message)
 
     @property
     def microsteps_per_hz(self):
         return 1 / self.stepper_tuner.hz_per_microstep
 
     def start_characterization(self):
-        if not self._characterization_start_pv_obj:
-            self._characterization_start_pv_obj = PV(
-                self.characterization_start_pv
-            )
-        self._characterization_start_pv_obj.put(1, wait=False)
-
-    @property
-    def cw_data_decimation_pv_obj(self) -> PV:
-        if not self._cw_data_decim_pv_obj:
-            self._cw_data_decim_pv_obj = PV(self.cw_data_decimation_pv)
-        return self._cw_data_decim_pv_obj
-
-    @property
-    def cw_data_decimation(self):
-        return self.cw_data_decimation_pv_obj.get()
-
-    @cw_data_decimation.setter
-    def cw_data_decimation(self, value: float):
-        self.cw_data_decimation_pv_obj.put(value)
-
-    @property
-    def pulsed_data_decimation_pv_obj(self) -> PV:
-        if not self._pulsed_data_decim_pv_obj:
-            self._pulsed_data_decim_pv_obj = PV(self.pulsed_data_decimation_pv)
-        return self._pulsed_data_decim_pv_obj
-
-    @property
-    def pulsed_data_decimation(self):
-        return self.pulsed_data_decimation_pv_obj.get()
-
-    @pulsed_data_decimation.setter
-    def pulsed_data_decimation(self, value):
-        self.pulsed_data_decimation_pv_obj.put(value)
-
-    @property
-    def rf_control_pv_obj(self) -> PV:
-        if not self._rf_control_pv_obj:
-            self._rf_control_pv_obj = PV(self.rf_control_pv)
-        return self._rf_control_pv_obj
-
-    @property
-    def rf_control(self):
-        return self.rf_control_pv_obj.get()
-
-    @rf_control.setter
-    def rf_control(self, value):
-        self.rf_control_pv_obj.put(value)
+        self.characterization_start_pv_obj.put(1, wait=False)
 
     @property
     def rf_mode(self):
-        if not self._rf_mode_pv_obj:
-            self._rf_mode_pv_obj = PV(self.rf_mode_pv)
-        return self._rf_mode_pv_obj.get()
-
-    @property
-    def rf_mode_ctrl_pv_obj(self) -> PV:
-        if not self._rf_mode_ctrl_pv_obj:
-            self._rf_mode_ctrl_pv_obj = PV(self.rf_mode_ctrl_pv)
-        return self._rf_mode_ctrl_pv_obj
+        return self.rf_mode_pv_obj.get()
 
     def set_chirp_mode(self):
         self.rf_mode_ctrl_pv_obj.put(linac_utils.RF_MODE_CHIRP)
@@ -395,37 +312,15 @@ class Cavity(linac_utils.SCLinacObject):
     def set_selap_mode(self):
         self.rf_mode_ctrl_pv_obj.put(linac_utils.RF_MODE_SELAP)
 
-    @property
-    def drive_level_pv_obj(self):
-        if not self._drive_level_pv_obj:
-            self._drive_level_pv_obj = PV(self.drive_level_pv)
-        return self._drive_level_pv_obj
-
-    @property
-    def drive_level(self):
-        return self.drive_level_pv_obj.get()
-
-    @drive_level.setter
-    def drive_level(self, value):
-        self.drive_level_pv_obj.put(value)
-
     def push_ssa_slope(self):
-        if not self._push_ssa_slope_pv_obj:
-            self._push_ssa_slope_pv_obj = PV(
-                self._pv_prefix + "PUSH_SSA_SLOPE.PROC"
-            )
-        self._push_ssa_slope_pv_obj.put(1, wait=False)
+        self.push_ssa_slope_pv_obj.put(1, wait=False)
 
     def save_ssa_slope(self):
-        if not self._save_ssa_slope_pv_obj:
-            self._save_ssa_slope_pv_obj = PV(self.save_ssa_slope_pv)
-        self._save_ssa_slope_pv_obj.put(1, wait=False)
+        self.save_ssa_slope_pv_obj.put(1, wait=False)
 
     @property
     def measured_loaded_q(self) -> float:
-        if not self._measured_loaded_q_pv_obj:
-            self._measured_loaded_q_pv_obj = PV(self.measured_loaded_q_pv)
-        return self._measured_loaded_q_pv_obj.get()
+        return self.measured_loaded_q_pv_obj.get()
 
     @property
     def measured_loaded_q_in_tolerance(self) -> bool:
@@ -436,17 +331,11 @@ class Cavity(linac_utils.SCLinacObject):
         )
 
     def push_loaded_q(self):
-        if not self._push_loaded_q_pv_obj:
-            self._push_loaded_q_pv_obj = PV(self.push_loaded_q_pv)
-        self._push_loaded_q_pv_obj.put(1, wait=False)
+        self.push_loaded_q_pv_obj.put(1, wait=False)
 
     @property
     def measured_scale_factor(self) -> float:
-        if not self._measured_scale_factor_pv_obj:
-            self._measured_scale_factor_pv_obj = PV(
-                self.measured_scale_factor_pv
-            )
-        return self._measured_scale_factor_pv_obj.get()
+        return self.measured_scale_factor_pv_obj.get()
 
     @property
     def measured_scale_factor_in_tolerance(self) -> bool:
@@ -457,17 +346,11 @@ class Cavity(linac_utils.SCLinacObject):
         )
 
     def push_scale_factor(self):
-        if not self._push_scale_factor_pv_obj:
-            self._push_scale_factor_pv_obj = PV(self.push_scale_factor_pv)
-        self._push_scale_factor_pv_obj.put(1, wait=False)
+        self.push_scale_factor_pv_obj.put(1, wait=False)
 
     @property
     def characterization_status(self):
-        if not self._characterization_status_pv_obj:
-            self._characterization_status_pv_obj = PV(
-                self.characterization_status_pv
-            )
-        return self._characterization_status_pv_obj.get()
+        return self.characterization_status_pv_obj.get()
 
     @property
     def characterization_running(self) -> bool:
@@ -483,69 +366,25 @@ class Cavity(linac_utils.SCLinacObject):
             == linac_utils.CHARACTERIZATION_CRASHED_VALUE
         )
 
-    @property
-    def pulse_on_time(self):
-        if not self._pulse_on_time_pv_obj:
-            self._pulse_on_time_pv_obj = PV(self.pulse_on_time_pv)
-        return self._pulse_on_time_pv_obj.get()
-
-    @pulse_on_time.setter
-    def pulse_on_time(self, value: int):
-        if not self._pulse_on_time_pv_obj:
-            self._pulse_on_time_pv_obj = PV(self.pulse_on_time_pv)
-        self._pulse_on_time_pv_obj.put(value)
-
     @property
     def pulse_status(self):
-        if not self._pulse_status_pv_obj:
-            self._pulse_status_pv_obj = PV(self.pulse_status_pv)
-        return self._pulse_status_pv_obj.get()
+        return self.pulse_status_pv_obj.get()
 
     @property
     def rf_permit(self):
-        if not self._rf_permit_pv_obj:
-            self._rf_permit_pv_obj = PV(self.rf_permit_pv)
-        return self._rf_permit_pv_obj.get()
+        return self.rf_permit_pv_obj.get()
 
     @property
     def rf_inhibited(self) -> bool:
         return self.rf_permit == 0
 
-    @property
-    def ades(self):
-        if not self._ades_pv_obj:
-            self._ades_pv_obj = PV(self.ades_pv)
-        return self._ades_pv_obj.get()
-
-    @ades.setter
-    def ades(self, value: float):
-        if not self._ades_pv_obj:
-            self._ades_pv_obj = PV(self._pv_prefix + "ADES")
-        self._ades_pv_obj.put(value)
-
-    @property
-    def acon(self):
-        if not self._acon_pv_obj:
-            self._acon_pv_obj = PV(self.acon_pv)
-        return self._acon_pv_obj.get()
-
-    @acon.setter
-    def acon(self, value: float):
-        if not self._acon_pv_obj:
-            self._acon_pv_obj = PV(self.acon_pv)
-        self._acon_pv_obj.put(value)
-
     @property
     def aact(self):
-        if not self._aact_pv_obj:
-            self._aact_pv_obj = PV(self.aact_pv)
-        return self._aact_pv_obj.get()
+        return self.aact_pv_obj.get()
 
     @property
     def ades_max(self):
-        if not self._ades_max_pv_obj:
-            self._ades_max_pv_obj = PV(self.ades_max_pv)
-        return self._ades_max_pv_obj.get()
+        return self.ades_max_pv_obj.get()
 
     @property
     def edm_macro_string(self):
@@ -580,12 +419,6 @@ class Cavity(linac_utils.SCLinacObject):
         area = self.cryomodule.linac.name
         return f"CM={cm},AREA={area}"
 
-    @property
-    def hw_mode_pv_obj(self) -> PV:
-        if not self._hw_mode_pv_obj:
-            self._hw_mode_pv_obj = PV(self.hw_mode_pv)
-        return self._hw_mode_pv_obj
-
     @property
     def hw_mode(self):
         return self.hw_mode_pv_obj.get()
@@ -600,51 +433,11 @@ class Cavity(linac_utils.SCLinacObject):
 
     @property
     def is_quenched(self) -> bool:
-        if not self._quench_latch_pv_obj:
-            self._quench_latch_pv_obj = PV(self.quench_latch_pv)
-        if self._quench_latch_pv_obj.severity == EPICS_INVALID_VAL:
+        # Latch value and severity from the same sample
+        latch = self.quench_latch_pv_obj.snapshot()
+        if latch.severity == EPICS_INVALID_VAL:
             raise PVInvalidError(f"{self} quench latch PV invalid")
-        return self._quench_latch_pv_obj.get() == 1
-
-    @property
-    def tune_config_pv_obj(self) -> PV:
-        if not self._tune_config_pv_obj:
-            self._tune_config_pv_obj = PV(self.tune_config_pv)
-        return self._tune_config_pv_obj
-
-    @property
-    def chirp_freq_start_pv_obj(self) -> PV:
-        if not self._chirp_freq_start_pv_obj:
-            self._chirp_freq_start_pv_obj = PV(self.chirp_freq_start_pv)
-        return self._chirp_freq_start_pv_obj
-
-    @property
-    def chirp_freq_start(self):
-        return self.chirp_freq_start_pv_obj.get()
-
-    @chirp_freq_start.setter
-    def chirp_freq_start(self, value):
-        self.chirp_freq_start_pv_obj.put(value)
-
-    @property
-    def freq_stop_pv_obj(self) -> PV:
-        if not self._chirp_freq_stop_pv_obj:
-            self._chirp_freq_stop_pv_obj = PV(self.chirp_freq_stop_pv)
-        return self._chirp_freq_stop_pv_obj
-
-    @property
-    def chirp_freq_stop(self):
-        return self.freq_stop_pv_obj.get()
-
-    @chirp_freq_stop.setter
-    def chirp_freq_stop(self, value):
-        self.freq_stop_pv_obj.put(value)
-
-    @property
-    def calc_probe_q_pv_obj(self) -> PV:
-        if not self._calc_probe_q_pv_obj:
-            self._calc_probe_q_pv_obj = PV(self.calc_probe_q_pv)
-        return self._calc_probe_q_pv_obj
+        return latch.value == 1
 
     def calculate_probe_q(self):
         self.calc_probe_q_pv_obj.put(1, wait=False)
@@ -660,12 +453,6 @@ class Cavity(linac_utils.SCLinacObject):
         self.chirp_freq_stop = offset
         self.set_status_message("Chirp range set successfully", logging.INFO)
 
-    @property
-    def rf_state_pv_obj(self) -> PV:
-        if not self._rf_state_pv_obj:
-            self._rf_state_pv_obj = PV(self.rf_state_pv)
-        return self._rf_state_pv_obj
-
     @property
     def rf_state(self):
         """This property is read only"""
@@ -729,18 +516,6 @@ class Cavity(linac_utils.SCLinacObject):
 
         self.tune_config_pv_obj.put(linac_utils.TUNE_CONFIG_RESONANCE_VALUE)
 
-    @property
-    def detune_best_pv_obj(self) -> PV:
-        if not self._detune_best_pv_obj:
-            self._detune_best_pv_obj = PV(self.detune_best_pv)
-        return self._detune_best_pv_obj
-
-    @property
-    def detune_chirp_pv_obj(self) -> PV:
-        if not self._detune_chirp_pv_obj:
-            self._detune_chirp_pv_obj = PV(self.detune_chirp_pv)
-        return self._detune_chirp_pv_obj
-
     @property
     def detune_best(self):
         return self.detune_best_pv_obj.get()
@@ -759,9 +534,10 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def detune_invalid(self) -> bool:
         if self.rf_mode == linac_utils.RF_MODE_CHIRP:
-            return self.detune_chirp_pv_obj.severity == EPICS_INVALID_VAL
+            detune = self.detune_chirp_pv_obj.snapshot()
         else:
-            return self.detune_best_pv_obj.severity == EPICS_INVALID_VAL
+            detune = self.detune_best_pv_obj.snapshot()
+        return detune.severity == EPICS_INVALID_VAL
 
     def _auto_tune(
         self,
@@ -773,7 +549,8 @@ class Cavity(linac_utils.SCLinacObject):
             raise linac_utils.DetuneError(f"{self} detune invalid")
 
         delta_hz = delta_hz_func()
-        expected_steps: int = abs(int(delta_hz * self.microsteps_per_hz))
+        model = StepResponseModel.for_cavity(self)
+        expected_steps: int = abs(int(model.steps_for(delta_hz)))
 
         stepper_tol_factor = linac_utils.stepper_tol_factor(expected_steps)
 
@@ -786,7 +563,7 @@ class Cavity(linac_utils.SCLinacObject):
 
         while abs(delta_hz) > tolerance:
             self.check_abort()
-            est_steps = int(0.9 * delta_hz * self.microsteps_per_hz)
+            est_steps = int(0.9 * model.steps_for(delta_hz))
 
             self.set_status_message(
                 "Moving stepper",
@@ -794,6 +571,7 @@ class Cavity(linac_utils.SCLinacObject):
                 extra_data={
                     "estimated_steps": est_steps,
                     "delta_hz": delta_hz,
+                    "hz_per_microstep": model.hz_per_microstep,
                     "cavity": str(self),
                 },
             )
@@ -824,7 +602,11 @@ class Cavity(linac_utils.SCLinacObject):
             # this should catch if the chirp range is wrong or if the cavity is off
             self.check_detune()
 
-            delta_hz = delta_hz_func()
+            new_delta_hz = delta_hz_func()
+            model.update(est_steps, delta_hz - new_delta_hz)
+            delta_hz = new_delta_hz
+
+        model.save(self)
 
     def check_detune(self):
         if self.detune_invalid:
@@ -868,36 +650,32 @@ class Cavity(linac_utils.SCLinacObject):
             self.pulse_on_time = linac_utils.NOMINAL_PULSED_ONTIME
             self.push_go_button()
 
-    @property
-    def pulse_go_pv_obj(self) -> PV:
-        if not self._pulse_go_pv_obj:
-            self._pulse_go_pv_obj = PV(self._pv_prefix + "PULSE_DIFF_SUM")
-        return self._pulse_go_pv_obj
-
     def push_go_button(self):
         """
         Many of the changes made to a cavity don't actually take effect until the
         go button is pressed
         :return:
         """
-        self._pulse_go_pv_obj.put(1, wait=False)
-        while self.pulse_status < 2:
-            self.check_abort()
-            self.set_status_message(
+        self.pulse_go_pv_obj.put(1, wait=False)
+        pulse_status = wait_until(
+            self.pulse_status_pv_obj,
+            lambda status: status >= 2,
+            abort_check=self.check_abort,
+            on_wait=lambda status: self.set_status_message(
                 "Waiting for pulse state to change",
                 logging.DEBUG,
                 extra_data={
-                    "current_pulse_status": self.pulse_status,
+                    "current_pulse_status": status,
                     "cavity": str(self),
                 },
-            )
-            time.sleep(1)
-        if self.pulse_status > 2:
+            ),
+        )
+        if pulse_status > 2:
             self.set_status_message(
                 "Pulse operation failed",
                 logging.ERROR,
                 extra_data={
-                    "pulse_status": self.pulse_status,
+                    "pulse_status": pulse_status,
                     "cavity": str(self),
                 },
             )
@@ -910,17 +688,19 @@ class Cavity(linac_utils.SCLinacObject):
             self.reset_interlocks()
             self.rf_control = 1
 
-            while not self.is_on:
-                self.check_abort()
-                self.set_status_message(
+            wait_until(
+                self.rf_state_pv_obj,
+                lambda rf_state: rf_state == 1,
+                abort_check=self.check_abort,
+                on_wait=lambda rf_state: self.set_status_message(
                     "Waiting for cavity to turn on",
                     logging.DEBUG,
                     extra_data={
-                        "rf_state": self.rf_state,
+                        "rf_state": rf_state,
                         "cavity": str(self),
                     },
-                )
-                time.sleep(1)
+                ),
+            )
 
             self.set_status_message(
                 "Cavity successfully turned on", logging.INFO
@@ -936,12 +716,14 @@ class Cavity(linac_utils.SCLinacObject):
     def turn_off(self):
         self.set_status_message("Turning cavity off", logging.INFO)
         self.rf_control = 0
-        while self.is_on:
-            self.check_abort()
-            self.set_status_message(
+        wait_until(
+            self.rf_state_pv_obj,
+            lambda rf_state: rf_state != 1,
+            abort_check=self.check_abort,
+            on_wait=lambda rf_state: self.set_status_message(
                 "Waiting for cavity to turn off", logging.DEBUG
-            )
-            time.sleep(1)
+            ),
+        )
         self.set_status_message("Cavity successfully turned off", logging.INFO)
 
     def setup_selap(self, des_amp: float = 5):
@@ -981,7 +763,12 @@ class Cavity(linac_utils.SCLinacObject):
             )
             raise linac_utils.CavityAbortError(f"Abort requested for {self}")
 
-    def setup_rf(self, des_amp):
+    def setup_rf(self, des_amp, policy: Optional[CalibrationPolicy] = None):
+        """
+        @param des_amp: amplitude to ramp up to, capped at AMAX
+        @param policy: when given, recent SSA calibration and characterization
+                       results it accepts are reused instead of remeasured
+        """
         if des_amp > self.ades_max:
             self.set_status_message(
                 "Requested amplitude too high - using AMAX instead",
@@ -1004,10 +791,19 @@ class Cavity(linac_utils.SCLinacObject):
         )
 
         self.turn_off()
-        self.ssa.calibrate(self.ssa.drive_max)
+        if policy and policy.reusable_ssa_calibration(self):
+            self.set_status_message(
+                "Recent SSA calibration still in place, skipping",
+                logging.INFO,
+            )
+            self.ssa.turn_on()
+        else:
+            self.ssa.calibrate(
+                policy.ssa_drive_max(self) if policy else self.ssa.drive_max
+            )
         self.move_to_resonance()
 
-        self.characterize()
+        self.characterize(policy)
         self.calculate_probe_q()
 
         self.check_abort()
@@ -1110,10 +906,7 @@ class Cavity(linac_utils.SCLinacObject):
             },
         )
 
-        if not self._interlock_reset_pv_obj:
-            self._interlock_reset_pv_obj = PV(self.interlock_reset_pv)
-
-        self._interlock_reset_pv_obj.put(1, wait=False)
+        self.interlock_reset_pv_obj.put(1, wait=False)
         time.sleep(wait)
 
         self.set_status_message("Checking RF permit status", logging.DEBUG)
@@ -1145,17 +938,17 @@ class Cavity(linac_utils.SCLinacObject):
 
     @property
     def characterization_timestamp(self) -> datetime:
-        if not self._char_timestamp_pv_obj:
-            self._char_timestamp_pv_obj = PV(self.char_timestamp_pv)
-        date_string = self._char_timestamp_pv_obj.get()
+        date_string = self.char_timestamp_pv_obj.get()
         time_readback = datetime.strptime(date_string, "%Y-%m-%d-%H:%M:%S")
         return time_readback
 
-    def characterize(self):
+    def characterize(self, policy: Optional[CalibrationPolicy] = None):
         """
         Calibrates the cavity's RF probe so that the amplitude readback will be
         accurate. Also measures the loaded Q (quality factor) of the cavity power
         coupler
+        :param policy: when given, a recent characterization it accepts is
+                       reused instead of measuring again
         :return:
         """
 
@@ -1167,6 +960,18 @@ class Cavity(linac_utils.SCLinacObject):
         )
         self.drive_level = linac_utils.SAFE_PULSED_DRIVE_LEVEL
 
+        if policy and policy.reusable_characterization(self):
+            self.set_status_message(
+                "Cached characterization still valid, skipping",
+                logging.INFO,
+                extra_data={
+                    "timestamp": self.characterization_timestamp.isoformat(),
+                    "cavity": str(self),
+                },
+            )
+            self.finish_characterization()
+            return
+
         if (
             datetime.now() - self.characterization_timestamp
         ).total_seconds() < 60:
@@ -1179,7 +984,7 @@ class Cavity(linac_utils.SCLinacObject):
                         "cavity": str(self),
                     },
                 )
-                self.finish_characterization()
+                self.finish_characterization(self.characterization_timestamp)
                 return
 
         self.set_status_message(
@@ -1188,17 +993,19 @@ class Cavity(linac_utils.SCLinacObject):
         self.start_characterization()
         time.sleep(2)
 
-        while self.characterization_running:
-            self.check_abort()
-            self.set_status_message(
+        wait_until(
+            self.characterization_status_pv_obj,
+            lambda status: status != linac_utils.CHARACTERIZATION_RUNNING_VALUE,
+            abort_check=self.check_abort,
+            on_wait=lambda status: self.set_status_message(
                 "Waiting for characterization to complete",
                 logging.DEBUG,
                 extra_data={
-                    "characterization_status": self.characterization_status,
+                    "characterization_status": status,
                     "cavity": str(self),
                 },
-            )
-            time.sleep(1)
+            ),
+        )
 
         if (
             self.characterization_status
@@ -1221,7 +1028,7 @@ class Cavity(linac_utils.SCLinacObject):
                 raise linac_utils.CavityCharacterizationError(
                     f"No valid {self} characterization within the last 5 min"
                 )
-            self.finish_characterization()
+            self.finish_characterization(self.characterization_timestamp)
 
         if self.characterization_crashed:
             self.set_status_message(
@@ -1236,7 +1043,12 @@ class Cavity(linac_utils.SCLinacObject):
                 f"{self} characterization crashed"
             )
 
-    def finish_characterization(self):
+    def finish_characterization(self, timestamp: Optional[datetime] = None):
+        """
+        Push the measured loaded Q and scale factor
+        @param timestamp: the IOC's characterization timestamp; when given the
+                          results are recorded in the CavityCache for reuse
+        """
         self.set_status_message(
             "Pushing characterization results", logging.INFO
         )
@@ -1302,43 +1114,31 @@ class Cavity(linac_utils.SCLinacObject):
         )
         self.piezo.feedback_setpoint = 0
 
+        if timestamp is not None:
+            record_characterization(self, timestamp)
+
         self.set_status_message(
             "Characterization completed successfully", logging.INFO
         )
 
-    def walk_amp(self, des_amp, step_size):
+    def walk_amp(self, des_amp, step_size, **ramp_options):
+        """
+        Ramp ADES up to des_amp (see AmplitudeRamp for ramp_options)
+        @raises QuenchError: if the cavity quenches during the ramp
+        """
+        start = self.ades
         self.set_status_message(
-            f"Walking amplitude to {des_amp:.2f} MV from {self.ades:.2f} MV (step size: {step_size:.2f})",
+            f"Walking amplitude to {des_amp:.2f} MV from {start:.2f} MV (step size: {step_size:.2f})",
             logging.INFO,
             extra_data={
                 "target_amplitude": des_amp,
-                "current_amplitude": self.ades,
+                "current_amplitude": start,
                 "step_size": step_size,
                 "cavity": str(self),
             },
         )
 
-        while self.ades <= (des_amp - step_size):
-            self.check_abort()
-            if self.is_quenched:
-                self.set_status_message(
-                    "Quench detected during RF ramp",
-                    logging.ERROR,
-                    extra_data={
-                        "current_amplitude": self.ades,
-                        "target_amplitude": des_amp,
-                        "cavity": str(self),
-                    },
-                )
-                raise linac_utils.QuenchError(
-                    f"{self} quench detected, aborting RF ramp"
-                )
-            self.ades = self.ades + step_size
-            # to avoid tripping sensitive interlock
-            time.sleep(0.1)
-
-        if self.ades != des_amp:
-            self.ades = des_amp
+        AmplitudeRamp(self, step_size, **ramp_options).run(des_amp, start)
 
         self.set_status_message(
             f"Amplitude walk complete - at {des_amp:.2f} MV",
@@ -0,0 +1,192 @@
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+from datetime import datetime
+from typing import NamedTuple, Optional, Union
+
+from sc_linac_physics.utils.sc_linac.linac_utils import cache_dir
+
+CAVITY_CACHE_FILENAME = "cavity_cache.sqlite"
+
+# Seconds to wait for another process holding the database lock
+CAVITY_CACHE_TIMEOUT = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tuner_scale (
+    cryomodule TEXT NOT NULL,
+    cavity INTEGER NOT NULL,
+    hz_per_microstep REAL NOT NULL,
+    timestamp REAL NOT NULL,
+    PRIMARY KEY (cryomodule, cavity)
+);
+CREATE TABLE IF NOT EXISTS characterization (
+    cryomodule TEXT NOT NULL,
+    cavity INTEGER NOT NULL,
+    loaded_q REAL NOT NULL,
+    scale_factor REAL NOT NULL,
+    ioc_timestamp TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    PRIMARY KEY (cryomodule, cavity)
+);
+CREATE TABLE IF NOT EXISTS ssa_calibration (
+    cryomodule TEXT NOT NULL,
+    cavity INTEGER NOT NULL,
+    slope REAL NOT NULL,
+    drive_max REAL NOT NULL,
+    max_fwd_pwr REAL NOT NULL,
+    timestamp REAL NOT NULL,
+    PRIMARY KEY (cryomodule, cavity)
+);
+"""
+
+
+class CharacterizationRecord(NamedTuple):
+    loaded_q: float
+    scale_factor: float
+    # The IOC's characterization timestamp, identifying the measurement
+    ioc_timestamp: datetime
+    # When it was recorded, in seconds since the epoch
+    timestamp: float
+
+
+class SSACalibrationRecord(NamedTuple):
+    slope: float
+    drive_max: float
+    max_fwd_pwr: float
+    timestamp: float
+
+
+class CavityCache:
+    """
+    Per-cavity results kept on local disk between runs, in one SQLite file
+    shared by every script on the host (SQLite serializes the writers).
+
+    Reads never raise: an unreadable or missing database is a cache miss.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        @param path: database file, cache_dir()/cavity_cache.sqlite by default
+        """
+        self.path = Path(path or cache_dir() / CAVITY_CACHE_FILENAME)
+
+    @contextmanager
+    def _connection(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(
+            sqlite3.connect(self.path, timeout=CAVITY_CACHE_TIMEOUT)
+        ) as conn:
+            with conn:
+                conn.executescript(_SCHEMA)
+                yield conn
+
+    def _fetch(self, query: str, *params) -> Optional[tuple]:
+        try:
+            with self._connection() as conn:
+                return conn.execute(query, params).fetchone()
+        except (OSError, sqlite3.Error):
+            return None
+
+    def tuner_scale(self, cryomodule: str, cavity: int) -> Optional[float]:
+        """Learned Hz per stepper microstep, None if never saved"""
+        row = self._fetch(
+            "SELECT hz_per_microstep FROM tuner_scale"
+            " WHERE cryomodule = ? AND cavity = ?",
+            cryomodule,
+            cavity,
+        )
+        return None if row is None else row[0]
+
+    def save_tuner_scale(
+        self, cryomodule: str, cavity: int, hz_per_microstep: float
+    ):
+        """
+        @raises OSError, sqlite3.Error: if the database cannot be written
+        """
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tuner_scale VALUES (?, ?, ?, ?)",
+                (cryomodule, cavity, hz_per_microstep, time.time()),
+            )
+
+    def characterization(
+        self, cryomodule: str, cavity: int
+    ) -> Optional[CharacterizationRecord]:
+        """Last successful characterization, None if never recorded"""
+        row = self._fetch(
+            "SELECT loaded_q, scale_factor, ioc_timestamp, timestamp"
+            " FROM characterization WHERE cryomodule = ? AND cavity = ?",
+            cryomodule,
+            cavity,
+        )
+        if row is None:
+            return None
+        loaded_q, scale_factor, ioc_timestamp, timestamp = row
+        return CharacterizationRecord(
+            loaded_q,
+            scale_factor,
+            datetime.fromisoformat(ioc_timestamp),
+            timestamp,
+        )
+
+    def save_characterization(
+        self,
+        cryomodule: str,
+        cavity: int,
+        loaded_q: float,
+        scale_factor: float,
+        ioc_timestamp: datetime,
+    ):
+        """
+        @raises OSError, sqlite3.Error: if the database cannot be written
+        """
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO characterization"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    cryomodule,
+                    cavity,
+                    loaded_q,
+                    scale_factor,
+                    ioc_timestamp.isoformat(),
+                    time.time(),
+                ),
+            )
+
+    def ssa_calibration(
+        self, cryomodule: str, cavity: int
+    ) -> Optional[SSACalibrationRecord]:
+        """Last successful SSA calibration, None if never recorded"""
+        row = self._fetch(
+            "SELECT slope, drive_max, max_fwd_pwr, timestamp"
+            " FROM ssa_calibration WHERE cryomodule = ? AND cavity = ?",
+            cryomodule,
+            cavity,
+        )
+        return None if row is None else SSACalibrationRecord(*row)
+
+    def save_ssa_calibration(
+        self,
+        cryomodule: str,
+        cavity: int,
+        slope: float,
+        drive_max: float,
+        max_fwd_pwr: float,
+    ):
+        """
+        @raises OSError, sqlite3.Error: if the database cannot be written
+        """
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ssa_calibration VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    cryomodule,
+                    cavity,
+                    slope,
+                    drive_max,
+                    max_fwd_pwr,
+                    time.time(),
+                ),
+            )
@@ -0,0 +1,215 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from sc_linac_physics.utils.epics import EPICS_INVALID_VAL, PV
+from sc_linac_physics.utils.epics.snapshot import empty_snapshot_records
+from sc_linac_physics.utils.sc_linac import linac_utils
+from sc_linac_physics.utils.sc_linac.pv_descriptors import pv_property
+
+# Fields are read from the cavity's "<field>_pv_obj" PV
+DEFAULT_SNAPSHOT_FIELDS = (
+    "ades",
+    "aact",
+    "rf_state",
+    "rf_mode",
+    "rf_control",
+    "hw_mode",
+    "quench_latch",
+    "detune_best",
+    "detune_chirp",
+)
+
+
+def snapshot_dtype(fields: Sequence[str]) -> np.dtype:
+    """
+    Record layout of a CavitySnapshot: the cavity's cryomodule and number,
+    then value, severity and valid flag per field
+    """
+    layout = [("cryomodule", "U2"), ("cavity", "i1")]
+    for field in fields:
+        layout += [
+            (field, "f8"),
+            (f"{field}_severity", "i2"),
+            (f"{field}_valid", "?"),
+        ]
+    return np.dtype(layout)
+
+
+class CavitySnapshot:
+    """
+    State of many cavities from one bulk read: ``records`` holds one row per
+    cavity (in the order of ``cavities``) and the properties below are
+    boolean masks over those rows, e.g.
+
+        snap = MACHINE.snapshot()
+        for cavity in snap.select(snap.online & snap.on & snap.sela): ...
+
+    Masks are False for cavities whose PVs could not be read or were
+    INVALID, so filtering on them never picks up a cavity by accident.
+    """
+
+    def __init__(self, cavities: Sequence, records: np.ndarray):
+        self.cavities: List = list(cavities)
+        self.records = records
+
+    @classmethod
+    def take(
+        cls,
+        cavities: Iterable,
+        fields: Sequence[str] = DEFAULT_SNAPSHOT_FIELDS,
+        timeout: Optional[float] = None,
+        connection_timeout: float = 1.0,
+    ) -> "CavitySnapshot":
+        """
+        Read fields for every cavity with one PV.snapshot_many call.
+
+        PV objects the cavities have not created yet are connected together
+        with PV.batch_create and kept on the cavities, so later snapshots
+        (and the cavities' own properties) reuse them.
+
+        @param fields: names of cavity "<field>_pv_obj" PVs, e.g. "ades"
+        @param timeout: shared deadline for the reads
+        @param connection_timeout: shared deadline for connecting new PVs
+        @raises AttributeError: if a cavity has no PV for a field
+        """
+        cavities = list(cavities)
+        fields = list(fields)
+        pvs = _pv_objects(cavities, fields, connection_timeout)
+        samples = empty_snapshot_records(len(pvs))
+        present = [index for index, pv in enumerate(pvs) if pv is not None]
+        if present:
+            samples[present] = PV.snapshot_many(
+                [pvs[index] for index in present], timeout=timeout
+            )
+
+        records = np.zeros(len(cavities), dtype=snapshot_dtype(fields))
+        records["cryomodule"] = [cavity.cryomodule.name for cavity in cavities]
+        records["cavity"] = [cavity.number for cavity in cavities]
+        for column, field in enumerate(fields):
+            field_samples = samples[column :: len(fields)]
+            records[field] = field_samples["value"]
+            records[f"{field}_severity"] = field_samples["severity"]
+            records[f"{field}_valid"] = field_samples["valid"] & (
+                field_samples["severity"] != EPICS_INVALID_VAL
+            )
+        return cls(cavities, records)
+
+    def __len__(self):
+        return len(self.cavities)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.records[field]
+
+    @property
+    def fields(self) -> List[str]:
+        return [
+            name
+            for name in self.records.dtype.names
+            if f"{name}_valid" in self.records.dtype.names
+        ]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Field values keyed by field name, indexed like cavities"""
+        return {field: self.records[field] for field in self.fields}
+
+    def select(self, mask: np.ndarray) -> List:
+        """Cavities where mask is True"""
+        return [self.cavities[i] for i in np.flatnonzero(mask)]
+
+    def valid(self, field: str) -> np.ndarray:
+        """Read successfully and not INVALID"""
+        return self.records[f"{field}_valid"]
+
+    def equals(self, field: str, value) -> np.ndarray:
+        return self.valid(field) & (self.records[field] == value)
+
+    @property
+    def online(self) -> np.ndarray:
+        return self.equals("hw_mode", linac_utils.HW_MODE_ONLINE_VALUE)
+
+    @property
+    def offline(self) -> np.ndarray:
+        return self.equals("hw_mode", linac_utils.HW_MODE_OFFLINE_VALUE)
+
+    @property
+    def on(self) -> np.ndarray:
+        return self.equals("rf_state", 1)
+
+    @property
+    def turned_off(self) -> np.ndarray:
+        return self.equals("rf_control", 0)
+
+    @property
+    def quenched(self) -> np.ndarray:
+        return self.equals("quench_latch", 1)
+
+    @property
+    def selap(self) -> np.ndarray:
+        return self.equals("rf_mode", linac_utils.RF_MODE_SELAP)
+
+    @property
+    def sela(self) -> np.ndarray:
+        return self.equals("rf_mode", linac_utils.RF_MODE_SELA)
+
+    @property
+    def sel(self) -> np.ndarray:
+        return self.equals("rf_mode", linac_utils.RF_MODE_SEL)
+
+    @property
+    def pulse(self) -> np.ndarray:
+        return self.equals("rf_mode", linac_utils.RF_MODE_PULSE)
+
+    @property
+    def chirp(self) -> np.ndarray:
+        return self.equals("rf_mode", linac_utils.RF_MODE_CHIRP)
+
+    @property
+    def detune(self) -> np.ndarray:
+        """Chirp detune in chirp mode, best detune otherwise (NaN if unread)"""
+        chirp = self.chirp
+        detune = np.where(
+            chirp, self.records["detune_chirp"], self.records["detune_best"]
+        )
+        valid = np.where(
+            chirp, self.valid("detune_chirp"), self.valid("detune_best")
+        )
+        return np.where(valid & self.valid("rf_mode"), detune, np.nan)
+
+
+def _pv_objects(
+    cavities: List, fields: List[str], connection_timeout: float
+) -> List:
+    """
+    PV objects for every (cavity, field) pair, cavity-major; None where a
+    new PV could not be created
+    """
+    pvs = []
+    missing = {}
+    for cavity in cavities:
+        for field in fields:
+            attr = f"{field}_pv_obj"
+            descriptor = getattr(type(cavity), attr, None)
+            if not isinstance(descriptor, pv_property):
+                pvs.append(getattr(cavity, attr))
+                continue
+            pv = getattr(cavity, descriptor.slot)
+            if not pv:
+                name = getattr(cavity, descriptor.name)
+                missing.setdefault(name, []).append(
+                    (len(pvs), cavity, descriptor.slot)
+                )
+            pvs.append(pv)
+
+    if missing:
+        created = PV.batch_create(
+            list(missing),
+            connection_timeout=connection_timeout,
+            auto_monitor=True,
+        )
+        for pv, users in zip(created, missing.values()):
+            for index, cavity, slot in users:
+                if pv is not None:
+                    setattr(cavity, slot, pv)
+                pvs[index] = pv
+    return pvs
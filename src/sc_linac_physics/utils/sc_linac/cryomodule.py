@@ -1,11 +1,11 @@
-from typing import Type, Dict, List, TYPE_CHECKING, Optional
+from typing import Type, Dict, List, TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV
 from sc_linac_physics.utils.sc_linac.linac_utils import (
     SCLinacObject,
     L1BHL,
     CRYO_NAME_MAP,
 )
+from sc_linac_physics.utils.sc_linac.pv_descriptors import pv_property
 
 if TYPE_CHECKING:
     from cavity import Cavity
@@ -24,6 +24,42 @@ class Cryomodule(SCLinacObject):
 
     """
 
+    __slots__ = (
+        "name",
+        "linac",
+        "magnet_class",
+        "rack_class",
+        "cavity_class",
+        "ssa_class",
+        "stepper_class",
+        "piezo_class",
+        "quad",
+        "xcor",
+        "ycor",
+        "_pv_prefix",
+        "cte_prefix",
+        "cvt_prefix",
+        "cpv_prefix",
+        "cryo_name",
+        "jt_prefix",
+        "heater_prefix",
+        "ds_level_pv",
+        "us_level_pv",
+        "ds_pressure_pv",
+        "jt_valve_readback_pv",
+        "heater_readback_pv",
+        "aact_mean_sum_pv",
+        "rack_a",
+        "rack_b",
+        "cavities",
+        "coupler_vacuum_pvs",
+        "vacuum_pvs",
+        "__dict__",
+        "__weakref__",
+    )
+
+    ds_level_pv_obj = pv_property()
+
     def __init__(
         self,
         cryo_name: str,
@@ -71,7 +107,6 @@ class Cryomodule(SCLinacObject):
         self.heater_prefix = f"CPIC:{self.cryo_name}:0000:EHCV:"
 
         self.ds_level_pv: str = f"CLL:CM{self.name}:2301:DS:LVL"
-        self._ds_level_pv_obj: Optional[PV] = None
 
         self.us_level_pv: str = f"CLL:CM{self.name}:2601:US:LVL"
         self.ds_pressure_pv: str = f"CPT:CM{self.name}:2302:DS:PRESS"
@@ -119,12 +154,6 @@ class Cryomodule(SCLinacObject):
     def make_jt_pv(self, suffix: str) -> str:
         return self.jt_prefix + suffix
 
-    @property
-    def ds_level_pv_obj(self) -> PV:
-        if not self._ds_level_pv_obj:
-            self._ds_level_pv_obj = PV(self.ds_level_pv)
-        return self._ds_level_pv_obj
-
     @property
     def ds_level(self):
         return self.ds_level_pv_obj.get()
@@ -3,14 +3,28 @@
 # NOTE: For some reason, using python 3 style type annotations causes circular
 #       import issues, so leaving as python 2 style for now
 ################################################################################
-from typing import Dict, List, Type
+from itertools import chain
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Type,
+)
 
 from sc_linac_physics.utils.sc_linac import linac_utils
 from sc_linac_physics.utils.sc_linac.cavity import Cavity
+from sc_linac_physics.utils.sc_linac.cavity_snapshot import (
+    DEFAULT_SNAPSHOT_FIELDS,
+    CavitySnapshot,
+)
 from sc_linac_physics.utils.sc_linac.cryomodule import Cryomodule
-from sc_linac_physics.utils.sc_linac.linac_utils import SCLinacObject
+from sc_linac_physics.utils.sc_linac.linac_utils import LazyDict, SCLinacObject
 from sc_linac_physics.utils.sc_linac.magnet import Magnet
 from sc_linac_physics.utils.sc_linac.piezo import Piezo
+from sc_linac_physics.utils.sc_linac.pv_table import PVNameTable
 from sc_linac_physics.utils.sc_linac.rack import Rack
 from sc_linac_physics.utils.sc_linac.ssa import SSA
 from sc_linac_physics.utils.sc_linac.stepper import StepperTuner
@@ -71,11 +85,18 @@ class Linac(SCLinacObject):
             for cm in insulating_vacuum_cryomodules
         ]
 
-        self.cryomodules: Dict[str, Cryomodule] = {}
-        for cm_name in linac_utils.LINAC_CM_MAP[linac_section]:
-            self.cryomodules[cm_name] = self.cryomodule_class(
-                cryo_name=cm_name, linac_object=self
-            )
+        cm_names = linac_utils.LINAC_CM_MAP[linac_section]
+        self.cryomodules: MutableMapping[str, Cryomodule]
+        if getattr(machine, "lazy", False) is True:
+            self.cryomodules = LazyDict(cm_names, self._make_cryomodule)
+        else:
+            self.cryomodules = {
+                cm_name: self._make_cryomodule(cm_name) for cm_name in cm_names
+            }
+
+    def _make_cryomodule(self, cm_name):
+        # type: (str) -> Cryomodule
+        return self.cryomodule_class(cryo_name=cm_name, linac_object=self)
 
     def __str__(self):
         return self.name
@@ -87,6 +108,11 @@ class Machine:
     as a generator for lower level accelerator objects, as well as a container
     for generated cryomodule objects
 
+    With lazy=True, cryomodules (and everything below them) are only built
+    the first time they are looked up through cryomodules, a linac's
+    cryomodules or one of the cavity iterators, so a tool that touches one
+    cavity does not pay for the whole machine.
+
     """
 
     def __init__(
@@ -99,13 +125,16 @@ class Machine:
         stepper_class: Type[StepperTuner] = StepperTuner,
         ssa_class: Type[SSA] = SSA,
         piezo_class: Type[Piezo] = Piezo,
+        lazy: bool = False,
     ):
         """
         All inputs are optional, but allow for object customization for more
         specific use cases. Only functionality used by at least two applications
         is put in default classes
 
+        @param lazy: build cryomodules on first access instead of up front
         """
+        self.lazy = lazy
         self.linac_class = linac_class
         self.cryomodule_class = cryomodule_class
         self.cavity_class = cavity_class
@@ -131,10 +160,30 @@ class Machine:
                 )
             )
 
+        self.global_heater_feedback_pv = "CHTR:CM00:0:HTR_POWER_TOT"
+        self._pv_table = None
+
+        self.cryomodules: MutableMapping[str, Cryomodule]
+        if lazy:
+            owners: Dict[str, Linac] = {
+                cm_name: linac
+                for linac in self.linacs
+                for cm_name in linac.cryomodules
+            }
+            self.cryomodules = LazyDict(
+                owners, lambda cm_name: owners[cm_name].cryomodules[cm_name]
+            )
+            self.non_hl_iterator = self._iter_cavities(hl=False)
+            self.hl_iterator = self._iter_cavities(hl=True)
+            self.all_iterator = chain(
+                self._iter_cavities(hl=False), self._iter_cavities(hl=True)
+            )
+            return
+
         non_hl_cavities = []
         hl_cavities = []
 
-        self.cryomodules: Dict[str, Cryomodule] = {}
+        self.cryomodules = {}
         for linac in self.linacs:
             for cm_name, cm_obj in linac.cryomodules.items():
                 self.cryomodules[cm_name] = cm_obj
@@ -148,7 +197,45 @@ class Machine:
         self.non_hl_iterator = iter(non_hl_cavities)
         self.hl_iterator = iter(hl_cavities)
         self.all_iterator = iter(non_hl_cavities + hl_cavities)
-        self.global_heater_feedback_pv = "CHTR:CM00:0:HTR_POWER_TOT"
+
+    @property
+    def pv_table(self) -> PVNameTable:
+        """
+        Interned name table of every PV declared by this machine's classes,
+        loaded from the disk cache when possible (see PVNameTable)
+        """
+        if self._pv_table is None:
+            self._pv_table = PVNameTable.for_machine(self)
+        return self._pv_table
+
+    def snapshot(
+        self,
+        fields: Sequence[str] = DEFAULT_SNAPSHOT_FIELDS,
+        cavities: Optional[Iterable[Cavity]] = None,
+        timeout: Optional[float] = None,
+    ) -> CavitySnapshot:
+        """
+        Read fields for every cavity in one bulk CA read, e.g.
+        snap.select(snap.online & snap.on & snap.sela) (see CavitySnapshot)
+
+        @param fields: cavity PV names without "_pv_obj", e.g. "ades"
+        @param cavities: cavities to read instead of the whole machine
+        @param timeout: shared deadline for the reads
+        """
+        if cavities is None:
+            cavities = chain(
+                self._iter_cavities(hl=False), self._iter_cavities(hl=True)
+            )
+        return CavitySnapshot.take(cavities, fields, timeout=timeout)
+
+    def _iter_cavities(self, hl):
+        """
+        Generator over the cavities of (non) harmonic linearizer cryomodules,
+        building each cryomodule only when the iterator reaches it
+        """
+        for cm_name in self.cryomodules:
+            if (cm_name in linac_utils.L1BHL) == hl:
+                yield from self.cryomodules[cm_name].cavities.values()
 
 
-MACHINE = Machine()
+MACHINE = Machine(lazy=True)
@@ -1,5 +1,9 @@
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
 
 from numpy import polyfit
 
@@ -113,6 +117,8 @@ DEFAULT_STEPPER_MAX_STEPS = 1000000
 DEFAULT_STEPPER_SPEED = 20000
 MAX_STEPPER_SPEED = 60000
 STEPPER_ON_LIMIT_SWITCH_VALUE = 1
+# Tuners take a moment to report moving after a move request
+STEPPER_START_TIMEOUT = 5
 
 # these values are based on the list of enum states found by probing {magnet_type}:L{x}B:{cm}85:CTRL
 MAGNET_RESET_VALUE = 10
@@ -165,8 +171,14 @@ class SCLinacObject(ABC, object):
     """
     Base class used to represent all components of the LCLS II superconducting
     accelerator (linacs, cryomodules, racks, cavities, SSAs, and tuners)
+
+    Classes instantiated once per cavity or cryomodule list the attributes
+    they set in __init__ in __slots__. They keep a __dict__ slot as well, so
+    subclasses, mocks and lazily created PVs can still add attributes.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def pv_prefix(self):
@@ -181,6 +193,65 @@ class SCLinacObject(ABC, object):
         return self.pv_addr(f"AUTO:{suffix}")
 
 
+_UNBUILT = object()
+
+# Local cache for derived data (PV tables, learned tuner scales, ...)
+CACHE_DIR_ENV = "SC_LINAC_CACHE_DIR"
+
+
+def cache_dir() -> Path:
+    return Path(
+        os.getenv(
+            CACHE_DIR_ENV, str(Path.home() / ".cache" / "sc_linac_physics")
+        )
+    )
+
+
+class LazyDict(MutableMapping):
+    """
+    Mapping whose values are built by factory(key) the first time they are
+    looked up. Keys, membership, len and iteration never build anything;
+    values() and items() build each entry as they reach it.
+    """
+
+    def __init__(self, keys: Iterable, factory: Callable):
+        self._factory = factory
+        self._data = dict.fromkeys(keys, _UNBUILT)
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        if value is _UNBUILT:
+            with self._lock:
+                value = self._data[key]
+                if value is _UNBUILT:
+                    value = self._data[key] = self._factory(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    @property
+    def built(self) -> List:
+        """Keys whose values have been built so far"""
+        return [k for k, v in self._data.items() if v is not _UNBUILT]
+
+    def __repr__(self):
+        return f"LazyDict({len(self.built)}/{len(self)} built)"
+
+
 def stepper_tol_factor(num_steps) -> float:
     """
     First attempt at making the stepper mover tolerance dependent on the
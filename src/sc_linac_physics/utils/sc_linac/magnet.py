@@ -1,7 +1,7 @@
-from typing import Optional, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV
 from sc_linac_physics.utils.sc_linac import linac_utils
+from sc_linac_physics.utils.sc_linac.pv_descriptors import pv_name, pv_property
 
 if TYPE_CHECKING:
     from cryomodule import Cryomodule
@@ -14,6 +14,24 @@ class Magnet(linac_utils.SCLinacObject):
 
     """
 
+    __slots__ = (
+        "_pv_prefix",
+        "name",
+        "cryomodule",
+        "__dict__",
+        "__weakref__",
+    )
+
+    bdes_pv_obj = pv_property("BDES")
+    control_pv_obj = pv_property("CTRL")
+    interlock_pv = pv_name("INTLKSUMY")
+    ps_status_pv = pv_name("STATE")
+    bact_pv = pv_name("BACT")
+    iact_pv = pv_name("IACT")
+
+    # changing IDES immediately perturbs
+    ides_pv = pv_name("IDES")
+
     def __init__(self, magnet_type: str, cryomodule: "Cryomodule"):
         """
         @param magnet_type: One of QUAD, XCOR, or YCOR
@@ -27,39 +45,17 @@ class Magnet(linac_utils.SCLinacObject):
         self.name = magnet_type
         self.cryomodule: "Cryomodule" = cryomodule
 
-        self.bdes_pv: str = self.pv_addr("BDES")
-        self._bdes_pv_obj: Optional[PV] = None
-
-        self.control_pv: str = self.pv_addr("CTRL")
-        self._control_pv_obj: Optional[PV] = None
-
-        self.interlock_pv: str = self.pv_addr("INTLKSUMY")
-        self.ps_status_pv: str = self.pv_addr("STATE")
-        self.bact_pv: str = self.pv_addr("BACT")
-        self.iact_pv: str = self.pv_addr("IACT")
-
-        # changing IDES immediately perturbs
-        self.ides_pv: str = self.pv_addr("IDES")
-
     @property
     def pv_prefix(self):
         return self._pv_prefix
 
-    @property
-    def control_pv_obj(self) -> PV:
-        if not self._control_pv_obj:
-            self._control_pv_obj = PV(self.control_pv)
-        return self._control_pv_obj
-
     @property
     def bdes(self):
-        if not self._bdes_pv_obj:
-            self._bdes_pv_obj = PV(self.bdes_pv)
-        return self._bdes_pv_obj.get()
+        return self.bdes_pv_obj.get()
 
     @bdes.setter
     def bdes(self, value):
-        self._bdes_pv_obj.put(value)
+        self.bdes_pv_obj.put(value)
         self.control_pv_obj.put(linac_utils.MAGNET_TRIM_VALUE)
 
     def reset(self):
@@ -1,8 +1,9 @@
 import time
-from typing import Optional, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import PV, wait_until
 from sc_linac_physics.utils.sc_linac import linac_utils
+from sc_linac_physics.utils.sc_linac.pv_descriptors import pv_property
 
 if TYPE_CHECKING:
     from cavity import Cavity
@@ -15,6 +16,23 @@ class Piezo(linac_utils.SCLinacObject):
 
     """
 
+    __slots__ = (
+        "cavity",
+        "_pv_prefix",
+        "__dict__",
+        "__weakref__",
+    )
+
+    enable_pv_obj = pv_property("ENABLE")
+    enable_stat_pv_obj = pv_property("ENABLESTAT")
+    feedback_control_pv_obj = pv_property("MODECTRL")
+    feedback_stat_pv_obj = pv_property("MODESTAT")
+    feedback_setpoint_pv_obj = pv_property("INTEG_SP")
+    dc_setpoint_pv_obj = pv_property("DAC_SP")
+    bias_voltage_pv_obj = pv_property("BIAS")
+    voltage_pv_obj = pv_property("V")
+    hz_per_v_pv_obj = pv_property("SCALE")
+
     def __init__(self, cavity: "Cavity"):
         """
         @param cavity: The cavity object tuned by this piezo
@@ -23,33 +41,6 @@ class Piezo(linac_utils.SCLinacObject):
         self.cavity: "Cavity" = cavity
         self._pv_prefix: str = self.cavity.pv_addr("PZT:")
 
-        self.enable_pv: str = self.pv_addr("ENABLE")
-        self._enable_pv_obj: Optional[PV] = None
-
-        self.enable_stat_pv: str = self.pv_addr("ENABLESTAT")
-        self._enable_stat_pv_obj: Optional[PV] = None
-
-        self.feedback_control_pv: str = self.pv_addr("MODECTRL")
-        self._feedback_control_pv_obj: Optional[PV] = None
-
-        self.feedback_stat_pv: str = self.pv_addr("MODESTAT")
-        self._feedback_stat_pv_obj: Optional[PV] = None
-
-        self.feedback_setpoint_pv: str = self.pv_addr("INTEG_SP")
-        self._feedback_setpoint_pv_obj: Optional[PV] = None
-
-        self.dc_setpoint_pv: str = self.pv_addr("DAC_SP")
-        self._dc_setpoint_pv_obj: Optional[PV] = None
-
-        self.bias_voltage_pv: str = self.pv_addr("BIAS")
-        self._bias_voltage_pv_obj: Optional[PV] = None
-
-        self.voltage_pv: str = self.pv_addr("V")
-        self._voltage_pv_obj: Optional[PV] = None
-
-        self.hz_per_v_pv: str = self.pv_addr("SCALE")
-        self._hz_per_v_pv_obj: Optional[PV] = None
-
     def __str__(self):
         return self.cavity.__str__() + " Piezo"
 
@@ -59,26 +50,12 @@ class Piezo(linac_utils.SCLinacObject):
 
     @property
     def hz_per_v(self):
-        if not self._hz_per_v_pv_obj:
-            self._hz_per_v_pv_obj = PV(self.hz_per_v_pv)
-        return self._hz_per_v_pv_obj.get()
-
-    @property
-    def voltage_pv_obj(self):
-        if not self._voltage_pv_obj:
-            self._voltage_pv_obj = PV(self.voltage_pv)
-        return self._voltage_pv_obj
+        return self.hz_per_v_pv_obj.get()
 
     @property
     def voltage(self):
         return self.voltage_pv_obj.get()
 
-    @property
-    def bias_voltage_pv_obj(self):
-        if not self._bias_voltage_pv_obj:
-            self._bias_voltage_pv_obj = PV(self.bias_voltage_pv)
-        return self._bias_voltage_pv_obj
-
     @property
     def bias_voltage(self):
         return self.bias_voltage_pv_obj.get()
@@ -92,12 +69,6 @@ class Piezo(linac_utils.SCLinacObject):
         )
         self.bias_voltage_pv_obj.put(value)
 
-    @property
-    def dc_setpoint_pv_obj(self) -> PV:
-        if not self._dc_setpoint_pv_obj:
-            self._dc_setpoint_pv_obj = PV(self.dc_setpoint_pv)
-        return self._dc_setpoint_pv_obj
-
     @property
     def dc_setpoint(self):
         return self.dc_setpoint_pv_obj.get()
@@ -111,12 +82,6 @@ class Piezo(linac_utils.SCLinacObject):
         )
         self.dc_setpoint_pv_obj.put(value)
 
-    @property
-    def feedback_setpoint_pv_obj(self) -> PV:
-        if not self._feedback_setpoint_pv_obj:
-            self._feedback_setpoint_pv_obj = PV(self.feedback_setpoint_pv)
-        return self._feedback_setpoint_pv_obj
-
     @property
     def feedback_setpoint(self):
         return self.feedback_setpoint_pv_obj.get()
@@ -132,29 +97,13 @@ class Piezo(linac_utils.SCLinacObject):
         )
         self.feedback_setpoint_pv_obj.put(value)
 
-    @property
-    def enable_pv_obj(self) -> PV:
-        if not self._enable_pv_obj:
-            self._enable_pv_obj = PV(self._pv_prefix + "ENABLE")
-        return self._enable_pv_obj
-
     @property
     def is_enabled(self) -> bool:
-        if not self._enable_stat_pv_obj:
-            self._enable_stat_pv_obj = PV(self.enable_stat_pv)
-        return self._enable_stat_pv_obj.get() == linac_utils.PIEZO_ENABLE_VALUE
-
-    @property
-    def feedback_control_pv_obj(self) -> PV:
-        if not self._feedback_control_pv_obj:
-            self._feedback_control_pv_obj = PV(self.feedback_control_pv)
-        return self._feedback_control_pv_obj
+        return self.enable_stat_pv_obj.get() == linac_utils.PIEZO_ENABLE_VALUE
 
     @property
     def feedback_stat(self):
-        if not self._feedback_stat_pv_obj:
-            self._feedback_stat_pv_obj = PV(self.feedback_stat_pv)
-        return self._feedback_stat_pv_obj.get()
+        return self.feedback_stat_pv_obj.get()
 
     @property
     def in_manual(self) -> bool:
@@ -168,6 +117,26 @@ class Piezo(linac_utils.SCLinacObject):
         self.cavity.logger.debug("Setting piezo to manual mode")
         self.feedback_control_pv_obj.put(linac_utils.PIEZO_MANUAL_VALUE)
 
+    def _settles(self, pv: PV, predicate, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for a status PV to reach the requested
+        state, returning early as soon as it does
+        @param pv: Status PV to watch
+        @param predicate: Called with each status value
+        @param timeout: Seconds to wait before giving up
+        @return: Whether the state was reached
+        """
+        try:
+            wait_until(
+                pv,
+                predicate,
+                timeout=timeout,
+                abort_check=self.cavity.check_abort,
+            )
+        except TimeoutError:
+            return False
+        return True
+
     def enable(self):
         self.cavity.logger.info(
             "Enabling piezo with bias voltage 25V",
@@ -176,7 +145,8 @@ class Piezo(linac_utils.SCLinacObject):
         self.bias_voltage = 25
 
         attempt = 0
-        while not self.is_enabled:
+        enabled = self.is_enabled
+        while not enabled:
             self.cavity.check_abort()
             attempt += 1
             self.cavity.logger.debug(
@@ -197,7 +167,11 @@ class Piezo(linac_utils.SCLinacObject):
             self.enable_pv_obj.put(linac_utils.PIEZO_DISABLE_VALUE)
             time.sleep(2)
             self.enable_pv_obj.put(linac_utils.PIEZO_ENABLE_VALUE)
-            time.sleep(2)
+            enabled = self._settles(
+                self.enable_stat_pv_obj,
+                lambda stat: stat == linac_utils.PIEZO_ENABLE_VALUE,
+                timeout=2,
+            )
 
         self.cavity.logger.info(
             "Piezo successfully enabled",
@@ -211,7 +185,8 @@ class Piezo(linac_utils.SCLinacObject):
         self.enable()
 
         attempt = 0
-        while self.in_manual:
+        in_manual = self.in_manual
+        while in_manual:
             self.cavity.check_abort()
             attempt += 1
             self.cavity.logger.debug(
@@ -228,7 +203,11 @@ class Piezo(linac_utils.SCLinacObject):
             self.set_to_manual()
             time.sleep(5)
             self.set_to_feedback()
-            time.sleep(5)
+            in_manual = not self._settles(
+                self.feedback_stat_pv_obj,
+                lambda stat: stat != linac_utils.PIEZO_MANUAL_VALUE,
+                timeout=5,
+            )
 
         self.cavity.logger.info(
             "Piezo feedback successfully enabled",
@@ -246,7 +225,8 @@ class Piezo(linac_utils.SCLinacObject):
         self.enable()
 
         attempt = 0
-        while not self.in_manual:
+        in_manual = self.in_manual
+        while not in_manual:
             self.cavity.check_abort()
             attempt += 1
             self.cavity.logger.debug(
@@ -263,7 +243,11 @@ class Piezo(linac_utils.SCLinacObject):
             self.set_to_feedback()
             time.sleep(2)
             self.set_to_manual()
-            time.sleep(2)
+            in_manual = self._settles(
+                self.feedback_stat_pv_obj,
+                lambda stat: stat == linac_utils.PIEZO_MANUAL_VALUE,
+                timeout=2,
+            )
 
         self.cavity.logger.info(
             "Piezo feedback successfully disabled",
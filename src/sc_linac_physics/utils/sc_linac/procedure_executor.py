@@ -0,0 +1,299 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from sc_linac_physics.utils.sc_linac import linac_utils
+
+if TYPE_CHECKING:
+    from sc_linac_physics.utils.sc_linac.cavity import Cavity
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+ABORTED = "aborted"
+SKIPPED = "skipped"
+
+# No limit on procedures per rack unless one is asked for
+DEFAULT_RACK_LIMIT: Optional[int] = None
+
+
+@dataclass
+class ProcedureResult:
+    cavity: "Cavity"
+    state: str = PENDING
+    value: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+
+@dataclass(frozen=True)
+class ExecutorProgress:
+    total: int
+    counts: Dict[str, int]
+    running: Tuple[str, ...]
+
+    @property
+    def finished(self) -> int:
+        return self.total - self.counts.get(PENDING, 0) - len(self.running)
+
+    @property
+    def fraction(self) -> float:
+        return self.finished / self.total if self.total else 1.0
+
+
+def ssa_key(cavity: "Cavity") -> Tuple[str, int]:
+    """
+    The physical SSA powering cavity. HL cryomodules only have 4 SSAs, each
+    shared by two cavities (see HL_SSA_MAP)
+    """
+    number = cavity.number
+    if cavity.cryomodule.is_harmonic_linearizer:
+        number = linac_utils.HL_SSA_MAP[number]
+    return cavity.cryomodule.name, number
+
+
+def rack_key(cavity: "Cavity") -> Tuple[str, str]:
+    return cavity.cryomodule.name, cavity.rack.rack_name
+
+
+def request_abort(cavity: "Cavity"):
+    cavity.request_abort()
+
+
+class ProcedureExecutor:
+    """
+    Runs a blocking per-cavity procedure (setup_rf, move_to_resonance,
+    characterize, turn_off...) on many cavities at once from one process.
+
+    At most max_workers procedures run at a time, at most rack_limit per
+    rack if one is given, and never two on cavities sharing an SSA. The calling thread
+    dispatches: it only hands a worker a cavity whose rack slot and SSA are
+    free, taking cavities in order but passing over blocked ones, so no
+    worker sits waiting on another cavity's resources. abort() asks every
+    running cavity to stop (their procedures raise CavityAbortError at the
+    next check_abort) and skips the ones not started yet.
+
+        executor = ProcedureExecutor(on_progress=print)
+        executor.run(cryomodule.cavities.values(), Cavity.setup_rf, 16)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        rack_limit: Optional[int] = DEFAULT_RACK_LIMIT,
+        stop_on_error: bool = False,
+        on_progress: Optional[Callable[[ExecutorProgress], None]] = None,
+        abort_cavity: Callable[["Cavity"], None] = request_abort,
+    ):
+        """
+        @param rack_limit: most procedures to run at once per rack, None for
+                           no limit
+        @param stop_on_error: abort the remaining cavities if one fails
+        @param on_progress: called (from worker threads) on every state change
+        @param abort_cavity: makes a running cavity's check_abort raise, e.g.
+                             SetupCavity.trigger_abort
+        """
+        self.max_workers = max_workers
+        self.rack_limit = rack_limit
+        self.stop_on_error = stop_on_error
+        self.on_progress = on_progress
+        self.abort_cavity = abort_cavity
+
+        self._lock = threading.Lock()
+        # Signalled whenever a cavity finishes or the run is aborted
+        self._changed = threading.Condition(self._lock)
+        self._running = False
+        self._aborted = False
+        self._results: List[ProcedureResult] = []
+        # Resources held by the running cavities
+        self._rack_use: Counter = Counter()
+        self._busy_ssas: Set[Tuple] = set()
+        self._active = 0
+
+    @property
+    def aborted(self) -> bool:
+        return self._aborted
+
+    @property
+    def progress(self) -> ExecutorProgress:
+        with self._lock:
+            return self._progress()
+
+    def run(
+        self, cavities: Iterable["Cavity"], procedure: Callable, *args, **kwargs
+    ) -> List[ProcedureResult]:
+        """
+        Call procedure(cavity, *args, **kwargs) for every cavity and wait for
+        all of them. Exceptions are caught per cavity and returned in the
+        results rather than raised.
+
+        @return: one ProcedureResult per cavity, in the order given
+        @raises RuntimeError: if this executor is already running
+        """
+        with self._lock:
+            if self._running:
+                raise RuntimeError("Procedure executor already running")
+            self._running = True
+            self._aborted = False
+            self._results = [ProcedureResult(cavity) for cavity in cavities]
+            self._rack_use.clear()
+            self._busy_ssas.clear()
+            self._active = 0
+            results = list(self._results)
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="cavity_procedure",
+            ) as pool:
+                futures = []
+                try:
+                    pending = list(results)
+                    while pending:
+                        for result, progress in self._next_batch(pending):
+                            self._notify(progress)
+                            if result.state == RUNNING:
+                                futures.append(
+                                    pool.submit(
+                                        self._run_one,
+                                        result,
+                                        procedure,
+                                        args,
+                                        kwargs,
+                                    )
+                                )
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    self.abort()
+                    raise
+        finally:
+            with self._lock:
+                self._running = False
+        return results
+
+    def abort(self):
+        """Stop running cavities through their check_abort; skip the rest"""
+        with self._lock:
+            running = self._abort()
+        for cavity in running:
+            self.abort_cavity(cavity)
+
+    def _abort(self) -> List["Cavity"]:
+        """Mark the run aborted (holding the lock); the running cavities"""
+        self._aborted = True
+        self._changed.notify_all()
+        return [
+            result.cavity for result in self._results if result.state == RUNNING
+        ]
+
+    def _next_batch(
+        self, pending: List[ProcedureResult]
+    ) -> List[Tuple[ProcedureResult, ExecutorProgress]]:
+        """
+        Wait until pending cavities can start and claim their resources, or
+        skip them all once aborted. Claimed and skipped results are removed
+        from pending.
+        @return: each result marked RUNNING or SKIPPED, with the progress
+                 after its change
+        """
+        with self._changed:
+            while True:
+                if self._aborted:
+                    batch = []
+                    for result in pending:
+                        result.state = SKIPPED
+                        batch.append((result, self._progress()))
+                    pending.clear()
+                    return batch
+
+                batch = []
+                for result in list(pending):
+                    if self._active >= self.max_workers:
+                        break
+                    cavity = result.cavity
+                    rack, ssa = rack_key(cavity), ssa_key(cavity)
+                    if ssa in self._busy_ssas or (
+                        self.rack_limit is not None
+                        and self._rack_use[rack] >= self.rack_limit
+                    ):
+                        continue
+                    pending.remove(result)
+                    self._rack_use[rack] += 1
+                    self._busy_ssas.add(ssa)
+                    self._active += 1
+                    result.state = RUNNING
+                    batch.append((result, self._progress()))
+                if batch:
+                    return batch
+                self._changed.wait()
+
+    def _run_one(
+        self,
+        result: ProcedureResult,
+        procedure: Callable,
+        args: Tuple,
+        kwargs: Dict,
+    ):
+        cavity = result.cavity
+        start = time.monotonic()
+        state = FAILED
+        try:
+            result.value = procedure(cavity, *args, **kwargs)
+            state = DONE
+        except linac_utils.CavityAbortError as e:
+            result.error = e
+            state = ABORTED
+        except Exception as e:
+            cavity.logger.exception(f"{cavity} procedure failed")
+            result.error = e
+        finally:
+            result.elapsed = time.monotonic() - start
+            self._finish(result, state)
+
+    def _finish(self, result: ProcedureResult, state: str):
+        """Record result's state and free its rack slot and SSA"""
+        cavity = result.cavity
+        with self._lock:
+            result.state = state
+            self._rack_use[rack_key(cavity)] -= 1
+            self._busy_ssas.discard(ssa_key(cavity))
+            self._active -= 1
+            # Before anything else can start in the freed slot
+            running = (
+                self._abort() if state == FAILED and self.stop_on_error else []
+            )
+            self._changed.notify_all()
+            progress = self._progress()
+        self._notify(progress)
+        for other in running:
+            self.abort_cavity(other)
+
+    def _progress(self) -> ExecutorProgress:
+        return ExecutorProgress(
+            total=len(self._results),
+            counts=dict(Counter(result.state for result in self._results)),
+            running=tuple(
+                str(result.cavity)
+                for result in self._results
+                if result.state == RUNNING
+            ),
+        )
+
+    def _notify(self, progress: ExecutorProgress):
+        if self.on_progress:
+            self.on_progress(progress)
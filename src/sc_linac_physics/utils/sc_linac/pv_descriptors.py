@@ -0,0 +1,153 @@
+import sys
+from typing import Any, Callable, Dict, Optional
+
+from sc_linac_physics.utils.epics import PV
+
+
+class pv_name:
+    """
+    Class-level PV name, computed from the instance's prefix on access.
+
+    ``ades_pv = pv_name("ADES")`` reads as ``self.pv_addr("ADES")`` without
+    storing a string on every instance. Assigning to the attribute on an
+    instance overrides the computed name for that instance.
+    """
+
+    def __init__(self, suffix: str, addr: str = "pv_addr"):
+        """
+        @param suffix: PV suffix passed to the address method
+        @param addr: name of the address method, e.g. "pv_addr" or
+                     "auto_pv_addr"
+        """
+        self.suffix = suffix
+        self.addr = addr
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.addr)(self.suffix)
+
+
+class pv_property:
+    """
+    Lazily created PV object, replacing the hand-written pattern
+
+        self.ades_pv: str = self.pv_addr("ADES")
+        self._ades_pv_obj: Optional[PV] = None
+
+        @property
+        def ades_pv_obj(self) -> PV:
+            if not self._ades_pv_obj:
+                self._ades_pv_obj = PV(self.ades_pv)
+            return self._ades_pv_obj
+
+    with ``ades_pv_obj = pv_property("ADES")``. The PV is stored under the
+    same ``_ades_pv_obj`` name (only once created, so unused PVs cost
+    nothing per instance) and the ``ades_pv`` name attribute is provided as
+    a pv_name unless the class already defines one. PV is looked up in the
+    declaring module at creation time, as the hand-written properties did.
+    """
+
+    def __init__(
+        self,
+        suffix: Optional[str] = None,
+        addr: str = "pv_addr",
+        name: Optional[str] = None,
+        slot: Optional[str] = None,
+        **pv_kwargs,
+    ):
+        """
+        @param suffix: PV suffix; None when the class provides the name
+                       attribute itself
+        @param addr: name of the address method used with suffix
+        @param name: name attribute holding the PV name (defaults to the
+                     property name without "_obj")
+        @param slot: instance attribute the PV is stored under (defaults to
+                     the property name with a leading underscore)
+        @param pv_kwargs: passed to PV on creation, e.g. connection_timeout
+        """
+        self.suffix = suffix
+        self.addr = addr
+        self.name = name
+        self.slot = slot
+        self.pv_kwargs = pv_kwargs
+        self.module = None
+
+    def __set_name__(self, owner, attr_name: str):
+        if self.slot is None:
+            self.slot = f"_{attr_name}"
+        self.module = owner.__module__
+        if self.name is None:
+            self.name = attr_name.removesuffix("_obj")
+        if self.suffix is not None and self.name not in owner.__dict__:
+            setattr(owner, self.name, pv_name(self.suffix, self.addr))
+        # Unset instances still read None, like the old __init__ defaults
+        if self.slot not in owner.__dict__:
+            setattr(owner, self.slot, None)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        pv = getattr(obj, self.slot)
+        if not pv:
+            factory = getattr(sys.modules[self.module], "PV", PV)
+            pv = factory(getattr(obj, self.name), **self.pv_kwargs)
+            setattr(obj, self.slot, pv)
+        return pv
+
+    def __set__(self, obj, pv):
+        setattr(obj, self.slot, pv)
+
+
+def instance_attributes(obj) -> Dict[str, Any]:
+    """
+    Attributes of obj as vars() would report them if nothing were slotted or
+    declared on the class: slot values, pv_name names and the instance dict
+    """
+    attrs = {}
+    for klass in reversed(type(obj).__mro__):
+        for attr, value in vars(klass).items():
+            if isinstance(value, pv_name):
+                attrs[attr] = getattr(obj, attr)
+        slots = vars(klass).get("__slots__", ())
+        for attr in (slots,) if isinstance(slots, str) else slots:
+            if attr in ("__dict__", "__weakref__"):
+                continue
+            try:
+                attrs[attr] = getattr(obj, attr)
+            except AttributeError:
+                # Declared but never set, e.g. magnets on HL cryomodules
+                continue
+    attrs.update(getattr(obj, "__dict__", {}))
+    return attrs
+
+
+class pv_value:
+    """
+    Read/write property backed by a PV object attribute, with an optional
+    type conversion on read, e.g. ``ades = pv_value("ades_pv_obj", float)``.
+    """
+
+    def __init__(
+        self,
+        pv_obj_attr: str,
+        cast: Optional[Callable[[Any], Any]] = None,
+        writable: bool = True,
+    ):
+        self.pv_obj_attr = pv_obj_attr
+        self.cast = cast
+        self.writable = writable
+
+    def __set_name__(self, owner, attr_name: str):
+        self.attr_name = attr_name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.pv_obj_attr).get()
+        return value if self.cast is None else self.cast(value)
+
+    def __set__(self, obj, value):
+        if not self.writable:
+            raise AttributeError(f"{self.attr_name} is read only")
+        getattr(obj, self.pv_obj_attr).put(value)
@@ -0,0 +1,371 @@
+import hashlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from sc_linac_physics.utils.sc_linac.linac_utils import cache_dir
+from sc_linac_physics.utils.sc_linac.pv_descriptors import instance_attributes
+
+# Bump when the columns or the way they are filled change, so stale cache
+# files are rebuilt instead of loaded
+TABLE_VERSION = 1
+
+# String columns, stored as integer codes into a list of interned categories
+CATEGORY_COLUMNS = (
+    "linac",
+    "cryomodule",
+    "rack",
+    "subsystem",
+    "source",
+    "attr",
+    "suffix",
+    "prefix",
+)
+COLUMNS = CATEGORY_COLUMNS + ("cavity",)
+
+# Machine class arguments, in Machine.__init__ order
+MACHINE_CLASS_ATTRS = (
+    "linac_class",
+    "cryomodule_class",
+    "cavity_class",
+    "magnet_class",
+    "rack_class",
+    "stepper_class",
+    "ssa_class",
+    "piezo_class",
+)
+
+MAGNET_SUBSYSTEMS = ("quad", "xcor", "ycor")
+
+
+class PVNameRow(NamedTuple):
+    linac: str
+    cryomodule: str
+    rack: str
+    subsystem: str
+    source: str
+    attr: str
+    suffix: str
+    prefix: str
+    cavity: int
+    pvname: str
+
+
+def is_pv_attribute(attr_name: str) -> bool:
+    """Check if attribute name indicates it holds PV name(s)"""
+    return (
+        attr_name.endswith("_pv") or attr_name.endswith("_pvs")
+    ) and not attr_name.endswith("_pv_obj")
+
+
+class PVNameTable:
+    """
+    Columnar index of every PV name the linac objects declare, one row per
+    name with its location (linac, cryomodule, rack, cavity), the subsystem
+    it belongs to (machine, linac, cryomodule, rack, rfs, quad/xcor/ycor,
+    cavity, ssa, stepper, piezo), the declaring class and attribute, and the
+    suffix after the object's PV prefix.
+
+    String columns are stored as integer codes so queries are numpy
+    comparisons, and every name is interned so the table, the linac objects
+    and anything else holding the same name share one string. Building needs
+    a full machine; for_machine keeps the result on disk keyed by the source
+    of the classes involved.
+
+        table.names(linac="L2B", suffix="ADES")
+    """
+
+    def __init__(
+        self,
+        codes: Dict[str, np.ndarray],
+        categories: Dict[str, Sequence[str]],
+        cavity: np.ndarray,
+        pvnames: Iterable[str],
+    ):
+        self.codes = codes
+        self.categories: Dict[str, Tuple[str, ...]] = {
+            column: tuple(sys.intern(str(value)) for value in values)
+            for column, values in categories.items()
+        }
+        self.cavity = cavity
+        self.pvnames: Tuple[str, ...] = tuple(
+            sys.intern(str(name)) for name in pvnames
+        )
+        self._category_index: Dict[str, Dict[str, int]] = {
+            column: {value: code for code, value in enumerate(values)}
+            for column, values in self.categories.items()
+        }
+
+    def __len__(self):
+        return len(self.pvnames)
+
+    def __iter__(self) -> Iterator[PVNameRow]:
+        return self.rows()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> "PVNameTable":
+        """
+        @param rows: tuples in PVNameRow field order
+        """
+        categories: Dict[str, Dict[str, int]] = {
+            column: {} for column in CATEGORY_COLUMNS
+        }
+        codes: Dict[str, List[int]] = {
+            column: [] for column in CATEGORY_COLUMNS
+        }
+        cavity = []
+        pvnames = []
+        for row in rows:
+            row = PVNameRow(*row)
+            for column in CATEGORY_COLUMNS:
+                index = categories[column]
+                codes[column].append(
+                    index.setdefault(getattr(row, column), len(index))
+                )
+            cavity.append(row.cavity)
+            pvnames.append(row.pvname)
+
+        return cls(
+            codes={
+                column: np.asarray(values, dtype=np.int32)
+                for column, values in codes.items()
+            },
+            categories={
+                column: list(index) for column, index in categories.items()
+            },
+            cavity=np.asarray(cavity, dtype=np.int16),
+            pvnames=pvnames,
+        )
+
+    @classmethod
+    def from_machine(cls, machine) -> "PVNameTable":
+        """
+        Walk machine and collect every PV name attribute. Lazy machines are
+        fully built by the walk.
+        """
+        return cls.from_rows(_machine_rows(machine))
+
+    @classmethod
+    def for_machine(cls, machine) -> "PVNameTable":
+        """
+        Load the table for machine's classes from the disk cache, building
+        and caching it on a miss. A lazy machine is left unbuilt; the table
+        is made from a separate machine with the same classes instead.
+        """
+        classes = {attr: getattr(machine, attr) for attr in MACHINE_CLASS_ATTRS}
+        path = cache_dir() / f"pv_table_{_fingerprint(machine, classes)}.npz"
+
+        try:
+            return cls.load(path)
+        except (OSError, ValueError, KeyError):
+            pass
+
+        if getattr(machine, "lazy", False) is True:
+            machine = type(machine)(lazy=True, **classes)
+        table = cls.from_machine(machine)
+
+        try:
+            table.save(path)
+        except OSError:
+            # A read-only home only costs the rebuild next time
+            pass
+        return table
+
+    def save(self, path: Union[str, Path]):
+        """Write atomically to path as an npz file (no pickled objects)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {"version": np.asarray(TABLE_VERSION), "cavity": self.cavity}
+        arrays["pvname"] = np.asarray(self.pvnames, dtype=str)
+        for column in CATEGORY_COLUMNS:
+            arrays[f"{column}_codes"] = self.codes[column]
+            arrays[f"{column}_categories"] = np.asarray(
+                self.categories[column], dtype=str
+            )
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            # mkstemp creates the file private to the user
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PVNameTable":
+        """
+        @raises OSError: if path cannot be read
+        @raises ValueError: if path is not a table of this TABLE_VERSION
+        """
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != TABLE_VERSION:
+                raise ValueError(
+                    f"{path} is not a version {TABLE_VERSION} table"
+                )
+            return cls(
+                codes={
+                    column: data[f"{column}_codes"]
+                    for column in CATEGORY_COLUMNS
+                },
+                categories={
+                    column: data[f"{column}_categories"].tolist()
+                    for column in CATEGORY_COLUMNS
+                },
+                cavity=data["cavity"],
+                pvnames=data["pvname"].tolist(),
+            )
+
+    def mask(self, **filters) -> np.ndarray:
+        """
+        Boolean row mask for filters given as column=value or
+        column=[values], e.g. mask(linac="L2B", suffix=["ADES", "AACT"])
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, wanted in filters.items():
+            if column not in COLUMNS:
+                raise KeyError(f"Unknown PV table column {column}")
+            if isinstance(wanted, (str, int, np.integer)):
+                wanted = [wanted]
+            if column == "cavity":
+                mask &= np.isin(self.cavity, list(wanted))
+            else:
+                index = self._category_index[column]
+                wanted_codes = [index[v] for v in wanted if v in index]
+                mask &= np.isin(self.codes[column], wanted_codes)
+        return mask
+
+    def column(self, column: str, mask: np.ndarray = None) -> List[Any]:
+        """Values of one column (optionally for masked rows only)"""
+        if column == "pvname":
+            names = self.pvnames
+            if mask is None:
+                return list(names)
+            return [names[i] for i in np.flatnonzero(mask)]
+        if column == "cavity":
+            values = self.cavity if mask is None else self.cavity[mask]
+            return values.tolist()
+
+        codes = self.codes[column] if mask is None else self.codes[column][mask]
+        categories = self.categories[column]
+        return [categories[code] for code in codes.tolist()]
+
+    def names(self, **filters) -> List[str]:
+        """PV names of the rows matching filters, in machine order"""
+        return self.column("pvname", self.mask(**filters))
+
+    def rows(self, **filters) -> Iterator[PVNameRow]:
+        mask = self.mask(**filters)
+        columns = [self.column(field, mask) for field in PVNameRow._fields]
+        return (PVNameRow(*row) for row in zip(*columns))
+
+    def lookup(
+        self, keys: Sequence[str], value: str = "pvname", **filters
+    ) -> Dict[Tuple, Any]:
+        """
+        Map the key columns of each matching row to its value column, e.g.
+        lookup(("cryomodule", "cavity"), "prefix", subsystem="ssa")
+        """
+        mask = self.mask(**filters)
+        key_columns = [self.column(key, mask) for key in keys]
+        return dict(zip(zip(*key_columns), self.column(value, mask)))
+
+    def unique(self, column: str, **filters) -> List[Any]:
+        """Distinct values of column for the matching rows, in machine order"""
+        return list(dict.fromkeys(self.column(column, self.mask(**filters))))
+
+
+def _fingerprint(machine, classes: Dict[str, type]) -> str:
+    """
+    Hash of the table version, the classes used and the source files of the
+    modules they (and their bases) are defined in
+    """
+    digest = hashlib.sha1(str(TABLE_VERSION).encode())
+    paths = set()
+    for klass in (type(machine), *classes.values()):
+        digest.update(f"{klass.__module__}.{klass.__qualname__}".encode())
+        for base in klass.__mro__:
+            module_file = getattr(
+                sys.modules.get(base.__module__), "__file__", None
+            )
+            if module_file:
+                paths.add(module_file)
+    for path in sorted(paths):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _object_rows(
+    obj, subsystem: str, linac="", cryomodule="", rack="", cavity=0
+):
+    prefix = getattr(obj, "pv_prefix", "")
+    source = type(obj).__name__
+    for attr, value in instance_attributes(obj).items():
+        if not is_pv_attribute(attr):
+            continue
+        for pvname in value if isinstance(value, list) else [value]:
+            if not isinstance(pvname, str):
+                continue
+            if prefix and pvname.startswith(prefix):
+                suffix = pvname[len(prefix) :]
+            else:
+                suffix = pvname.rsplit(":", 1)[-1]
+            yield (
+                linac,
+                cryomodule,
+                rack,
+                subsystem,
+                source,
+                attr,
+                suffix,
+                prefix,
+                cavity,
+                pvname,
+            )
+
+
+def _machine_rows(machine) -> Iterator[Tuple]:
+    yield from _object_rows(machine, "machine")
+    for linac in machine.linacs:
+        yield from _object_rows(linac, "linac", linac.name)
+        for cm_obj in linac.cryomodules.values():
+            location = (linac.name, cm_obj.name)
+            yield from _object_rows(cm_obj, "cryomodule", *location)
+            for subsystem in MAGNET_SUBSYSTEMS:
+                # HL cryomodules have no magnets
+                magnet = getattr(cm_obj, subsystem, None)
+                if magnet is not None:
+                    yield from _object_rows(magnet, subsystem, *location)
+            for rack in (cm_obj.rack_a, cm_obj.rack_b):
+                rack_location = location + (rack.rack_name,)
+                yield from _object_rows(rack, "rack", *rack_location)
+                for rfs in (rack.rfs1, rack.rfs2):
+                    yield from _object_rows(rfs, "rfs", *rack_location)
+                for cavity in rack.cavities.values():
+                    cavity_location = rack_location + (cavity.number,)
+                    for subsystem, obj in (
+                        ("cavity", cavity),
+                        ("ssa", cavity.ssa),
+                        ("stepper", cavity.stepper_tuner),
+                        ("piezo", cavity.piezo),
+                    ):
+                        yield from _object_rows(
+                            obj, subsystem, *cavity_location
+                        )
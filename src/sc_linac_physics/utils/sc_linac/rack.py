@@ -15,6 +15,21 @@ class Rack(SCLinacObject):
     Rack A has cavities 1 through 4, Rack B has cavities 5 through 8.
     """
 
+    __slots__ = (
+        "cryomodule",
+        "rack_name",
+        "cavity_class",
+        "ssa_class",
+        "stepper_class",
+        "piezo_class",
+        "cavities",
+        "_pv_prefix",
+        "rfs1",
+        "rfs2",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         rack_name: str,
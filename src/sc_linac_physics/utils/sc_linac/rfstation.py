@@ -1,13 +1,23 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV
 from sc_linac_physics.utils.sc_linac.linac_utils import SCLinacObject
+from sc_linac_physics.utils.sc_linac.pv_descriptors import pv_property
 
 if TYPE_CHECKING:
     from rack import Rack
 
 
 class RFStation(SCLinacObject):
+    __slots__ = (
+        "rack",
+        "num",
+        "_pv_prefix",
+        "__dict__",
+        "__weakref__",
+    )
+
+    dac_amp_pv_obj = pv_property("DAC_AMPLITUDE")
+
     def __init__(
         self,
         num: int,
@@ -20,19 +30,10 @@ class RFStation(SCLinacObject):
             f"RFS{self.num}{self.rack.rack_name}:"
         )
 
-        self.dac_amp_pv: str = self.pv_addr("DAC_AMPLITUDE")
-        self._dac_amp_pv_obj: Optional[PV] = None
-
     @property
     def pv_prefix(self):
         return self._pv_prefix
 
-    @property
-    def dac_amp_pv_obj(self) -> PV:
-        if not self._dac_amp_pv_obj:
-            self._dac_amp_pv_obj = PV(self.dac_amp_pv)
-        return self._dac_amp_pv_obj
-
     @property
     def dac_amp(self) -> float:
         return self.dac_amp_pv_obj.get()
@@ -1,9 +1,13 @@
 import time
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import wait_until
 from sc_linac_physics.utils.sc_linac import linac_utils
+from sc_linac_physics.utils.sc_linac.calibration_policy import (
+    record_ssa_calibration,
+)
+from sc_linac_physics.utils.sc_linac.pv_descriptors import pv_property
 
 if TYPE_CHECKING:
     from cavity import Cavity
@@ -16,6 +20,38 @@ class SSA(linac_utils.SCLinacObject):
 
     """
 
+    __slots__ = (
+        "cavity",
+        "_pv_prefix",
+        "hl_prefix",
+        "fwd_power_lower_limit",
+        "ps_volt_setpoint1_pv",
+        "ps_volt_setpoint2_pv",
+        "status_pv",
+        "turn_on_pv",
+        "turn_off_pv",
+        "reset_pv",
+        "__dict__",
+        "__weakref__",
+    )
+
+    calibration_start_pv_obj = pv_property("CALSTRT")
+    calibration_status_pv_obj = pv_property("CALSTS", connection_timeout=10)
+    cal_result_status_pv_obj = pv_property("CALSTAT")
+    current_slope_pv_obj = pv_property("SLOPE")
+    measured_slope_pv_obj = pv_property("SLOPE_NEW")
+    drive_max_setpoint_pv_obj = pv_property("DRV_MAX_REQ")
+    saved_drive_max_pv_obj = pv_property("DRV_MAX_SAVE")
+    max_fwd_pwr_pv_obj = pv_property("CALPWR")
+
+    # Names set in __init__, since HL SSAs share these controls
+    status_pv_obj = pv_property()
+    turn_on_pv_obj = pv_property()
+    turn_off_pv_obj = pv_property()
+    reset_pv_obj = pv_property()
+    ps_volt_setpoint1_pv_obj = pv_property()
+    ps_volt_setpoint2_pv_obj = pv_property()
+
     def __init__(self, cavity: "Cavity"):
         """
         @param cavity: the cavity object powered by this SSA
@@ -39,10 +75,7 @@ class SSA(linac_utils.SCLinacObject):
             self.fwd_power_lower_limit = 500
 
             self.ps_volt_setpoint1_pv: str = self.hl_prefix + "PSVoltSetpt1"
-            self._ps_volt_setpoint1_pv_obj: Optional[PV] = None
-
             self.ps_volt_setpoint2_pv: str = self.hl_prefix + "PSVoltSetpt2"
-            self._ps_volt_setpoint2_pv_obj: Optional[PV] = None
 
             self.status_pv: str = self.hl_prefix + "StatusMsg"
             self.turn_on_pv: str = self.hl_prefix + "PowerOn"
@@ -56,34 +89,6 @@ class SSA(linac_utils.SCLinacObject):
             self.turn_off_pv: str = self.pv_addr("PowerOff")
             self.reset_pv: str = self.pv_addr("FaultReset")
 
-        self._status_pv_obj: Optional[PV] = None
-        self._turn_on_pv_obj: Optional[PV] = None
-        self._turn_off_pv_obj: Optional[PV] = None
-        self._reset_pv_obj: Optional[PV] = None
-
-        self.calibration_start_pv: str = self.pv_addr("CALSTRT")
-        self._calibration_start_pv_obj: Optional[PV] = None
-
-        self.calibration_status_pv: str = self.pv_addr("CALSTS")
-        self._calibration_status_pv_obj: Optional[PV] = None
-
-        self.cal_result_status_pv: str = self.pv_addr("CALSTAT")
-        self._cal_result_status_pv_obj: Optional[PV] = None
-
-        self.current_slope_pv: str = self.pv_addr("SLOPE")
-
-        self.measured_slope_pv: str = self.pv_addr("SLOPE_NEW")
-        self._measured_slope_pv_obj: Optional[PV] = None
-
-        self.drive_max_setpoint_pv: str = self.pv_addr("DRV_MAX_REQ")
-        self._drive_max_setpoint_pv_obj: Optional[PV] = None
-
-        self.saved_drive_max_pv: str = self.pv_addr("DRV_MAX_SAVE")
-        self._saved_drive_max_pv_obj: Optional[PV] = None
-
-        self.max_fwd_pwr_pv: str = self.pv_addr("CALPWR")
-        self._max_fwd_pwr_pv_obj: Optional[PV] = None
-
     def __str__(self):
         return f"{self.cavity} SSA"
 
@@ -108,9 +113,7 @@ class SSA(linac_utils.SCLinacObject):
 
     @property
     def status_message(self):
-        if not self._status_pv_obj:
-            self._status_pv_obj = PV(self.status_pv)
-        return self._status_pv_obj.get()
+        return self.status_pv_obj.get()
 
     @property
     def is_on(self) -> bool:
@@ -131,15 +134,11 @@ class SSA(linac_utils.SCLinacObject):
 
     @property
     def max_fwd_pwr(self):
-        if not self._max_fwd_pwr_pv_obj:
-            self._max_fwd_pwr_pv_obj = PV(self.max_fwd_pwr_pv)
-        return self._max_fwd_pwr_pv_obj.get()
+        return self.max_fwd_pwr_pv_obj.get()
 
     @property
     def drive_max(self):
-        if not self._saved_drive_max_pv_obj:
-            self._saved_drive_max_pv_obj = PV(self.saved_drive_max_pv)
-        saved_val = self._saved_drive_max_pv_obj.get()
+        saved_val = self.saved_drive_max_pv_obj.get()
         return (
             saved_val
             if saved_val
@@ -148,9 +147,7 @@ class SSA(linac_utils.SCLinacObject):
 
     @drive_max.setter
     def drive_max(self, value: float):
-        if not self._drive_max_setpoint_pv_obj:
-            self._drive_max_setpoint_pv_obj = PV(self.drive_max_setpoint_pv)
-        self._drive_max_setpoint_pv_obj.put(value)
+        self.drive_max_setpoint_pv_obj.put(value)
 
     def calibrate(self, drive_max, attempt=0):
         """
@@ -193,6 +190,7 @@ class SSA(linac_utils.SCLinacObject):
         try:
             self.cavity.check_abort()
             self.run_calibration()
+            record_ssa_calibration(self, drive_max)
 
         except (
             linac_utils.SSACalibrationToleranceError,
@@ -226,24 +224,6 @@ class SSA(linac_utils.SCLinacObject):
                 )
                 raise linac_utils.SSACalibrationError(e)
 
-    @property
-    def ps_volt_setpoint2_pv_obj(self):
-        if not self._ps_volt_setpoint2_pv_obj:
-            self._ps_volt_setpoint2_pv_obj = PV(self.ps_volt_setpoint2_pv)
-        return self._ps_volt_setpoint2_pv_obj
-
-    @property
-    def ps_volt_setpoint1_pv_obj(self):
-        if not self._ps_volt_setpoint1_pv_obj:
-            self._ps_volt_setpoint1_pv_obj = PV(self.ps_volt_setpoint1_pv)
-        return self._ps_volt_setpoint1_pv_obj
-
-    @property
-    def turn_on_pv_obj(self) -> PV:
-        if not self._turn_on_pv_obj:
-            self._turn_on_pv_obj = PV(self.turn_on_pv)
-        return self._turn_on_pv_obj
-
     def turn_on(self):
         if not self.is_on:
             # Check to see if SSA is hard faulted first (cls.reset() tries a set
@@ -253,18 +233,20 @@ class SSA(linac_utils.SCLinacObject):
             self.cavity.logger.info("Turning SSA on")
             self.turn_on_pv_obj.put(1)
 
-            while not self.is_on:
-                self.cavity.check_abort()
-                self.cavity.logger.debug(
+            wait_until(
+                self.status_pv_obj,
+                lambda status: status == linac_utils.SSA_STATUS_ON_VALUE,
+                abort_check=self.cavity.check_abort,
+                on_wait=lambda status: self.cavity.logger.debug(
                     "Waiting for SSA to turn on",
                     extra={
                         "extra_data": {
-                            "status_message": self.status_message,
+                            "status_message": status,
                             "ssa": str(self),
                         }
                     },
-                )
-                time.sleep(1)
+                ),
+            )
 
         if self.cavity.cryomodule.is_harmonic_linearizer:
             self.cavity.logger.debug(
@@ -276,38 +258,28 @@ class SSA(linac_utils.SCLinacObject):
 
         self.cavity.logger.info("SSA successfully turned on")
 
-    @property
-    def turn_off_pv_obj(self) -> PV:
-        if not self._turn_off_pv_obj:
-            self._turn_off_pv_obj = PV(self.turn_off_pv)
-        return self._turn_off_pv_obj
-
     def turn_off(self):
         if self.is_on:
             self.cavity.logger.info("Turning SSA off")
             self.turn_off_pv_obj.put(1)
 
-            while self.is_on:
-                self.cavity.check_abort()
-                self.cavity.logger.debug(
+            wait_until(
+                self.status_pv_obj,
+                lambda status: status != linac_utils.SSA_STATUS_ON_VALUE,
+                abort_check=self.cavity.check_abort,
+                on_wait=lambda status: self.cavity.logger.debug(
                     "Waiting for SSA to turn off",
                     extra={
                         "extra_data": {
-                            "status_message": self.status_message,
+                            "status_message": status,
                             "ssa": str(self),
                         }
                     },
-                )
-                time.sleep(1)
+                ),
+            )
 
         self.cavity.logger.info("SSA successfully turned off")
 
-    @property
-    def reset_pv_obj(self) -> PV:
-        if not self._reset_pv_obj:
-            self._reset_pv_obj = PV(self.reset_pv)
-        return self._reset_pv_obj
-
     def reset(self):
         reset_attempt = 0
         while self.is_faulted:
@@ -352,8 +324,8 @@ class SSA(linac_utils.SCLinacObject):
 
     def wait_while_resetting(self):
         start = datetime.now()
-        while self.is_resetting:
-            self.cavity.check_abort()
+
+        def report_progress(status):
             elapsed = (datetime.now() - start).total_seconds()
             self.cavity.logger.debug(
                 "Waiting for SSA to finish resetting (%.0fs elapsed)",
@@ -361,40 +333,46 @@ class SSA(linac_utils.SCLinacObject):
                 extra={
                     "extra_data": {
                         "elapsed_seconds": elapsed,
-                        "status_message": self.status_message,
+                        "status_message": status,
                         "ssa": str(self),
                     }
                 },
             )
-            time.sleep(5)
-            if elapsed >= 90:
-                self.cavity.logger.error(
-                    "SSA reset timeout",
-                    extra={
-                        "extra_data": {
-                            "elapsed_seconds": elapsed,
-                            "timeout_seconds": 90,
-                            "final_status": self.status_message,
-                            "ssa": str(self),
-                        }
-                    },
-                )
-                raise linac_utils.SSAFaultError(
-                    f"{self} took too long to reset, inspect and try again"
-                )
+
+        try:
+            wait_until(
+                self.status_pv_obj,
+                lambda status: status
+                != linac_utils.SSA_STATUS_RESETTING_FAULTS_VALUE,
+                timeout=90,
+                abort_check=self.cavity.check_abort,
+                poll_interval=5,
+                on_wait=report_progress,
+            )
+        except TimeoutError:
+            self.cavity.logger.error(
+                "SSA reset timeout",
+                extra={
+                    "extra_data": {
+                        "elapsed_seconds": (
+                            datetime.now() - start
+                        ).total_seconds(),
+                        "timeout_seconds": 90,
+                        "final_status": self.status_message,
+                        "ssa": str(self),
+                    }
+                },
+            )
+            raise linac_utils.SSAFaultError(
+                f"{self} took too long to reset, inspect and try again"
+            )
 
     def start_calibration(self):
-        if not self._calibration_start_pv_obj:
-            self._calibration_start_pv_obj = PV(self.calibration_start_pv)
-        self._calibration_start_pv_obj.put(1, wait=False)
+        self.calibration_start_pv_obj.put(1, wait=False)
 
     @property
     def calibration_status(self):
-        if not self._calibration_status_pv_obj:
-            self._calibration_status_pv_obj = PV(
-                self.calibration_status_pv, connection_timeout=10
-            )
-        return self._calibration_status_pv_obj.get(timeout=10)
+        return self.calibration_status_pv_obj.get(timeout=10)
 
     @property
     def calibration_running(self) -> bool:
@@ -408,12 +386,6 @@ class SSA(linac_utils.SCLinacObject):
             self.calibration_status == linac_utils.SSA_CALIBRATION_CRASHED_VALUE
         )
 
-    @property
-    def cal_result_status_pv_obj(self) -> PV:
-        if not self._cal_result_status_pv_obj:
-            self._cal_result_status_pv_obj = PV(self.cal_result_status_pv)
-        return self._cal_result_status_pv_obj
-
     @property
     def calibration_result_good(self) -> bool:
         return (
@@ -448,17 +420,19 @@ class SSA(linac_utils.SCLinacObject):
         self.start_calibration()
         time.sleep(2)
 
-        while self.calibration_running:
-            self.cavity.logger.debug(
+        wait_until(
+            self.calibration_status_pv_obj,
+            lambda status: status != linac_utils.SSA_CALIBRATION_RUNNING_VALUE,
+            on_wait=lambda status: self.cavity.logger.debug(
                 "Waiting for SSA calibration to complete",
                 extra={
                     "extra_data": {
-                        "calibration_status": self.calibration_status,
+                        "calibration_status": status,
                         "ssa": str(self),
                     }
                 },
-            )
-            time.sleep(1)
+            ),
+        )
         time.sleep(2)
 
         if self.calibration_crashed:
@@ -548,9 +522,7 @@ class SSA(linac_utils.SCLinacObject):
 
     @property
     def measured_slope(self):
-        if not self._measured_slope_pv_obj:
-            self._measured_slope_pv_obj = PV(self.measured_slope_pv)
-        return self._measured_slope_pv_obj.get()
+        return self.measured_slope_pv_obj.get()
 
     @property
     def measured_slope_in_tolerance(self) -> bool:
@@ -0,0 +1,108 @@
+import atexit
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sc_linac_physics.utils.epics import PV
+
+# Seconds between puts to any one status PV
+STATUS_PUBLISH_INTERVAL = 0.2
+
+# Seconds to wait at interpreter exit for the last values to go out
+STATUS_FLUSH_TIMEOUT = 5
+
+
+class StatusPublisher:
+    """
+    Writes status PVs (script messages, progress, status) from one
+    background thread so the procedures setting them never wait on a put.
+
+    Writes to the same PV coalesce: each PV is put at most once per interval
+    and always with the latest value, so the messages a polling loop sets on
+    every iteration cost one put per interval instead of one each. The last
+    value set is always published, including at interpreter exit.
+
+    Puts do not wait for completion, so the values due together go out in
+    one pass instead of one round trip each, and a failing PV only costs
+    its own value.
+    """
+
+    def __init__(self, interval: float = STATUS_PUBLISH_INTERVAL):
+        """
+        @param interval: minimum seconds between puts to one PV
+        """
+        self.interval = interval
+        self._pending: Dict[int, Tuple[PV, Any, Optional[logging.Logger]]] = {}
+        self._last_put: Dict[int, float] = {}
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(
+        self, pv: PV, value: Any, logger: Optional[logging.Logger] = None
+    ):
+        """
+        Queue value for pv, replacing any value still waiting for it
+        @param logger: where to report the put failing
+        """
+        with self._condition:
+            self._pending[id(pv)] = (pv, value, logger)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="StatusPublisher", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush, STATUS_FLUSH_TIMEOUT)
+            self._condition.notify_all()
+
+    def get(self, pv: PV) -> Any:
+        """The value waiting to be published to pv, else the PV's value"""
+        with self._condition:
+            pending = self._pending.get(id(pv))
+        return pv.get() if pending is None else pending[1]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every queued value to be published
+        @return: False if values were still queued after timeout seconds
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._in_flight, timeout
+            )
+
+    def _next_due(self) -> Tuple[list, Optional[float]]:
+        """Queued values whose interval has passed and seconds to the next"""
+        now = time.monotonic()
+        due = []
+        wait = None
+        for key in list(self._pending):
+            last_put = self._last_put.get(key, float("-inf"))
+            remaining = last_put + self.interval - now
+            if remaining <= 0:
+                due.append(self._pending.pop(key))
+                self._last_put[key] = now
+            elif wait is None or remaining < wait:
+                wait = remaining
+        return due, wait
+
+    def _run(self):
+        while True:
+            with self._condition:
+                due, wait = self._next_due()
+                while not due:
+                    self._condition.wait(wait)
+                    due, wait = self._next_due()
+                self._in_flight = len(due)
+
+            for pv, value, logger in due:
+                try:
+                    pv.put(value, wait=False)
+                except Exception as e:
+                    if logger:
+                        logger.warning(f"Could not publish {value!r}: {e}")
+
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
@@ -1,11 +1,15 @@
-import time
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
 from numpy import sign
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import wait_until
 from sc_linac_physics.utils.sc_linac import linac_utils
+from sc_linac_physics.utils.sc_linac.pv_descriptors import (
+    pv_name,
+    pv_property,
+    pv_value,
+)
 
 if TYPE_CHECKING:
     from cavity import Cavity
@@ -18,6 +22,37 @@ class StepperTuner(linac_utils.SCLinacObject):
     status, and retrieving stored movement parameters
     """
 
+    __slots__ = (
+        "cavity",
+        "_pv_prefix",
+        "abort_flag",
+        "__dict__",
+        "__weakref__",
+    )
+
+    move_pos_pv_obj = pv_property("MOV_REQ_POS")
+    move_neg_pv_obj = pv_property("MOV_REQ_NEG")
+    abort_pv_obj = pv_property("ABORT_REQ")
+    step_des_pv_obj = pv_property("NSTEPS")
+    max_steps_pv_obj = pv_property("NSTEPS.DRVH")
+    speed_pv_obj = pv_property("VELO")
+    step_tot_pv = pv_name("REG_TOTABS")
+    step_signed_pv = pv_name("REG_TOTSGN")
+    reset_tot_pv = pv_name("TOTABS_RESET")
+    reset_signed_pv_obj = pv_property("TOTSGN_RESET")
+    steps_cold_landing_pv = pv_name("NSTEPS_COLD")
+    push_signed_cold_pv = pv_name("PUSH_NSTEPS_COLD.PROC")
+    push_signed_park_pv = pv_name("PUSH_NSTEPS_PARK.PROC")
+    motor_moving_pv_obj = pv_property("STAT_MOV")
+    motor_done_pv = pv_name("STAT_DONE")
+    limit_switch_a_pv_obj = pv_property("STAT_LIMA")
+    limit_switch_b_pv_obj = pv_property("STAT_LIMB")
+    hz_per_microstep_pv_obj = pv_property("SCALE")
+
+    step_des = pv_value("step_des_pv_obj")
+    max_steps = pv_value("max_steps_pv_obj")
+    speed = pv_value("speed_pv_obj")
+
     def __init__(self, cavity: "Cavity"):
         """
         @param cavity: the cavity object tuned by this stepper
@@ -26,49 +61,6 @@ class StepperTuner(linac_utils.SCLinacObject):
         self.cavity: "Cavity" = cavity
         self._pv_prefix: str = self.cavity.pv_addr("STEP:")
 
-        self.move_pos_pv: str = self.pv_addr("MOV_REQ_POS")
-        self._move_pos_pv_obj: Optional[PV] = None
-
-        self.move_neg_pv: str = self.pv_addr("MOV_REQ_NEG")
-        self._move_neg_pv_obj: Optional[PV] = None
-
-        self.abort_pv: str = self.pv_addr("ABORT_REQ")
-        self._abort_pv_obj: Optional[PV] = None
-
-        self.step_des_pv: str = self.pv_addr("NSTEPS")
-        self._step_des_pv_obj: Optional[PV] = None
-
-        self.max_steps_pv: str = self.pv_addr("NSTEPS.DRVH")
-        self._max_steps_pv_obj: Optional[PV] = None
-
-        self.speed_pv: str = self.pv_addr("VELO")
-        self._speed_pv_obj: Optional[PV] = None
-
-        self.step_tot_pv: str = self.pv_addr("REG_TOTABS")
-        self.step_signed_pv: str = self.pv_addr("REG_TOTSGN")
-        self.reset_tot_pv: str = self.pv_addr("TOTABS_RESET")
-
-        self.reset_signed_pv: str = self.pv_addr("TOTSGN_RESET")
-        self._reset_signed_pv_obj: Optional[PV] = None
-
-        self.steps_cold_landing_pv: str = self.pv_addr("NSTEPS_COLD")
-        self.push_signed_cold_pv: str = self.pv_addr("PUSH_NSTEPS_COLD.PROC")
-        self.push_signed_park_pv: str = self.pv_addr("PUSH_NSTEPS_PARK.PROC")
-
-        self.motor_moving_pv: str = self.pv_addr("STAT_MOV")
-        self._motor_moving_pv_obj: Optional[PV] = None
-
-        self.motor_done_pv: str = self.pv_addr("STAT_DONE")
-
-        self.limit_switch_a_pv: str = self.pv_addr("STAT_LIMA")
-        self._limit_switch_a_pv_obj: Optional[PV] = None
-
-        self.limit_switch_b_pv: str = self.pv_addr("STAT_LIMB")
-        self._limit_switch_b_pv_obj: Optional[PV] = None
-
-        self.hz_per_microstep_pv: str = self.pv_addr("SCALE")
-        self._hz_per_microstep_pv_obj: Optional[PV] = None
-
         self.abort_flag: bool = False
 
     def __str__(self):
@@ -78,12 +70,6 @@ class StepperTuner(linac_utils.SCLinacObject):
     def pv_prefix(self):
         return self._pv_prefix
 
-    @property
-    def hz_per_microstep_pv_obj(self) -> PV:
-        if not self._hz_per_microstep_pv_obj:
-            self._hz_per_microstep_pv_obj = PV(self.hz_per_microstep_pv)
-        return self._hz_per_microstep_pv_obj
-
     @property
     def hz_per_microstep(self):
         return abs(self.hz_per_microstep_pv_obj.get())
@@ -103,57 +89,21 @@ class StepperTuner(linac_utils.SCLinacObject):
 
     def abort(self):
         self.cavity.logger.info("Aborting stepper movement")
-        if not self._abort_pv_obj:
-            self._abort_pv_obj = PV(self.abort_pv)
-        self._abort_pv_obj.put(1)
+        self.abort_pv_obj.put(1)
 
     def move_positive(self):
-        if not self._move_pos_pv_obj:
-            self._move_pos_pv_obj = PV(self.move_pos_pv)
-        self._move_pos_pv_obj.put(1, wait=False)
+        self.move_pos_pv_obj.put(1, wait=False)
 
     def move_negative(self):
-        if not self._move_neg_pv_obj:
-            self._move_neg_pv_obj = PV(self.move_neg_pv)
-        self._move_neg_pv_obj.put(1, wait=False)
-
-    @property
-    def step_des_pv_obj(self):
-        if not self._step_des_pv_obj:
-            self._step_des_pv_obj = PV(self.step_des_pv)
-        return self._step_des_pv_obj
-
-    @property
-    def step_des(self):
-        return self.step_des_pv_obj.get()
-
-    @step_des.setter
-    def step_des(self, value: int):
-        self.step_des_pv_obj.put(value)
+        self.move_neg_pv_obj.put(1, wait=False)
 
     @property
     def motor_moving(self) -> bool:
-        if not self._motor_moving_pv_obj:
-            self._motor_moving_pv_obj = PV(self.motor_moving_pv)
-        return self._motor_moving_pv_obj.get() == 1
+        return self.motor_moving_pv_obj.get() == 1
 
     def reset_signed_steps(self):
         self.cavity.logger.debug("Resetting stepper signed steps counter")
-        if not self._reset_signed_pv_obj:
-            self._reset_signed_pv_obj = PV(self.reset_signed_pv)
-        self._reset_signed_pv_obj.put(0)
-
-    @property
-    def limit_switch_a_pv_obj(self):
-        if not self._limit_switch_a_pv_obj:
-            self._limit_switch_a_pv_obj = PV(self.limit_switch_a_pv)
-        return self._limit_switch_a_pv_obj
-
-    @property
-    def limit_switch_b_pv_obj(self):
-        if not self._limit_switch_b_pv_obj:
-            self._limit_switch_b_pv_obj = PV(self.limit_switch_b_pv)
-        return self._limit_switch_b_pv_obj
+        self.reset_signed_pv_obj.put(0)
 
     @property
     def on_limit_switch(self) -> bool:
@@ -164,34 +114,6 @@ class StepperTuner(linac_utils.SCLinacObject):
             == linac_utils.STEPPER_ON_LIMIT_SWITCH_VALUE
         )
 
-    @property
-    def max_steps_pv_obj(self) -> PV:
-        if not self._max_steps_pv_obj:
-            self._max_steps_pv_obj = PV(self.max_steps_pv)
-        return self._max_steps_pv_obj
-
-    @property
-    def max_steps(self):
-        return self.max_steps_pv_obj.get()
-
-    @max_steps.setter
-    def max_steps(self, value: int):
-        self.max_steps_pv_obj.put(value)
-
-    @property
-    def speed_pv_obj(self):
-        if not self._speed_pv_obj:
-            self._speed_pv_obj = PV(self.speed_pv)
-        return self._speed_pv_obj
-
-    @property
-    def speed(self):
-        return self.speed_pv_obj.get()
-
-    @speed.setter
-    def speed(self, value: int):
-        self.speed_pv_obj.put(value)
-
     def restore_defaults(self):
         self.cavity.logger.debug(
             "Restoring stepper default settings",
@@ -343,15 +265,27 @@ class StepperTuner(linac_utils.SCLinacObject):
         else:
             self.move_negative()
 
-        self.cavity.logger.debug("Waiting 5s for motor to start moving")
-        time.sleep(5)
+        # The moving monitor wakes both waits as soon as the motor state
+        # changes; a move that finishes before it is seen costs the timeout
+        self.cavity.logger.debug("Waiting for motor to start moving")
+        try:
+            wait_until(
+                self.motor_moving_pv_obj,
+                lambda moving: moving == 1,
+                timeout=linac_utils.STEPPER_START_TIMEOUT,
+                abort_check=self.check_abort,
+            )
+        except TimeoutError:
+            self.cavity.logger.debug("Motor not seen moving, checking if done")
 
         move_start_time = datetime.now()
-        while self.motor_moving:
+
+        def check_move():
             self.check_abort()
             if check_detune:
                 self.cavity.check_detune()
 
+        def report_progress(moving):
             elapsed = (datetime.now() - move_start_time).total_seconds()
             self.cavity.logger.debug(
                 "Motor still moving (%.0fs elapsed)",
@@ -363,7 +297,14 @@ class StepperTuner(linac_utils.SCLinacObject):
                     }
                 },
             )
-            time.sleep(5)
+
+        wait_until(
+            self.motor_moving_pv_obj,
+            lambda moving: moving != 1,
+            abort_check=check_move,
+            poll_interval=5,
+            on_wait=report_progress,
+        )
 
         total_move_time = (datetime.now() - move_start_time).total_seconds()
         self.cavity.logger.info(
@@ -0,0 +1,101 @@
+import sqlite3
+from typing import TYPE_CHECKING, Optional
+
+from sc_linac_physics.utils.sc_linac.cavity_cache import CavityCache
+
+if TYPE_CHECKING:
+    from sc_linac_physics.utils.sc_linac.cavity import Cavity
+
+# Prior confidence expressed as the size of move (in microsteps) that weighs
+# as much as the prior: a first move of this size moves the estimate halfway
+TUNER_PRIOR_STEPS = 10000
+
+# Older moves count for this fraction of the next one
+TUNER_FORGETTING_FACTOR = 0.9
+
+# Estimates are kept within this factor of the nominal scale so a bad detune
+# reading cannot send the tuner off by orders of magnitude
+TUNER_MAX_SCALE_RATIO = 4
+
+
+class StepResponseModel:
+    """
+    Online fit of the Hz of detune removed per stepper microstep.
+
+    Each move of steps microsteps that changes the detune by hz_change Hz is
+    one observation of hz_change = hz_per_microstep * steps, folded in with
+    scalar recursive least squares (with forgetting, so the estimate follows
+    the tuner as it moves through its range). The prior is the cavity's
+    cached estimate from earlier runs, or the stepper's SCALE PV.
+
+    The limits always come from the nominal scale (the SCALE PV), never
+    from a cached estimate, so they cannot drift from run to run.
+    """
+
+    def __init__(
+        self,
+        hz_per_microstep: float,
+        nominal: Optional[float] = None,
+        prior_steps: float = TUNER_PRIOR_STEPS,
+        forgetting_factor: float = TUNER_FORGETTING_FACTOR,
+        max_ratio: float = TUNER_MAX_SCALE_RATIO,
+    ):
+        """
+        @param hz_per_microstep: starting estimate
+        @param nominal: scale the limits are set around, hz_per_microstep by
+                        default
+        """
+        if nominal is None:
+            nominal = hz_per_microstep
+        self.forgetting_factor = forgetting_factor
+        self.lower_limit = nominal / max_ratio
+        self.upper_limit = nominal * max_ratio
+        self.hz_per_microstep = self._bounded(hz_per_microstep)
+        self.covariance = 1 / prior_steps**2
+        self.num_moves = 0
+
+    @classmethod
+    def for_cavity(
+        cls, cavity: "Cavity", cache: Optional[CavityCache] = None, **kwargs
+    ) -> "StepResponseModel":
+        cache = cache or CavityCache()
+        nominal = cavity.stepper_tuner.hz_per_microstep
+        cached = cache.tuner_scale(cavity.cryomodule.name, cavity.number)
+        return cls(
+            nominal if cached is None else cached, nominal=nominal, **kwargs
+        )
+
+    def _bounded(self, hz_per_microstep: float) -> float:
+        return min(self.upper_limit, max(self.lower_limit, hz_per_microstep))
+
+    def steps_for(self, delta_hz: float) -> float:
+        """Microsteps expected to remove delta_hz of detune"""
+        return delta_hz / self.hz_per_microstep
+
+    def update(self, steps: float, hz_change: float):
+        """
+        @param steps: signed microsteps moved
+        @param hz_change: detune before the move minus detune after it
+        """
+        if not steps:
+            return
+        lam = self.forgetting_factor
+        gain = self.covariance * steps / (lam + self.covariance * steps**2)
+        estimate = self.hz_per_microstep + gain * (
+            hz_change - self.hz_per_microstep * steps
+        )
+        self.hz_per_microstep = self._bounded(estimate)
+        self.covariance = (1 - gain * steps) * self.covariance / lam
+        self.num_moves += 1
+
+    def save(self, cavity: "Cavity", cache: Optional[CavityCache] = None):
+        """Cache the estimate for the cavity's next run if it learned one"""
+        if not self.num_moves:
+            return
+        cache = cache or CavityCache()
+        try:
+            cache.save_tuner_scale(
+                cavity.cryomodule.name, cavity.number, self.hz_per_microstep
+            )
+        except (OSError, sqlite3.Error) as e:
+            cavity.logger.warning(f"Could not cache {cavity} tuner scale: {e}")
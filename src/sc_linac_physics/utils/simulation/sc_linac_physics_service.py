@@ -1,12 +1,17 @@
+from typing import Optional
+
 from caproto import ChannelEnum, ChannelFloat, ChannelInteger
 from caproto.server import ioc_arg_parser, run
 
 from sc_linac_physics.utils.sc_linac.decarad import Decarad
+from sc_linac_physics.utils.sc_linac.linac import MACHINE
 from sc_linac_physics.utils.sc_linac.linac_utils import (
+    ALL_CRYOMODULES,
     L1BHL,
     LINAC_CM_DICT,
     LINAC_TUPLES,
 )
+from sc_linac_physics.utils.sc_linac.pv_table import PVNameTable
 from sc_linac_physics.utils.simulation.cavity_service import CavityPVGroup
 from sc_linac_physics.utils.simulation.cryo_service import (
     CryoPVGroup,
@@ -66,6 +71,12 @@ HEARTBEAT_CHANNELS = [
     "SC_SEL_PHAS_OPT_HEARTBEAT",
     "SC_CAV_QNCH_RESET_HEARTBEAT",
     "SC_CAV_FAULT_HEARTBEAT",
+    # The cavity fault runner's shard heartbeats, sharded by linac or by
+    # cryomodule
+    *(
+        f"SC_CAV_FAULT_HEARTBEAT_{shard}"
+        for shard in [linac for linac, _ in LINAC_TUPLES] + ALL_CRYOMODULES
+    ),
 ]
 
 ALARM_CHANNELS = [
@@ -77,6 +88,9 @@ ALARM_CHANNELS = [
 ALARM_STATES = ("RUNNING", "NOT_RUNNING", "INVALID")
 RACK_A_CAVITIES = range(1, 5)
 
+# Cavity level groups whose prefixes come from the PV name table
+CAVITY_SUBSYSTEMS = ("cavity", "ssa", "stepper", "piezo")
+
 # Launcher type configuration
 # Launcher type configuration
 LAUNCHER_TYPES = {
@@ -143,8 +157,19 @@ class LauncherGroups:
 
 
 class SCLinacPhysicsService(Service):
-    def __init__(self):
+    def __init__(self, pv_table: Optional[PVNameTable] = None):
+        """
+        @param pv_table: name table the cavity, tuner, SSA and RF station
+                         prefixes are read from (defaults to the machine's)
+        """
         super().__init__()
+        self.pv_table = pv_table if pv_table is not None else MACHINE.pv_table
+        self.cavity_prefixes = {
+            subsystem: self.pv_table.lookup(
+                ("cryomodule", "cavity"), "prefix", subsystem=subsystem
+            )
+            for subsystem in CAVITY_SUBSYSTEMS
+        }
         self._setup_system_pvs()
         self._setup_decarad_pvs()
         self._setup_linac_pvs()
@@ -264,7 +289,7 @@ class SCLinacPhysicsService(Service):
         self._setup_rack_launchers(cm_prefix, cm_name, rack_launchers)
 
         # Set up RFS groups
-        self._setup_rfs_groups(cm_prefix)
+        self._setup_rfs_groups(cm_name)
 
         # Create and return CM-level launcher groups
         return self._create_cm_launcher_groups(
@@ -351,15 +376,12 @@ class SCLinacPhysicsService(Service):
                 )
                 self.add_pvs(launcher)
 
-    def _setup_rfs_groups(self, cm_prefix):
+    def _setup_rfs_groups(self, cm_name):
         """Set up RF Station groups for the cryomodule."""
-        for rfs_infix in ["A:", "B:"]:
-            for rfs_num in [1, 2]:
-                self.add_pvs(
-                    RFStationPVGroup(
-                        prefix=f"{cm_prefix}00:RFS{rfs_num}{rfs_infix}"
-                    )
-                )
+        for rfs_prefix in self.pv_table.unique(
+            "prefix", subsystem="rfs", cryomodule=cm_name
+        ):
+            self.add_pvs(RFStationPVGroup(prefix=rfs_prefix))
 
     def _create_cm_launcher_groups(self, cm_prefix, cm_name, cavity_launchers):
         """Create and add CM-level launcher groups.
@@ -385,7 +407,8 @@ class SCLinacPhysicsService(Service):
         Returns:
             LauncherGroups: Container with all launcher types
         """
-        cav_prefix = f"{cm_prefix}{cav_num}0:"
+        cav_key = (cm_name, cav_num)
+        cav_prefix = self.cavity_prefixes["cavity"][cav_key]
 
         # Cavity group
         cavity_group = CavityPVGroup(prefix=cav_prefix, isHL=is_hl)
@@ -393,12 +416,13 @@ class SCLinacPhysicsService(Service):
 
         # Tuner groups
         piezo_group = PiezoPVGroup(
-            prefix=f"{cav_prefix}PZT:", cavity_group=cavity_group
+            prefix=self.cavity_prefixes["piezo"][cav_key],
+            cavity_group=cavity_group,
         )
         self.add_pvs(piezo_group)
         self.add_pvs(
             StepperPVGroup(
-                prefix=f"{cav_prefix}STEP:",
+                prefix=self.cavity_prefixes["stepper"][cav_key],
                 cavity_group=cavity_group,
                 piezo_group=piezo_group,
             )
@@ -406,7 +430,10 @@ class SCLinacPhysicsService(Service):
 
         # Other cavity-related groups
         self.add_pvs(
-            SSAPVGroup(prefix=f"{cav_prefix}SSA:", cavityGroup=cavity_group)
+            SSAPVGroup(
+                prefix=self.cavity_prefixes["ssa"][cav_key],
+                cavityGroup=cavity_group,
+            )
         )
         self.add_pvs(CavFaultPVGroup(prefix=cav_prefix))
         self.add_pvs(JTPVGroup(prefix=f"CLIC:CM{cm_name}:3001:PVJT:"))
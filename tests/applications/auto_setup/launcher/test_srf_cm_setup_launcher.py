@@ -11,8 +11,10 @@ from sc_linac_physics.applications.auto_setup.backend.setup_cryomodule import (
     SetupCryomodule,
 )
 from sc_linac_physics.applications.auto_setup.launcher.srf_cm_setup_launcher import (
+    run_in_process,
     setup_cavity,
 )
+from sc_linac_physics.utils.sc_linac.procedure_executor import DONE
 from sc_linac_physics.utils.sc_linac.linac_utils import (
     ALL_CRYOMODULES,
     STATUS_READY_VALUE,
@@ -90,3 +92,37 @@ def test_setup_cavity(cavity, mock_logger):
 
     cavity._rf_ramp_requested_pv_obj.put.assert_called()
     cryomodule._rf_ramp_requested_pv_obj.get.assert_called()
+
+
+@pytest.mark.parametrize(
+    "shutdown, procedure", [(False, "setup"), (True, "shut_down")]
+)
+def test_run_in_process(mock_logger, shutdown, procedure):
+    cm = MagicMock()
+    cm.name = "01"
+    cm.is_harmonic_linearizer = False
+    cm.cavities = {}
+    for number in range(1, 9):
+        cavity = MagicMock()
+        cavity.number = number
+        cavity.cryomodule = cm
+        cavity.rack.rack_name = "A" if number <= 4 else "B"
+        cm.cavities[number] = cavity
+    args = MagicMock()
+    args.shutdown = shutdown
+
+    with patch.object(SetupCavity, procedure) as cavity_procedure:
+        results = run_in_process(cm, args, mock_logger)
+
+    assert [result.state for result in results] == [DONE] * 8
+    assert {call.args[0] for call in cavity_procedure.call_args_list} == set(
+        cm.cavities.values()
+    )
+    publishers = {
+        id(cavity.status_publisher) for cavity in cm.cavities.values()
+    }
+    assert len(publishers) == 1
+    # Only a setup takes the cryomodule's request flags
+    for cavity in cm.cavities.values():
+        copied = cavity.ssa_cal_requested is cm.ssa_cal_requested
+        assert copied is not shutdown
@@ -5,6 +5,8 @@ from unittest.mock import Mock, patch
 import numpy as np
 import pytest
 
+from sc_linac_physics.utils.epics import make_mock_pv
+
 
 @pytest.fixture
 def mock_linac_object():
@@ -1210,6 +1212,12 @@ class TestQ0CryomoduleJTPositionCoverage:
                     "sc_linac_physics.applications.q0.q0_cryomodule.caget",
                     side_effect=ultra_safe_caget,
                 ),
+                patch(
+                    "sc_linac_physics.applications.q0.q0_cryomodule.PV",
+                    side_effect=lambda pv: make_mock_pv(
+                        pv, get_val=ultra_safe_caget(pv)
+                    ),
+                ) as mock_pv,
                 patch(
                     "sc_linac_physics.applications.q0.q0_cryomodule.caput"
                 ) as mock_caput,
@@ -1218,6 +1226,8 @@ class TestQ0CryomoduleJTPositionCoverage:
             ):
                 Q0Cryomodule.jt_position.fset(fast_q0_cryo, target_position)
                 assert mock_caput.call_count > 0
+                mock_pv.assert_any_call(fast_q0_cryo.jt_mode_pv)
+                mock_pv.assert_any_call(fast_q0_cryo.jt_valve_readback_pv)
         finally:
             # Clean up the alarm
             signal.alarm(0)
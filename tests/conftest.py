@@ -158,6 +158,12 @@ def pytest_configure(config):
     os.environ.setdefault("QT_API", "pyqt5")
     os.environ.setdefault("PYDM_DISABLE_TELEMETRY", "1")
 
+    # Keep everything under cache_dir() (the PV name and fault tables and
+    # the sqlite CavityCache) out of the home directory
+    os.environ.setdefault(
+        "SC_LINAC_CACHE_DIR", str(_TEMP_PHYSICS_DIR / "sc_linac_cache")
+    )
+
     # Inject fake EPICS module
     _setup_fake_epics()
 
@@ -242,6 +248,19 @@ class FakeEPICS_PV:
     ):
         return self._get_value
 
+    def get_with_metadata(
+        self, form=None, use_monitor=True, timeout=None, **kwargs
+    ):
+        value = self.get(timeout=timeout, use_monitor=use_monitor)
+        if value is None:
+            return None
+        return {
+            "value": value,
+            "severity": self.severity,
+            "status": 0,
+            "timestamp": 0.0,
+        }
+
     def put(
         self,
         value,
@@ -284,7 +303,7 @@ class FakeEPICS_PV:
         self.callbacks.clear()
         self.connection_callbacks.clear()
 
-    def disconnect(self):
+    def disconnect(self, deepclean=True):
         """Disconnect the PV."""
         self._connected = False
         self.clear_callbacks()
@@ -421,6 +440,19 @@ def clear_logger_cache():
     sc_linac_physics.utils.logger._created_loggers.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_pv_registry():
+    """Drop shared PV instances and breaker state between tests."""
+    yield
+
+    from sc_linac_physics.utils.epics import PV
+
+    if PV.registry is not None:
+        PV.registry.clear()
+    if PV.breakers is not None:
+        PV.breakers.reset()
+
+
 # ============================================================================
 # Qt/GUI Fixtures
 # ============================================================================
@@ -15,6 +15,9 @@ from sc_linac_physics.displays.cavity_display.backend.fault import (
     FaultCounter,
     Fault,
 )
+from sc_linac_physics.displays.cavity_display.utils.fault_table import (
+    FaultTable,
+)
 from tests.displays.cavity_display.test_utils.utils import mock_parse
 
 
@@ -26,8 +29,8 @@ def cavity():
 
     rack.cryomodule.linac.machine.lazy_fault_pvs = True
     with patch(
-        "sc_linac_physics.displays.cavity_display.utils.utils.parse_csv",
-        mock_parse,
+        "sc_linac_physics.displays.cavity_display.utils.utils.fault_table",
+        lambda: FaultTable.from_records(mock_parse()),
     ):
         cavity = BackendCavity(cavity_num=cav_num, rack_object=rack)
         cavity._status_pv_obj = make_mock_pv()
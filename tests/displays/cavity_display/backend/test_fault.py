@@ -7,6 +7,7 @@ from lcls_tools.common.data.archiver import ArchiverValue, ArchiveDataHandler
 
 from sc_linac_physics.displays.cavity_display.backend.fault import (
     Fault,
+    FaultCondition,
     FaultCounter,
 )
 from sc_linac_physics.utils.epics import (
@@ -39,7 +40,9 @@ class TestFault(TestCase):
         self.fault.is_faulted = MagicMock()
         self.fault._pv_obj = make_mock_pv()
         self.fault.is_currently_faulted()
-        self.fault.is_faulted.assert_called_with(self.fault._pv_obj)
+        self.fault._pv_obj.snapshot.assert_called_once()
+        snapshot = self.fault.is_faulted.call_args.args[0]
+        self.assertEqual(snapshot.pvname, self.fault._pv_obj.pvname)
 
     def test_is_faulted_invalid(self):
         pv = make_mock_pv(severity=EPICS_INVALID_VAL)
@@ -95,6 +98,40 @@ class TestFault(TestCase):
         )
 
 
+class TestFaultCondition(TestCase):
+    def setUp(self):
+        self.condition = FaultCondition()
+        self.pv_obj = make_mock_pv()
+        self.faults = [
+            Fault(severity=2, pv="PV", fault_value=1, pv_obj=self.pv_obj)
+            for _ in range(3)
+        ]
+        for fault in self.faults:
+            fault.condition = self.condition
+            fault.is_faulted = MagicMock(return_value=True)
+
+    def test_checked_once_per_update(self):
+        # A monitored PV serves the same snapshot until it updates
+        self.pv_obj.snapshot.side_effect = None
+        self.pv_obj.snapshot.return_value = MagicMock()
+        for fault in self.faults:
+            self.assertTrue(fault.is_currently_faulted())
+        self.faults[0].is_faulted.assert_called_once()
+        self.faults[1].is_faulted.assert_not_called()
+
+        # A new monitor update
+        self.pv_obj.snapshot.return_value = MagicMock()
+        self.faults[2].is_currently_faulted()
+        self.faults[2].is_faulted.assert_called_once()
+
+    def test_invalid(self):
+        self.pv_obj.snapshot.side_effect = None
+        self.faults[0].is_faulted.side_effect = PVInvalidError("PV")
+        for fault in self.faults:
+            self.assertRaises(PVInvalidError, fault.is_currently_faulted)
+        self.faults[0].is_faulted.assert_called_once()
+
+
 class TestFaultCounter(TestCase):
     def setUp(self):
         max_rand_count = 1
@@ -0,0 +1,69 @@
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
+    BackendCavity,
+)
+from sc_linac_physics.displays.cavity_display.backend.backend_machine import (
+    BackendMachine,
+)
+from sc_linac_physics.displays.cavity_display.backend.fault import Fault
+from sc_linac_physics.displays.cavity_display.backend.fault_index import (
+    FaultIndex,
+)
+from sc_linac_physics.utils.epics import make_mock_pv
+
+
+@pytest.fixture(scope="module")
+def machine() -> BackendMachine:
+    return BackendMachine(lazy_fault_pvs=True)
+
+
+@pytest.fixture(scope="module")
+def cavities(machine) -> List[BackendCavity]:
+    return list(machine.all_iterator)
+
+
+def test_deduplicates(machine, cavities):
+    index = machine.fault_index
+    assert index.num_faults == sum(len(cavity.faults) for cavity in cavities)
+    # Rack, cryomodule and machine wide faults share PVs
+    assert index.num_pvs <= index.num_conditions < index.num_faults
+
+
+def test_shared_by_cavities(machine, cavities):
+    # BSOIC chain A is checked by every cavity
+    users = machine.fault_index.cavities("BSOC:SYSW:2:SumyA")
+    assert len(users) == len(cavities)
+    assert set(users) == set(cavities)
+
+    faults = [
+        fault
+        for cavity in cavities
+        for fault in cavity.faults.values()
+        if fault.pv == "BSOC:SYSW:2:SumyA"
+    ]
+    assert len({id(fault.condition) for fault in faults}) == 1
+
+
+def test_watch():
+    index = FaultIndex()
+    pv_obj = make_mock_pv()
+    cavities = [MagicMock(), MagicMock()]
+    for cavity in cavities:
+        for fault_value in (1, 2):
+            index.add(
+                cavity,
+                Fault(
+                    severity=2, pv="PV", fault_value=fault_value, pv_obj=pv_obj
+                ),
+            )
+    assert (index.num_faults, index.num_pvs, index.num_conditions) == (4, 1, 2)
+
+    changed = []
+    index.watch(changed.append)
+    pv_obj.add_callback.assert_called_once()
+    pv_obj.add_callback.call_args.args[0](value=0)
+    assert changed == cavities
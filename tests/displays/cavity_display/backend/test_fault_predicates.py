@@ -0,0 +1,223 @@
+from random import Random
+from typing import List
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
+    BackendCavity,
+)
+from sc_linac_physics.displays.cavity_display.backend.backend_machine import (
+    BackendMachine,
+)
+from sc_linac_physics.displays.cavity_display.backend.fault import Fault
+from sc_linac_physics.displays.cavity_display.backend.fault_predicates import (
+    FaultPredicates,
+    snapshot_record,
+    snapshot_value,
+)
+from sc_linac_physics.displays.cavity_display.backend.runner import FaultShard
+from sc_linac_physics.utils.epics import (
+    PVConnectionError,
+    PVSnapshot,
+    SNAPSHOT_DTYPE,
+    make_mock_pv,
+)
+
+
+@pytest.fixture(scope="module")
+def cavities() -> List[BackendCavity]:
+    # A 1.3 GHz and a harmonic linearizer cryomodule
+    cavities = [
+        cavity
+        for cavity in BackendMachine(lazy_fault_pvs=True).all_iterator
+        if cavity.cryomodule.name in ("02", "H1")
+    ]
+    # One mock per PV, shared by its faults like the real PV objects
+    pv_objs = {}
+    for cavity in cavities:
+        for fault in cavity.faults.values():
+            if fault.pv not in pv_objs:
+                pv_obj = make_mock_pv()
+                pv_obj.snapshot.side_effect = None
+                pv_objs[fault.pv] = pv_obj
+            fault._pv_obj = pv_objs[fault.pv]
+    return cavities
+
+
+@pytest.fixture(scope="module")
+def predicates(cavities) -> FaultPredicates:
+    return FaultPredicates(cavities)
+
+
+def random_snapshot(random: Random, pv: str) -> PVSnapshot:
+    return PVSnapshot(
+        pv,
+        random.choice([0, 1, 1, 1, 2, 2, 3, 4, 5, 8, 0.5, "OK", None, True]),
+        random.choice([0, 0, 0, 1, 2, 3, None]),
+        random.choice([0, 0, 0, 1, None]),
+        None,
+    )
+
+
+def set_snapshots(predicates: FaultPredicates, snapshots: List[PVSnapshot]):
+    for pv_fault, snapshot in zip(predicates._pv_faults, snapshots):
+        pv_fault.pv_obj.snapshot.return_value = snapshot
+
+
+def serial_results(cavities: List[BackendCavity]):
+    """The fault, severity and invalid flag run_through_faults publishes"""
+    results = []
+    for cavity in cavities:
+        cavity.publish_fault = MagicMock()
+        cavity.run_through_faults()
+        fault, invalid = cavity.publish_fault.call_args.args
+        del cavity.publish_fault
+        severity = 0 if fault is None else 3 if invalid else fault.severity
+        results.append((fault, severity, invalid))
+    return results
+
+
+def vectorized_results(predicates: FaultPredicates, cavities=None):
+    states = predicates.check(cavities)
+    return [
+        (
+            predicates.faults[row] if row >= 0 else None,
+            int(severity),
+            bool(invalid),
+        )
+        for row, severity, invalid in zip(*states[:3])
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_run_through_faults(cavities, predicates, seed):
+    random = Random(seed)
+    set_snapshots(
+        predicates, [random_snapshot(random, pv) for pv in predicates.pvs]
+    )
+    assert vectorized_results(predicates) == serial_results(cavities)
+
+
+def test_all_ok(cavities, predicates):
+    snapshots = []
+    for pv_fault in predicates._pv_faults:
+        # A value no fault condition in the spreadsheet is faulted at
+        value = pv_fault.ok_value if pv_fault.ok_value is not None else -1
+        snapshots.append(PVSnapshot(pv_fault.pv, value, 0, 0, None))
+    set_snapshots(predicates, snapshots)
+
+    states = predicates.check()
+    assert (states.rows == -1).all()
+    assert (states.severity == 0).all()
+    assert serial_results(cavities[:8]) == [(None, 0, False)] * 8
+
+
+def test_evaluate_cavities(cavities, predicates):
+    random = Random(7)
+    set_snapshots(
+        predicates, [random_snapshot(random, pv) for pv in predicates.pvs]
+    )
+    subset = cavities[14:2:-3]
+    assert vectorized_results(predicates, subset) == serial_results(subset)
+
+
+def test_evaluate_records(predicates):
+    records = np.zeros(len(predicates.pvs), dtype=SNAPSHOT_DTYPE)
+    records["value"] = np.nan
+    # Every cavity stops at its first fault: invalid
+    records["status"] = -1
+    states = predicates.evaluate(records)
+    assert (states.rows == predicates.starts[:-1]).all()
+    assert states.invalid.all()
+
+    with pytest.raises(ValueError):
+        predicates.evaluate(records[:-1])
+
+
+def test_snapshot_converted_once(predicates):
+    random = Random(11)
+    set_snapshots(
+        predicates, [random_snapshot(random, pv) for pv in predicates.pvs]
+    )
+    records, _ = predicates.snapshot()
+    pv_obj = predicates._pv_faults[0].pv_obj
+    pv_obj.snapshot.return_value = PVSnapshot(predicates.pvs[0], 7, 0, 0, 5)
+
+    updated, _ = predicates.snapshot()
+    assert updated[0]["value"] == 7
+    assert updated[1:].tobytes() == records[1:].tobytes()
+    # The records returned earlier are not changed by later snapshots
+    assert records[0]["timestamp"] != 5
+
+
+def test_unread_pv():
+    # An unreadable PV only raises for cavities that reach it
+    pv_obj = make_mock_pv()
+    pv_obj.snapshot.side_effect = PVConnectionError("not connected")
+    faulted_pv_obj = make_mock_pv()
+    faulted_pv_obj.snapshot.side_effect = None
+    faulted_pv_obj.snapshot.return_value = PVSnapshot("PV2", 1, 2, 0, None)
+    reached, skipped = MagicMock(), MagicMock()
+    for cavity in (reached, skipped):
+        cavity.faults = {
+            1: Fault(severity="2", pv="PV", fault_value="1", pv_obj=pv_obj),
+            2: Fault(
+                severity="2", pv="PV2", ok_value="0", pv_obj=faulted_pv_obj
+            ),
+        }
+    skipped.faults = dict(reversed(list(skipped.faults.items())))
+    predicates = FaultPredicates([reached, skipped])
+
+    states = predicates.check()
+    assert list(states.errors) == [0]
+    assert states.errors[0] is pv_obj.snapshot.side_effect
+    assert predicates.faults[states.rows[1]] is skipped.faults[2]
+
+    shard = FaultShard("test", [reached, skipped], vectorized=True)
+    with pytest.raises(PVConnectionError):
+        shard.check_faults()
+    reached.publish_fault.assert_not_called()
+    assert BackendCavity.run_through_faults(skipped) is None
+    with pytest.raises(PVConnectionError):
+        BackendCavity.run_through_faults(reached)
+
+
+def test_no_condition():
+    cavity = MagicMock()
+    cavity.faults = {1: Fault(severity=2, pv="PV", pv_obj=make_mock_pv())}
+    states = FaultPredicates([cavity]).check()
+    assert "neither" in str(states.errors[0])
+
+
+def test_snapshot_value():
+    assert snapshot_value(2) == 2.0
+    assert snapshot_value(np.int16(2)) == 2.0
+    assert snapshot_value(True) == 1.0
+    assert snapshot_value(np.array([4.0])) == 4.0
+    for value in ("2", None, np.arange(3)):
+        assert np.isnan(snapshot_value(value))
+
+    record = np.array(
+        snapshot_record(PVSnapshot("PV", "1", None, None, None)),
+        dtype=SNAPSHOT_DTYPE,
+    )
+    assert (int(record["severity"]), int(record["status"])) == (-1, -1)
+
+
+def test_shard_publishes(cavities):
+    cavity = cavities[10]
+    shard = FaultShard("test", [cavity], vectorized=True)
+    shard._heartbeat_pv_obj = make_mock_pv()
+    random = Random(3)
+    set_snapshots(
+        shard.predicates,
+        [random_snapshot(random, pv) for pv in shard.predicates.pvs],
+    )
+    ((fault, severity, invalid),) = serial_results([cavity])
+
+    cavity.publish_fault = MagicMock()
+    shard.check_faults()
+    cavity.publish_fault.assert_called_once_with(fault, invalid)
+    del cavity.publish_fault
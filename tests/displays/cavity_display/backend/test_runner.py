@@ -1,27 +1,187 @@
+import threading
+import time
 from random import randint
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from lcls_tools.common.controls.pyepics.utils import make_mock_pv
 
-from sc_linac_physics.displays.cavity_display.backend.runner import Runner
+from sc_linac_physics.displays.cavity_display.backend.runner import (
+    Runner,
+    main,
+)
+from sc_linac_physics.utils.epics import PVConnectionError, PVPutError
 
 
 @pytest.fixture
 def runner() -> Runner:
     runner = Runner(lazy_fault_pvs=True)
     runner._watcher_pv_obj = make_mock_pv(get_val=randint(0, 1000000))
+    fault_pv = make_mock_pv()
     for cavity in runner.backend_cavities:
         cavity.run_through_faults = MagicMock()
+        for fault in cavity.faults.values():
+            fault._pv_obj = fault_pv
+    for shard in runner.shards:
+        shard._heartbeat_pv_obj = make_mock_pv()
     return runner
 
 
+def set_fault_pv(cavity, pv_obj):
+    """Give the faults on the cavity's first fault PV their own PV object"""
+    pv = next(iter(cavity.faults.values())).pv
+    for fault in cavity.faults.values():
+        if fault.pv == pv:
+            fault._pv_obj = pv_obj
+
+
 def test_check_faults(runner):
     runner.check_faults()
     for cavity in runner.backend_cavities:
         cavity.run_through_faults.assert_called()
     runner._watcher_pv_obj.put.assert_called()
+    for shard in runner.shards:
+        shard._heartbeat_pv_obj.put.assert_called_with(1)
+        assert runner.cycle_times[shard.name] >= 0
 
 
 def test_watcher_pv_obj(runner):
     assert runner.watcher_pv_obj == runner._watcher_pv_obj
+
+
+def test_beat_put_error(runner):
+    runner._watcher_pv_obj.put.side_effect = PVConnectionError("breaker open")
+    runner.beat()
+    runner._watcher_pv_obj.put.side_effect = PVPutError("put failed")
+    runner.beat()
+
+
+def test_heartbeat_pv_obj(runner):
+    shard = runner.shards[0]
+    shard._heartbeat_pv_obj = None
+    with patch(
+        "sc_linac_physics.displays.cavity_display.backend.runner.PV"
+    ) as pv_class:
+        assert shard.heartbeat_pv_obj is shard.heartbeat_pv_obj
+    pv_class.assert_called_once_with(
+        "PHYS:SYS0:1:SC_CAV_FAULT_HEARTBEAT_L0B", require_connection=False
+    )
+
+
+def test_shard_beat_unconnected(runner):
+    shard = runner.shards[0]
+    shard._heartbeat_pv_obj.connected = False
+    shard.check_faults()
+    shard._heartbeat_pv_obj.put.assert_not_called()
+
+    shard._heartbeat_pv_obj.connected = True
+    shard._heartbeat_pv_obj.put.side_effect = PVPutError("put failed")
+    shard.check_faults()
+    shard._heartbeat_pv_obj.put.assert_called_once_with(2)
+
+
+def test_shards(runner):
+    assert [shard.name for shard in runner.shards] == [
+        "L0B",
+        "L1B",
+        "L2B",
+        "L3B",
+    ]
+    assert sum(len(shard.cavities) for shard in runner.shards) == len(
+        runner.backend_cavities
+    )
+    for shard in runner.shards:
+        assert all(cavity.linac.name == shard.name for cavity in shard.cavities)
+
+
+def test_shard_by_cryomodule():
+    runner = Runner(lazy_fault_pvs=True, shard_by="cryomodule")
+    assert len(runner.shards) == len(runner.backend_cavities) // 8
+    assert runner.shards[0].heartbeat_pv.endswith("_01")
+
+
+def test_run(runner, monkeypatch):
+    monkeypatch.setattr(
+        "sc_linac_physics.displays.cavity_display.backend.runner"
+        ".SHARD_IDLE_TIMEOUT",
+        0.05,
+    )
+    beats = threading.Semaphore(0)
+    runner._watcher_pv_obj.put.side_effect = lambda value: beats.release()
+    thread = threading.Thread(target=runner.run, daemon=True)
+    thread.start()
+
+    # The reset to 0, then two aggregate beats
+    for _ in range(3):
+        assert beats.acquire(timeout=5)
+    runner.stop()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert runner._watcher_pv_obj.put.call_args_list[0].args == (0,)
+    for shard in runner.shards:
+        assert shard.cycles >= 2
+
+
+def test_run_shard_error(runner):
+    runner.shards[2].cavities[0].run_through_faults.side_effect = KeyError(
+        "bad fault"
+    )
+    with pytest.raises(KeyError):
+        runner.run()
+
+
+def test_watch(runner):
+    shard = runner.shards[1]
+    cavity = shard.cavities[3]
+    fault_pv = make_mock_pv()
+    set_fault_pv(cavity, fault_pv)
+    runner.watch()
+
+    assert shard.take_dirty(timeout=0) == []
+    fault_pv.add_callback.call_args.args[0](value=1)
+    assert shard.take_dirty(timeout=0) == [cavity]
+    assert shard.take_dirty(timeout=0) == []
+    for other in runner.shards:
+        if other is not shard:
+            assert other.take_dirty(timeout=0) == []
+
+
+def test_run_checks_changed_cavities(runner):
+    shard = runner.shards[0]
+    cavity = shard.cavities[5]
+    fault_pv = make_mock_pv()
+    set_fault_pv(cavity, fault_pv)
+    checked = threading.Event()
+
+    thread = threading.Thread(target=runner.run, daemon=True)
+    thread.start()
+    # Initial full check
+    deadline = time.monotonic() + 5
+    while shard.cycles < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for other in shard.cavities:
+        other.run_through_faults.reset_mock()
+    cavity.run_through_faults.side_effect = checked.set
+
+    fault_pv.add_callback.call_args.args[0](value=1)
+    assert checked.wait(timeout=0.5)
+    runner.stop()
+    thread.join(timeout=5)
+
+    for other in shard.cavities:
+        if other is not cavity:
+            other.run_through_faults.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "argv, vectorized", [([], True), (["--serial"], False)]
+)
+def test_main(argv, vectorized):
+    with patch(
+        "sc_linac_physics.displays.cavity_display.backend.runner.Runner"
+    ) as runner_cls:
+        main(argv)
+    runner_cls.assert_called_once_with(
+        lazy_fault_pvs=False, vectorized=vectorized
+    )
+    runner_cls.return_value.run.assert_called_once_with()
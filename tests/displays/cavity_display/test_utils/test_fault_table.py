@@ -0,0 +1,140 @@
+from csv import DictReader
+from unittest.mock import MagicMock
+
+import pytest
+
+from sc_linac_physics.displays.cavity_display.utils.fault_table import (
+    FAULTS_CSV,
+    FaultTable,
+)
+from sc_linac_physics.displays.cavity_display.utils.utils import (
+    SpreadsheetError,
+)
+from tests.displays.cavity_display.test_utils.utils import (
+    csv_keys,
+    mock_parse,
+)
+
+
+@pytest.fixture
+def table():
+    yield FaultTable.from_records(mock_parse())
+
+
+@pytest.fixture
+def cavity():
+    cavity = MagicMock()
+    cavity.linac.name = "L1B"
+    cavity.cryomodule.name = "02"
+    cavity.cryomodule.is_harmonic_linearizer = False
+    cavity.rack.rack_name = "A"
+    cavity.number = 3
+    cavity.pv_prefix = "ACCL:L1B:0230:"
+    cavity.ssa.pv_addr = lambda suffix: f"ACCL:L1B:0230:SSA:{suffix}"
+    yield cavity
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SC_LINAC_CACHE_DIR", str(tmp_path / "cache"))
+    yield tmp_path / "cache"
+
+
+def test_records_match_spreadsheet():
+    with open(FAULTS_CSV, encoding="utf-8-sig") as f:
+        rows = [
+            {key: row[key] for key in csv_keys}
+            for row in DictReader(f)
+            if row["PV Suffix"]
+        ]
+    assert FaultTable.from_csv().records() == rows
+
+
+def test_immutable(table):
+    with pytest.raises(ValueError):
+        table.columns["suffix"][0] = "HWMODE"
+
+
+def test_for_cavity(table, cavity):
+    pvs = {template.tlc: pv for template, key, pv in table.for_cavity(cavity)}
+    assert pvs == {
+        "   ": "ACCL:L1B:0230:HWMODE",
+        "BLV": "ACCL:L1B:0200:BMLNVACA_LTCH",
+        "BSO": "BSOC:SYSW:2:SumyA",
+        "SSA": "ACCL:L1B:0230:SSA:FaultSummary.SEVR",
+        "USL": "CLL:CM02:2601:US:LVL.SEVR",
+        "BCS": "ACCL:L1B:0200:BCSDRVSUM",
+    }
+
+    cavity.rack.rack_name = "B"
+    assert "BLV" not in [
+        template.tlc for template, *_ in table.for_cavity(cavity)
+    ]
+
+
+def test_for_cavity_cm_type(cavity):
+    records = mock_parse()
+    for record in records:
+        if record["Level"] == "CM":
+            record["CM Type"] = "1.3"
+    table = FaultTable.from_records(records)
+
+    assert "BCS" in [template.tlc for template, *_ in table.for_cavity(cavity)]
+    cavity.cryomodule.is_harmonic_linearizer = True
+    assert "BCS" not in [
+        template.tlc for template, *_ in table.for_cavity(cavity)
+    ]
+
+
+def test_rejects_unknown_level():
+    records = mock_parse()
+    records[0]["Level"] = "LINAC"
+    with pytest.raises(SpreadsheetError):
+        FaultTable.from_records(records)
+
+
+def test_rejects_missing_column():
+    records = mock_parse()
+    del records[0]["Severity"]
+    with pytest.raises(SpreadsheetError):
+        FaultTable.from_records(records)
+
+
+@pytest.mark.parametrize(
+    "prefix", ["CLL:{LINAC}:2601:", "CLL:CM{CRYOMODULE:>3}:", "CLL:{{CM}}:"]
+)
+def test_rejects_prefix_fields(prefix):
+    records = mock_parse()
+    for record in records:
+        if record["Level"] == "CRYO":
+            record["PV Prefix"] = prefix
+    with pytest.raises(SpreadsheetError):
+        FaultTable.from_records(records)
+
+
+def test_save_load(table, tmp_path):
+    path = tmp_path / "table.npy"
+    table.save(path)
+    loaded = FaultTable.load(path)
+    assert loaded.templates == table.templates
+    assert loaded.keys == table.keys
+
+
+def test_for_csv_caches(cache_dir, tmp_path, monkeypatch):
+    path = tmp_path / "faults.csv"
+    path.write_bytes(FAULTS_CSV.read_bytes())
+    table = FaultTable.for_csv(path)
+    (cached,) = cache_dir.glob("fault_table_*.npy")
+
+    def from_csv(path):
+        raise AssertionError("compiled again")
+
+    monkeypatch.setattr(FaultTable, "from_csv", from_csv)
+    assert FaultTable.for_csv(path).templates == table.templates
+
+    monkeypatch.undo()
+    monkeypatch.setenv("SC_LINAC_CACHE_DIR", str(cache_dir))
+    with open(path, "a") as f:
+        f.write("\n")
+    FaultTable.for_csv(path)
+    assert len(list(cache_dir.glob("fault_table_*.npy"))) == 2
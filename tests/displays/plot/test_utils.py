@@ -14,6 +14,9 @@ from sc_linac_physics.displays.plot.utils import (
     get_pvs_all_groupings,
     _is_pv_attribute,
 )
+from sc_linac_physics.utils.sc_linac.linac import Machine
+from sc_linac_physics.utils.sc_linac.pv_descriptors import pv_name
+from sc_linac_physics.utils.sc_linac.pv_table import PVNameTable
 
 
 class TestPVGroup:
@@ -349,6 +352,64 @@ class TestGetPVsAllGroupings:
             ("Machine", "global_heater_feedback_pv")
         ] == ["CHTR:CM00:0:HTR_POWER_TOT"]
 
+    def test_extracts_declared_pv_names(self):
+        """Test PV names declared on the class with pv_name."""
+
+        class Machine:
+            heater_pv = pv_name("HTR_POWER_TOT")
+            linacs = []
+
+            def pv_addr(self, suffix):
+                return "CHTR:CM00:0:" + suffix
+
+        result = get_pvs_all_groupings(Machine())
+
+        assert result.machine.pvs.pvs[("Machine", "heater_pv")] == [
+            "CHTR:CM00:0:HTR_POWER_TOT"
+        ]
+
+    def test_extracts_slotted_pvs(self):
+        """Test PV names stored in __slots__ rather than the instance dict."""
+
+        class Machine:
+            __slots__ = ("heater_pv", "unset_pv", "linacs")
+
+            def __init__(self):
+                self.heater_pv = "CHTR:CM00:0:HTR_POWER_TOT"
+                self.linacs = []
+
+        result = get_pvs_all_groupings(Machine())
+
+        assert result.machine.pvs.pvs == {
+            ("Machine", "heater_pv"): ["CHTR:CM00:0:HTR_POWER_TOT"]
+        }
+
+    def test_extracts_from_pv_table(self):
+        """Test objects with a pv_table are grouped from the table."""
+        machine = Mock(spec=["pv_table"])
+        machine.pv_table = PVNameTable.from_rows(
+            [
+                ("", "", "", "machine", "Machine", "heater_pv", "HTR", "", 0)
+                + ("CHTR:CM00:0:HTR",),
+                ("L0B", "01", "", "quad", "Magnet", "bdes_pv", "BDES")
+                + ("QUAD:L0B:0185:", 0, "QUAD:L0B:0185:BDES"),
+                ("L0B", "01", "A", "cavity", "Cavity", "ades_pv", "ADES")
+                + ("ACCL:L0B:0110:", 1, "ACCL:L0B:0110:ADES"),
+            ]
+        )
+
+        result = get_pvs_all_groupings(machine)
+
+        assert result.machine.pvs["heater_pv"] == ["CHTR:CM00:0:HTR"]
+        assert result.get_linac("L0B").pvs["bdes_pv"] == ["QUAD:L0B:0185:BDES"]
+        assert result.get_cryomodule("01").linac_name == "L0B"
+        assert result.get_rack("01", "A").pvs.pvs == {
+            ("Cavity", "ades_pv"): ["ACCL:L0B:0110:ADES"]
+        }
+        cavity = result.get_cavity("01", 1)
+        assert cavity.rack_name == "A"
+        assert cavity.pvs.pvs == {("Cavity", "ades_pv"): ["ACCL:L0B:0110:ADES"]}
+
     def test_extract_linac_level_pvs(self):
         """Test extracting linac-level PVs."""
         linac = Mock(spec=["name", "beamline_vacuum_pvs", "cryomodules"])
@@ -588,6 +649,16 @@ class TestGetPVsAllGroupings:
         assert ("Cryomodule", "ds_level_pv") in result.cryomodules["02"].pvs.pvs
         assert ("Cavity", "ades_pv") in result.cryomodules["02"].pvs.pvs
 
+    def test_walks_lazy_machine(self):
+        """Test a lazy machine's LazyDict children are walked like dicts."""
+        eager = get_pvs_all_groupings(Machine().linacs[1])
+        lazy = get_pvs_all_groupings(Machine(lazy=True).linacs[1])
+
+        assert lazy.cryomodules.keys() == eager.cryomodules.keys()
+        assert lazy.cavities.keys() == eager.cavities.keys()
+        assert lazy.linacs["L1B"].pvs.pvs == eager.linacs["L1B"].pvs.pvs
+        assert ("Cavity", "ades_pv") in lazy.cryomodules["02"].pvs.pvs
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,144 @@
+import asyncio
+import sys
+
+import pytest
+
+from sc_linac_physics.utils.epics import (
+    AsyncPV,
+    PV,
+    PVConfig,
+    PVGetError,
+    PVPutError,
+)
+
+FakeEPICS_PV = sys.modules["epics"].PV
+
+FAST_CONFIG = PVConfig(max_retries=2, retry_delay=0.01, put_timeout=0.1)
+
+
+@pytest.fixture
+def apv():
+    pv = AsyncPV("TEST:ASYNC")
+    yield pv
+    pv.close()
+
+
+class TestAsyncPVGet:
+    @pytest.mark.asyncio
+    async def test_get_served_from_monitor(self, apv):
+        original_get = FakeEPICS_PV.get
+        FakeEPICS_PV.get = lambda self, *args, **kwargs: pytest.fail(
+            "network get issued for a monitored value"
+        )
+        try:
+            assert await apv.get() == 42.0
+        finally:
+            FakeEPICS_PV.get = original_get
+
+    @pytest.mark.asyncio
+    async def test_get_retries_then_raises(self):
+        apv = AsyncPV(
+            "TEST:ASYNC:NOMON", auto_monitor=False, config=FAST_CONFIG
+        )
+
+        calls = []
+        original_get = FakeEPICS_PV.get
+
+        def failing_get(self, *args, **kwargs):
+            calls.append(kwargs.get("timeout"))
+            return None
+
+        FakeEPICS_PV.get = failing_get
+        try:
+            with pytest.raises(PVGetError) as exc_info:
+                await apv.get(timeout=0.5)
+        finally:
+            FakeEPICS_PV.get = original_get
+
+        assert calls == [0.5, 0.5]
+        assert "after 2 attempts" in str(exc_info.value)
+
+
+class TestAsyncPVPut:
+    @pytest.mark.asyncio
+    async def test_put_awaits_completion_callback(self, apv):
+        original_put = FakeEPICS_PV.put
+        seen = {}
+
+        def put_with_completion(self, value, callback=None, **kwargs):
+            seen.update(kwargs, value=value)
+            if callback:
+                callback(pvname=self.pvname)
+            return 1
+
+        FakeEPICS_PV.put = put_with_completion
+        try:
+            await apv.put(5.0)
+        finally:
+            FakeEPICS_PV.put = original_put
+
+        assert seen["value"] == 5.0
+        assert seen["wait"] is False
+        assert seen["use_complete"] is True
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_put_raises_after_retries(self):
+        apv = AsyncPV(PV("TEST:ASYNC:PUT", config=FAST_CONFIG))
+
+        with pytest.raises(PVPutError) as exc_info:
+            await apv.put(1.0)
+
+        assert "after 2 attempts" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_put_without_wait_returns_once_issued(self, apv):
+        await apv.put(3.0, wait=False)
+        assert apv.pv._monitor_value == 3.0
+
+
+class TestAsyncPVWaitFor:
+    @pytest.mark.asyncio
+    async def test_wait_for_wakes_on_monitor_event(self, apv):
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, lambda: FakeEPICS_PV.put(apv.pv, 7.0))
+
+        value = await apv.wait_for(lambda v: v == 7.0, timeout=1.0)
+
+        assert value == 7.0
+        assert apv.pv.callbacks.keys() == {0}
+
+    @pytest.mark.asyncio
+    async def test_wait_for_returns_immediately_when_met(self, apv):
+        assert await apv.wait_for(lambda v: v > 0, timeout=0.1) == 42.0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_timeout(self, apv):
+        with pytest.raises(TimeoutError) as exc_info:
+            await apv.wait_for(lambda v: v < 0, timeout=0.05)
+
+        assert "TEST:ASYNC" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_polls_unmonitored_pv(self):
+        apv = AsyncPV("TEST:ASYNC:POLL", auto_monitor=False)
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.02, lambda: setattr(apv.pv, "_get_value", 1.0))
+
+        value = await apv.wait_for(
+            lambda v: v == 1.0, timeout=1.0, poll_interval=0.01
+        )
+
+        assert value == 1.0
+
+    @pytest.mark.asyncio
+    async def test_many_waits_share_one_loop(self):
+        pvs = [AsyncPV(f"TEST:ASYNC:{i}") for i in range(50)]
+        loop = asyncio.get_running_loop()
+        for apv in pvs:
+            loop.call_later(0.02, lambda p=apv: FakeEPICS_PV.put(p.pv, 0.0))
+
+        values = await asyncio.gather(
+            *(apv.wait_for(lambda v: v == 0.0, timeout=1.0) for apv in pvs)
+        )
+
+        assert values == [0.0] * 50
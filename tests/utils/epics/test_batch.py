@@ -0,0 +1,132 @@
+import sys
+
+import numpy as np
+import pytest
+
+from sc_linac_physics.utils.epics import PVBatch
+
+FakeEPICS_PV = sys.modules["epics"].PV
+
+
+@pytest.fixture
+def fake_ca(monkeypatch):
+    """Pipelined CA calls answered with the channel's chid as the value"""
+    ca = sys.modules["epics"].ca
+    calls = []
+    monkeypatch.setattr(
+        ca, "get", lambda chid, **kwargs: calls.append(("get", chid))
+    )
+    monkeypatch.setattr(ca, "flush_io", lambda: calls.append(("flush",)))
+
+    def get_complete(chid, **kwargs):
+        calls.append(("complete", chid))
+        return None if chid < 0 else float(chid)
+
+    monkeypatch.setattr(ca, "get_complete", get_complete)
+    return calls
+
+
+def make_batch(names, **kwargs) -> PVBatch:
+    batch = PVBatch(names, **kwargs)
+    for i, (_, channel) in enumerate(batch._unique):
+        channel.chid = i
+        channel.ftype = 6
+    return batch
+
+
+class TestPVBatchInstance:
+    def test_get_returns_float_array(self, fake_ca):
+        batch = make_batch(["PV:A", "PV:B", "PV:C"])
+
+        values, invalid = batch.get()
+
+        assert values.dtype == float
+        np.testing.assert_array_equal(values, [0.0, 1.0, 2.0])
+        assert not invalid.any()
+        kinds = [c[0] for c in fake_ca]
+        assert kinds == ["get"] * 3 + ["flush"] + ["complete"] * 3
+
+    def test_repeated_gets_reuse_channels(self, fake_ca, monkeypatch):
+        batch = make_batch(["PV:A", "PV:B"])
+        created = []
+        monkeypatch.setattr(
+            FakeEPICS_PV,
+            "__init__",
+            lambda self, *args, **kwargs: created.append(args),
+        )
+
+        for _ in range(3):
+            batch.get()
+
+        assert created == []
+
+    def test_disconnected_and_unanswered_are_masked(self, fake_ca):
+        batch = make_batch(["PV:A", "PV:B", "PV:C"])
+        batch._unique[1][1]._connected = False
+        batch._unique[2][1].chid = -1
+
+        values, invalid = batch.get()
+
+        np.testing.assert_array_equal(invalid, [False, True, True])
+        assert values[0] == 0.0
+        assert np.isnan(values[1:]).all()
+        np.testing.assert_array_equal(batch.connected, [True, False, True])
+        assert ("get", 1) not in fake_ca
+
+    def test_duplicates_share_one_channel(self, fake_ca):
+        batch = make_batch(["PV:A", "PV:B", "PV:A"])
+
+        values, _ = batch.get()
+
+        assert len(batch._unique) == 2
+        np.testing.assert_array_equal(values, [0.0, 1.0, 0.0])
+        assert [c for c in fake_ca if c[0] == "get"] == [
+            ("get", 0),
+            ("get", 1),
+        ]
+
+    def test_non_scalar_values_use_object_array(self, monkeypatch):
+        ca = sys.modules["epics"].ca
+        monkeypatch.setattr(ca, "get", lambda chid, **kwargs: None)
+        monkeypatch.setattr(
+            ca,
+            "get_complete",
+            lambda chid, **kwargs: "ON" if chid == 0 else None,
+        )
+        batch = make_batch(["PV:STR", "PV:DEAD"])
+
+        values, invalid = batch.get()
+
+        assert values.dtype == object
+        assert values[0] == "ON" and values[1] is None
+        np.testing.assert_array_equal(invalid, [False, True])
+
+    def test_put_waits_for_completions(self):
+        batch = make_batch(["PV:A", "PV:B"])
+        original_put = FakeEPICS_PV.put
+
+        def put_with_callback(self, value, callback=None, **kwargs):
+            if callback and self.pvname == "PV:A":
+                callback(pvname=self.pvname)
+            return 1
+
+        FakeEPICS_PV.put = put_with_callback
+        try:
+            ok = batch.put([1.0, 2.0], timeout=0.05)
+        finally:
+            FakeEPICS_PV.put = original_put
+
+        np.testing.assert_array_equal(ok, [True, False])
+
+    def test_put_length_mismatch(self):
+        batch = make_batch(["PV:A", "PV:B"])
+        with pytest.raises(ValueError):
+            batch.put([1.0])
+
+    def test_close_disconnects(self, fake_ca):
+        with make_batch(["PV:A"]) as batch:
+            channel = batch._unique[0][1]
+
+        assert not channel.connected
+        values, invalid = batch.get()
+        assert invalid.all()
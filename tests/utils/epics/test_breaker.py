@@ -0,0 +1,274 @@
+import sys
+from time import sleep
+
+import pytest
+
+from sc_linac_physics.utils.epics import (
+    PV,
+    PVCircuitBreakers,
+    PVConfig,
+    PVConnectionError,
+    PVGetError,
+    PVMetrics,
+)
+from sc_linac_physics.utils.epics.breaker import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    CircuitBreaker,
+)
+
+FakeEPICS_PV = sys.modules["epics"].PV
+
+FAST_CONFIG = PVConfig(max_retries=2, retry_delay=0.0)
+
+PREFIX = "ACCL:L0B:0110"
+
+
+@pytest.fixture
+def metrics():
+    return PVMetrics()
+
+
+@pytest.fixture
+def breakers(metrics):
+    original = PV.breakers
+    PV.breakers = PVCircuitBreakers(
+        failure_threshold=3, cooldown=0.05, metrics=metrics
+    )
+    yield PV.breakers
+    PV.breakers = original
+
+
+@pytest.fixture
+def get_calls():
+    """Make every network get time out, recording the PV names asked for"""
+    calls = []
+    original_get = FakeEPICS_PV.get
+
+    def failing_get(self, *args, **kwargs):
+        calls.append(self.pvname)
+        return None
+
+    FakeEPICS_PV.get = failing_get
+    yield calls
+    FakeEPICS_PV.get = original_get
+
+
+def make_pv(suffix: str) -> PV:
+    return PV(f"{PREFIX}:{suffix}", auto_monitor=False, config=FAST_CONFIG)
+
+
+HOST = "ioc-l0b:5064"
+
+
+def pyepics_connect(pv):
+    """Connect pv the way pyepics does: callbacks first, then connected"""
+    for callback in pv.connection_callbacks:
+        callback(pvname=pv.pvname, conn=True, pv=pv)
+        assert not pv.connected
+    pv._connected = True
+
+
+def trip(pv: PV, times: int = 3):
+    for _ in range(times):
+        with pytest.raises(PVGetError):
+            pv.get()
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=10)
+        breaker.record_failure()
+        assert breaker.state == BREAKER_CLOSED
+        breaker.record_failure()
+        assert breaker.state == BREAKER_OPEN
+        assert breaker.trips == 1
+        assert not breaker.allow()
+        assert 0 < breaker.retry_in <= 10
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=10)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == BREAKER_CLOSED
+
+    def test_single_probe_after_cooldown(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=0.05)
+        breaker.record_failure()
+        sleep(0.06)
+        assert breaker.allow()
+        assert breaker.state == BREAKER_HALF_OPEN
+        assert not breaker.allow()
+
+    def test_lost_probe_replaced_after_cooldown(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=0.05)
+        breaker.record_failure()
+        sleep(0.06)
+        assert breaker.allow()
+        # The probe never records a result
+        sleep(0.06)
+        assert breaker.allow()
+        assert not breaker.allow()
+
+
+class TestPVCircuitBreakers:
+    def test_open_breaker_fails_fast(self, breakers, get_calls):
+        pv = make_pv("AACTMEAN")
+        trip(pv)
+        assert len(get_calls) == 6
+        assert breakers.state(PREFIX) == BREAKER_OPEN
+
+        # Another channel on the same IOC is not attempted at all
+        other = make_pv("ADES")
+        with pytest.raises(PVConnectionError) as exc_info:
+            other.get()
+        assert len(get_calls) == 6
+        assert PREFIX in str(exc_info.value)
+
+    def test_other_iocs_unaffected(self, breakers, get_calls):
+        trip(make_pv("AACTMEAN"))
+        healthy = PV("ACCL:L0B:0120:AACTMEAN", auto_monitor=False)
+        FakeEPICS_PV.get = lambda self, *args, **kwargs: 16.0
+
+        assert healthy.get() == 16.0
+        assert breakers.state("ACCL:L0B:0120") == BREAKER_CLOSED
+
+    def test_successful_probe_closes(self, breakers, get_calls):
+        pv = make_pv("AACTMEAN")
+        trip(pv)
+        sleep(0.06)
+        FakeEPICS_PV.get = lambda self, *args, **kwargs: 16.0
+
+        assert pv.get() == 16.0
+        assert breakers.state(PREFIX) == BREAKER_CLOSED
+
+    def test_failed_probe_reopens(self, breakers, get_calls):
+        pv = make_pv("AACTMEAN")
+        trip(pv)
+        sleep(0.06)
+
+        with pytest.raises(PVGetError):
+            pv.get()
+        assert breakers.state(PREFIX) == BREAKER_OPEN
+        with pytest.raises(PVConnectionError):
+            pv.get()
+
+    def test_failed_put_counts(self, breakers):
+        pv = make_pv("ADES")
+        original_put = FakeEPICS_PV.put
+        FakeEPICS_PV.put = lambda self, *args, **kwargs: -1
+        try:
+            for _ in range(3):
+                with pytest.raises(Exception):
+                    pv.put(1.0)
+        finally:
+            FakeEPICS_PV.put = original_put
+
+        assert breakers.state(PREFIX) == BREAKER_OPEN
+
+    def test_disabled(self, get_calls):
+        original = PV.breakers
+        PV.breakers = None
+        try:
+            pv = make_pv("AACTMEAN")
+            trip(pv, times=4)
+        finally:
+            PV.breakers = original
+        assert len(get_calls) == 8
+
+    def test_state_published_to_metrics(self, breakers, metrics, get_calls):
+        trip(make_pv("AACTMEAN"))
+
+        assert metrics.breaker_state(PREFIX) == {"state": "open", "trips": 1}
+        assert metrics.snapshot()["breakers"][PREFIX]["state"] == "open"
+        text = metrics.to_prometheus()
+        assert f'sc_linac_pv_breaker_open{{ioc="{PREFIX}"}} 1' in text
+        assert f'sc_linac_pv_breaker_trips_total{{ioc="{PREFIX}"}} 1' in text
+
+    def test_reset_closes(self, breakers, metrics, get_calls):
+        trip(make_pv("AACTMEAN"))
+        breakers.reset()
+
+        assert breakers.states() == {}
+        assert metrics.breaker_state(PREFIX)["state"] == "closed"
+
+    def test_pipelined_probe_without_reply(
+        self, breakers, get_calls, monkeypatch
+    ):
+        pv = make_pv("AACTMEAN")
+        pv.chid, pv.ftype = 1, 6
+        trip(pv)
+        sleep(0.06)
+        calls = len(get_calls)
+        fake_ca = sys.modules["epics"].ca
+        monkeypatch.setattr(fake_ca, "get", lambda chid, **kwargs: None)
+        monkeypatch.setattr(
+            fake_ca, "get_complete", lambda chid, **kwargs: None
+        )
+
+        assert PV.get_many([pv], raise_on_error=False, parallel=True) == [None]
+        # The failed probe re-opened the breaker and was not retried
+        assert breakers.state(PREFIX) == BREAKER_OPEN
+        assert len(get_calls) == calls
+
+        sleep(0.06)
+        FakeEPICS_PV.get = lambda self, *args, **kwargs: 16.0
+        assert pv.get() == 16.0
+        assert breakers.state(PREFIX) == BREAKER_CLOSED
+
+    def test_keyed_by_connected_host(self, breakers, get_calls, monkeypatch):
+        monkeypatch.setattr(
+            FakeEPICS_PV, "_args", {"host": HOST}, raising=False
+        )
+        pv = make_pv("AACTMEAN")
+        trip(pv)
+        assert breakers.state(HOST) == BREAKER_OPEN
+
+        # Another cavity on the same IOC host shares the breaker
+        other = PV("ACCL:L0B:0120:AACTMEAN", auto_monitor=False)
+        with pytest.raises(PVConnectionError):
+            other.get()
+        assert len(get_calls) == 6
+
+    def test_host_from_connection_wait(self, breakers, monkeypatch):
+        def connect_like_pyepics(self, timeout=None):
+            self._args = {"host": HOST}
+            pyepics_connect(self)
+            return True
+
+        original_init = FakeEPICS_PV.__init__
+
+        def disconnected_init(self, *args, **kwargs):
+            original_init(self, *args, **kwargs)
+            self._connected = False
+
+        monkeypatch.setattr(FakeEPICS_PV, "__init__", disconnected_init)
+        monkeypatch.setattr(
+            FakeEPICS_PV, "wait_for_connection", connect_like_pyepics
+        )
+        pv = make_pv("AACTMEAN")
+
+        assert pv.connected
+        assert breakers.ioc(pv.pvname) == HOST
+
+    def test_host_updated_on_reconnect(self, breakers):
+        pv = make_pv("AACTMEAN")
+        assert breakers.ioc(pv.pvname) == PREFIX
+
+        pv._connected = False
+        pv._args = {"host": HOST}
+        pyepics_connect(pv)
+        assert breakers.ioc(pv.pvname) == HOST
+
+    def test_ioc_map(self):
+        breakers = PVCircuitBreakers(
+            ioc_map={"ACCL:L0B:": "IOC-L0B", "ACCL:L0B:01": "IOC-CM01"}
+        )
+        assert breakers.ioc("ACCL:L0B:0110:AACTMEAN") == "IOC-CM01"
+        assert breakers.ioc("ACCL:L0B:0210:AACTMEAN") == "IOC-L0B"
+        assert breakers.ioc("ACCL:L1B:0210:AACTMEAN") == "ACCL:L1B:0210"
+
+        breakers.set_host("ACCL:L0B:0110:AACTMEAN", "ioc-l0b:5064")
+        assert breakers.ioc("ACCL:L0B:0110:AACTMEAN") == "ioc-l0b:5064"
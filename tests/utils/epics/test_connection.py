@@ -0,0 +1,73 @@
+# tests/utils/epics/test_connection.py
+import threading
+
+from sc_linac_physics.utils.epics.connection import (
+    ConnectionReport,
+    ConnectionWaiter,
+)
+
+
+class FakeRawPV:
+    def __init__(self, connected=False):
+        self.connected = connected
+
+
+class TestConnectionWaiter:
+    def test_wait_returns_when_all_connected(self):
+        waiter = ConnectionWaiter(2)
+        pvs = [("PV:1", FakeRawPV()), ("PV:2", FakeRawPV())]
+
+        def connect_later():
+            waiter.callback(pvname="PV:1", conn=True)
+            waiter.callback(pvname="PV:2", conn=True)
+
+        threading.Timer(0.05, connect_later).start()
+        report = waiter.wait(pvs, timeout=5.0)
+
+        assert report.failed == []
+        assert set(report.latencies) == {"PV:1", "PV:2"}
+        assert report.elapsed < 5.0
+
+    def test_wait_reports_unconnected_after_deadline(self):
+        waiter = ConnectionWaiter(3)
+        waiter.callback(pvname="PV:1", conn=True)
+        pvs = [("PV:1", FakeRawPV()), ("PV:2", FakeRawPV()), ("PV:3", None)]
+
+        report = waiter.wait(pvs, timeout=0.1)
+
+        assert report.failed == ["PV:2", "PV:3"]
+        assert list(report.latencies) == ["PV:1"]
+
+    def test_disconnect_events_ignored(self):
+        waiter = ConnectionWaiter(1)
+        waiter.callback(pvname="PV:1", conn=False)
+        report = waiter.wait([("PV:1", FakeRawPV())], timeout=0.05)
+        assert report.failed == ["PV:1"]
+
+    def test_late_connection_counted(self):
+        waiter = ConnectionWaiter(1)
+        report = waiter.wait(
+            [("PV:1", FakeRawPV(connected=True))], timeout=0.05
+        )
+        assert "PV:1" in report.latencies
+
+    def test_zero_expected_does_not_block(self):
+        waiter = ConnectionWaiter(0)
+        report = waiter.wait([], timeout=10.0)
+        assert report.elapsed < 1.0
+
+
+class TestConnectionReport:
+    def test_histogram_clips_to_last_bucket(self):
+        report = ConnectionReport(latencies={"A": 0.0005, "B": 0.02, "C": 60.0})
+        counts, edges = report.histogram(bins=(0.0, 0.001, 0.1, 1.0))
+        assert counts.tolist() == [1, 1, 1]
+        assert edges[-1] == 1.0
+
+    def test_summary(self):
+        report = ConnectionReport(
+            latencies={"A": 0.002}, failed=["B"], elapsed=0.5
+        )
+        summary = report.summary()
+        assert "1 connected" in summary
+        assert "1 failed" in summary
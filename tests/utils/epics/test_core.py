@@ -10,10 +10,13 @@ from sc_linac_physics.utils.epics import (
     PVGetError,
     PVPutError,
     PVInvalidError,
+    PVMetrics,
     make_mock_pv,
     EPICS_NO_ALARM_VAL,
     EPICS_MINOR_VAL,
     EPICS_MAJOR_VAL,
+    EPICS_INVALID_VAL,
+    PVSnapshot,
 )
 
 FakeEPICS_PV = sys.modules["epics"].PV
@@ -170,6 +173,154 @@ class TestPVGet:
         assert result == 42.0
 
 
+# Test Monitor Cache Reads
+class TestPVMonitorCache:
+    def test_fresh_monitor_value_served_from_cache(self, connected_pv):
+        """Test max_age read returns the monitored value without a CA get"""
+        original_get = FakeEPICS_PV.get
+        FakeEPICS_PV.get = lambda self, *args, **kwargs: pytest.fail(
+            "network get issued for a fresh monitor value"
+        )
+        try:
+            assert connected_pv.get(max_age=1.0) == 42.0
+        finally:
+            FakeEPICS_PV.get = original_get
+
+        assert connected_pv.cache_stats == {"hits": 1, "misses": 0}
+
+    def test_monitor_update_refreshes_cache(self, connected_pv):
+        """Test monitor events replace the cached value"""
+        connected_pv.put(7.0)
+        assert connected_pv.get(max_age=1.0) == 7.0
+        assert connected_pv.cache_hits == 1
+
+    def test_stale_monitor_value_forces_fresh_get(self, connected_pv):
+        """Test a cached value older than max_age is not used"""
+        connected_pv._monitor_stamp -= 10.0
+
+        calls = []
+        original_get = FakeEPICS_PV.get
+
+        def tracking_get(self, *args, **kwargs):
+            calls.append(kwargs.get("use_monitor"))
+            return 43.0
+
+        FakeEPICS_PV.get = tracking_get
+        try:
+            assert connected_pv.get(max_age=1.0) == 43.0
+        finally:
+            FakeEPICS_PV.get = original_get
+
+        assert calls == [False]
+        assert connected_pv.cache_stats == {"hits": 0, "misses": 1}
+
+    def test_cache_skipped_for_string_reads(self, connected_pv):
+        """Test reads needing a different form go to the network"""
+        connected_pv.get(max_age=1.0, as_string=True)
+        assert connected_pv.cache_misses == 1
+
+    def test_no_monitor_means_no_cache(self):
+        """Test PVs without auto_monitor always miss"""
+        pv = PV("TEST:NOMON", auto_monitor=False)
+        assert pv.monitor_age is None
+        assert pv.get(max_age=1.0) == 42.0
+        assert pv.cache_stats == {"hits": 0, "misses": 1}
+
+    def test_plain_get_does_not_count(self, connected_pv):
+        """Test reads without max_age leave the counters alone"""
+        connected_pv.get()
+        assert connected_pv.cache_stats == {"hits": 0, "misses": 0}
+
+
+# Test Alarm Snapshots
+class TestPVSnapshot:
+    def test_snapshot_from_time_monitor_event(self, connected_pv):
+        """Test a DBR_TIME monitor event is served without a CA read"""
+        connected_pv._on_monitor_update(
+            value=3.0, severity=EPICS_MAJOR_VAL, status=7, timestamp=12.5
+        )
+        original = FakeEPICS_PV.get_with_metadata
+        FakeEPICS_PV.get_with_metadata = lambda self, **kwargs: pytest.fail(
+            "network read issued for a monitored sample"
+        )
+        try:
+            snap = connected_pv.snapshot()
+        finally:
+            FakeEPICS_PV.get_with_metadata = original
+
+        assert snap == PVSnapshot("TEST:PV", 3.0, EPICS_MAJOR_VAL, 7, 12.5)
+        assert snap.val == 3.0
+
+    def test_snapshot_is_immutable(self, connected_pv):
+        snap = connected_pv.snapshot()
+        with pytest.raises(AttributeError):
+            snap.value = 1.0
+        assert not hasattr(snap, "__dict__")
+
+    def test_snapshot_single_time_read(self, connected_pv):
+        """Test value and alarm come from one DBR_TIME read"""
+        calls = []
+        original = FakeEPICS_PV.get_with_metadata
+
+        def tracking_read(self, **kwargs):
+            calls.append(kwargs)
+            return {"value": 1.0, "severity": 3, "status": 17}
+
+        FakeEPICS_PV.get_with_metadata = tracking_read
+        try:
+            snap = connected_pv.snapshot()
+        finally:
+            FakeEPICS_PV.get_with_metadata = original
+
+        assert len(calls) == 1
+        assert calls[0]["form"] == "time"
+        assert snap.is_invalid and snap.status == 17 and snap.timestamp is None
+
+    def test_snapshot_retries_then_raises(self, connected_pv):
+        original = FakeEPICS_PV.get_with_metadata
+        FakeEPICS_PV.get_with_metadata = lambda self, **kwargs: None
+        try:
+            with pytest.raises(PVGetError):
+                connected_pv.snapshot()
+        finally:
+            FakeEPICS_PV.get_with_metadata = original
+
+    def test_snapshot_many(self, monkeypatch):
+        pvs = [PV(f"TEST:SNAP{i}", auto_monitor=False) for i in range(3)]
+        for i, pv in enumerate(pvs):
+            pv.chid = i
+        monitored = PV("TEST:SNAP:MON")
+        monitored._on_monitor_update(value=9.0, severity=1, status=3)
+        pvs[2]._connected = False
+
+        fake_ca = sys.modules["epics"].ca
+        issued = []
+        monkeypatch.setattr(
+            fake_ca, "get", lambda chid, **kwargs: issued.append(chid)
+        )
+        monkeypatch.setattr(
+            fake_ca,
+            "get_complete_with_metadata",
+            lambda chid, **kwargs: (
+                None
+                if chid == 1
+                else {"value": 5.0, "severity": 0, "status": 0}
+            ),
+        )
+
+        records = PV.snapshot_many(pvs + [monitored])
+
+        assert issued == [0, 1]
+        assert records["valid"].tolist() == [True, False, False, True]
+        assert records["value"][0] == 5.0 and records["value"][3] == 9.0
+        assert records["severity"].tolist() == [
+            0,
+            EPICS_INVALID_VAL,
+            EPICS_INVALID_VAL,
+            1,
+        ]
+
+
 # Test Put Operations
 class TestPVPut:
     def test_successful_put(self, connected_pv):
@@ -350,6 +501,11 @@ class TestPVAlarmChecking:
         severity = connected_pv.check_alarm()
         assert severity == EPICS_NO_ALARM_VAL
 
+    def test_check_alarm_uses_snapshot(self, connected_pv):
+        """Test check_alarm reads severity from the monitored sample"""
+        connected_pv._on_monitor_update(value=1.0, severity=EPICS_MINOR_VAL)
+        assert connected_pv.check_alarm() == EPICS_MINOR_VAL
+
     def test_check_alarm_minor(self):
         """Test check_alarm detects MINOR alarm"""
         pv = PV("TEST:PV")
@@ -490,6 +646,42 @@ class TestPVBatchOperations:
         finally:
             FakeEPICS_PV.wait_for_connection = original_wait
 
+    def test_batch_create_dead_pvs_share_one_deadline(self):
+        """Test dead PVs wait on a single shared deadline, not one each"""
+        import time
+
+        original_init = FakeEPICS_PV.__init__
+
+        def dead_init(self, *args, connection_callback=None, **kwargs):
+            original_init(self, *args, **kwargs)
+            self._connected = "DEAD" not in self.pvname
+            if self._connected and connection_callback:
+                connection_callback(pvname=self.pvname, conn=True, pv=self)
+
+        FakeEPICS_PV.__init__ = dead_init
+        try:
+            pv_names = [f"DEAD:PV{i}" for i in range(10)] + ["LIVE:PV"]
+            start = time.monotonic()
+            PV.batch_create(pv_names, connection_timeout=0.2)
+            elapsed = time.monotonic() - start
+        finally:
+            FakeEPICS_PV.__init__ = original_init
+
+        assert elapsed < 1.0
+        report = PV.last_connection_report
+        assert report.failed == [f"DEAD:PV{i}" for i in range(10)]
+        assert list(report.latencies) == ["LIVE:PV"]
+
+    def test_batch_create_records_latency_report(self):
+        """Test batch_create stores a per-PV connection latency report"""
+        pv_names = ["TEST:PV1", "TEST:PV2", "TEST:PV1"]
+        PV.batch_create(pv_names)
+        report = PV.last_connection_report
+        assert set(report.latencies) == {"TEST:PV1", "TEST:PV2"}
+        assert report.failed == []
+        counts, _ = report.histogram()
+        assert counts.sum() == 2
+
     def test_get_many_success(self):
         """Test get_many retrieves multiple values"""
         pvs = [PV(f"TEST:PV{i}") for i in range(3)]
@@ -583,5 +775,177 @@ class TestPVBatchOperations:
             FakeEPICS_PV.put = original_put
 
 
+class TestPVParallelBulkOperations:
+    @pytest.fixture
+    def pvs(self):
+        pvs = [PV(f"TEST:PAR{i}") for i in range(3)]
+        for i, pv in enumerate(pvs):
+            pv.chid = i
+            pv.ftype = 6
+        return pvs
+
+    def test_get_many_parallel_issues_all_before_waiting(
+        self, pvs, monkeypatch
+    ):
+        calls = []
+        fake_ca = sys.modules["epics"].ca
+        monkeypatch.setattr(
+            fake_ca,
+            "get",
+            lambda chid, **kwargs: calls.append(("get", chid)),
+        )
+
+        def get_complete(chid, **kwargs):
+            calls.append(("complete", chid))
+            return float(chid)
+
+        monkeypatch.setattr(fake_ca, "get_complete", get_complete)
+
+        results = PV.get_many(pvs, parallel=True)
+
+        assert results == [0.0, 1.0, 2.0]
+        assert [c[0] for c in calls] == ["get"] * 3 + ["complete"] * 3
+
+    def test_get_many_parallel_falls_back_on_no_reply(self, pvs, monkeypatch):
+        fake_ca = sys.modules["epics"].ca
+        monkeypatch.setattr(fake_ca, "get", lambda chid, **kwargs: None)
+        monkeypatch.setattr(
+            fake_ca,
+            "get_complete",
+            lambda chid, **kwargs: None if chid == 1 else float(chid),
+        )
+
+        results = PV.get_many(pvs, parallel=True)
+
+        # PV 1 never answered the pipelined get, so it was read normally
+        assert results == [0.0, 42.0, 2.0]
+
+    def test_get_many_parallel_flushes_before_waiting(self, pvs, monkeypatch):
+        calls = []
+        fake_ca = sys.modules["epics"].ca
+        monkeypatch.setattr(
+            fake_ca, "get", lambda chid, **kwargs: calls.append("get")
+        )
+        monkeypatch.setattr(fake_ca, "flush_io", lambda: calls.append("flush"))
+
+        def get_complete(chid, **kwargs):
+            calls.append("complete")
+            return float(chid)
+
+        monkeypatch.setattr(fake_ca, "get_complete", get_complete)
+
+        PV.get_many(pvs, parallel=True)
+
+        assert calls == ["get"] * 3 + ["flush"] + ["complete"] * 3
+
+    def test_get_many_parallel_disconnected_fails_at_once(
+        self, pvs, monkeypatch
+    ):
+        fake_ca = sys.modules["epics"].ca
+        monkeypatch.setattr(fake_ca, "get", lambda chid, **kwargs: None)
+        monkeypatch.setattr(
+            fake_ca, "get_complete", lambda chid, **kwargs: float(chid)
+        )
+        monkeypatch.setattr(
+            FakeEPICS_PV,
+            "get",
+            lambda self, *args, **kwargs: pytest.fail("retried"),
+        )
+        pvs[1]._connected = False
+
+        results = PV.get_many(pvs, raise_on_error=False, parallel=True)
+        assert results == [0.0, None, 2.0]
+
+        with pytest.raises(PVGetError):
+            PV.get_many(pvs, parallel=True)
+
+    def test_get_many_parallel_counts_towards_breakers_and_metrics(
+        self, pvs, monkeypatch
+    ):
+        fake_ca = sys.modules["epics"].ca
+        monkeypatch.setattr(fake_ca, "get", lambda chid, **kwargs: None)
+        monkeypatch.setattr(
+            fake_ca, "get_complete", lambda chid, **kwargs: float(chid)
+        )
+        monkeypatch.setattr(PV, "metrics", PVMetrics())
+        failures = []
+        monkeypatch.setattr(
+            PV.breakers,
+            "record_failure",
+            lambda pvname: failures.append(pvname),
+        )
+        pvs[1]._connected = False
+
+        PV.get_many(pvs, raise_on_error=False, parallel=True)
+
+        assert PV.metrics.pv_stats("TEST:PAR0")["gets"] == 1
+        assert PV.metrics.pv_stats("TEST:PAR1")["errors"] == 1
+        assert failures == ["TEST:PAR1"]
+
+    def test_put_many_parallel_waits_on_completion_callbacks(self, pvs):
+        original_put = FakeEPICS_PV.put
+        issued = []
+
+        def put_with_callback(self, value, wait=True, callback=None, **kwargs):
+            issued.append((self.pvname, value, wait))
+            if callback:
+                callback(pvname=self.pvname)
+            return 1
+
+        FakeEPICS_PV.put = put_with_callback
+        try:
+            results = PV.put_many(pvs, [1, 2, 3], parallel=True)
+        finally:
+            FakeEPICS_PV.put = original_put
+
+        assert results == [True, True, True]
+        assert issued == [
+            ("TEST:PAR0", 1, False),
+            ("TEST:PAR1", 2, False),
+            ("TEST:PAR2", 3, False),
+        ]
+
+    def test_put_many_parallel_reports_unconfirmed_in_order(self, pvs):
+        original_put = FakeEPICS_PV.put
+
+        def put_without_completion(self, value, callback=None, **kwargs):
+            if callback and "PAR1" not in self.pvname:
+                callback(pvname=self.pvname)
+            return 1
+
+        FakeEPICS_PV.put = put_without_completion
+        try:
+            results = PV.put_many(
+                pvs, [1, 2, 3], timeout=0.1, parallel=True, raise_on_error=False
+            )
+            with pytest.raises(PVPutError) as exc_info:
+                PV.put_many(pvs, [1, 2, 3], timeout=0.1, parallel=True)
+        finally:
+            FakeEPICS_PV.put = original_put
+
+        assert results == [True, False, True]
+        assert "TEST:PAR1" in str(exc_info.value)
+
+    def test_put_many_parallel_retries_unissued_puts(self, pvs):
+        original_put = FakeEPICS_PV.put
+        calls = []
+
+        def put_rejected_once(self, value, callback=None, **kwargs):
+            calls.append(self.pvname)
+            if callback:
+                # Issue rejected; the serial retry path takes over
+                return 0
+            return 1
+
+        FakeEPICS_PV.put = put_rejected_once
+        try:
+            results = PV.put_many(pvs, [1, 2, 3], parallel=True)
+        finally:
+            FakeEPICS_PV.put = original_put
+
+        assert results == [True, True, True]
+        assert len(calls) == 6
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,157 @@
+import json
+import sys
+
+import pytest
+
+from sc_linac_physics.utils.epics import (
+    PV,
+    PVConfig,
+    PVGetError,
+    PVMetrics,
+    PVPutError,
+)
+from sc_linac_physics.utils.epics.metrics import LatencyHistogram, ioc_prefix
+
+FakeEPICS_PV = sys.modules["epics"].PV
+
+FAST_CONFIG = PVConfig(max_retries=3, retry_delay=0.0)
+
+
+@pytest.fixture
+def metrics():
+    original = PV.metrics
+    PV.metrics = PVMetrics()
+    yield PV.metrics
+    PV.metrics = original
+
+
+class TestIOCPrefix:
+    def test_default_depth(self):
+        assert ioc_prefix("ACCL:L0B:0110:AACTMEAN") == "ACCL:L0B:0110"
+
+    def test_short_names(self):
+        assert ioc_prefix("TEST:PV") == "TEST:PV"
+        assert ioc_prefix("ACCL:L0B:0110:AACTMEAN", depth=2) == "ACCL:L0B"
+
+
+class TestLatencyHistogram:
+    def test_cumulative_buckets(self):
+        hist = LatencyHistogram(bounds=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 3.0):
+            hist.observe(seconds)
+
+        assert hist.cumulative() == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+        assert hist.count == 4
+        assert hist.total == pytest.approx(3.65)
+
+
+class TestPVMetrics:
+    def test_successful_get_and_put(self, metrics):
+        pv = PV("ACCL:L0B:0110:AACTMEAN")
+        pv.get()
+        pv.put(1.0)
+
+        stats = metrics.pv_stats("ACCL:L0B:0110:AACTMEAN")
+        assert stats["gets"] == 1
+        assert stats["puts"] == 1
+        assert stats["retries"] == 0
+        assert stats["latency"]["get"]["count"] == 1
+        assert metrics.prefix_stats("ACCL:L0B:0110")["gets"] == 1
+
+    def test_retries_and_timeouts(self, metrics):
+        pv = PV("ACCL:L0B:0120:AACTMEAN", config=FAST_CONFIG)
+
+        calls = []
+        original_get = FakeEPICS_PV.get
+
+        def slow_then_ok(self, *args, **kwargs):
+            calls.append(1)
+            return None if len(calls) < 3 else 5.0
+
+        FakeEPICS_PV.get = slow_then_ok
+        try:
+            assert pv.get() == 5.0
+        finally:
+            FakeEPICS_PV.get = original_get
+
+        stats = metrics.pv_stats(pv.pvname)
+        assert stats["retries"] == 2
+        assert stats["timeouts"] == 2
+        assert stats["errors"] == 0
+
+    def test_failed_operations_count_errors(self, metrics):
+        pv = PV("ACCL:L0B:0130:ADES", config=FAST_CONFIG)
+
+        original_put = FakeEPICS_PV.put
+        FakeEPICS_PV.put = lambda self, *args, **kwargs: -1
+        try:
+            with pytest.raises(PVPutError):
+                pv.put(1.0)
+        finally:
+            FakeEPICS_PV.put = original_put
+
+        original_get = FakeEPICS_PV.get
+        FakeEPICS_PV.get = lambda self, *args, **kwargs: (_ for _ in ()).throw(
+            RuntimeError("boom")
+        )
+        try:
+            with pytest.raises(PVGetError):
+                pv.get()
+        finally:
+            FakeEPICS_PV.get = original_get
+
+        stats = metrics.pv_stats(pv.pvname)
+        assert stats["puts"] == 1
+        assert stats["gets"] == 1
+        assert stats["errors"] == 2
+        # Only the put attempts returned the pyepics timeout status
+        assert stats["timeouts"] == 3
+        assert stats["retries"] == 4
+
+    def test_reconnect_counted(self, metrics):
+        pv = PV("ACCL:L0B:0140:AACTMEAN")
+        pv._connected = False
+        pv.wait_for_connection = lambda timeout=None: True
+
+        pv.get()
+
+        assert metrics.pv_stats(pv.pvname)["reconnects"] == 1
+
+    def test_disabled(self, metrics):
+        metrics.enabled = False
+        PV("ACCL:L0B:0150:AACTMEAN").get()
+        assert metrics.snapshot() == {"iocs": {}, "pvs": {}, "breakers": {}}
+
+    def test_no_sink(self, metrics):
+        PV.metrics = None
+        assert PV("ACCL:L0B:0160:AACTMEAN").get() == 42.0
+
+
+class TestMetricsExport:
+    def test_json_round_trip(self, metrics):
+        PV("ACCL:L0B:0110:AACTMEAN").get()
+
+        dumped = json.loads(metrics.to_json())
+
+        assert dumped["iocs"]["ACCL:L0B:0110"]["gets"] == 1
+        assert dumped["pvs"]["ACCL:L0B:0110:AACTMEAN"]["gets"] == 1
+
+    def test_prometheus_text(self, metrics):
+        PV("ACCL:L0B:0110:AACTMEAN").get()
+
+        text = metrics.to_prometheus()
+
+        assert "# TYPE sc_linac_pv_gets_total counter" in text
+        assert 'sc_linac_pv_gets_total{ioc="ACCL:L0B:0110"} 1' in text
+        assert (
+            'sc_linac_pv_latency_seconds_bucket{ioc="ACCL:L0B:0110",'
+            'operation="get",le="+Inf"} 1'
+        ) in text
+        assert "AACTMEAN" not in text
+
+    def test_prometheus_per_pv(self, metrics):
+        PV("ACCL:L0B:0110:AACTMEAN").get()
+
+        text = metrics.to_prometheus(per_pv=True)
+
+        assert 'sc_linac_pv_gets_total{pv="ACCL:L0B:0110:AACTMEAN"} 1' in text
@@ -0,0 +1,182 @@
+# tests/utils/epics/test_registry.py
+import sys
+
+import pytest
+
+from sc_linac_physics.utils.epics import (
+    AsyncPV,
+    PV,
+    PVConfig,
+    PVConnectionError,
+    PVLease,
+    PVRegistry,
+)
+
+FakeEPICS_PV = sys.modules["epics"].PV
+
+
+def registry_key(name, form="time", auto_monitor=True):
+    return PVRegistry.make_key(PV, name, form, auto_monitor)
+
+
+class TestSharedPV:
+    def test_same_name_returns_same_instance(self):
+        a = PV("SHARED:PV")
+        b = PV("SHARED:PV")
+        assert a is b
+        assert a.is_shared
+        assert PV.registry.refcount(registry_key("SHARED:PV")) == 2
+
+    def test_different_form_or_monitor_not_shared(self):
+        a = PV("SHARED:PV")
+        assert PV("SHARED:PV", form="ctrl") is not a
+        assert PV("SHARED:PV", auto_monitor=False) is not a
+
+    def test_customized_pv_is_private(self):
+        shared = PV("SHARED:PV")
+        with_callback = PV("SHARED:PV", callback=lambda **kw: None)
+        with_config = PV("SHARED:PV", config=PVConfig(max_retries=5))
+        optional = PV("SHARED:PV", require_connection=False)
+
+        for pv in (with_callback, with_config, optional):
+            assert pv is not shared
+            assert not pv.is_shared
+
+    def test_release_evicts_after_last_holder(self):
+        a = PV("SHARED:PV")
+        b = PV("SHARED:PV")
+
+        a.release()
+        assert registry_key("SHARED:PV") in PV.registry
+        assert b.connected
+
+        b.release()
+        assert registry_key("SHARED:PV") not in PV.registry
+        assert PV("SHARED:PV") is not a
+
+    def test_disconnect_only_releases_shared_reference(self):
+        a = PV("SHARED:PV")
+        b = PV("SHARED:PV")
+        a.disconnect()
+        assert b.connected
+        assert PV.registry.refcount(registry_key("SHARED:PV")) == 1
+
+    def test_context_manager_releases(self):
+        holder = PV("SHARED:PV")
+        with PV("SHARED:PV") as pv:
+            assert pv is holder
+        assert holder.connected
+        assert PV.registry.refcount(registry_key("SHARED:PV")) == 1
+
+    def test_joining_dead_channel_raises_and_releases(self):
+        pv = PV("SHARED:PV")
+        pv._connected = False
+
+        original_wait = FakeEPICS_PV.wait_for_connection
+        FakeEPICS_PV.wait_for_connection = lambda self, timeout=None: False
+        try:
+            with pytest.raises(PVConnectionError):
+                PV("SHARED:PV", connection_timeout=0.1)
+        finally:
+            FakeEPICS_PV.wait_for_connection = original_wait
+
+        assert PV.registry.refcount(registry_key("SHARED:PV")) == 1
+
+    def test_double_release_of_lease(self):
+        lease = PV.lease("SHARED:PV")
+        other = PV.lease("SHARED:PV")
+        assert lease.pv is other.pv is PV("SHARED:PV")
+
+        # Releasing one holder's lease twice only drops its own reference
+        assert lease.release() is False
+        assert lease.release() is False
+        assert lease.released
+        assert PV.registry.refcount(registry_key("SHARED:PV")) == 2
+        assert other.pv.connected
+
+    def test_anonymous_release_keeps_leases(self):
+        lease = PV.lease("SHARED:PV")
+        pv = PV("SHARED:PV")
+        pv.release()
+        # Nothing anonymous left to release: the lease keeps its reference
+        pv.release()
+        assert PV.registry.refcount(registry_key("SHARED:PV")) == 1
+
+        with lease:
+            pass
+        assert registry_key("SHARED:PV") not in PV.registry
+
+    def test_private_lease(self):
+        lease = PV.lease("SHARED:PV", require_connection=False)
+        assert not lease.pv.is_shared
+        assert lease.release() is True
+        assert lease.release() is False
+
+    def test_async_pv_closes_once(self):
+        holder = PV("SHARED:PV")
+        apv = AsyncPV("SHARED:PV")
+        assert apv.pv is holder
+        apv.close()
+        apv.close()
+        assert PV.registry.refcount(registry_key("SHARED:PV")) == 1
+        assert holder.connected
+
+    def test_sharing_disabled(self, monkeypatch):
+        monkeypatch.setattr(PV, "registry", None)
+        assert PV("SHARED:PV") is not PV("SHARED:PV")
+
+
+class TestPVRegistry:
+    def test_stats(self):
+        registry = PVRegistry()
+        for _ in range(3):
+            registry.acquire("KEY", lambda: FakeShared())
+        assert registry.stats() == {"channels": 1, "references": 3}
+
+    def test_release_unknown_pv(self):
+        assert PVRegistry().release(FakeShared()) is False
+
+    def test_lease(self):
+        registry = PVRegistry()
+        pv = registry.acquire("KEY", lambda: FakeShared())
+        lease = registry.lease("KEY", lambda: FakeShared())
+        assert isinstance(lease, PVLease) and lease.pv is pv
+        assert registry.stats() == {"channels": 1, "references": 2}
+
+        assert registry.release(pv) is False
+        assert registry.release(pv) is False
+        assert lease.release() is True
+        assert lease.release() is False
+        assert pv.closed
+
+    def test_race_loser_is_closed(self):
+        registry = PVRegistry()
+        winner = FakeShared()
+        loser = FakeShared()
+
+        def factory():
+            # Another holder registers the key while we are connecting
+            registry.acquire("KEY", lambda: winner)
+            return loser
+
+        assert registry.acquire("KEY", factory) is winner
+        assert loser.closed
+        assert registry.refcount("KEY") == 2
+
+    def test_clear_closes_everything(self):
+        registry = PVRegistry()
+        pv = registry.acquire("KEY", lambda: FakeShared())
+        registry.clear()
+        assert pv.closed
+        assert len(registry) == 0
+
+
+class FakeShared:
+    pvname = "FAKE"
+
+    def __init__(self):
+        self.closed = False
+        self._registry_key = None
+
+    def _close(self):
+        self.closed = True
@@ -0,0 +1,70 @@
+import sys
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from sc_linac_physics.utils.epics import PV, make_mock_pv, wait_until
+
+FakeEPICS_PV = sys.modules["epics"].PV
+
+
+class TestWaitUntil:
+    def test_returns_immediately_when_met(self):
+        pv = make_mock_pv(get_val=1)
+        abort_check = Mock()
+
+        assert wait_until(pv, lambda v: v == 1, abort_check=abort_check) == 1
+        abort_check.assert_not_called()
+        pv.get.assert_called_once()
+
+    def test_wakes_on_monitor_event(self):
+        pv = PV("TEST:WAIT")
+        timer = threading.Timer(0.05, lambda: FakeEPICS_PV.put(pv, 5.0))
+        timer.start()
+
+        # Long poll interval: only the monitor event can end the wait in time
+        value = wait_until(
+            pv, lambda v: v == 5.0, timeout=2.0, poll_interval=10.0
+        )
+
+        assert value == 5.0
+        timer.join()
+
+    def test_polls_without_monitor_events(self):
+        pv = make_mock_pv()
+        pv.get.side_effect = [0, 0, 1]
+
+        assert wait_until(pv, bool, poll_interval=0.01) == 1
+        assert pv.get.call_count == 3
+        pv.remove_callback.assert_called_once_with(pv.add_callback.return_value)
+
+    def test_timeout(self):
+        pv = make_mock_pv(pv_name="TEST:WAIT", get_val=0)
+
+        with pytest.raises(TimeoutError) as exc_info:
+            wait_until(pv, bool, timeout=0.05, poll_interval=0.01)
+
+        assert "TEST:WAIT" in str(exc_info.value)
+        pv.remove_callback.assert_called_once()
+
+    def test_abort_check_raises_out_of_wait(self):
+        pv = make_mock_pv(get_val=0)
+        abort_check = Mock(side_effect=[None, RuntimeError("abort")])
+
+        with pytest.raises(RuntimeError):
+            wait_until(pv, bool, abort_check=abort_check, poll_interval=0.01)
+
+        assert abort_check.call_count == 2
+        pv.remove_callback.assert_called_once()
+
+    def test_on_wait_sees_current_value(self):
+        pv = make_mock_pv()
+        pv.get.side_effect = [3, 2, 0]
+        seen = []
+
+        wait_until(
+            pv, lambda v: v == 0, poll_interval=0.01, on_wait=seen.append
+        )
+
+        assert seen == [3, 2]
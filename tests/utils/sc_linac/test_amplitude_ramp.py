@@ -0,0 +1,140 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from sc_linac_physics.utils.epics import PVSnapshot
+from sc_linac_physics.utils.epics.testing import make_mock_pv
+from sc_linac_physics.utils.sc_linac import amplitude_ramp
+from sc_linac_physics.utils.sc_linac.amplitude_ramp import (
+    RAMP_MIN_STEP_INTERVAL,
+    AmplitudeRamp,
+    ramp_setpoints,
+)
+from sc_linac_physics.utils.sc_linac.linac_utils import (
+    CavityAbortError,
+    QuenchError,
+)
+
+
+@pytest.fixture
+def cavity():
+    cavity = MagicMock()
+    cavity.is_quenched = False
+    cavity.ades_pv_obj = make_mock_pv()
+    cavity.aact_pv_obj = make_mock_pv()
+    cavity.quench_latch_pv_obj = make_mock_pv(get_val=0)
+    # AACT's monitored sample follows the last setpoint
+    cavity.aact_pv_obj.get.side_effect = (
+        lambda **kwargs: cavity.ades_pv_obj.put.call_args.args[0]
+    )
+    yield cavity
+
+
+@pytest.fixture
+def fast_floor(monkeypatch):
+    monkeypatch.setattr(amplitude_ramp, "RAMP_MIN_STEP_INTERVAL", 0.001)
+
+
+def fast_ramp(cavity, step_size, **kwargs):
+    return AmplitudeRamp(
+        cavity,
+        step_size,
+        step_interval=0.004,
+        min_interval=0.001,
+        max_interval=0.016,
+        **kwargs,
+    )
+
+
+def test_ramp_setpoints():
+    assert ramp_setpoints(0, 1, 0.25) == [0.25, 0.5, 0.75, 1]
+    assert ramp_setpoints(16.05, 16.1, 0.1) == [16.1]
+    assert ramp_setpoints(5, 3, 0.5) == [3]
+    assert ramp_setpoints(0, 1, 0.3) == pytest.approx([0.3, 0.6, 0.9, 1])
+
+
+def test_run(cavity, fast_floor):
+    fast_ramp(cavity, 0.5).run(2, start=0)
+
+    puts = cavity.ades_pv_obj.put.call_args_list
+    assert [put.args for put in puts] == [(0.5,), (1.0,), (1.5,)]
+    assert all(put.kwargs == {"wait": False} for put in puts)
+    assert cavity.ades == 2
+    assert cavity.check_abort.call_count == 4
+    cavity.quench_latch_pv_obj.remove_callback.assert_called_once()
+
+
+def test_already_at_amplitude(cavity, fast_floor):
+    cavity.ades = 5
+    fast_ramp(cavity, 0.5).run(5)
+    cavity.ades_pv_obj.put.assert_not_called()
+    cavity.quench_latch_pv_obj.add_callback.assert_called_once()
+
+
+def test_speeds_up_while_tracking(cavity, fast_floor):
+    ramp = fast_ramp(cavity, 0.1)
+    ramp.run(1, start=0)
+    assert ramp.interval == 0.001
+
+
+def test_slows_down_when_lagging(cavity, fast_floor):
+    cavity.aact_pv_obj.get.side_effect = None
+    cavity.aact_pv_obj.get.return_value = 0
+    ramp = fast_ramp(cavity, 0.1)
+    ramp.run(1, start=0)
+    assert ramp.interval == 0.016
+
+
+def test_quench_from_monitor(cavity, fast_floor):
+    ramp = fast_ramp(cavity, 0.1)
+
+    def quench_at_half(**kwargs):
+        setpoint = cavity.ades_pv_obj.put.call_args.args[0]
+        if setpoint >= 0.5:
+            callback = cavity.quench_latch_pv_obj.add_callback.call_args.args[0]
+            callback(value=1)
+        return setpoint
+
+    cavity.aact_pv_obj.get.side_effect = quench_at_half
+
+    with pytest.raises(QuenchError):
+        ramp.run(1, start=0)
+
+    assert cavity.ades_pv_obj.put.call_args.args == (pytest.approx(0.5),)
+    cavity.quench_latch_pv_obj.remove_callback.assert_called_once()
+    cavity.set_status_message.assert_called_once()
+
+
+def test_quench_latched_before_start(cavity, fast_floor):
+    cavity.is_quenched = True
+    with pytest.raises(QuenchError):
+        fast_ramp(cavity, 0.1).run(1, start=0)
+    cavity.ades_pv_obj.put.assert_not_called()
+
+
+def test_abort(cavity, fast_floor):
+    cavity.check_abort.side_effect = [None, CavityAbortError("abort")]
+    with pytest.raises(CavityAbortError):
+        fast_ramp(cavity, 0.1).run(1, start=0)
+    cavity.ades_pv_obj.put.assert_called_once()
+    cavity.quench_latch_pv_obj.remove_callback.assert_called_once()
+
+
+def test_interval_floor(cavity):
+    ramp = AmplitudeRamp(cavity, 0.1, step_interval=0.01, min_interval=0.01)
+    assert ramp.min_interval == ramp.interval == RAMP_MIN_STEP_INTERVAL
+    cavity.aact_pv_obj.get.side_effect = None
+    cavity.aact_pv_obj.get.return_value = 0.1
+    ramp._adapt(0.1)
+    assert ramp.interval == RAMP_MIN_STEP_INTERVAL
+
+
+def test_unchanged_sample(cavity, fast_floor):
+    # A sample that has not updated since the last step adapts nothing
+    cavity.aact_pv_obj.snapshot.side_effect = None
+    cavity.aact_pv_obj.snapshot.return_value = PVSnapshot("AACT", 0, 0, 0, 1.0)
+    ramp = fast_ramp(cavity, 0.1)
+    ramp.run(1, start=0)
+    # Only the first step's sample counted
+    assert ramp.interval == pytest.approx(0.004 * 0.8)
+    cavity.aact_pv_obj.get.assert_not_called()
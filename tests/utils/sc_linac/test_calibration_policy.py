@@ -0,0 +1,106 @@
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from sc_linac_physics.utils.epics.testing import make_mock_pv
+from sc_linac_physics.utils.sc_linac.calibration_policy import (
+    CalibrationPolicy,
+    record_characterization,
+    record_ssa_calibration,
+)
+from sc_linac_physics.utils.sc_linac.cavity_cache import CavityCache
+from sc_linac_physics.utils.sc_linac.linac_utils import (
+    CALIBRATION_COMPLETE_VALUE,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    yield CavityCache(tmp_path / "cache.sqlite")
+
+
+@pytest.fixture
+def cavity():
+    cavity = MagicMock()
+    cavity.cryomodule.name = "05"
+    cavity.number = 7
+    cavity.characterization_timestamp = (
+        datetime.now() - timedelta(hours=1)
+    ).replace(microsecond=0)
+    cavity.characterization_status = CALIBRATION_COMPLETE_VALUE
+    cavity.measured_loaded_q = 4.1e7
+    cavity.measured_scale_factor = 21.5
+    cavity.ssa.cavity = cavity
+    cavity.ssa.measured_slope = 3.2
+    # The saved drive max, which a calibration need not have used
+    cavity.ssa.drive_max = 0.9
+    cavity.ssa.max_fwd_pwr = 3500
+    cavity.ssa.current_slope_pv_obj = make_mock_pv(get_val=3.2)
+    yield cavity
+
+
+def test_nothing_cached(cavity, cache):
+    policy = CalibrationPolicy(cache=cache)
+    assert policy.reusable_characterization(cavity) is None
+    assert policy.reusable_ssa_calibration(cavity) is None
+    cavity.ssa.drive_max = 0.8
+    assert policy.ssa_drive_max(cavity) == 0.8
+
+
+def test_reuse_characterization(cavity, cache):
+    record_characterization(
+        cavity, cavity.characterization_timestamp, cache=cache
+    )
+    record = CalibrationPolicy(cache=cache).reusable_characterization(cavity)
+    assert record.loaded_q == 4.1e7
+    assert record.scale_factor == 21.5
+
+
+def test_characterization_superseded(cavity, cache):
+    record_characterization(
+        cavity, cavity.characterization_timestamp, cache=cache
+    )
+    cavity.characterization_timestamp += timedelta(minutes=5)
+    policy = CalibrationPolicy(cache=cache)
+    assert policy.reusable_characterization(cavity) is None
+
+
+def test_characterization_too_old(cavity, cache):
+    record_characterization(
+        cavity, cavity.characterization_timestamp, cache=cache
+    )
+    policy = CalibrationPolicy(characterization_max_age=1800, cache=cache)
+    assert policy.reusable_characterization(cavity) is None
+
+
+def test_reuse_ssa_calibration(cavity, cache):
+    record_ssa_calibration(cavity.ssa, 0.79, cache=cache)
+    policy = CalibrationPolicy(cache=cache)
+    assert policy.reusable_ssa_calibration(cavity).slope == 3.2
+
+    cavity.ssa.drive_max = 0.8
+    assert policy.ssa_drive_max(cavity) == 0.79
+
+    # Slope changed since, e.g. by a calibration from another tool
+    cavity.ssa.current_slope_pv_obj.get.return_value = 3.0
+    assert policy.reusable_ssa_calibration(cavity) is None
+
+
+def test_ssa_calibration_too_old(cavity, cache, monkeypatch):
+    record_ssa_calibration(cavity.ssa, 0.79, cache=cache)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 3600)
+    policy = CalibrationPolicy(ssa_calibration_max_age=1800, cache=cache)
+    assert policy.reusable_ssa_calibration(cavity) is None
+    # Nor does a stale calibration's drive max carry over
+    assert policy.ssa_drive_max(cavity) == 0.9
+
+
+def test_record_failure_logged(cavity, tmp_path):
+    (tmp_path / "cache.sqlite").mkdir()
+    record_ssa_calibration(
+        cavity.ssa, 0.79, cache=CavityCache(tmp_path / "cache.sqlite")
+    )
+    cavity.logger.warning.assert_called_once()
@@ -3,12 +3,13 @@ from random import randint, choice
 from unittest.mock import MagicMock, patch
 
 import pytest
-from lcls_tools.common.controls.pyepics.utils import (
+
+from sc_linac_physics.utils.epics import (
     EPICS_INVALID_VAL,
     EPICS_NO_ALARM_VAL,
+    PVSnapshot,
     make_mock_pv,
 )
-
 from sc_linac_physics.utils.sc_linac.cavity import Cavity
 from sc_linac_physics.utils.sc_linac.linac import MACHINE
 from sc_linac_physics.utils.sc_linac.linac_utils import (
@@ -484,21 +485,35 @@ def test_detune_in_chirp(cavity):
     assert cavity.detune == val
 
 
+def set_snapshot(pv_obj, value=0, severity=EPICS_NO_ALARM_VAL):
+    """Make value and severity pv_obj's monitored sample"""
+    pv_obj.snapshot.side_effect = None
+    pv_obj.snapshot.return_value = PVSnapshot(
+        pv_obj.pvname, value, severity, EPICS_NO_ALARM_VAL, None
+    )
+
+
+def make_snapshot_pv(value=0, severity=EPICS_NO_ALARM_VAL):
+    pv_obj = make_mock_pv(get_val=value, severity=severity)
+    set_snapshot(pv_obj, value, severity)
+    return pv_obj
+
+
 def test_detune_invalid(cavity):
-    cavity._detune_best_pv_obj = make_mock_pv(severity=EPICS_INVALID_VAL)
+    cavity._detune_best_pv_obj = make_snapshot_pv(severity=EPICS_INVALID_VAL)
     cavity._rf_mode_pv_obj = make_mock_pv(get_val=RF_MODE_SELA)
     assert cavity.detune_invalid
 
-    cavity._detune_best_pv_obj.severity = EPICS_NO_ALARM_VAL
+    set_snapshot(cavity._detune_best_pv_obj, severity=EPICS_NO_ALARM_VAL)
     assert not cavity.detune_invalid
 
 
 def test_detune_invalid_chirp(cavity):
-    cavity._detune_chirp_pv_obj = make_mock_pv(severity=EPICS_INVALID_VAL)
+    cavity._detune_chirp_pv_obj = make_snapshot_pv(severity=EPICS_INVALID_VAL)
     cavity._rf_mode_pv_obj = make_mock_pv(get_val=RF_MODE_CHIRP)
     assert cavity.detune_invalid
 
-    cavity._detune_chirp_pv_obj.severity = EPICS_NO_ALARM_VAL
+    set_snapshot(cavity._detune_chirp_pv_obj, severity=EPICS_NO_ALARM_VAL)
     assert not cavity.detune_invalid
 
 
@@ -507,7 +522,7 @@ def test__auto_tune_invalid(cavity):
     TODO figure out how to test the guts when detune > tolerance
     """
     cavity._rf_mode_pv_obj = make_mock_pv(get_val=RF_MODE_CHIRP)
-    cavity._detune_chirp_pv_obj = make_mock_pv(severity=EPICS_INVALID_VAL)
+    cavity._detune_chirp_pv_obj = make_snapshot_pv(severity=EPICS_INVALID_VAL)
 
     # delta_hz_func argument is unnecessary
     with pytest.raises(DetuneError):
@@ -531,7 +546,7 @@ class MockDetune:
 
 def test__auto_tune_out_of_tol(cavity):
     cavity._rf_mode_pv_obj = make_mock_pv(get_val=RF_MODE_CHIRP)
-    cavity._detune_chirp_pv_obj = make_mock_pv(severity=EPICS_NO_ALARM_VAL)
+    cavity._detune_chirp_pv_obj = make_snapshot_pv()
     cavity.stepper_tuner.move = MagicMock()
     cavity._tune_config_pv_obj = make_mock_pv(get_val=HW_MODE_ONLINE_VALUE)
     mock_detune = MockDetune()
@@ -542,7 +557,7 @@ def test__auto_tune_out_of_tol(cavity):
 
 def test_check_detune(cavity):
     cavity._rf_mode_pv_obj = make_mock_pv(get_val=RF_MODE_CHIRP)
-    cavity._detune_chirp_pv_obj = make_mock_pv(severity=EPICS_INVALID_VAL)
+    cavity._detune_chirp_pv_obj = make_snapshot_pv(severity=EPICS_INVALID_VAL)
     cavity._chirp_freq_start_pv_obj = make_mock_pv(
         cavity.chirp_freq_start_pv, get_val=50000
     )
@@ -553,7 +568,7 @@ def test_check_detune(cavity):
 
 def test_check_detune_sela(cavity):
     cavity._rf_mode_pv_obj = make_mock_pv(get_val=RF_MODE_SELA)
-    cavity._detune_best_pv_obj = make_mock_pv(severity=EPICS_INVALID_VAL)
+    cavity._detune_best_pv_obj = make_snapshot_pv(severity=EPICS_INVALID_VAL)
     with pytest.raises(DetuneError):
         cavity.check_detune()
 
@@ -656,6 +671,34 @@ def test_setup_rf(cavity):
     cavity.ssa.calibrate.assert_called()
 
 
+def test_setup_rf_reuses_calibration(cavity):
+    cavity.turn_off = MagicMock()
+    cavity.ssa.calibrate = MagicMock()
+    cavity.ssa.turn_on = MagicMock()
+    cavity._ades_max_pv_obj = make_mock_pv(get_val=21)
+    cavity.move_to_resonance = MagicMock()
+    cavity.characterize = MagicMock()
+    cavity.calculate_probe_q = MagicMock()
+    cavity.reset_data_decimation = MagicMock()
+    cavity.check_abort = MagicMock()
+    cavity._ades_pv_obj = make_mock_pv(get_val=5)
+    cavity.set_sel_mode = MagicMock()
+    cavity.piezo.enable_feedback = MagicMock()
+    cavity.set_sela_mode = MagicMock()
+    cavity.walk_amp = MagicMock()
+    policy = MagicMock()
+
+    cavity.setup_rf(5, policy=policy)
+    cavity.ssa.calibrate.assert_not_called()
+    cavity.ssa.turn_on.assert_called()
+    cavity.characterize.assert_called_with(policy)
+
+    policy.reusable_ssa_calibration.return_value = None
+    policy.ssa_drive_max.return_value = 0.77
+    cavity.setup_rf(5, policy=policy)
+    cavity.ssa.calibrate.assert_called_with(0.77)
+
+
 def test_reset_data_decimation(cavity):
     cavity._cw_data_decim_pv_obj = make_mock_pv()
     cavity._pulsed_data_decim_pv_obj = make_mock_pv()
@@ -698,7 +741,7 @@ def test_setup_tuning_not_sela(cavity):
 def test_find_chirp_range_valid(cavity):
     cavity.set_chirp_range = MagicMock()
     cavity._rf_mode_pv_obj = make_mock_pv(get_val=RF_MODE_CHIRP)
-    cavity._detune_chirp_pv_obj = make_mock_pv(severity=EPICS_NO_ALARM_VAL)
+    cavity._detune_chirp_pv_obj = make_snapshot_pv()
 
     cavity.find_chirp_range(50000)
     cavity.set_chirp_range.assert_called_with(50000)
@@ -779,6 +822,21 @@ def test_characterize_recent(cavity):
     cavity.finish_characterization.assert_called()
 
 
+def test_characterize_cached(cavity):
+    cavity.reset_interlocks = MagicMock()
+    cavity._drive_level_pv_obj = make_mock_pv()
+    char_time = (datetime.now() - timedelta(hours=1)).strftime(
+        "%Y-%m-%d-%H:%M:%S"
+    )
+    cavity._char_timestamp_pv_obj = make_mock_pv(get_val=char_time)
+    cavity.finish_characterization = MagicMock()
+    cavity.start_characterization = MagicMock()
+
+    cavity.characterize(policy=MagicMock())
+    cavity.start_characterization.assert_not_called()
+    cavity.finish_characterization.assert_called_with()
+
+
 def test_finish_characterization(cavity):
     cavity._measured_loaded_q_pv_obj = make_mock_pv(
         get_val=randint(
@@ -806,14 +864,14 @@ def test_finish_characterization(cavity):
 
 def test_walk_amp_quench(cavity):
     cavity._ades_pv_obj = make_mock_pv(get_val=0)
-    cavity._quench_latch_pv_obj = make_mock_pv(get_val=1)
+    cavity._quench_latch_pv_obj = make_snapshot_pv(value=1)
     cavity._ades_pv_obj = make_mock_pv(get_val=16)
     with pytest.raises(QuenchError):
         cavity.walk_amp(des_amp=16.6, step_size=0.1)
 
 
 def test_walk_amp(cavity):
-    cavity._quench_latch_pv_obj = make_mock_pv(get_val=0)
+    cavity._quench_latch_pv_obj = make_snapshot_pv(value=0)
     cavity._ades_pv_obj = make_mock_pv(get_val=16.05)
     cavity.walk_amp(16.1, 0.1)
     cavity._ades_pv_obj.put.assert_called_with(16.1)
@@ -822,3 +880,24 @@ def test_walk_amp(cavity):
 def test_is_offline(cavity):
     cavity._hw_mode_pv_obj = make_mock_pv(get_val=HW_MODE_OFFLINE_VALUE)
     assert cavity.is_offline
+
+
+def test_status_publisher(cavity):
+    cavity._status_msg_pv_obj = make_mock_pv()
+    cavity._progress_pv_obj = make_mock_pv()
+    cavity.status_publisher = MagicMock()
+
+    cavity.set_status_message("Waiting for characterization to complete")
+    cavity.progress = 60
+    cavity.status_publisher.publish.assert_any_call(
+        cavity._status_msg_pv_obj,
+        "Waiting for characterization to complete",
+        cavity.logger,
+    )
+    cavity.status_publisher.publish.assert_called_with(
+        cavity._progress_pv_obj, 60, cavity.logger
+    )
+    cavity._status_msg_pv_obj.put.assert_not_called()
+
+    cavity.status_publisher.get.return_value = 60
+    assert cavity.progress == 60
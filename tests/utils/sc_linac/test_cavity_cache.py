@@ -0,0 +1,51 @@
+from datetime import datetime
+
+import pytest
+
+from sc_linac_physics.utils.sc_linac.cavity_cache import CavityCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    yield CavityCache(tmp_path / "cache.sqlite")
+
+
+def test_default_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("SC_LINAC_CACHE_DIR", str(tmp_path))
+    assert CavityCache().path == tmp_path / "cavity_cache.sqlite"
+
+
+def test_tuner_scale(cache):
+    assert cache.tuner_scale("H1", 5) is None
+    cache.save_tuner_scale("H1", 5, 0.07)
+    cache.save_tuner_scale("H1", 5, 0.08)
+    cache.save_tuner_scale("H2", 5, 0.09)
+    assert cache.tuner_scale("H1", 5) == 0.08
+    assert CavityCache(cache.path).tuner_scale("H2", 5) == 0.09
+
+
+def test_unreadable_is_miss(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    path.write_text("not a database")
+    assert CavityCache(path).tuner_scale("01", 1) is None
+
+
+def test_characterization(cache):
+    assert cache.characterization("01", 2) is None
+    ioc_timestamp = datetime(2024, 5, 1, 12, 30, 5)
+    cache.save_characterization("01", 2, 4.1e7, 21.5, ioc_timestamp)
+    record = cache.characterization("01", 2)
+    assert record.loaded_q == 4.1e7
+    assert record.scale_factor == 21.5
+    assert record.ioc_timestamp == ioc_timestamp
+
+
+def test_ssa_calibration(cache):
+    assert cache.ssa_calibration("01", 2) is None
+    cache.save_ssa_calibration("01", 2, 3.2, 0.79, 3500)
+    record = cache.ssa_calibration("01", 2)
+    assert (record.slope, record.drive_max, record.max_fwd_pwr) == (
+        3.2,
+        0.79,
+        3500,
+    )
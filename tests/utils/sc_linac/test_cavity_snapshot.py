@@ -0,0 +1,143 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from sc_linac_physics.utils.epics import EPICS_INVALID_VAL, PV
+from sc_linac_physics.utils.epics.snapshot import (
+    empty_snapshot_records,
+    fill_snapshot_record,
+)
+from sc_linac_physics.utils.epics.testing import make_mock_pv
+from sc_linac_physics.utils.sc_linac import linac_utils
+from sc_linac_physics.utils.sc_linac.cavity_snapshot import (
+    DEFAULT_SNAPSHOT_FIELDS,
+    CavitySnapshot,
+)
+from sc_linac_physics.utils.sc_linac.linac import Machine
+
+
+def fake_snapshot_many(pvs, timeout=None):
+    records = empty_snapshot_records(len(pvs))
+    for index, pv in enumerate(pvs):
+        snap = pv.snapshot()
+        fill_snapshot_record(
+            records, index, snap.value, snap.severity, snap.status, None
+        )
+    return records
+
+
+@pytest.fixture
+def snapshot_many(monkeypatch):
+    fake = MagicMock(side_effect=fake_snapshot_many)
+    monkeypatch.setattr(PV, "snapshot_many", fake)
+    yield fake
+
+
+@pytest.fixture
+def batch_create(monkeypatch):
+    fake = MagicMock(
+        side_effect=lambda names, **kwargs: [make_mock_pv(n) for n in names]
+    )
+    monkeypatch.setattr(PV, "batch_create", fake)
+    yield fake
+
+
+@pytest.fixture
+def cavities():
+    machine = Machine(lazy=True)
+    cavities = list(machine.cryomodules["01"].cavities.values())[:3]
+    for cavity in cavities:
+        for field in DEFAULT_SNAPSHOT_FIELDS:
+            setattr(cavity, f"_{field}_pv_obj", make_mock_pv(get_val=0))
+    yield cavities
+
+
+def set_value(cavity, field, value, severity=0):
+    pv = getattr(cavity, f"{field}_pv_obj")
+    pv.get.return_value = value
+    pv.severity = severity
+
+
+def test_records(cavities, snapshot_many):
+    set_value(cavities[1], "ades", 16.6)
+    snap = CavitySnapshot.take(cavities)
+
+    snapshot_many.assert_called_once()
+    assert len(snapshot_many.call_args.args[0]) == 3 * len(
+        DEFAULT_SNAPSHOT_FIELDS
+    )
+    assert len(snap) == 3
+    assert snap.records["cryomodule"].tolist() == ["01", "01", "01"]
+    assert snap.records["cavity"].tolist() == [1, 2, 3]
+    assert snap["ades"].tolist() == [0, 16.6, 0]
+    assert snap.fields == list(DEFAULT_SNAPSHOT_FIELDS)
+    assert snap.columns()["ades"] is not None
+
+
+def test_masks(cavities, snapshot_many):
+    for cavity in cavities:
+        set_value(cavity, "rf_state", 1)
+        set_value(cavity, "rf_mode", linac_utils.RF_MODE_SELA)
+    set_value(cavities[0], "hw_mode", linac_utils.HW_MODE_OFFLINE_VALUE)
+    set_value(cavities[2], "rf_mode", linac_utils.RF_MODE_CHIRP)
+    set_value(cavities[1], "quench_latch", 1)
+
+    snap = CavitySnapshot.take(cavities)
+
+    assert snap.online.tolist() == [False, True, True]
+    assert snap.offline.tolist() == [True, False, False]
+    assert snap.select(snap.online & snap.on & snap.sela) == [cavities[1]]
+    assert snap.select(snap.quenched) == [cavities[1]]
+    assert snap.select(snap.chirp) == [cavities[2]]
+
+
+def test_invalid_excluded(cavities, snapshot_many):
+    set_value(cavities[0], "quench_latch", 1, severity=EPICS_INVALID_VAL)
+    set_value(cavities[1], "quench_latch", 1)
+
+    snap = CavitySnapshot.take(cavities)
+
+    assert snap.valid("quench_latch").tolist() == [False, True, True]
+    assert snap["quench_latch_severity"][0] == EPICS_INVALID_VAL
+    assert snap.select(snap.quenched) == [cavities[1]]
+
+
+def test_detune(cavities, snapshot_many):
+    for cavity in cavities:
+        set_value(cavity, "detune_best", 10)
+        set_value(cavity, "detune_chirp", 20)
+    set_value(cavities[1], "rf_mode", linac_utils.RF_MODE_CHIRP)
+    set_value(cavities[2], "detune_best", 10, severity=EPICS_INVALID_VAL)
+
+    detune = CavitySnapshot.take(cavities).detune
+
+    assert detune[:2].tolist() == [10, 20]
+    assert np.isnan(detune[2])
+
+
+def test_creates_missing_pvs_once(snapshot_many, batch_create):
+    cavity = Machine(lazy=True).cryomodules["02"].cavities[4]
+
+    CavitySnapshot.take([cavity], ["ades", "aact"])
+
+    batch_create.assert_called_once()
+    assert batch_create.call_args.args[0] == [
+        "ACCL:L1B:0240:ADES",
+        "ACCL:L1B:0240:AACTMEAN",
+    ]
+    assert cavity.ades_pv_obj.pvname == "ACCL:L1B:0240:ADES"
+
+    CavitySnapshot.take([cavity], ["ades", "aact"])
+    batch_create.assert_called_once()
+
+
+def test_machine_snapshot(snapshot_many, batch_create):
+    snap = Machine(lazy=True).snapshot(fields=["hw_mode"])
+
+    assert len(snap) == len(linac_utils.ALL_CRYOMODULES) * 8
+    assert snap.records["cryomodule"][0] == "01"
+    assert snap.records["cryomodule"][-1] == "H2"
+    assert snap.fields == ["hw_mode"]
+    batch_create.assert_called_once()
+    snapshot_many.assert_called_once()
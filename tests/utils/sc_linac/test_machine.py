@@ -22,3 +22,49 @@ def test_linac_names(machine):
 def test_cryomodules(machine):
     for cm_name in ALL_CRYOMODULES:
         assert cm_name in machine.cryomodules
+
+
+@pytest.fixture
+def lazy_machine():
+    yield Machine(lazy=True)
+
+
+def test_lazy_builds_nothing_up_front(lazy_machine):
+    assert len(lazy_machine.cryomodules) == len(ALL_CRYOMODULES)
+    assert lazy_machine.cryomodules.built == []
+    for linac in lazy_machine.linacs:
+        assert linac.cryomodules.built == []
+
+
+def test_lazy_builds_on_access(lazy_machine):
+    cm = lazy_machine.cryomodules["02"]
+
+    assert lazy_machine.cryomodules.built == ["02"]
+    assert lazy_machine.linacs[1].cryomodules["02"] is cm
+    assert lazy_machine.cryomodules["02"] is cm
+    assert cm.cavities[1].cryomodule is cm
+
+
+def test_lazy_iterator_order_matches_eager(machine, lazy_machine):
+    eager = [str(cavity) for cavity in machine.all_iterator]
+    lazy_iterator = lazy_machine.all_iterator
+
+    first = next(lazy_iterator)
+    assert str(first) == eager[0]
+    assert lazy_machine.cryomodules.built == ["01"]
+    assert [str(first)] + [str(cavity) for cavity in lazy_iterator] == eager
+
+
+def test_slotted_objects(machine):
+    cavity = machine.cryomodules["02"].cavities[1]
+    for obj in (cavity, cavity.ssa, cavity.stepper_tuner, cavity.piezo):
+        assert vars(obj) == {}
+    assert cavity.number == 1
+    assert cavity.rack.rack_name == "A"
+
+
+def test_slotted_objects_accept_new_attributes(machine):
+    cavity = machine.cryomodules["02"].cavities[1]
+    cavity.extra = 1
+    assert vars(cavity) == {"extra": 1}
+    assert cavity.ades_pv == "ACCL:L1B:0210:ADES"
@@ -0,0 +1,179 @@
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from sc_linac_physics.utils.sc_linac.linac import Machine
+from sc_linac_physics.utils.sc_linac.linac_utils import CavityAbortError
+from sc_linac_physics.utils.sc_linac.procedure_executor import (
+    ABORTED,
+    DONE,
+    FAILED,
+    SKIPPED,
+    ProcedureExecutor,
+    rack_key,
+    ssa_key,
+)
+
+
+@pytest.fixture(scope="module")
+def machine():
+    yield Machine(lazy=True)
+
+
+class Tracker:
+    """Procedure recording which resources are in use at the same time"""
+
+    def __init__(self, duration=0.05):
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.active = Counter()
+        self.max_active = Counter()
+
+    def __call__(self, cavity, value=None):
+        keys = ["all", rack_key(cavity), ssa_key(cavity)]
+        with self.lock:
+            for key in keys:
+                self.active[key] += 1
+                self.max_active[key] = max(
+                    self.max_active[key], self.active[key]
+                )
+        time.sleep(self.duration)
+        with self.lock:
+            for key in keys:
+                self.active[key] -= 1
+        return value or cavity.number
+
+
+def test_ssa_key_hl(machine):
+    cavities = machine.cryomodules["H1"].cavities
+    assert ssa_key(cavities[1]) == ssa_key(cavities[5]) == ("H1", 1)
+    assert ssa_key(cavities[4]) == ssa_key(cavities[8]) != ssa_key(cavities[3])
+    assert ssa_key(machine.cryomodules["01"].cavities[5]) == ("01", 5)
+
+
+def test_run(machine):
+    cavities = list(machine.cryomodules["01"].cavities.values())
+    tracker = Tracker()
+    results = ProcedureExecutor(max_workers=8, rack_limit=2).run(
+        cavities, tracker
+    )
+
+    assert [result.cavity for result in results] == cavities
+    assert [result.state for result in results] == [DONE] * 8
+    assert [result.value for result in results] == list(range(1, 9))
+    assert tracker.max_active["all"] == 4
+    assert tracker.max_active[("01", "A")] == 2
+    assert tracker.max_active[("01", "B")] == 2
+
+
+def test_no_rack_limit_by_default(machine):
+    tracker = Tracker()
+    ProcedureExecutor().run(
+        machine.cryomodules["09"].cavities.values(), tracker
+    )
+    assert tracker.max_active["all"] == 8
+
+
+def test_blocked_cavities_do_not_hold_workers(machine):
+    # Cryomodule order puts each rack's cavities together: workers taking
+    # them in order would wait on the rack limit instead of running the
+    # other cryomodule's cavities
+    cavities = [
+        *machine.cryomodules["07"].cavities.values(),
+        *machine.cryomodules["08"].cavities.values(),
+    ]
+    tracker = Tracker(0.1)
+    start = time.monotonic()
+    results = ProcedureExecutor(max_workers=8, rack_limit=2).run(
+        cavities, tracker
+    )
+
+    assert all(result.state == DONE for result in results)
+    assert tracker.max_active["all"] == 8
+    # Two rounds of 8
+    assert time.monotonic() - start < 0.35
+
+
+def test_passes_arguments(machine):
+    cavities = list(machine.cryomodules["02"].cavities.values())[:2]
+    results = ProcedureExecutor().run(cavities, Tracker(0), value=16)
+    assert [result.value for result in results] == [16, 16]
+
+
+def test_hl_shared_ssa_serialized(machine):
+    tracker = Tracker()
+    results = ProcedureExecutor(rack_limit=4).run(
+        machine.cryomodules["H2"].cavities.values(), tracker
+    )
+
+    assert all(result.state == DONE for result in results)
+    assert tracker.max_active["all"] == 4
+    assert all(tracker.max_active[("H2", ssa)] == 1 for ssa in range(1, 5))
+
+
+def test_failure_captured(machine):
+    cavities = list(machine.cryomodules["03"].cavities.values())[:3]
+
+    def procedure(cavity):
+        if cavity.number == 2:
+            raise ValueError("bad cavity")
+
+    results = ProcedureExecutor().run(cavities, procedure)
+
+    assert [result.state for result in results] == [DONE, FAILED, DONE]
+    assert isinstance(results[1].error, ValueError)
+
+
+def test_abort(machine):
+    cavities = list(machine.cryomodules["04"].cavities.values())[:4]
+    abort_events = {cavity.number: threading.Event() for cavity in cavities}
+    started = threading.Semaphore(0)
+
+    def procedure(cavity):
+        started.release()
+        if abort_events[cavity.number].wait(timeout=5):
+            raise CavityAbortError(f"Abort requested for {cavity}")
+
+    executor = ProcedureExecutor(
+        max_workers=2,
+        abort_cavity=lambda cavity: abort_events[cavity.number].set(),
+    )
+    results = []
+    runner = threading.Thread(
+        target=lambda: results.extend(executor.run(cavities, procedure))
+    )
+    runner.start()
+    assert started.acquire(timeout=5) and started.acquire(timeout=5)
+    executor.abort()
+    runner.join(timeout=5)
+
+    assert executor.aborted
+    assert [result.state for result in results] == [ABORTED] * 2 + [SKIPPED] * 2
+
+
+def test_stop_on_error(machine):
+    cavities = list(machine.cryomodules["05"].cavities.values())[:3]
+
+    def procedure(cavity):
+        if cavity.number == 1:
+            raise ValueError("bad cavity")
+
+    executor = ProcedureExecutor(max_workers=1, stop_on_error=True)
+    results = executor.run(cavities, procedure)
+
+    assert [result.state for result in results] == [FAILED, SKIPPED, SKIPPED]
+
+
+def test_progress(machine):
+    cavities = list(machine.cryomodules["06"].cavities.values())
+    updates = []
+    executor = ProcedureExecutor(on_progress=updates.append)
+    executor.run(cavities, Tracker(0))
+
+    assert len(updates) == 2 * len(cavities)
+    assert updates[-1].counts == {DONE: 8}
+    assert updates[-1].fraction == 1.0
+    assert executor.progress.finished == 8
+    assert executor.progress.running == ()
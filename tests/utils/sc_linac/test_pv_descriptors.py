@@ -0,0 +1,126 @@
+import sys
+from random import randint
+from unittest.mock import MagicMock
+
+import pytest
+from lcls_tools.common.controls.pyepics.utils import make_mock_pv
+
+from sc_linac_physics.utils.sc_linac.linac_utils import SCLinacObject
+from sc_linac_physics.utils.sc_linac.pv_descriptors import (
+    pv_name,
+    pv_property,
+    pv_value,
+)
+
+
+class Device(SCLinacObject):
+    ades_pv_obj = pv_property("ADES")
+    status_pv_obj = pv_property("STATUS", addr="auto_pv_addr")
+    timeout_pv_obj = pv_property("SLOW", connection_timeout=10)
+    decim_pv_obj = pv_property(
+        "ACQ_DECIM_SEL.A", name="decimation_pv", slot="_decim_pv_obj"
+    )
+    shared_pv_obj = pv_property()
+    waveform_pv = pv_name("CAV:AWF")
+
+    ades = pv_value("ades_pv_obj")
+    requested = pv_value("status_pv_obj", bool)
+    readback = pv_value("ades_pv_obj", writable=False)
+
+    def __init__(self):
+        super().__init__()
+        self.shared_pv = "ACCL:L1B:0100:SHARED"
+
+    @property
+    def pv_prefix(self):
+        return "ACCL:L1B:0110:"
+
+
+@pytest.fixture
+def fake_pv(monkeypatch):
+    factory = MagicMock(side_effect=lambda name, **kwargs: make_mock_pv())
+    monkeypatch.setattr(sys.modules[__name__], "PV", factory, raising=False)
+    yield factory
+
+
+def test_pv_name():
+    device = Device()
+    assert device.ades_pv == "ACCL:L1B:0110:ADES"
+    assert device.status_pv == "ACCL:L1B:0110:AUTO:STATUS"
+    assert device.waveform_pv == "ACCL:L1B:0110:CAV:AWF"
+    assert device.decimation_pv == "ACCL:L1B:0110:ACQ_DECIM_SEL.A"
+
+
+def test_pv_name_override():
+    device = Device()
+    device.ades_pv = "OTHER:ADES"
+    assert device.ades_pv == "OTHER:ADES"
+    assert Device().ades_pv == "ACCL:L1B:0110:ADES"
+
+
+def test_created_lazily(fake_pv):
+    device = Device()
+    assert device._ades_pv_obj is None
+    assert "_ades_pv_obj" not in vars(device)
+
+    pv = device.ades_pv_obj
+    fake_pv.assert_called_once_with("ACCL:L1B:0110:ADES")
+    assert device.ades_pv_obj is pv
+    assert device._ades_pv_obj is pv
+    fake_pv.assert_called_once()
+
+
+def test_injected_pv(fake_pv):
+    device = Device()
+    mock_pv = make_mock_pv()
+    device._decim_pv_obj = mock_pv
+    assert device.decim_pv_obj is mock_pv
+    fake_pv.assert_not_called()
+
+
+def test_assign_pv(fake_pv):
+    device = Device()
+    mock_pv = make_mock_pv()
+    device.ades_pv_obj = mock_pv
+    assert device._ades_pv_obj is mock_pv
+    assert device.ades_pv_obj is mock_pv
+
+
+def test_pv_kwargs(fake_pv):
+    Device().timeout_pv_obj
+    fake_pv.assert_called_once_with("ACCL:L1B:0110:SLOW", connection_timeout=10)
+
+
+def test_name_from_instance(fake_pv):
+    Device().shared_pv_obj
+    fake_pv.assert_called_once_with("ACCL:L1B:0100:SHARED")
+
+
+def test_pv_value(fake_pv):
+    device = Device()
+    val = randint(1, 20)
+    device._ades_pv_obj = make_mock_pv(get_val=val)
+    assert device.ades == val
+    assert device.readback == val
+
+    device.ades = val + 1
+    device._ades_pv_obj.put.assert_called_once_with(val + 1)
+
+
+def test_pv_value_cast(fake_pv):
+    device = Device()
+    device._status_pv_obj = make_mock_pv(get_val=1)
+    assert device.requested is True
+
+
+def test_pv_value_read_only(fake_pv):
+    device = Device()
+    device._ades_pv_obj = make_mock_pv()
+    with pytest.raises(AttributeError):
+        device.readback = 5
+    device._ades_pv_obj.put.assert_not_called()
+
+
+def test_instance_dict():
+    device = Device()
+    assert set(vars(device)) == {"shared_pv"}
@@ -0,0 +1,147 @@
+import pytest
+
+from sc_linac_physics.utils.sc_linac.cavity import Cavity
+from sc_linac_physics.utils.sc_linac.linac import Machine
+from sc_linac_physics.utils.sc_linac.linac_utils import ALL_CRYOMODULES
+from sc_linac_physics.utils.sc_linac.pv_descriptors import pv_name
+from sc_linac_physics.utils.sc_linac.pv_table import (
+    PVNameRow,
+    PVNameTable,
+    TABLE_VERSION,
+)
+
+
+@pytest.fixture(scope="module")
+def machine():
+    yield Machine()
+
+
+@pytest.fixture(scope="module")
+def table(machine):
+    yield PVNameTable.from_machine(machine)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SC_LINAC_CACHE_DIR", str(tmp_path))
+    yield tmp_path
+
+
+def test_query_by_location_and_suffix(table):
+    ades = table.names(linac="L2B", suffix="ADES")
+    assert len(ades) == 12 * 8
+    assert ades[0] == "ACCL:L2B:0410:ADES"
+    assert all(name.startswith("ACCL:L2B:") for name in ades)
+
+
+def test_query_multiple_values(table):
+    names = table.names(cryomodule="01", cavity=1, suffix=["ADES", "ACON"])
+    assert names == ["ACCL:L0B:0110:ADES", "ACCL:L0B:0110:ACON"]
+
+
+def test_matches_objects(machine, table):
+    cavity = machine.cryomodules["H2"].cavities[5]
+    (row,) = table.rows(cryomodule="H2", cavity=5, attr="ades_pv")
+    assert row == PVNameRow(
+        linac="L1B",
+        cryomodule="H2",
+        rack="B",
+        subsystem="cavity",
+        source="Cavity",
+        attr="ades_pv",
+        suffix="ADES",
+        prefix=cavity.pv_prefix,
+        cavity=5,
+        pvname=cavity.ades_pv,
+    )
+
+    # HL SSA controls live under the SSA shared with another cavity
+    ssa = table.names(
+        cryomodule="H2", cavity=5, subsystem="ssa", attr="status_pv"
+    )
+    assert ssa == [cavity.ssa.status_pv] == ["ACCL:L1B:H210:SSA:StatusMsg"]
+
+
+def test_machine_and_linac_rows(table):
+    assert table.names(subsystem="machine") == ["CHTR:CM00:0:HTR_POWER_TOT"]
+    assert table.names(subsystem="linac", attr="aact_mean_sum_pv") == [
+        f"ACCL:L{i}B:1:AACTMEANSUM" for i in range(4)
+    ]
+
+
+def test_lookup(table):
+    prefixes = table.lookup(("cryomodule", "cavity"), "prefix", subsystem="ssa")
+    assert len(prefixes) == len(ALL_CRYOMODULES) * 8
+    assert prefixes[("03", 2)] == "ACCL:L1B:0320:SSA:"
+
+
+def test_unique(table):
+    assert table.unique("prefix", subsystem="rfs", cryomodule="01") == [
+        "ACCL:L0B:0100:RFS1A:",
+        "ACCL:L0B:0100:RFS2A:",
+        "ACCL:L0B:0100:RFS1B:",
+        "ACCL:L0B:0100:RFS2B:",
+    ]
+    assert table.unique("cryomodule", linac="L0B", subsystem="cavity") == ["01"]
+
+
+def test_no_magnets_on_hl(table):
+    assert (
+        table.names(cryomodule="H1", subsystem=["quad", "xcor", "ycor"]) == []
+    )
+
+
+def test_unknown_value_and_column(table):
+    assert table.names(suffix="NOT_A_SUFFIX") == []
+    with pytest.raises(KeyError):
+        table.names(sector="L2B")
+
+
+def test_names_interned(machine, table):
+    (name,) = table.names(cryomodule="01", cavity=1, suffix="ADES")
+    assert name is table.names(suffix="ADES")[0]
+
+
+def test_save_load(table, tmp_path):
+    path = tmp_path / "table.npz"
+    table.save(path)
+    loaded = PVNameTable.load(path)
+    assert list(loaded) == list(table)
+    assert loaded.names(linac="L3B", suffix="GACT") == table.names(
+        linac="L3B", suffix="GACT"
+    )
+
+
+def test_load_rejects_other_version(table, tmp_path, monkeypatch):
+    path = tmp_path / "table.npz"
+    monkeypatch.setattr(
+        "sc_linac_physics.utils.sc_linac.pv_table.TABLE_VERSION",
+        TABLE_VERSION + 1,
+    )
+    table.save(path)
+    monkeypatch.undo()
+    with pytest.raises(ValueError):
+        PVNameTable.load(path)
+
+
+def test_for_machine_caches(cache_dir):
+    table = PVNameTable.for_machine(Machine(lazy=True))
+    (path,) = cache_dir.glob("pv_table_*.npz")
+
+    lazy_machine = Machine(lazy=True)
+    assert lazy_machine.pv_table.pvnames == table.pvnames
+    assert lazy_machine.cryomodules.built == []
+    assert list(cache_dir.glob("pv_table_*.npz")) == [path]
+
+
+def test_for_machine_keyed_by_classes(cache_dir):
+    class HeaterCavity(Cavity):
+        __slots__ = ()
+        heater_pv = pv_name("HTR")
+
+    table = Machine(cavity_class=HeaterCavity, lazy=True).pv_table
+    assert table.names(cryomodule="01", cavity=3, attr="heater_pv") == [
+        "ACCL:L0B:0130:HTR"
+    ]
+    assert Machine(lazy=True).pv_table.names(attr="heater_pv") == []
+    assert len(list(cache_dir.glob("pv_table_*.npz"))) == 2
@@ -112,13 +112,19 @@ def test_calibrate_low_drive(ssa):
         ssa.calibrate(uniform(0, 0.3))
 
 
-def test_calibrate(ssa):
+def test_calibrate(ssa, monkeypatch):
     ssa.run_calibration = MagicMock()
     ssa._drive_max_setpoint_pv_obj = make_mock_pv()
+    record = MagicMock()
+    monkeypatch.setattr(
+        "sc_linac_physics.utils.sc_linac.ssa.record_ssa_calibration", record
+    )
     drive = uniform(0.5, 1)
     ssa.calibrate(drive)
     ssa._drive_max_setpoint_pv_obj.put.assert_called_with(drive)
     ssa.run_calibration.assert_called()
+    # The drive max that calibrated, not the saved one
+    record.assert_called_once_with(ssa, drive)
 
 
 def test_ps_volt_setpoint2_pv_obj(ssa):
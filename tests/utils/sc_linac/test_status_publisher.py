@@ -0,0 +1,66 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from sc_linac_physics.utils.epics.testing import make_mock_pv
+from sc_linac_physics.utils.sc_linac.status_publisher import StatusPublisher
+
+
+@pytest.fixture
+def publisher():
+    yield StatusPublisher(interval=0.05)
+
+
+def test_publish(publisher):
+    pv = make_mock_pv()
+    publisher.publish(pv, "Turning cavity on")
+    assert publisher.flush(timeout=1)
+    pv.put.assert_called_once_with("Turning cavity on", wait=False)
+
+
+def test_coalesces(publisher):
+    pv = make_mock_pv()
+    for i in range(100):
+        publisher.publish(pv, f"Motor still moving ({i})")
+    assert publisher.flush(timeout=1)
+    assert pv.put.call_count < 10
+    assert pv.put.call_args.args == ("Motor still moving (99)",)
+
+
+def test_does_not_wait_on_put(publisher):
+    release = threading.Event()
+    pv = make_mock_pv()
+    pv.put.side_effect = lambda value, **kwargs: release.wait(1)
+    publisher.publish(pv, 1)
+    publisher.publish(pv, 2)
+    assert publisher.get(pv) == 2
+    assert not publisher.flush(timeout=0.01)
+    release.set()
+    assert publisher.flush(timeout=1)
+    assert pv.put.call_args.args == (2,)
+
+
+def test_get_published(publisher):
+    pv = make_mock_pv(get_val=3)
+    assert publisher.get(pv) == 3
+
+
+def test_failure_logged(publisher):
+    pv = make_mock_pv()
+    pv.put.side_effect = TimeoutError("put timed out")
+    logger = MagicMock()
+    publisher.publish(pv, 50, logger)
+    assert publisher.flush(timeout=1)
+    logger.warning.assert_called_once()
+
+
+def test_failure_isolated(publisher):
+    failing, working = make_mock_pv(), make_mock_pv()
+    failing.put.side_effect = TimeoutError("put timed out")
+    logger = MagicMock()
+    publisher.publish(failing, "Tuning", logger)
+    publisher.publish(working, 40, logger)
+    assert publisher.flush(timeout=1)
+    working.put.assert_called_once_with(40, wait=False)
+    logger.warning.assert_called_once()
@@ -164,7 +164,8 @@ def test_move(stepper):
 def test_issue_move_command(stepper):
     stepper.cavity.rack.cryomodule.is_harmonic_linearizer = False
     stepper.move_positive = MagicMock()
-    stepper._motor_moving_pv_obj = make_mock_pv(get_val=0)
+    stepper._motor_moving_pv_obj = make_mock_pv()
+    stepper._motor_moving_pv_obj.get.side_effect = [1, 0]
     stepper._limit_switch_a_pv_obj = make_mock_pv(get_val=0)
     stepper._limit_switch_b_pv_obj = make_mock_pv(get_val=0)
 
@@ -178,7 +179,8 @@ def test_issue_move_command(stepper):
 def test_issue_move_command_hl(stepper):
     stepper.cavity.rack.cryomodule.is_harmonic_linearizer = True
     stepper.move_negative = MagicMock()
-    stepper._motor_moving_pv_obj = make_mock_pv(get_val=0)
+    stepper._motor_moving_pv_obj = make_mock_pv()
+    stepper._motor_moving_pv_obj.get.side_effect = [1, 0]
     stepper._limit_switch_a_pv_obj = make_mock_pv(get_val=0)
     stepper._limit_switch_b_pv_obj = make_mock_pv(get_val=0)
 
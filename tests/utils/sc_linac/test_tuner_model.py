@@ -0,0 +1,95 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from sc_linac_physics.utils.sc_linac.cavity_cache import CavityCache
+from sc_linac_physics.utils.sc_linac.tuner_model import StepResponseModel
+
+
+@pytest.fixture
+def cache(tmp_path):
+    yield CavityCache(tmp_path / "cache.sqlite")
+
+
+@pytest.fixture
+def cavity():
+    cavity = MagicMock()
+    cavity.cryomodule.name = "02"
+    cavity.number = 3
+    cavity.stepper_tuner.hz_per_microstep = 0.005
+    yield cavity
+
+
+def test_converges_to_true_scale():
+    model = StepResponseModel(0.005)
+    true_scale = 0.008
+    delta_hz = 40000
+
+    moves = 0
+    while abs(delta_hz) > 50:
+        steps = int(0.9 * model.steps_for(delta_hz))
+        hz_change = true_scale * steps
+        model.update(steps, hz_change)
+        delta_hz -= hz_change
+        moves += 1
+
+    assert model.hz_per_microstep == pytest.approx(true_scale, rel=0.01)
+    # A fixed 0.005 estimate needs 9 moves for the same detune
+    assert moves <= 4
+
+
+def test_update_ignores_empty_move():
+    model = StepResponseModel(0.005)
+    model.update(0, 100)
+    assert model.hz_per_microstep == 0.005
+    assert model.num_moves == 0
+
+
+def test_estimate_bounded():
+    model = StepResponseModel(0.005, max_ratio=4)
+    model.update(10000, -1e6)
+    assert model.hz_per_microstep == 0.005 / 4
+    model.update(10000, 1e9)
+    assert model.hz_per_microstep == 0.005 * 4
+
+
+def test_prior_from_pv(cavity, cache):
+    model = StepResponseModel.for_cavity(cavity, cache=cache)
+    assert model.hz_per_microstep == 0.005
+
+
+def test_save_and_reuse(cavity, cache):
+    model = StepResponseModel.for_cavity(cavity, cache=cache)
+    model.save(cavity, cache=cache)
+    assert cache.tuner_scale("02", 3) is None
+
+    model.update(10000, 60)
+    model.save(cavity, cache=cache)
+
+    cavity.stepper_tuner.hz_per_microstep = 0.004
+    reloaded = StepResponseModel.for_cavity(cavity, cache=cache)
+    assert reloaded.hz_per_microstep == model.hz_per_microstep != 0.005
+
+
+def test_limits_from_pv(cavity, cache):
+    # Each run ending at the upper limit does not move the next run's limits
+    for _ in range(3):
+        model = StepResponseModel.for_cavity(cavity, cache=cache)
+        assert model.upper_limit == 0.005 * 4
+        model.update(10000, 1e9)
+        model.save(cavity, cache=cache)
+    assert cache.tuner_scale("02", 3) == 0.005 * 4
+
+    # A cached estimate outside the PV's limits starts at the nearest one
+    cavity.stepper_tuner.hz_per_microstep = 0.001
+    model = StepResponseModel.for_cavity(cavity, cache=cache)
+    assert model.hz_per_microstep == 0.001 * 4
+
+
+def test_save_failure_logged(cavity, tmp_path):
+    # A directory where the database file should be
+    (tmp_path / "cache.sqlite").mkdir()
+    model = StepResponseModel(0.005)
+    model.update(10000, 60)
+    model.save(cavity, cache=CavityCache(tmp_path / "cache.sqlite"))
+    cavity.logger.warning.assert_called_once()
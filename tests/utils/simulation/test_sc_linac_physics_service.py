@@ -225,6 +225,10 @@ class TestSCLinacPhysicsService:
             assert pv_name in service
             assert isinstance(service[pv_name], ChannelInteger)
 
+        # Fault runner shard heartbeats, by linac and by cryomodule
+        for shard in ("L0B", "L3B", "01", "H2"):
+            assert f"PHYS:SYS0:1:SC_CAV_FAULT_HEARTBEAT_{shard}" in service
+
         # Check alarm channels
         for channel in ALARM_CHANNELS:
             pv_name = f"ALRM:SYS0:{channel}:ALHBERR"